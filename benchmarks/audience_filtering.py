@@ -0,0 +1,94 @@
+"""Compare DISTINCT-join and EXISTS audience filtering.
+
+Builds an in-memory SQLite database with the test settings, fills it with
+announcements targeting a few audiences each, then times a first page and a
+full count of ``get_by_audience`` against the former ``DISTINCT`` join.
+
+Usage:
+    python benchmarks/audience_filtering.py [--announcements 100000]
+
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from django_announcement.tests import setup  # noqa: E402,F401  isort:skip
+
+from django.core.management import call_command  # noqa: E402
+
+from django_announcement.models import (  # noqa: E402
+    Announcement,
+    AnnouncementCategory,
+    Audience,
+    AudienceAnnouncement,
+)
+
+BATCH_SIZE = 5000
+
+
+def populate(announcements: int, audiences: int) -> list:
+    """Create the benchmark rows and return the audience ids."""
+    call_command("migrate", verbosity=0)
+    category = AnnouncementCategory.objects.create(name="Benchmark")
+    audience_ids = [
+        Audience.objects.create(name=f"Audience {i}").pk for i in range(audiences)
+    ]
+
+    for start in range(0, announcements, BATCH_SIZE):
+        created = Announcement.objects.bulk_create(
+            Announcement(
+                title=f"Announcement {i}",
+                content="lorem ipsum " * 50,
+                category=category,
+            )
+            for i in range(start, min(start + BATCH_SIZE, announcements))
+        )
+        AudienceAnnouncement.objects.bulk_create(
+            AudienceAnnouncement(announcement=announcement, audience_id=audience_id)
+            for announcement in created
+            for audience_id in random.sample(audience_ids, 3)
+        )
+
+    return audience_ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--announcements", type=int, default=100_000)
+    parser.add_argument("--audiences", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    audience_ids = populate(args.announcements, args.audiences)
+    user_audiences = audience_ids[:4]
+
+    queries = {
+        "distinct join": lambda: Announcement.objects.get_queryset()
+        ._join.filter(audience__in=user_audiences)
+        .distinct(),
+        "exists": lambda: Announcement.objects.get_queryset().get_by_audience(
+            user_audiences
+        ),
+    }
+
+    print(f"{args.announcements} announcements, {args.audiences} audiences")
+    for name, build in queries.items():
+        page = min(
+            repeat(
+                lambda: list(build().order_by("-id")[:10]), number=1, repeat=args.repeat
+            )
+        )
+        count = min(repeat(lambda: build().count(), number=1, repeat=args.repeat))
+        print(
+            f"{name:>14}: first page {page * 1000:8.2f} ms, count {count * 1000:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
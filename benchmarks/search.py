@@ -0,0 +1,107 @@
+"""Compare ``LIKE`` searches and the full-text search backends as the
+announcement table grows.
+
+Builds an in-memory SQLite database with the test settings and, for each
+size, fills it with announcements of which one in a hundred mentions the
+searched word, then times counting the matches and fetching their first page, as the
+list endpoint does, with the
+``icontains`` lookups of ``SearchFilter``, ``SQLiteFTS5SearchBackend`` and
+``InMemorySearchBackend``.
+
+Usage:
+    python benchmarks/search.py [--sizes 1000 10000 50000]
+
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from django_announcement.tests import setup  # noqa: E402,F401  isort:skip
+
+from django.core.management import call_command  # noqa: E402
+from django.db.models import Q  # noqa: E402
+
+from django_announcement.models import (  # noqa: E402
+    Announcement,
+    AnnouncementCategory,
+)
+from django_announcement.search import (  # noqa: E402
+    InMemorySearchBackend,
+    SQLiteFTS5SearchBackend,
+)
+
+WORDS = (
+    "meeting office schedule update policy team review project budget "
+    "release customer training holiday security network report"
+).split()
+
+
+def populate(start: int, stop: int, category: AnnouncementCategory) -> None:
+    """Create the announcements numbered from start to stop."""
+    Announcement.objects.bulk_create(
+        (
+            Announcement(
+                title=" ".join(random.choices(WORDS, k=4)),
+                content=" ".join(random.choices(WORDS, k=80))
+                + (" outage" if i % 100 == 0 else ""),
+                category=category,
+            )
+            for i in range(start, stop)
+        ),
+        batch_size=1000,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--query", default="outage")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    random.seed(0)
+    call_command("migrate", verbosity=0)
+    category = AnnouncementCategory.objects.create(name="Benchmark")
+    sqlite, memory = SQLiteFTS5SearchBackend(), InMemorySearchBackend()
+    sqlite.setup()
+
+    def page(queryset):
+        return queryset.count(), list(queryset[: args.page_size])
+
+    def ranked(backend):
+        return lambda: page(
+            backend.search(Announcement.objects.all(), args.query).order_by(
+                f"-{backend.rank_annotation}", "-pk"
+            )
+        )
+
+    paths = {
+        "LIKE": lambda: page(
+            Announcement.objects.filter(
+                Q(title__icontains=args.query)
+                | Q(content__icontains=args.query)
+                | Q(category__name__icontains=args.query)
+            ).order_by("-pk")
+        ),
+        "SQLite FTS5": ranked(sqlite),
+        "in-memory": ranked(memory),
+    }
+
+    size = 0
+    for target in sorted(args.sizes):
+        populate(size, target, category)
+        size = target
+        memory.setup()
+        for name, run in paths.items():
+            timing = min(repeat(run, number=1, repeat=args.repeat))
+            print(f"{size:>8} announcements {name:>12}: {timing * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Compare model serializers and the row fast path on list pages.
+
+Builds an in-memory SQLite database with the test settings, fills it with
+announcements targeting a few audiences each, then times fetching and
+serializing a page with ``SimpleAnnouncementSerializer`` and
+``AnnouncementSerializer`` over model instances against ``RowSerializer``
+over ``as_rows()``.
+
+Usage:
+    python benchmarks/serialization.py [--page-size 100]
+
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from django_announcement.tests import setup  # noqa: E402,F401  isort:skip
+
+from django.core.management import call_command  # noqa: E402
+from django.utils.timezone import now  # noqa: E402
+
+from django_announcement.api.serializers.announcement import (  # noqa: E402
+    AnnouncementSerializer,
+    SimpleAnnouncementSerializer,
+)
+from django_announcement.api.serializers.row import RowSerializer  # noqa: E402
+from django_announcement.models import (  # noqa: E402
+    Announcement,
+    AnnouncementCategory,
+    Audience,
+    AudienceAnnouncement,
+)
+
+
+def populate(announcements: int, audiences: int) -> None:
+    """Create the benchmark rows."""
+    call_command("migrate", verbosity=0)
+    category = AnnouncementCategory.objects.create(
+        name="Benchmark", description="Benchmark category"
+    )
+    audience_ids = [
+        Audience.objects.create(name=f"Audience {i}", description="Members").pk
+        for i in range(audiences)
+    ]
+    created = Announcement.objects.bulk_create(
+        Announcement(
+            title=f"Announcement {i}",
+            content="lorem ipsum " * 50,
+            category=category,
+            published_at=now(),
+            attachment=f"announcement_attachments/{i}.pdf" if i % 2 else "",
+        )
+        for i in range(announcements)
+    )
+    AudienceAnnouncement.objects.bulk_create(
+        AudienceAnnouncement(announcement=announcement, audience_id=audience_id)
+        for announcement in created
+        for audience_id in random.sample(audience_ids, 3)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--announcements", type=int, default=1000)
+    parser.add_argument("--audiences", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    random.seed(0)
+    populate(args.announcements, args.audiences)
+
+    def page():
+        return Announcement.objects.all().order_by("-id")[: args.page_size]
+
+    print(f"pages of {args.page_size} announcements")
+    for serializer_class in (SimpleAnnouncementSerializer, AnnouncementSerializer):
+        with_audience = RowSerializer.requires_audience(serializer_class)
+        paths = {
+            "model serializer": lambda: serializer_class(page(), many=True).data,
+            "row fast path": lambda: RowSerializer(
+                page().as_rows(with_audience=with_audience),
+                serializer_class=serializer_class,
+            ).data,
+        }
+        timings = {
+            name: min(repeat(run, number=1, repeat=args.repeat))
+            for name, run in paths.items()
+        }
+        baseline = timings["model serializer"]
+        for name, timing in timings.items():
+            print(
+                f"{serializer_class.__name__:>28} {name:>16}: "
+                f"{timing * 1000:8.2f} ms ({baseline / timing:4.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Compare the role-based, sliding-window and leased throttles at growing
+rates.
+
+Drives ``allow_request`` of ``RoleBasedUserRateThrottle`` (DRF's list of
+request timestamps), ``SlidingWindowUserRateThrottle`` (two counters) and
+``LeasedUserRateThrottle`` (a counter leased in batches) for a single user close to the rate, with the local-memory cache of the
+test settings, then reports the time per request and the bytes kept in
+the cache for the user.
+
+Usage:
+    python benchmarks/throttling.py [--rates 100 1000 10000]
+
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from timeit import repeat
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from django_announcement.tests import setup  # noqa: E402,F401  isort:skip
+
+from django.core.cache import cache  # noqa: E402
+from rest_framework.request import Request  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from django_announcement.api.throttlings import (  # noqa: E402
+    LeasedUserRateThrottle,
+    RoleBasedUserRateThrottle,
+    SlidingWindowUserRateThrottle,
+)
+from django_announcement.settings.conf import config  # noqa: E402
+
+
+def cached_bytes(prefix: str) -> int:
+    """Return the size of the cache entries of a key prefix, which the
+    local-memory cache keeps pickled."""
+    return sum(
+        len(value)
+        for key, value in cache._cache.items()  # pylint: disable=protected-access
+        if cache.make_key(prefix) in key
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rates", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    request = Request(APIRequestFactory().get("/announcements/"))
+    request.user = SimpleNamespace(pk=1, is_staff=False, is_authenticated=True)
+
+    for rate in args.rates:
+        config.authenticated_user_throttle_rate = f"{rate}/hour"
+        print(f"{rate} requests per hour, {rate - 1} already made")
+        for throttle_class in (
+            RoleBasedUserRateThrottle,
+            SlidingWindowUserRateThrottle,
+            LeasedUserRateThrottle,
+        ):
+            cache.clear()
+            LeasedUserRateThrottle.leases.clear()
+            for _ in range(rate - 1):
+                throttle_class().allow_request(request, None)
+            size = cached_bytes("throttle_user_1")
+
+            def run(throttle_class=throttle_class):
+                throttle_class().allow_request(request, None)
+
+            timing = min(repeat(run, number=100, repeat=args.repeat)) / 100
+            print(
+                f"{throttle_class.__name__:>32}: "
+                f"{timing * 1e6:8.1f} us/request, {size:7d} bytes cached"
+            )
+
+
+if __name__ == "__main__":
+    main()
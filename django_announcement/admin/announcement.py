@@ -1,4 +1,7 @@
+from typing import Tuple
+
 from django.contrib.admin import register
+from django.contrib.admin.views.main import ORDER_VAR
 from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
@@ -6,6 +9,7 @@ from django.utils.translation import gettext_lazy as _
 from django_announcement.admin.inlines import AudienceInline
 from django_announcement.mixins.admin.base import BaseModelAdmin
 from django_announcement.models import Announcement
+from django_announcement.search import get_search_backend
 from django_announcement.settings.conf import config
 
 
@@ -60,3 +64,35 @@ class AnnouncementAdmin(BaseModelAdmin):
 
         """
         return super().get_queryset(request).select_related("category")
+
+    def get_search_results(
+        self, request: HttpRequest, queryset: QuerySet, search_term: str
+    ) -> Tuple[QuerySet, bool]:
+        """Search the announcements with the configured full-text search
+        backend, falling back to the `search_fields` lookups without one.
+
+        Matches are ordered by relevance, unless a column of the change
+        list is sorted.
+
+        Args:
+            request: The current HTTP request.
+            queryset: The announcements to search.
+            search_term: The search term entered in the admin.
+
+        Returns:
+            The matching announcements, and whether they may contain
+            duplicates.
+
+        """
+        backend = get_search_backend()
+        if backend is None:
+            return super().get_search_results(request, queryset, search_term)
+
+        if not backend.tokenize(search_term):
+            return queryset, False
+
+        queryset = backend.search(queryset, search_term)
+        if not request.GET.get(ORDER_VAR):
+            queryset = queryset.order_by(f"-{backend.rank_annotation}", "-pk")
+
+        return queryset, False
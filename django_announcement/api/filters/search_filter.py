@@ -0,0 +1,37 @@
+from typing import Any
+
+from django.db.models import QuerySet
+from rest_framework.filters import SearchFilter
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from django_announcement.search import get_search_backend
+
+
+class AnnouncementSearchFilter(SearchFilter):
+    """Search filter answering ``?search=`` with the configured full-text
+    search backend.
+
+    Matches are ordered by relevance, most relevant first, unless the
+    request orders the results explicitly with ``?ordering=``. Without a
+    search backend, the view's ``search_fields`` are searched with
+    `SearchFilter` lookups.
+
+    """
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet, view: Any
+    ) -> QuerySet:
+        backend = get_search_backend()
+        if backend is None:
+            return super().filter_queryset(request, queryset, view)
+
+        query = request.query_params.get(self.search_param, "")
+        if not backend.tokenize(query):
+            return queryset
+
+        queryset = backend.search(queryset, query)
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+
+        return queryset.order_by(f"-{backend.rank_annotation}", "-pk")
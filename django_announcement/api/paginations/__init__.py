@@ -1 +1,2 @@
+from .cursor_pagination import DefaultCursorPagination
 from .limit_offset_pagination import DefaultLimitOffSetPagination
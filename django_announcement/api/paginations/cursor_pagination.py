@@ -0,0 +1,279 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db.models import Q, QuerySet
+from django.db.models.functions import Coalesce
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+# A cursor position: (effective publication time, announcement id)
+Position = Tuple[Any, int]
+
+
+class DefaultCursorPagination(BasePagination):
+    """A keyset (cursor) pagination class for announcement lists.
+
+    Results are ordered by their effective publication time (``published_at``,
+    falling back to ``created_at`` for announcements published on creation)
+    and ``id``, newest first. Each page is fetched with a range condition on
+    that pair instead of an ``OFFSET``, and no ``COUNT`` query is ever issued,
+    so fetching page N costs the same as fetching page 1. The ordering matches
+    the ``announcement_cursor_idx`` expression index of the Announcement model,
+    so each page is served by an index range scan.
+
+    The ordering is fixed: combining it with ``?ordering=`` would break the
+    cursors, so such requests are rejected with a 400 response.
+
+    Cursors are opaque to clients; they are returned in the ``next`` and
+    ``previous`` links of each page.
+
+    """
+
+    cursor_query_param: str = "cursor"
+    page_size_query_param: str = "limit"
+
+    # Minimum page size allowed in query parameters
+    min_page_size: int = 1
+
+    # Maximum page size allowed in query parameters
+    max_page_size: int = 100
+
+    # Default page size when no limit is specified
+    default_page_size: int = 10
+
+    # Name of the annotation holding the effective publication time
+    position_field: str = "cursor_published_at"
+
+    invalid_cursor_message = _("Invalid cursor")
+    ordering_conflict_message = _("Ordering is not supported with cursor pagination.")
+
+    def get_page_size(self, request: Request) -> int:
+        """Return the page size requested by the client, constrained by the
+        defined minimum and maximum, or the default page size if not
+        specified.
+
+        Parameters:
+        -----------
+        request : Request
+            The request object containing query parameters with the page size.
+
+        Returns:
+        --------
+        int
+            The number of items to be returned per page.
+
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.default_page_size
+
+        if page_size < self.min_page_size:
+            return self.default_page_size
+
+        return min(page_size, self.max_page_size)
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> List[Any]:
+        """Return a single page of results, fetching one extra row to detect
+        whether more results exist in the requested direction.
+
+        Parameters:
+        -----------
+        queryset : QuerySet
+            The queryset of announcements to paginate.
+        request : Request
+            The request object, optionally carrying a cursor.
+        view : Any
+            The view requesting pagination.
+
+        Returns:
+        --------
+        List[Any]
+            The announcements of the requested page, newest first.
+
+        """
+        if api_settings.ORDERING_PARAM in request.query_params:
+            raise ValidationError(
+                {api_settings.ORDERING_PARAM: [self.ordering_conflict_message]}
+            )
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+
+        position, reverse = self.decode_cursor(request)
+        queryset = self.order_queryset(
+            queryset.annotate(
+                **{self.position_field: Coalesce("published_at", "created_at")}
+            ),
+            reverse,
+        )
+
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(position, reverse))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page = results
+        return results
+
+    def order_queryset(self, queryset: QuerySet, reverse: bool) -> QuerySet:
+        """Apply the stable keyset ordering, ascending when paging backwards.
+
+        Args:
+            queryset (QuerySet): The annotated queryset.
+            reverse (bool): Whether the page is fetched backwards.
+
+        Returns:
+            QuerySet: The ordered queryset.
+
+        """
+        if reverse:
+            return queryset.order_by(self.position_field, "id")
+
+        return queryset.order_by(f"-{self.position_field}", "-id")
+
+    def get_position_filter(self, position: Position, reverse: bool) -> Q:
+        """Build the range condition selecting the rows after (or before)
+        the given position.
+
+        Args:
+            position (Position): The (publication time, id) pair of the cursor.
+            reverse (bool): Whether the page is fetched backwards.
+
+        Returns:
+            Q: The keyset condition.
+
+        """
+        published_at, pk = position
+        lookup = "gt" if reverse else "lt"
+
+        return Q(**{f"{self.position_field}__{lookup}": published_at}) | Q(
+            **{self.position_field: published_at, f"id__{lookup}": pk}
+        )
+
+    def get_next_link(self) -> Optional[str]:
+        """Return the link to the page after the current one, if any."""
+        if not self.has_next or not self.page:
+            return None
+
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        """Return the link to the page before the current one, if any."""
+        if not self.has_previous:
+            return None
+
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, instance: Any, reverse: bool) -> str:
+        """Build a URL carrying an opaque cursor positioned on the given
+        announcement.
+
+        Args:
+            instance (Any): The announcement at the edge of the current page.
+            reverse (bool): Whether the cursor pages backwards.
+
+        Returns:
+            str: The absolute URL of the adjacent page.
+
+        """
+        payload = {
+            "p": getattr(instance, self.position_field).isoformat(),
+            "i": instance.pk,
+        }
+        if reverse:
+            payload["r"] = 1
+
+        encoded = urlsafe_b64encode(
+            json.dumps(payload, separators=(",", ":")).encode("ascii")
+        ).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request: Request) -> Tuple[Optional[Position], bool]:
+        """Decode the cursor of the request.
+
+        Args:
+            request (Request): The request optionally carrying a cursor.
+
+        Returns:
+            Tuple[Optional[Position], bool]: The cursor position (None for the
+            first page) and whether the page is fetched backwards.
+
+        Raises:
+            NotFound: If the cursor can not be decoded.
+
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            published_at = parse_datetime(payload["p"])
+            pk = int(payload["i"])
+            reverse = bool(payload.get("r"))
+        except (
+            BinasciiError,
+            KeyError,
+            TypeError,
+            UnicodeEncodeError,
+            ValueError,
+        ) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+        if published_at is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return (published_at, pk), reverse
+
+    def get_paginated_response(self, data: List[Dict[str, Any]]) -> Response:
+        """Return the page without any count.
+
+        Args:
+            data (List[Dict[str, Any]]): The serialized page.
+
+        Returns:
+            Response: The paginated response.
+
+        """
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Describe the paginated response for schema generation."""
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
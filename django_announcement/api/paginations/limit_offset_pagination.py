@@ -1,12 +1,36 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+from django.db.models import QuerySet
 from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from django_announcement.constants.pagination import (
+    COUNT_MODE_CAPPED,
+    COUNT_MODE_EXACT,
+    COUNT_MODES,
+)
+
+# The settings load this class, so the module is imported rather than the
+# `config` instance it is still building
+from django_announcement.settings import conf
 
 
 class DefaultLimitOffSetPagination(LimitOffsetPagination):
     """A custom LimitOffsetPagination class that enforces minimum and maximum
-    limits on the number of items returned per page."""
+    limits on the number of items returned per page.
+
+    Besides the exact ``count`` of DRF, the pagination supports two cheaper
+    count modes, selected with ``DJANGO_ANNOUNCEMENT_API_PAGINATION_COUNT_MODE``
+    or per request with ``?count=``:
+
+    - ``capped``: counts at most ``DJANGO_ANNOUNCEMENT_API_PAGINATION_COUNT_CAP``
+      rows and flags the count with ``count_is_approximate`` when the cap is hit.
+    - ``none``: never counts; ``has_next`` is derived from fetching one row
+      more than the requested limit.
+
+    """
 
     # Minimum limit allowed in query parameters
     min_limit: int = 1
@@ -17,6 +41,9 @@ class DefaultLimitOffSetPagination(LimitOffsetPagination):
     # Default limit when no limit is specified
     default_limit: int = 10
 
+    # Query parameter selecting the count mode of a single request
+    count_query_param: str = "count"
+
     def get_limit(self, request: Request) -> Optional[int]:
         """Override the `get_limit` method to enforce minimum and maximum
         limits on the number of items returned per page. The limit is extracted
@@ -57,3 +84,161 @@ class DefaultLimitOffSetPagination(LimitOffsetPagination):
 
         # Return the default limit if no valid limit is provided
         return self.default_limit
+
+    def get_count_mode(self, request: Request) -> str:
+        """Return the count mode requested by the client, or the configured
+        mode if the request does not specify a supported one.
+
+        Args:
+            request (Request): The request object, optionally carrying ``?count=``.
+
+        Returns:
+            str: One of ``exact``, ``capped`` or ``none``.
+
+        """
+        count_mode = request.query_params.get(self.count_query_param)
+        if count_mode in COUNT_MODES:
+            return count_mode
+
+        return conf.config.api_pagination_count_mode
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> List[Any]:
+        """Paginate the queryset according to the selected count mode.
+
+        In the ``exact`` mode the DRF behaviour is kept as is. The other
+        modes fetch ``limit + 1`` rows to detect whether a next page exists,
+        and either skip counting or count up to the configured cap.
+
+        Args:
+            queryset (QuerySet): The queryset of announcements to paginate.
+            request (Request): The request object.
+            view (Any): The view requesting pagination.
+
+        Returns:
+            List[Any]: The announcements of the requested page.
+
+        """
+        self.count_mode = self.get_count_mode(request)
+        if self.count_mode == COUNT_MODE_EXACT:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.offset = self.get_offset(request)
+        self.count = None
+        self.count_is_approximate = False
+
+        if self.count_mode == COUNT_MODE_CAPPED:
+            cap = conf.config.api_pagination_count_cap
+            self.count = queryset.order_by()[: cap + 1].count()
+            if self.count > cap:
+                self.count, self.count_is_approximate = cap, True
+
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(results) > self.limit
+        return results[: self.limit]
+
+    async def apaginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> List[Any]:
+        """Asynchronous version of `paginate_queryset` for async views,
+        counting and fetching the page with the async ORM interface.
+
+        Args:
+            queryset (QuerySet): The queryset of announcements to paginate.
+            request (Request): The request object.
+            view (Any): The view requesting pagination.
+
+        Returns:
+            List[Any]: The announcements of the requested page.
+
+        """
+        self.count_mode = self.get_count_mode(request)
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.offset = self.get_offset(request)
+
+        if self.count_mode == COUNT_MODE_EXACT:
+            self.count = await queryset.acount()
+            if self.count > self.limit and self.template is not None:
+                self.display_page_controls = True
+            if self.count == 0 or self.offset > self.count:
+                return []
+            return [
+                item async for item in queryset[self.offset : self.offset + self.limit]
+            ]
+
+        self.count = None
+        self.count_is_approximate = False
+
+        if self.count_mode == COUNT_MODE_CAPPED:
+            cap = conf.config.api_pagination_count_cap
+            self.count = await queryset.order_by()[: cap + 1].acount()
+            if self.count > cap:
+                self.count, self.count_is_approximate = cap, True
+
+        results = [
+            item async for item in queryset[self.offset : self.offset + self.limit + 1]
+        ]
+        self.has_next = len(results) > self.limit
+        return results[: self.limit]
+
+    def get_next_link(self) -> Optional[str]:
+        """Return the link to the next page, relying on the extra row fetched
+        instead of the count when counting is skipped or capped."""
+        if self.count_mode == COUNT_MODE_EXACT:
+            return super().get_next_link()
+
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(
+            url, self.offset_query_param, self.offset + self.limit
+        )
+
+    def get_paginated_response(self, data: List[Dict[str, Any]]) -> Response:
+        """Return the page with the fields of the selected count mode.
+
+        Args:
+            data (List[Dict[str, Any]]): The serialized page.
+
+        Returns:
+            Response: The paginated response.
+
+        """
+        if self.count_mode == COUNT_MODE_EXACT:
+            return super().get_paginated_response(data)
+
+        if self.count_mode == COUNT_MODE_CAPPED:
+            counts = {
+                "count": self.count,
+                "count_is_approximate": self.count_is_approximate,
+            }
+        else:
+            counts = {"has_next": self.has_next}
+
+        return Response(
+            {
+                **counts,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Describe the paginated response of every count mode for schema
+        generation."""
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["required"] = ["results"]
+        response_schema["properties"].update(
+            {
+                "count_is_approximate": {"type": "boolean"},
+                "has_next": {"type": "boolean"},
+            }
+        )
+        return response_schema
@@ -0,0 +1 @@
+from .event_stream import EventStreamRenderer
@@ -0,0 +1,30 @@
+import json
+from typing import Any, Mapping, Optional
+
+from rest_framework.renderers import BaseRenderer
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Renderer accepting ``text/event-stream`` requests.
+
+    Streams are written by the view itself; this renderer only formats the
+    error responses answered before a stream opens (e.g. when throttled)
+    as a single ``error`` event, so ``EventSource`` clients pass content
+    negotiation.
+
+    """
+
+    media_type: str = "text/event-stream"
+    format: str = "event-stream"
+    charset: str = "utf-8"
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+
+        return f"event: error\ndata: {json.dumps(data)}\n\n".encode(self.charset)
@@ -1,8 +1,24 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
 from django_announcement.api.views.announcement import AnnouncementViewSet
+from django_announcement.api.views.announcement_stream import AnnouncementStreamView
+from django_announcement.api.views.async_announcement import AsyncAnnouncementViewSet
+from django_announcement.settings.conf import config
 
 router = DefaultRouter()
-router.register(r"announcements", AnnouncementViewSet, basename="announcement")
+router.register(
+    r"announcements",
+    AsyncAnnouncementViewSet if config.api_async_enabled else AnnouncementViewSet,
+    basename="announcement",
+)
 
-urlpatterns = router.urls
+urlpatterns = [
+    # Ahead of the router, whose detail route would match "stream" as an id
+    path(
+        "announcements/stream/",
+        AnnouncementStreamView.as_view(),
+        name="announcement-stream",
+    ),
+    *router.urls,
+]
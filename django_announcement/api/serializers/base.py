@@ -1,6 +1,7 @@
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
 
-from rest_framework.serializers import ModelSerializer
+from rest_framework.serializers import BaseSerializer, ModelSerializer
 
 from django_announcement.settings.conf import config
 from django_announcement.utils.serialization import filter_non_empty_fields
@@ -8,7 +9,21 @@ from django_announcement.utils.serialization import filter_non_empty_fields
 
 class BaseFilteredSerializer(ModelSerializer):
     """Base serializer that filters out empty fields from the
-    representation."""
+    representation.
+
+    A ``fields`` argument narrows the representation to the given
+    subset of the declared fields (sparse fieldsets).
+
+    """
+
+    def __init__(
+        self, *args: Any, fields: Optional[Iterable[str]] = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
 
     def to_representation(self, instance: Any) -> Dict[str, Any]:
         """Convert the instance to a representation format, filtering out empty
@@ -28,3 +43,24 @@ class BaseFilteredSerializer(ModelSerializer):
             return filter_non_empty_fields(data)
 
         return data
+
+
+@lru_cache(maxsize=None)
+def get_serializer_relations(
+    serializer_class: Type[ModelSerializer],
+) -> Tuple[str, ...]:
+    """Return the model relations rendered by the nested serializers of a
+    serializer, i.e. the relations a queryset has to load for it.
+
+    Args:
+        serializer_class (Type[ModelSerializer]): The serializer to inspect.
+
+    Returns:
+        Tuple[str, ...]: The relation names, in field declaration order.
+
+    """
+    return tuple(
+        field.source
+        for field in serializer_class().fields.values()
+        if isinstance(field, BaseSerializer)
+    )
@@ -0,0 +1,38 @@
+from typing import Any, Dict
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework.serializers import (
+    BooleanField,
+    IntegerField,
+    ListField,
+    Serializer,
+    ValidationError,
+)
+
+
+class MarkReadSerializer(Serializer):
+    """Validate the announcements to mark as read: either a list of ids or
+    every announcement of the user."""
+
+    ids = ListField(
+        child=IntegerField(min_value=1),
+        required=False,
+        max_length=1000,
+        help_text=_("The ids of the announcements to mark as read."),
+    )
+    all = BooleanField(
+        default=False,
+        help_text=_("Mark every announcement of the user as read."),
+    )
+
+    def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        """Require either ``ids`` or ``all``.
+
+        Raises:
+            ValidationError: If neither or both are given.
+
+        """
+        if attrs["all"] == ("ids" in attrs):
+            raise ValidationError(_("Provide either `ids` or `all`."))
+
+        return attrs
@@ -0,0 +1,243 @@
+from functools import lru_cache
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from django.db.models import FileField as ModelFileField
+from rest_framework import fields as drf_fields
+from rest_framework.request import Request
+from rest_framework.serializers import BaseSerializer, ListSerializer, Serializer
+from rest_framework.settings import api_settings
+
+from django_announcement.repository.queryset.rows import Row
+from django_announcement.settings.conf import config
+from django_announcement.utils.serialization import filter_non_empty_fields
+
+# Converts a non-None value of a row, given the current request
+Converter = Callable[[Any, Optional[Request]], Any]
+
+# One compiled field: (field name, value getter, converter or None to copy)
+Step = Tuple[str, Callable[[Row], Any], Optional[Converter]]
+
+# Fields whose database values are already in their representation form
+PASSTHROUGH_FIELDS = (
+    drf_fields.BooleanField,
+    drf_fields.CharField,
+    drf_fields.IntegerField,
+)
+
+
+class RowSerializer:
+    """Serialize `Row` objects (see `AnnouncementQuerySet.as_rows`) into
+    the exact representation of a ``ModelSerializer``.
+
+    The declared fields of the serializer are compiled once per serializer
+    class into a flat list of getters and converters, so serializing a row
+    is a single loop over plain attributes instead of the per-field
+    ``get_attribute``/``to_representation`` machinery of DRF. Nested
+    serializers read the flattened ``<field>__<name>`` columns of the row,
+    nested lists (``many=True``) read a list of rows.
+
+    Like `BaseFilteredSerializer`, a ``fields`` argument narrows the
+    representation to a subset of the declared fields.
+
+    Only read-only representations are supported; use the regular
+    serializer for validation and saving.
+
+    """
+
+    def __init__(
+        self,
+        instance: Iterable[Row],
+        serializer_class: Type[Serializer],
+        context: Optional[Dict[str, Any]] = None,
+        fields: Optional[Collection[str]] = None,
+    ) -> None:
+        self.instance = instance
+        self.serializer_class = serializer_class
+        self.context = context or {}
+        self.fields = fields
+
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        """Return the representation of every row."""
+        steps = compile_serializer(self.serializer_class)
+        if self.fields is not None:
+            steps = [step for step in steps if step[0] in self.fields]
+        request = self.context.get("request")
+        return [render(steps, row, request) for row in self.instance]
+
+    @staticmethod
+    def requires_audience(
+        serializer_class: Type[Serializer], fields: Optional[Collection[str]] = None
+    ) -> bool:
+        """Return whether the serializer represents the audiences, which the
+        rows then have to carry.
+
+        Args:
+            serializer_class (Type[Serializer]): The serializer to emulate.
+            fields (Optional[Collection[str]]): The requested subset of fields.
+
+        Returns:
+            bool: True if the ``audience`` field is declared and requested.
+
+        """
+        if fields is not None and "audience" not in fields:
+            return False
+
+        return "audience" in serializer_class().fields
+
+
+def render(steps: List[Step], row: Row, request: Optional[Request]) -> Dict[str, Any]:
+    """Apply the compiled steps of a serializer to a row.
+
+    Args:
+        steps (List[Step]): The compiled serializer.
+        row (Row): The row to represent.
+        request (Optional[Request]): The current request, for absolute URLs.
+
+    Returns:
+        Dict[str, Any]: The representation of the row.
+
+    """
+    data = {}
+    for name, getter, convert in steps:
+        value = getter(row)
+        data[name] = (
+            value if value is None or convert is None else convert(value, request)
+        )
+
+    if config.exclude_serializer_empty_fields:
+        return filter_non_empty_fields(data)
+
+    return data
+
+
+@lru_cache(maxsize=None)
+def compile_serializer(
+    serializer_class: Type[Serializer], prefix: str = ""
+) -> List[Step]:
+    """Compile the readable fields of a serializer into steps.
+
+    Args:
+        serializer_class (Type[Serializer]): The serializer to compile.
+        prefix (str): The lookup prefix of a nested serializer's columns.
+
+    Returns:
+        List[Step]: One step per readable field, in declaration order.
+
+    """
+    serializer = serializer_class()
+    model = serializer.Meta.model
+    steps = []
+    for field in serializer._readable_fields:
+        source = f"{prefix}{field.source}"
+
+        if isinstance(field, ListSerializer):
+            steps.append(
+                (field.field_name, attrgetter(source), compile_many(type(field.child)))
+            )
+        elif isinstance(field, BaseSerializer):
+            pk_name = field.Meta.model._meta.pk.name
+            steps.append(
+                (
+                    field.field_name,
+                    nested_getter(f"{source}__{pk_name}"),
+                    compile_nested(type(field), f"{source}__"),
+                )
+            )
+        elif isinstance(field, drf_fields.FileField):
+            steps.append(
+                (
+                    field.field_name,
+                    attrgetter(source),
+                    compile_file(model._meta.get_field(field.source), field),
+                )
+            )
+        elif isinstance(field, PASSTHROUGH_FIELDS):
+            steps.append((field.field_name, attrgetter(source), None))
+        else:
+            steps.append(
+                (
+                    field.field_name,
+                    attrgetter(source),
+                    compile_field(field),
+                )
+            )
+
+    return steps
+
+
+def compile_field(field: drf_fields.Field) -> Converter:
+    """Compile a field converting its value with its own
+    ``to_representation``, e.g. the datetime formatting of DRF."""
+    to_representation = field.to_representation
+
+    def convert(value: Any, request: Optional[Request]) -> Any:
+        return to_representation(value)
+
+    return convert
+
+
+def compile_many(serializer_class: Type[Serializer]) -> Converter:
+    """Compile a nested ``many=True`` serializer reading a list of rows."""
+    steps = compile_serializer(serializer_class)
+
+    def convert(rows: List[Row], request: Optional[Request]) -> List[Dict[str, Any]]:
+        return [render(steps, row, request) for row in rows]
+
+    return convert
+
+
+def nested_getter(pk_column: str) -> Callable[[Row], Optional[Row]]:
+    """Return a getter passing the row itself on to a nested serializer,
+    or None when the relation is missing (its primary key is None)."""
+    get_pk = attrgetter(pk_column)
+
+    def getter(row: Row) -> Optional[Row]:
+        return None if get_pk(row) is None else row
+
+    return getter
+
+
+def compile_nested(serializer_class: Type[Serializer], prefix: str) -> Converter:
+    """Compile a nested serializer reading the prefixed columns of the
+    parent row."""
+    steps = compile_serializer(serializer_class, prefix)
+
+    def convert(row: Row, request: Optional[Request]) -> Dict[str, Any]:
+        return render(steps, row, request)
+
+    return convert
+
+
+def compile_file(model_field: ModelFileField, field: drf_fields.FileField) -> Converter:
+    """Compile a file field, whose row value is the stored file name.
+
+    Mirrors ``FileField.to_representation``: the URL of the file is
+    returned (absolute when a request is available) unless
+    ``UPLOADED_FILES_USE_URL`` is disabled, in which case the name is.
+
+    """
+    use_url = getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL)
+    storage = model_field.storage
+
+    def convert(name: str, request: Optional[Request]) -> Optional[str]:
+        if not name:
+            return None
+        if not use_url:
+            return name
+
+        url = storage.url(name)
+        return request.build_absolute_uri(url) if request is not None else url
+
+    return convert
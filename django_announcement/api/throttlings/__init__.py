@@ -1 +1,3 @@
+from .leased_throttle import LeasedUserRateThrottle
 from .role_base_throttle import RoleBasedUserRateThrottle
+from .sliding_window_throttle import SlidingWindowUserRateThrottle
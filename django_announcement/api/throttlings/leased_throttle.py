@@ -0,0 +1,145 @@
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from django_announcement.api.throttlings.role_base_throttle import (
+    RoleBasedUserRateThrottle,
+)
+
+# The module is imported while the settings resolve the throttle classes,
+# so `config` is read from its module once built
+from django_announcement.settings import conf
+
+
+class LeasedUserRateThrottle(RoleBasedUserRateThrottle):
+    """A role-based throttle deciding most requests from a budget leased
+    by the process, without a cache round trip.
+
+    The requests of each user are counted per fixed window of the rate
+    duration in the shared cache. Instead of counting every request there,
+    each process leases a batch of requests from the shared counter with
+    one atomic ``incr``, and spends it locally. A process leases at most a
+    tenth of the rate at once, capped by ``THROTTLE_LEASE_SIZE``, so the
+    budget is spread over the processes serving the user. Once the window
+    is spent, further requests are rejected locally until it ends.
+
+    The shared counter caps each window at the rate, but windows are
+    fixed, so a user may be served up to twice the rate across a window
+    boundary: the end of one window and the start of the next. A process
+    may also hold requests it does not serve before the window ends, so
+    users spreading their requests over many processes can be throttled
+    slightly early.
+
+    The lock only guards the local budgets; leases are taken outside of
+    it, so a cache round trip never holds up the requests of other users.
+
+    """
+
+    # Local budgets, by user cache key: (window, requests left or -1)
+    leases: Dict[str, Tuple[int, int]] = {}
+    lock: Lock = Lock()
+
+    # Number of local budgets above which those of past windows are dropped
+    max_leases: int = 10000
+
+    def allow_request(self, request: Request, view: APIView) -> bool:
+        """Spend a request of the local budget of the user, leasing a new
+        batch from the shared counter when it runs out.
+
+        Args:
+            request (Request): The incoming HTTP request object.
+            view (APIView): The API view being accessed by the request.
+
+        Returns:
+            bool: True if the request is allowed; False otherwise.
+
+        """
+        self.apply_user_rate(request.user)
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        window, self.elapsed = divmod(self.timer(), self.duration)
+        window = int(window)
+        with self.lock:
+            left = self.get_budget(window)
+            if left > 0:
+                self.store(window, left - 1)
+        if left == 0:
+            left = self.lease(f"{self.key}:{window}")
+            with self.lock:
+                # Requests of the same user may have leased meanwhile
+                left += max(0, self.get_budget(window))
+                # -1 marks the window as spent for the whole deployment
+                self.store(window, left - 1 if left > 0 else -1)
+
+        return left > 0 or self.throttle_failure()
+
+    def get_budget(self, window: int) -> int:
+        """Return the requests left in the local budget of the user for a
+        window, 0 when a lease is needed and -1 when the window is spent.
+
+        Must be called with the lock held.
+
+        """
+        lease_window, left = self.leases.get(self.key, (window, 0))
+        return left if lease_window == window else 0
+
+    def get_lease_size(self) -> int:
+        """Return the number of requests leased at once.
+
+        Returns:
+            int: A tenth of the rate, between 1 and the configured lease
+            size.
+
+        """
+        return max(1, min(conf.config.throttle_lease_size, self.num_requests // 10))
+
+    def lease(self, key: str) -> int:
+        """Lease a batch of requests from the shared counter of a window.
+
+        Args:
+            key (str): The cache key of the window.
+
+        Returns:
+            int: The requests leased, fewer than asked when the window is
+            almost spent, and 0 once it is spent.
+
+        """
+        size = self.get_lease_size()
+        try:
+            total = self.cache.incr(key, size)
+        except ValueError:
+            if self.cache.add(key, size, self.duration):
+                total = size
+            else:
+                total = self.cache.incr(key, size)
+
+        return max(0, min(size, self.num_requests - (total - size)))
+
+    def store(self, window: int, left: int) -> None:
+        """Keep the local budget of the user, dropping the budgets of past
+        windows when there are too many."""
+        if len(self.leases) >= self.max_leases:
+            for key in [
+                key
+                for key, (lease_window, _left) in self.leases.items()
+                if lease_window < window
+            ]:
+                del self.leases[key]
+
+        self.leases[self.key] = (window, left)
+
+    def wait(self) -> Optional[float]:
+        """Return the number of seconds until the window ends.
+
+        Returns:
+            Optional[float]: The time until the shared counter resets.
+
+        """
+        return self.duration - self.elapsed
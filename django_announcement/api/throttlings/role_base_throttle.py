@@ -1,3 +1,5 @@
+from typing import Any
+
 from rest_framework.request import Request
 from rest_framework.throttling import UserRateThrottle
 from rest_framework.views import APIView
@@ -66,13 +68,21 @@ class RoleBasedUserRateThrottle(UserRateThrottle):
             bool: True if the request is allowed based on the user's rate limit; False otherwise.
 
         """
-        user = request.user
+        self.apply_user_rate(request.user)
+
+        return super().allow_request(request, view)
 
+    def apply_user_rate(self, user: Any) -> None:
+        """Set the rate, number of requests and duration for the role of a
+        user.
+
+        Args:
+            user (Any): The user making the request.
+
+        """
         # Apply staff rate for staff users
         if user.is_staff:
             self.rate = self.staff_rate
 
         # Parse rate to get number of requests and duration
         self.num_requests, self.duration = self.parse_rate(self.rate)
-
-        return super().allow_request(request, view)
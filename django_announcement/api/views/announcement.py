@@ -1,19 +1,30 @@
-from typing import List, Type
+from functools import cached_property
+from typing import Any, List, Optional, Sequence, Type
 
 from django.db.models import QuerySet
-from rest_framework.filters import OrderingFilter, SearchFilter
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 from rest_framework.serializers import Serializer
 from rest_framework.viewsets import GenericViewSet
 
+from django_announcement.api.filters.search_filter import AnnouncementSearchFilter
 from django_announcement.api.serializers.announcement import (
     AnnouncementSerializer,
     SimpleAnnouncementSerializer,
 )
+from django_announcement.api.serializers.base import get_serializer_relations
+from django_announcement.api.serializers.row import RowSerializer
+from django_announcement.mixins.conditional_request import ConditionalRequestMixin
 from django_announcement.mixins.config_api_attrs import ConfigureAttrsMixin
 from django_announcement.mixins.control_api_methods import ControlAPIMethodsMixin
+from django_announcement.mixins.delta_sync import DeltaSyncMixin
+from django_announcement.mixins.list_response_cache import ListResponseCacheMixin
+from django_announcement.mixins.read_state import ReadStateMixin
 from django_announcement.models.announcement import Announcement
 from django_announcement.settings.conf import config
+from django_announcement.utils.cache import get_user_audience_ids
 
 try:
     from django_filters.rest_framework import DjangoFilterBackend
@@ -25,6 +36,10 @@ except ImportError:  # pragma: no cover
 
 class AnnouncementViewSet(
     GenericViewSet,
+    ConditionalRequestMixin,
+    ListResponseCacheMixin,
+    DeltaSyncMixin,
+    ReadStateMixin,
     ListModelMixin,
     RetrieveModelMixin,
     ControlAPIMethodsMixin,
@@ -43,11 +58,27 @@ class AnnouncementViewSet(
     - Dynamic Serializer: Depending on the user's role or configuration, selects between
       `AnnouncementSerializer` for detailed information and `SimpleAnnouncementSerializer` for basic announcement data.
     - Filtering and Searching: Supports filtering, searching, and ordering through Django filters
-      (`DjangoFilterBackend`, `SearchFilter`, `OrderingFilter`) if `django-filter` is installed
+      (`DjangoFilterBackend`, `AnnouncementSearchFilter`, `OrderingFilter`) if `django-filter` is installed.
+      When a search backend is configured, searches use its full-text index and are ranked by relevance.
+    - Conditional Requests: When enabled, answers `If-None-Match`/`If-Modified-Since` with
+      `304 Not Modified` before any serialization (see `ConditionalRequestMixin`).
+    - List Response Cache: When enabled, list responses are shared between users belonging
+      to the same audiences (see `ListResponseCacheMixin`).
+    - Sparse Fieldsets: `?fields=id,title,published_at` narrows the representation and loads
+      only the columns and relations of the requested fields.
+    - Fast Path: When enabled, lists are fetched as lightweight rows and serialized by
+      `RowSerializer`, producing the same JSON without instantiating models.
+    - Delta Sync: When the change log is enabled, `changes` returns the announcements changed
+      since a cursor, with the ids of removed ones as tombstones (see `DeltaSyncMixin`).
+    - Read State: When enabled, `mark-read` records the announcements read by the user and
+      `unread-count` counts the others (see `ReadStateMixin`).
 
     Methods:
     - `GET /announcements/`: List announcements.
     - `GET /announcements/<id>/`: Retrieve detailed information about a specific announcement.
+    - `GET /announcements/changes/?since=<cursor>`: List the changes since a cursor.
+    - `POST /announcements/mark-read/`: Mark announcements as read.
+    - `GET /announcements/unread-count/`: Count the unread announcements.
 
     Permissions:
     - Only authenticated users with proper permissions can interact with announcements.
@@ -57,14 +88,28 @@ class AnnouncementViewSet(
     filter_backends: List = [
         *([DjangoFilterBackend] if django_filter_installed else []),
         OrderingFilter,
-        SearchFilter,
+        AnnouncementSearchFilter,
     ]
 
+    # The nested category is part of every representation
+    validator_fields: Sequence[str] = ("updated_at", "category__updated_at")
+
+    # Query parameter selecting a subset of the serializer fields
+    fields_query_param: str = "fields"
+
+    invalid_fields_message = _("Unknown fields: {fields}.")
+
+    # The audience ids of the requesting user, once resolved by `audience_ids`
+    # (or ahead of it by the async viewset)
+    resolved_audience_ids: Optional[List[int]] = None
+
     def __init__(self, *args, **kwargs) -> None:
         """Initialize the viewset and configure attributes based on settings.
 
         Disables the 'list' and 'retrieve' methods if their corresponding settings
-        (`api_allow_list` and `api_allow_retrieve`) are set to `False`.
+        (`api_allow_list` and `api_allow_retrieve`) are set to `False`, and the
+        'changes' method unless the change log is enabled, and the read state
+        methods unless read states are enabled.
 
         """
         super().__init__(*args, **kwargs)
@@ -78,6 +123,13 @@ class AnnouncementViewSet(
         if not config.api_allow_retrieve:
             self.disable_methods(["RETRIEVE"])
 
+        # The delta sync reads the change log, which is only kept when enabled
+        if not self.change_log_enabled():
+            self.disable_methods(["CHANGES"])
+
+        if not self.read_state_enabled():
+            self.disable_methods(["MARK_READ", "UNREAD_COUNT"])
+
     def get_serializer_class(self) -> Type[Serializer]:
         """Get the appropriate serializer class based on the user's role and
         configuration.
@@ -91,6 +143,133 @@ class AnnouncementViewSet(
 
         return SimpleAnnouncementSerializer
 
+    @cached_property
+    def requested_fields(self) -> Optional[List[str]]:
+        """The fields requested with ``?fields=``, parsed once per request.
+
+        Returns:
+            Optional[List[str]]: The requested field names, or None to
+            represent every field of the serializer.
+
+        Raises:
+            ValidationError: If a requested field is not a field of the
+                serializer.
+
+        """
+        value = self.request.query_params.get(self.fields_query_param)
+        if not value:
+            return None
+
+        fields = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = sorted(set(fields) - set(self.get_serializer_class().Meta.fields))
+        if unknown:
+            raise ValidationError(
+                {
+                    self.fields_query_param: [
+                        self.invalid_fields_message.format(fields=", ".join(unknown))
+                    ]
+                }
+            )
+
+        return fields
+
+    def use_fast_path(self) -> bool:
+        """Return whether lists are serialized from rows.
+
+        Returns:
+            bool: True when the serializer fast path is enabled.
+
+        """
+        return config.use_serializer_fast_path
+
+    def as_rows(self, queryset: QuerySet) -> QuerySet:
+        """Switch a filtered announcement queryset to lightweight rows
+        carrying every column the serializer of the request reads.
+
+        Args:
+            queryset (QuerySet): The filtered announcements.
+
+        Returns:
+            QuerySet: The same announcements, yielded as rows.
+
+        """
+        return queryset.as_rows(
+            with_audience=RowSerializer.requires_audience(
+                self.get_serializer_class(), self.requested_fields
+            ),
+            fields=self.requested_fields,
+        )
+
+    def paginate_queryset(self, queryset: QuerySet) -> Optional[List[Any]]:
+        """Paginate the announcements, fetching rows instead of model
+        instances on the fast path."""
+        if self.use_fast_path():
+            queryset = self.as_rows(queryset)
+
+        return super().paginate_queryset(queryset)
+
+    def get_serializer(self, *args: Any, **kwargs: Any) -> Any:
+        """Return a `RowSerializer` for lists on the fast path, and the
+        regular serializer otherwise, narrowed to the requested fields."""
+        if self.requested_fields is not None:
+            kwargs["fields"] = self.requested_fields
+
+        if not (kwargs.get("many") and self.use_fast_path()):
+            return super().get_serializer(*args, **kwargs)
+
+        rows = args[0] if args else kwargs["instance"]
+        if isinstance(rows, QuerySet):
+            # Unpaginated lists hand over the model queryset
+            rows = self.as_rows(rows)
+
+        return RowSerializer(
+            rows,
+            serializer_class=self.get_serializer_class(),
+            context=self.get_serializer_context(),
+            fields=kwargs.get("fields"),
+        )
+
+    def get_etag_context(self) -> List[str]:
+        """Extend the ETag with the audience set of non-staff users, since
+        it decides which announcements they can see.
+
+        Returns:
+            List[str]: The parts hashed into the ETag.
+
+        """
+        context = super().get_etag_context()
+        if self.request.user.is_staff:
+            return [*context, "staff"]
+
+        return [*context, ",".join(map(str, self.audience_ids))]
+
+    def get_list_cache_context(self) -> List[str]:
+        """Key cached lists by the audience set of non-staff users, so users
+        with the same audiences share their responses.
+
+        Returns:
+            List[str]: The parts hashed into the cache key.
+
+        """
+        if self.request.user.is_staff:
+            return ["staff"]
+
+        return [",".join(map(str, self.audience_ids))]
+
+    @property
+    def audience_ids(self) -> List[int]:
+        """The audience ids of the requesting user, resolved once per
+        request into `resolved_audience_ids`.
+
+        Returns:
+            List[int]: The sorted audience ids of the user.
+
+        """
+        if self.resolved_audience_ids is None:
+            self.resolved_audience_ids = get_user_audience_ids(self.request.user.pk)
+
+        return self.resolved_audience_ids
+
     def get_staff_queryset(self) -> QuerySet:
         """Get the queryset for staff users. Staff users can view all
         announcements with full details.
@@ -101,8 +280,8 @@ class AnnouncementViewSet(
         """
         return Announcement.objects.all()
 
-    def get_queryset(self) -> QuerySet:
-        """Get the queryset of available announcements based on user's
+    def get_visible_queryset(self) -> QuerySet:
+        """Get the announcements the user can see, based on the user's
         audiences.
 
         Returns:
@@ -112,7 +291,48 @@ class AnnouncementViewSet(
         if self.request.user.is_staff:
             return self.get_staff_queryset()
 
-        user_audiences = self.request.user.announcement_profile.audiences.values_list(
-            "id", flat=True
+        if config.materialized_feed_enabled:
+            return Announcement.objects.active().get_by_feed(self.request.user)
+
+        return Announcement.objects.active().get_by_audience(self.audience_ids)
+
+    def get_queryset(self) -> QuerySet:
+        """Get the queryset of available announcements based on user's
+        audiences, loading only the requested fields.
+
+        Returns:
+            QuerySet: A queryset of announcements suitable for the current user.
+
+        """
+        return self.narrow_queryset(self.get_visible_queryset())
+
+    def narrow_queryset(self, queryset: QuerySet) -> QuerySet:
+        """Restrict the loaded relations to those rendered by the chosen
+        serializer, and the loaded columns to the requested fields.
+
+        Retrieves answering conditional requests also load the validator
+        fields, which their ETag is computed from.
+
+        Args:
+            queryset (QuerySet): The announcements of the user.
+
+        Returns:
+            QuerySet: The narrowed queryset.
+
+        """
+        validator_fields = []
+        if self.action == "retrieve" and self.conditional_requests_enabled():
+            validator_fields = [name.split("__") for name in self.validator_fields]
+
+        fields = self.requested_fields
+        if fields is not None:
+            return queryset.only_fields(
+                [*fields, *(lookup[0] for lookup in validator_fields)]
+            )
+
+        return queryset.with_relations(
+            [
+                *get_serializer_relations(self.get_serializer_class()),
+                *(lookup[0] for lookup in validator_fields if len(lookup) > 1),
+            ]
         )
-        return Announcement.objects.active().get_by_audience(user_audiences)
@@ -0,0 +1,159 @@
+import json
+from typing import Any, AsyncIterator, List, Optional
+
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from django_announcement.api.renderers import EventStreamRenderer
+from django_announcement.mixins.config_api_attrs import ConfigureAttrsMixin
+from django_announcement.mixins.control_api_methods import ControlAPIMethodsMixin
+from django_announcement.settings.conf import config
+from django_announcement.streaming import get_event_hub
+from django_announcement.streaming.brokers import MEMBERSHIP_EVENT, Event
+from django_announcement.streaming.hub import (
+    AnnouncementEventHub,
+    EventKey,
+    format_event_id,
+    get_event_key,
+    parse_event_id,
+)
+from django_announcement.utils.cache import (
+    aget_user_audience_ids,
+    get_user_audience_ids,
+)
+
+# Comment sent when a stream opens, flushing the response headers
+CONNECTED = ": connected\n\n"
+# Comment sent while idle, keeping proxies from closing the connection
+KEEPALIVE = ": keepalive\n\n"
+
+
+def format_event(event: Event) -> str:
+    """Format an announcement event as a Server-Sent Event.
+
+    Args:
+        event (Event): The announcement event.
+
+    Returns:
+        str: The ``announcement`` event carrying the announcement id, whose
+        id is the position of the event in the streams.
+
+    """
+    data = json.dumps({"id": event["id"]})
+    event_id = format_event_id(get_event_key(event))
+    return f"id: {event_id}\nevent: announcement\ndata: {data}\n\n"
+
+
+class StreamRequiresASGI(APIException):
+    """Raised when a stream is requested from a WSGI server, where it would
+    hold a worker thread for as long as it stays open."""
+
+    status_code = status.HTTP_501_NOT_IMPLEMENTED
+    default_detail = _("Announcement streams are only served by ASGI servers.")
+    default_code = "stream_requires_asgi"
+
+
+class AnnouncementStreamView(APIView, ControlAPIMethodsMixin, ConfigureAttrsMixin):
+    """Server-Sent Events stream of the announcements becoming active for
+    the requesting user.
+
+    The stream pushes an ``announcement`` event with the id of every
+    announcement of the user's audiences as soon as it becomes active:
+    when it is created for (or added to) one of the audiences, or when its
+    ``published_at`` comes. Staff users receive the announcements of all
+    audiences. Clients open the stream, then fetch the list once, and
+    retrieve each announcement pushed afterwards, instead of polling.
+
+    The connection passes the authentication, permission and throttle
+    classes of the announcement API once, when it opens. The audiences of
+    the user are resolved then, and again whenever the memberships of the
+    user change. Clients reconnecting with ``Last-Event-ID`` are first sent
+    the events they missed, among those kept by the hub of the process.
+
+    Streams are served from the event loop of ASGI servers only: under
+    WSGI, each open stream would hold a worker thread, so the request is
+    answered with ``501 Not Implemented``.
+
+    Methods:
+    - `GET /announcements/stream/`: Open the stream.
+
+    """
+
+    renderer_classes: List = [EventStreamRenderer, JSONRenderer]
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the view, disabling it unless
+        `config.stream_enabled`."""
+        super().__init__(*args, **kwargs)
+        self.configure_attrs()
+
+        if not config.stream_enabled:
+            self.disable_methods(["GET"])
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> StreamingHttpResponse:
+        if not isinstance(request._request, ASGIRequest):
+            raise StreamRequiresASGI()
+
+        user_id = None if request.user.is_staff else request.user.pk
+        audience_ids = None if user_id is None else get_user_audience_ids(user_id)
+        hub = get_event_hub()
+        hub.start()
+
+        events = self.astream(
+            hub,
+            user_id,
+            audience_ids,
+            parse_event_id(request.META.get("HTTP_LAST_EVENT_ID")),
+        )
+        response = StreamingHttpResponse(events, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Keep reverse proxies such as nginx from buffering the events
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def astream(
+        self,
+        hub: AnnouncementEventHub,
+        user_id: Optional[int],
+        audience_ids: Optional[List[int]],
+        last_event_key: Optional[EventKey],
+    ) -> AsyncIterator[str]:
+        """Write the events of a subscription from the event loop.
+
+        Args:
+            hub (AnnouncementEventHub): The event hub of the process.
+            user_id (Optional[int]): The user, or None for staff streams,
+                which receive the events of all audiences.
+            audience_ids (Optional[List[int]]): The audiences of the user.
+            last_event_key (Optional[EventKey]): The position of the last
+                event received by a reconnecting client.
+
+        """
+        subscription = hub.subscribe(
+            audience_ids,
+            asynchronous=True,
+            user_id=user_id,
+            last_event_key=last_event_key,
+        )
+        try:
+            yield CONNECTED
+            while True:
+                event = await subscription.get(config.stream_heartbeat_interval)
+                if event is None:
+                    yield KEEPALIVE
+                elif event.get("type") == MEMBERSHIP_EVENT:
+                    hub.update_audiences(
+                        subscription,
+                        await aget_user_audience_ids(user_id),
+                        since=event["delivery"],
+                    )
+                else:
+                    yield format_event(event)
+        finally:
+            hub.unsubscribe(subscription)
@@ -0,0 +1,240 @@
+import asyncio
+from functools import wraps
+from typing import Any, Callable, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import NotSupportedError
+from django.db.models import Model, QuerySet
+from django.http import Http404, HttpRequest
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from django_announcement.api.views.announcement import AnnouncementViewSet
+from django_announcement.utils.cache import (
+    aget_user_audience_ids,
+    get_cached_list_response,
+    set_cached_list_response,
+)
+from django_announcement.utils.cache.list_responses import MISSING
+
+
+class AsyncAnnouncementViewSet(AnnouncementViewSet):
+    """Asynchronous variant of `AnnouncementViewSet` for ASGI deployments.
+
+    The list and retrieve actions are coroutines reading the database with
+    the async ORM interface (``acount``, ``aaggregate``, ``aget`` and async
+    iteration), so a worker serves other requests while queries run. They
+    reuse the querysets, filters, pagination, serializers, conditional
+    requests and list response cache of `AnnouncementViewSet`.
+
+    DRF's authentication, permission, throttling and filter backends are
+    synchronous, so they run in a thread with ``sync_to_async``. Paginators
+    without an ``apaginate_queryset`` coroutine are run the same way.
+
+    """
+
+    # Rows fetched per round trip when listing without pagination
+    chunk_size: int = 2000
+
+    @classmethod
+    def as_view(cls, actions: Optional[dict] = None, **initkwargs: Any) -> Callable:
+        """Return a coroutine function serving the actions, so Django runs
+        the view in the event loop."""
+        view = super().as_view(actions, **initkwargs)
+
+        @wraps(view)
+        async def async_view(request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+            return await view(request, *args, **kwargs)
+
+        return async_view
+
+    async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        """Asynchronous version of ``APIView.dispatch``, awaiting the
+        handler of the action."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            if not asyncio.iscoroutinefunction(handler):
+                # Synchronous actions, such as ``changes``, run in a thread
+                handler = sync_to_async(handler)
+
+            response = await handler(request, *args, **kwargs)
+
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def aget_queryset(self) -> QuerySet:
+        """Resolve the audiences of non-staff users with the async cache and
+        ORM, then build the filtered queryset of the request.
+
+        Returns:
+            QuerySet: The filtered announcements of the user.
+
+        """
+        if not self.request.user.is_staff and self.resolved_audience_ids is None:
+            self.resolved_audience_ids = await aget_user_audience_ids(
+                self.request.user.pk
+            )
+
+        return await sync_to_async(self.filter_queryset)(self.get_queryset())
+
+    async def apaginate_queryset(self, queryset: QuerySet) -> Optional[List[Any]]:
+        """Asynchronous version of `paginate_queryset`.
+
+        Args:
+            queryset (QuerySet): The filtered announcements.
+
+        Returns:
+            Optional[List[Any]]: The page, or None without pagination.
+
+        """
+        if self.paginator is None:
+            return None
+
+        if self.use_fast_path():
+            queryset = self.as_rows(queryset)
+
+        apaginate = getattr(self.paginator, "apaginate_queryset", None)
+        if apaginate is None:
+            return await sync_to_async(self.paginator.paginate_queryset)(
+                queryset, self.request, view=self
+            )
+
+        return await apaginate(queryset, self.request, view=self)
+
+    async def aget_object(self) -> Model:
+        """Asynchronous version of ``get_object``.
+
+        Returns:
+            Model: The announcement looked up by the URL.
+
+        Raises:
+            Http404: If the announcement is not visible to the user.
+
+        """
+        queryset = await self.aget_queryset()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+
+        try:
+            instance = await queryset.aget(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        except (
+            queryset.model.DoesNotExist,
+            DjangoValidationError,
+            TypeError,
+            ValueError,
+        ) as exc:
+            raise Http404 from exc
+
+        await sync_to_async(self.check_object_permissions)(self.request, instance)
+        return instance
+
+    async def alist_response(self, queryset: QuerySet) -> Response:
+        """Serialize the page (or all) of the filtered announcements.
+
+        Args:
+            queryset (QuerySet): The filtered announcements.
+
+        Returns:
+            Response: The list response.
+
+        """
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            return self.paginator.get_paginated_response(
+                self.get_serializer(page, many=True).data
+            )
+
+        if self.use_fast_path():
+            queryset = self.as_rows(queryset)
+
+        try:
+            instances = [
+                instance async for instance in queryset.aiterator(self.chunk_size)
+            ]
+        except NotSupportedError:
+            # Django < 5.0 can not prefetch while iterating asynchronously, as
+            # the full-details serializer needs for the audiences
+            instances = await sync_to_async(list)(queryset)
+
+        return Response(self.get_serializer(instances, many=True).data)
+
+    async def acached_list_response(self, queryset: QuerySet) -> Response:
+        """Serve the list from the list response cache, or produce and
+        cache it.
+
+        Args:
+            queryset (QuerySet): The filtered announcements.
+
+        Returns:
+            Response: The list response.
+
+        """
+        key = await sync_to_async(self.get_list_cache_key)()
+        data = await sync_to_async(get_cached_list_response)(key)
+        if data is not MISSING:
+            return Response(data)
+
+        response = await self.alist_response(queryset)
+        if response.status_code == 200:
+            await sync_to_async(set_cached_list_response)(key, response.data)
+
+        return response
+
+    async def list(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        """List the announcements, answering ``304`` and serving cached
+        lists like the synchronous viewset."""
+        queryset = await self.aget_queryset()
+
+        etag, last_modified = None, None
+        if self.conditional_requests_enabled():
+            etag, last_modified = await self.aget_list_validators(queryset)
+            not_modified = self.get_not_modified_response(
+                etag, last_modified, use_last_modified=False
+            )
+            if not_modified is not None:
+                return not_modified
+
+        if self.list_response_cache_enabled():
+            response = await self.acached_list_response(queryset)
+        else:
+            response = await self.alist_response(queryset)
+
+        if etag is not None:
+            self.set_validator_headers(response, etag, last_modified)
+
+        return response
+
+    async def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        """Retrieve an announcement, answering ``304`` when the client's
+        copy is still current."""
+        instance = await self.aget_object()
+        if not self.conditional_requests_enabled():
+            return Response(self.get_serializer(instance).data)
+
+        etag, last_modified = self.get_object_validators(instance)
+        not_modified = self.get_not_modified_response(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = Response(self.get_serializer(instance).data)
+        self.set_validator_headers(response, etag, last_modified)
+        return response
@@ -18,7 +18,41 @@ class DjangoAnnouncementConfig(AppConfig):
 
         In this case, it imports the settings checks from the
         `django_announcement.settings` module to validate the configuration
-        settings for notifications.
+        settings for notifications, and connects the signal receivers that
+        keep derived data up to date. The materialized feed, audience
+        cache and list response cache receivers are only connected when their feature is enabled,
+        so deletions keep using Django's fast-delete path otherwise. The
+        search index receivers are only connected for search backends whose
+        index is not maintained by the database. The stream receivers are
+        only connected when announcement streams are enabled, the change
+        log receivers only when the change log is enabled, and the audience
+        sync receivers, hooked to the user-related models, only when the
+        live audience sync is enabled.
 
         """
+        from django_announcement import signals
+        from django_announcement.search import get_search_backend
         from django_announcement.settings import checks
+        from django_announcement.settings.conf import config
+
+        if config.materialized_feed_enabled:
+            signals.connect_feed_receivers()
+
+        if config.audience_cache_enabled:
+            signals.connect_audience_cache_receivers()
+
+        if config.list_response_cache_enabled:
+            signals.connect_list_response_cache_receivers()
+
+        search_backend = get_search_backend()
+        if search_backend is not None and search_backend.maintained_by_signals:
+            signals.connect_search_index_receivers()
+
+        if config.stream_enabled:
+            signals.connect_stream_receivers()
+
+        if config.change_log_enabled:
+            signals.connect_change_log_receivers()
+
+        if config.audience_live_sync_enabled:
+            signals.connect_audience_sync_receivers()
@@ -12,12 +12,43 @@ class DefaultAttachmentSettings:
 class DefaultCommandSettings:
     generate_audiences_exclude_apps: List[str] = field(default_factory=lambda: [])
     generate_audiences_exclude_models: List[str] = field(default_factory=lambda: [])
+    audience_live_sync_enabled: bool = False
+
+
+@dataclass(frozen=True)
+class DefaultFeedSettings:
+    materialized_feed_enabled: bool = False
+    change_log_enabled: bool = False
+    read_state_enabled: bool = False
+
+
+@dataclass(frozen=True)
+class DefaultCacheSettings:
+    cache_alias: str = "default"
+    audience_cache_enabled: bool = False
+    audience_cache_timeout: int = 300
+    list_response_cache_enabled: bool = False
+    list_response_cache_timeout: int = 60
+
+
+@dataclass(frozen=True)
+class DefaultDatabaseSettings:
+    replica_aliases: List[str] = field(default_factory=lambda: [])
+    stickiness_timeout: int = 5
+
+
+@dataclass(frozen=True)
+class DefaultStreamSettings:
+    enabled: bool = False
+    broker: str = "django_announcement.streaming.brokers.LocalBroker"
+    heartbeat_interval: int = 15
 
 
 @dataclass(frozen=True)
 class DefaultSerializerSettings:
     include_serializer_full_details: bool = False
     exclude_serializer_empty_fields: bool = False
+    use_serializer_fast_path: bool = False
 
 
 # pylint: disable=too-many-instance-attributes
@@ -40,6 +71,7 @@ class DefaultThrottleSettings:
     throttle_class: str = (
         "django_announcement.api.throttlings.RoleBasedUserRateThrottle"
     )
+    throttle_lease_size: int = 10
 
 
 @dataclass(frozen=True)
@@ -47,6 +79,8 @@ class DefaultPaginationAndFilteringSettings:
     pagination_class: str = (
         "django_announcement.api.paginations.DefaultLimitOffSetPagination"
     )
+    count_mode: str = "exact"
+    count_cap: int = 1000
     filterset_class: Optional[str] = None
     ordering_fields: List[str] = field(
         default_factory=lambda: [
@@ -60,6 +94,7 @@ class DefaultPaginationAndFilteringSettings:
     search_fields: List[str] = field(
         default_factory=lambda: ["title", "content", "category__name"]
     )
+    search_backend: Optional[str] = None
 
 
 # pylint: disable=too-many-instance-attributes
@@ -67,6 +102,8 @@ class DefaultPaginationAndFilteringSettings:
 class DefaultAPISettings:
     allow_list: bool = True
     allow_retrieve: bool = True
+    conditional_requests_enabled: bool = False
+    async_enabled: bool = False
     extra_permission_class: Optional[str] = None
     parser_classes: List[str] = field(
         default_factory=lambda: [
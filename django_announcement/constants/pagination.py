@@ -0,0 +1,6 @@
+# Count modes supported by DefaultLimitOffSetPagination
+COUNT_MODE_EXACT = "exact"
+COUNT_MODE_CAPPED = "capped"
+COUNT_MODE_NONE = "none"
+
+COUNT_MODES = (COUNT_MODE_EXACT, COUNT_MODE_CAPPED, COUNT_MODE_NONE)
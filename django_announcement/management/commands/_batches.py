@@ -0,0 +1,36 @@
+from typing import Iterator, List
+
+from django.db.models import QuerySet
+
+
+def iter_id_batches(rows: QuerySet, batch_size: int) -> Iterator[List[int]]:
+    """Yield the ids of the selected rows in ascending batches.
+
+    Each batch is read with a range query starting after the last id of
+    the previous one, so no more than one batch of ids is held, and rows
+    that keep matching, such as memberships skipped on conflict, never
+    make the walk loop.
+
+    The module name starts with an underscore so Django does not list it
+    as a management command.
+
+    Args:
+    ----
+        rows (QuerySet): The rows to walk.
+        batch_size (int): The number of ids per batch.
+
+    Yields:
+    ------
+        List[int]: The ids of a batch of rows.
+
+    """
+    ids = rows.order_by("pk").values_list("pk", flat=True)
+    last_id = None
+    while True:
+        batch = ids if last_id is None else ids.filter(pk__gt=last_id)
+        batch = list(batch[:batch_size])
+        if not batch:
+            return
+
+        yield batch
+        last_id = batch[-1]
@@ -0,0 +1,50 @@
+from typing import Dict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from django_announcement.models import UserAnnouncementFeed
+from django_announcement.settings.conf import config
+
+
+class Command(BaseCommand):
+    """A Django management command to (re)build the materialized announcement
+    feed from the current audience memberships and announcement targets.
+
+    Run it once after enabling `DJANGO_ANNOUNCEMENT_MATERIALIZED_FEED_ENABLED`
+    on an existing database; afterwards the feed is kept up to date on write.
+
+    """
+
+    help = (
+        "Build the materialized per-user announcement feed from audience memberships."
+    )
+
+    @transaction.atomic
+    def handle(self, *args: str, **kwargs: Dict[str, str]) -> None:
+        """Synchronize the whole feed, adding missing entries and removing
+        stale ones.
+
+        Args:
+        ----
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        """
+        if not config.materialized_feed_enabled:
+            self.stdout.write(
+                self.style.WARNING(
+                    "The materialized feed is disabled. Set "
+                    "'DJANGO_ANNOUNCEMENT_MATERIALIZED_FEED_ENABLED = True' "
+                    "to let the API read from it."
+                )
+            )
+
+        UserAnnouncementFeed.objects.sync()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Announcement feed is up to date "
+                f"({UserAnnouncementFeed.objects.count()} entries)."
+            )
+        )
@@ -1,12 +1,43 @@
-from typing import Dict, List
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
+import django
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from django.db.models import Q, QuerySet
-
+from django.db import IntegrityError, connections, router, transaction
+from django.db.models import (
+    AutoField,
+    DateTimeField,
+    Exists,
+    F,
+    IntegerField,
+    Max,
+    Min,
+    Model,
+    OuterRef,
+    Q,
+    QuerySet,
+    Value,
+)
+from django.utils import timezone
+
+from django_announcement.management.commands._batches import iter_id_batches
 from django_announcement.management.commands.generate_audiences import Command as cmd
-from django_announcement.models import Audience, UserAnnouncementProfile, UserAudience
-from django_announcement.utils.user_model import UserModel
+from django_announcement.models import (
+    Audience,
+    ProfileGenerationWatermark,
+    UserAnnouncementFeed,
+    UserAnnouncementProfile,
+    UserAudience,
+)
+from django_announcement.settings.conf import config
+from django_announcement.utils.cache import invalidate_all_audience_ids
+from django_announcement.utils.user_model import (
+    UserModel,
+    get_user_relation,
+    get_user_relation_filter,
+)
 
 
 class Command(BaseCommand):
@@ -14,15 +45,34 @@ class Command(BaseCommand):
     audiences using the UserAnnouncementProfile model. It ensures that users
     are associated with audiences based on user-related models.
 
+    Users are processed in batches of consecutive ids, and only ids are
+    loaded from the database, so the memory used does not grow with the
+    number of users. Each run records the highest user id and the highest
+    id of the rows of each relation, and ``--incremental`` runs only
+    process the users added since or linked by new related rows. With
+    ``--workers``, ranges of user ids are processed by a pool of
+    processes, each with its own database connection. With ``--set-based``,
+    profiles and assignments are instead created by one ``INSERT ...
+    SELECT`` statement each, run entirely in the database.
+
     Attributes:
     ----------
         PROCEED_CONFIRMATION: A set of valid user inputs for confirmation.
+        DEFAULT_BATCH_SIZE: The number of users processed per batch.
+        USERS_MARK: The name of the watermark of user ids.
+        RELATION_MARK: The name format of the watermarks of relations.
+        RANGES_PER_WORKER: The number of user id ranges per worker, so
+            workers given sparse ranges pick up more.
 
     """
 
     help = "Assign users to the dynamically created audiences using UserAnnouncementProfile model."
 
     PROCEED_CONFIRMATION = {"yes", "y"}
+    DEFAULT_BATCH_SIZE = 1000
+    USERS_MARK = "users"
+    RELATION_MARK = "relation:{}"
+    RANGES_PER_WORKER = 4
 
     def add_arguments(self, parser):
         """Add optional arguments to the command parser.
@@ -37,13 +87,37 @@ class Command(BaseCommand):
             action="store_true",
             help="Skip the confirmation prompt if no needed.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=self.DEFAULT_BATCH_SIZE,
+            help="Number of users processed per batch (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only process users and related rows added since the last run.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes assigning ranges of users (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--set-based",
+            action="store_true",
+            help="Create profiles and assignments with INSERT ... SELECT statements.",
+        )
 
-    @transaction.atomic
     def handle(self, *args: str, **kwargs: Dict[str, str]) -> None:
         """Execute the command to assign users to audiences. It checks if the
         audience generation command has been run and processes user assignments
         accordingly.
 
+        Each batch of users is committed on its own, and the watermarks are
+        recorded once every batch is committed.
+
         Args:
         ----
             *args: Additional positional arguments.
@@ -67,8 +141,18 @@ class Command(BaseCommand):
         user_related_model_keys = list(user_related_models_dict.keys())
         user_related_model_values = list(user_related_models_dict.values())
 
-        related_users = self._get_related_users(user_related_model_values)
-        if not related_users:
+        # Taken first, so rows added while the command runs are seen next time
+        marks = self._get_high_water_marks(user_related_model_values)
+        previous_marks = (
+            ProfileGenerationWatermark.objects.marks()
+            if kwargs.get("incremental")
+            else None
+        )
+
+        related_users = self._get_users_to_process(
+            user_related_model_values, previous_marks
+        )
+        if not related_users.exists():
             self.stdout.write(
                 self.style.WARNING("No users found related to the provided models.")
             )
@@ -83,15 +167,45 @@ class Command(BaseCommand):
             )
             return
 
-        self._create_user_profiles(related_users)
-
-        audience_assignments = self._build_audience_assignments(
-            user_related_model_keys,
-            user_related_model_values,
-            related_users,
-            audiences_mapping,
-        )
-        self._bulk_assign_audiences(audience_assignments)
+        options = {
+            "user_related_model_keys": user_related_model_keys,
+            "user_related_model_values": user_related_model_values,
+            "audiences_mapping": audiences_mapping,
+            "marks": previous_marks,
+            "batch_size": kwargs.get("batch_size") or self.DEFAULT_BATCH_SIZE,
+        }
+        workers = kwargs.get("workers") or 1
+        if kwargs.get("set_based"):
+            assigned = self._assign_users_in_database(
+                user_related_model_keys,
+                user_related_model_values,
+                audiences_mapping,
+                previous_marks,
+            )
+        elif workers > 1 and isinstance(UserModel._meta.pk, IntegerField):
+            assigned = self._assign_in_workers(related_users, options, workers)
+        else:
+            assigned = self._assign_users(**options)
+
+        with transaction.atomic():
+            if assigned:
+                transaction.on_commit(invalidate_all_audience_ids)
+
+            # Relations without an audience are not processed, so keep no mark
+            processed_marks = {self.USERS_MARK} | {
+                self.RELATION_MARK.format(rel_name)
+                for model_key, rel_name in zip(
+                    user_related_model_keys, user_related_model_values
+                )
+                if model_key._meta.verbose_name.title() in audiences_mapping
+            }
+            ProfileGenerationWatermark.objects.store(
+                {
+                    name: value
+                    for name, value in marks.items()
+                    if name in processed_marks
+                }
+            )
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -99,6 +213,246 @@ class Command(BaseCommand):
             )
         )
 
+    def _assign_users(
+        self,
+        user_related_model_keys: List[str],
+        user_related_model_values: List[str],
+        audiences_mapping: Dict[str, Audience],
+        marks: Optional[Dict[str, int]],
+        batch_size: int,
+        bounds: Optional[Tuple[int, int]] = None,
+    ) -> bool:
+        """Create the missing profiles and audience assignments of the users
+        to process, committing each batch.
+
+        Args:
+        ----
+            user_related_model_keys (List[str]): A list of keys for user-related models.
+            user_related_model_values (List[str]): A list of values for user-related models.
+            audiences_mapping (Dict[str, Audience]): A mapping of audience names to Audience objects.
+            marks (Optional[Dict[str, int]]): The marks of the last run, or None to process every user.
+            batch_size (int): The number of users processed per batch.
+            bounds (Optional[Tuple[int, int]]): The ids after which and up to which to process users, or None for all.
+
+        Returns:
+        -------
+            bool: True if any assignment was created.
+
+        """
+        related_users = self._get_users_to_process(user_related_model_values, marks)
+        if bounds is not None:
+            related_users = related_users.filter(pk__gt=bounds[0], pk__lte=bounds[1])
+
+        assigned = False
+        for user_ids in iter_id_batches(related_users, batch_size):
+            with transaction.atomic():
+                self._create_user_profiles(user_ids, batch_size)
+
+                audience_assignments = self._build_audience_assignments(
+                    user_related_model_keys,
+                    user_related_model_values,
+                    user_ids,
+                    audiences_mapping,
+                )
+                assigned |= self._bulk_assign_audiences(
+                    audience_assignments, batch_size
+                )
+
+        return assigned
+
+    def _assign_in_workers(
+        self, related_users: QuerySet, options: Dict[str, Any], workers: int
+    ) -> bool:
+        """Split the user ids into ranges assigned by a pool of processes.
+
+        Workers are forked where possible and open their own database
+        connections. Ranges never overlap, and concurrent inserts of the
+        same rows are absorbed by ``ignore_conflicts``.
+
+        Args:
+        ----
+            related_users (QuerySet): A QuerySet of the users to process.
+            options (Dict[str, Any]): The arguments of `_assign_users`.
+            workers (int): The number of processes.
+
+        Returns:
+        -------
+            bool: True if any assignment was created.
+
+        """
+        ranges = self._get_user_id_ranges(
+            related_users, workers * self.RANGES_PER_WORKER
+        )
+
+        # Forked workers must not share the connections of this process
+        connections.close_all()
+        context = (
+            multiprocessing.get_context("fork")
+            if "fork" in multiprocessing.get_all_start_methods()
+            else None
+        )
+
+        assigned = False
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=django.setup
+        ) as executor:
+            for range_assigned in executor.map(
+                partial(_assign_user_range, options), ranges
+            ):
+                assigned |= range_assigned
+
+        return assigned
+
+    def _get_user_id_ranges(
+        self, related_users: QuerySet, parts: int
+    ) -> List[Tuple[int, int]]:
+        """Split the ids of the users to process into ranges of equal span.
+
+        Args:
+        ----
+            related_users (QuerySet): A QuerySet of the users to process.
+            parts (int): The number of ranges.
+
+        Returns:
+        -------
+            List[Tuple[int, int]]: The ids after which and up to which each
+            range goes.
+
+        """
+        bounds = related_users.aggregate(low=Min("pk"), high=Max("pk"))
+        low, high = bounds["low"] - 1, bounds["high"]
+        step = -(-(high - low) // parts)
+
+        return [(start, min(start + step, high)) for start in range(low, high, step)]
+
+    def _assign_users_in_database(
+        self,
+        user_related_model_keys: List[str],
+        user_related_model_values: List[str],
+        audiences_mapping: Dict[str, Audience],
+        marks: Optional[Dict[str, int]],
+    ) -> bool:
+        """Create the missing profiles, then the missing assignments of each
+        relation, with one ``INSERT ... SELECT`` statement each.
+
+        Args:
+        ----
+            user_related_model_keys (List[str]): A list of keys for user-related models.
+            user_related_model_values (List[str]): A list of values for user-related models.
+            audiences_mapping (Dict[str, Audience]): A mapping of audience names to Audience objects.
+            marks (Optional[Dict[str, int]]): The marks of the last run, or None to process every user.
+
+        Returns:
+        -------
+            bool: True if any assignment was created.
+
+        """
+        related_users = self._get_users_to_process(user_related_model_values, marks)
+        now = Value(timezone.now(), output_field=DateTimeField())
+        assigned = 0
+
+        with transaction.atomic():
+            if config.materialized_feed_enabled:
+                # Assignments above it are those of this run, or concurrent ones
+                last_assignment_id = (
+                    UserAudience.objects.aggregate(last_id=Max("pk"))["last_id"] or 0
+                )
+
+            self._insert_from_select(
+                UserAnnouncementProfile,
+                related_users.exclude(
+                    Exists(UserAnnouncementProfile.objects.filter(user=OuterRef("pk")))
+                ),
+                {"user": F("pk"), "created_at": now, "updated_at": now},
+            )
+
+            for model_key, rel_name in zip(
+                user_related_model_keys, user_related_model_values
+            ):
+                audience = audiences_mapping.get(model_key._meta.verbose_name.title())
+                if audience is None:
+                    continue
+
+                profiles = UserAnnouncementProfile.objects.filter(
+                    get_user_relation_filter(rel_name, user_path="user__")
+                ).exclude(
+                    Exists(
+                        UserAudience.objects.filter(
+                            user_announce_profile=OuterRef("pk"), audience=audience
+                        )
+                    )
+                )
+                if marks is not None:
+                    profiles = profiles.filter(user__in=related_users.values("pk"))
+
+                assigned += self._insert_from_select(
+                    UserAudience,
+                    profiles,
+                    {
+                        "user_announce_profile": F("pk"),
+                        "audience": Value(audience.id),
+                        "created_at": now,
+                        "updated_at": now,
+                    },
+                )
+
+            if assigned and config.materialized_feed_enabled:
+                UserAnnouncementFeed.objects.fill(
+                    profile_ids=UserAudience.objects.filter(
+                        pk__gt=last_assignment_id
+                    ).values("user_announce_profile_id")
+                )
+
+        return bool(assigned)
+
+    def _insert_from_select(
+        self, model: Model, queryset: QuerySet, values: Dict[str, Any]
+    ) -> int:
+        """Insert a row for each row of a queryset in a single standard
+        ``INSERT ... SELECT`` statement.
+
+        The queryset excludes the rows that already exist. When a
+        concurrent transaction commits one of them first, the statement
+        fails on the unique constraint and is run once more, leaving that
+        row out, which skips conflicts like
+        ``bulk_create(ignore_conflicts=True)``.
+
+        Args:
+        ----
+            model (Model): The model to insert rows of.
+            queryset (QuerySet): The rows to select, without existing ones.
+            values (Dict[str, Any]): The expressions, over the selected
+                rows, of the fields of the inserted rows.
+
+        Returns:
+        -------
+            int: The number of inserted rows.
+
+        """
+        aliases = {f"insert_{name}": expression for name, expression in values.items()}
+        select = queryset.annotate(**aliases).order_by().values_list(*aliases)
+
+        using = router.db_for_write(model)
+        connection = connections[using]
+        select_sql, params = select.query.get_compiler(connection=connection).as_sql()
+        columns = ", ".join(
+            connection.ops.quote_name(model._meta.get_field(name).column)
+            for name in values
+        )
+        sql = (
+            f"INSERT INTO {connection.ops.quote_name(model._meta.db_table)} "
+            f"({columns}) {select_sql}"
+        )
+
+        for attempt in range(2):
+            try:
+                with transaction.atomic(using=using), connection.cursor() as cursor:
+                    cursor.execute(sql, params)
+                    return cursor.rowcount
+            except IntegrityError:
+                if attempt:
+                    raise
+
     def _check_audience_generation(self) -> bool:
         """Check if the 'generate_audiences' command has been run.
 
@@ -167,26 +521,120 @@ class Command(BaseCommand):
         """
         user_filter = Q()
         for rel_name in user_related_model_values:
-            user_filter |= Q(**{f"{rel_name}__isnull": False})
+            user_filter |= get_user_relation_filter(rel_name)
+
+        return UserModel.objects.filter(user_filter)
+
+    def _get_users_to_process(
+        self, user_related_model_values: List[str], marks: Optional[Dict[str, int]]
+    ) -> QuerySet:
+        """Fetch the related users, only keeping the new ones when marks are
+        given.
+
+        Args:
+        ----
+            user_related_model_values (List[str]): A list of values for user-related models.
+            marks (Optional[Dict[str, int]]): The marks of the last run, or None.
+
+        Returns:
+        -------
+            QuerySet: A QuerySet of the users to process.
+
+        """
+        related_users = self._get_related_users(user_related_model_values)
+        if marks is None:
+            return related_users
+
+        return related_users.filter(
+            self._get_new_users_filter(user_related_model_values, marks)
+        )
+
+    def _get_high_water_marks(
+        self, user_related_model_values: List[str]
+    ) -> Dict[str, int]:
+        """Return the highest user id and the highest row id of each
+        relation.
+
+        Args:
+        ----
+            user_related_model_values (List[str]): A list of values for user-related models.
+
+        Returns:
+        -------
+            Dict[str, int]: The marks by name, without those of tables whose
+            ids do not grow monotonically.
+
+        """
+        marks = {}
+        if isinstance(UserModel._meta.pk, AutoField):
+            marks[self.USERS_MARK] = (
+                UserModel.objects.aggregate(mark=Max("pk"))["mark"] or 0
+            )
+
+        for rel_name in user_related_model_values:
+            model, _user_fk = get_user_relation(rel_name)
+            if isinstance(model._meta.pk, AutoField):
+                marks[self.RELATION_MARK.format(rel_name)] = (
+                    model._default_manager.aggregate(mark=Max("pk"))["mark"] or 0
+                )
 
-        return UserModel.objects.filter(user_filter).distinct()
+        return marks
 
-    def _create_user_profiles(self, related_users: QuerySet) -> None:
+    def _get_new_users_filter(
+        self, user_related_model_values: List[str], marks: Dict[str, int]
+    ) -> Q:
+        """Build a filter of the users added or linked to related rows since
+        the marks were recorded.
+
+        Relations without a mark, such as those that just got an audience,
+        are processed in full.
+
+        Args:
+        ----
+            user_related_model_values (List[str]): A list of values for user-related models.
+            marks (Dict[str, int]): The marks recorded by the last run.
+
+        Returns:
+        -------
+            Q: The filter of the users to process.
+
+        """
+        if self.USERS_MARK not in marks:
+            return Q()
+
+        user_filter = Q(pk__gt=marks[self.USERS_MARK])
+        for rel_name in user_related_model_values:
+            user_filter |= get_user_relation_filter(
+                rel_name, marks.get(self.RELATION_MARK.format(rel_name))
+            )
+
+        return user_filter
+
+    def _create_user_profiles(self, user_ids: List[int], batch_size: int) -> None:
         """Create user announcement profiles for users without profiles.
 
         Args:
         ----
-            related_users QuerySet: A QuerySet of related users.
+            user_ids (List[int]): The ids of a batch of related users.
+            batch_size (int): The number of profiles inserted per query.
 
         """
-        existing_profiles = UserAnnouncementProfile.objects.filter(
-            user__in=related_users
-        ).values_list("user_id", flat=True)
-        users_without_profiles = related_users.exclude(id__in=existing_profiles)
+        existing_profiles = set(
+            UserAnnouncementProfile.objects.filter(user_id__in=user_ids).values_list(
+                "user_id", flat=True
+            )
+        )
+        users_without_profiles = [
+            user_id for user_id in user_ids if user_id not in existing_profiles
+        ]
 
         if users_without_profiles:
             UserAnnouncementProfile.objects.bulk_create(
-                [UserAnnouncementProfile(user=user) for user in users_without_profiles],
+                [
+                    UserAnnouncementProfile(user_id=user_id)
+                    for user_id in users_without_profiles
+                ],
+                batch_size=batch_size,
                 ignore_conflicts=True,
             )
 
@@ -194,16 +642,20 @@ class Command(BaseCommand):
         self,
         user_related_model_keys: List[str],
         user_related_model_values: List[str],
-        related_users: QuerySet,
+        user_ids: List[int],
         audiences_mapping: Dict[str, Audience],
     ) -> List[UserAudience]:
-        """Build a list of audience assignments for users.
+        """Build the missing audience assignments of a batch of users.
+
+        Only ids are loaded: the profile id of each user, the existing
+        assignments of the batch, and the users of the batch having each
+        related model.
 
         Args:
         ----
             user_related_model_keys (List[str]): A list of keys for user-related models.
             user_related_model_values (List[str]): A list of values for user-related models.
-            related_users (QuerySet): A QuerySet of related users.
+            user_ids (List[int]): The ids of a batch of related users.
             audiences_mapping (Dict[str, Audience]): A mapping of audience names to Audience objects.
 
         Returns:
@@ -211,51 +663,98 @@ class Command(BaseCommand):
             List[UserAudience]: A list of UserAudience assignments to be created.
 
         """
-        user_profiles = UserAnnouncementProfile.objects.filter(user__in=related_users)
-        profiles_dict = {profile.user_id: profile for profile in user_profiles}
-
-        existing_assignments = UserAudience.objects.filter(
-            user_announce_profile__in=user_profiles
-        ).values_list("user_announce_profile_id", "audience_id")
+        profiles_dict = dict(
+            UserAnnouncementProfile.objects.filter(user_id__in=user_ids).values_list(
+                "user_id", "id"
+            )
+        )
 
-        existing_assignments_set = set(existing_assignments)
+        existing_assignments_set = set(
+            UserAudience.objects.filter(
+                user_announce_profile_id__in=profiles_dict.values()
+            ).values_list("user_announce_profile_id", "audience_id")
+        )
         audience_assignments = []
 
         for model_key, rel_name in zip(
             user_related_model_keys, user_related_model_values
         ):
-            related_user_ids = related_users.filter(
-                **{f"{rel_name}__isnull": False}
-            ).values_list("id", flat=True)
+            audience = audiences_mapping.get(model_key._meta.verbose_name.title())
+            if audience is None:
+                continue
+
+            related_user_ids = (
+                UserModel.objects.filter(
+                    get_user_relation_filter(rel_name), pk__in=user_ids
+                )
+                .values_list("pk", flat=True)
+                .iterator()
+            )
 
             for user_id in related_user_ids:
-                if user_id in profiles_dict:
-                    audience = audiences_mapping.get(
-                        model_key._meta.verbose_name.title()
-                    )
-                    if (
-                        audience
-                        and (profiles_dict[user_id].id, audience.id)
-                        not in existing_assignments_set
-                    ):
-                        audience_assignments.append(
-                            UserAudience(
-                                user_announce_profile=profiles_dict[user_id],
-                                audience=audience,
-                            )
+                profile_id = profiles_dict.get(user_id)
+                if (
+                    profile_id is not None
+                    and (profile_id, audience.id) not in existing_assignments_set
+                ):
+                    audience_assignments.append(
+                        UserAudience(
+                            user_announce_profile_id=profile_id,
+                            audience_id=audience.id,
                         )
+                    )
 
         return audience_assignments
 
-    def _bulk_assign_audiences(self, audience_assignments: List[UserAudience]) -> None:
+    def _bulk_assign_audiences(
+        self, audience_assignments: List[UserAudience], batch_size: int
+    ) -> bool:
         """Bulk assign audiences to users.
 
+        `bulk_create` bypasses model signals, so the materialized feed of
+        the affected profiles is synchronized explicitly. The caller
+        invalidates the cached audience ids once the command's transaction
+        commits.
+
         Args:
         ----
             audience_assignments (List[UserAudience]): A list of UserAudience assignments to create.
+            batch_size (int): The number of assignments inserted per query.
+
+        Returns:
+        -------
+            bool: True if any assignment was created.
 
         """
-        if audience_assignments:
-            UserAudience.objects.bulk_create(
-                audience_assignments, ignore_conflicts=True
+        if not audience_assignments:
+            return False
+
+        UserAudience.objects.bulk_create(
+            audience_assignments, batch_size=batch_size, ignore_conflicts=True
+        )
+
+        if config.materialized_feed_enabled:
+            UserAnnouncementFeed.objects.sync(
+                profile_ids={
+                    assignment.user_announce_profile_id
+                    for assignment in audience_assignments
+                }
             )
+
+        return True
+
+
+def _assign_user_range(options: Dict[str, Any], bounds: Tuple[int, int]) -> bool:
+    """Assign the users of a range of ids, in a worker process.
+
+    Args:
+    ----
+        options (Dict[str, Any]): The arguments of `Command._assign_users`.
+        bounds (Tuple[int, int]): The ids after which and up to which to process users.
+
+    Returns:
+    -------
+        bool: True if any assignment was created.
+
+    """
+    return Command()._assign_users(bounds=bounds, **options)
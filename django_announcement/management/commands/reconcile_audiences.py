@@ -0,0 +1,282 @@
+import time
+from functools import reduce
+from operator import or_
+from typing import Callable, Dict, List, Tuple
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
+
+from django_announcement.management.commands._batches import iter_id_batches
+from django_announcement.management.commands.generate_audiences import Command as cmd
+from django_announcement.models import (
+    Audience,
+    UserAnnouncementFeed,
+    UserAnnouncementProfile,
+    UserAudience,
+)
+from django_announcement.settings.conf import config
+from django_announcement.utils.cache import invalidate_all_audience_ids
+from django_announcement.utils.user_model import UserModel, get_user_relation_filter
+
+
+class Command(BaseCommand):
+    """A Django management command to reconcile the memberships of the
+    audiences of user-related models with the rows of these models.
+
+    For the audience of each user-related model, the users having rows in
+    the model but missing from the audience, and the members without any
+    row left, are selected in the database. Both sets are then walked in
+    batches of ids, each committed on its own, so memory and transaction
+    size stay bounded. The missing profiles of related users are created
+    first.
+
+    Attributes:
+    ----------
+        DEFAULT_BATCH_SIZE: The number of rows written per batch.
+
+    """
+
+    help = "Add missing and remove stale memberships of the audiences of user-related models."
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    def add_arguments(self, parser):
+        """Add optional arguments to the command parser.
+
+        Args:
+        ----
+            parser: The argument parser instance to which the arguments are added.
+
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=self.DEFAULT_BATCH_SIZE,
+            help="Number of rows written per batch (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the rows to write, without changing anything.",
+        )
+
+    def handle(self, *args: str, **kwargs: Dict[str, str]) -> None:
+        """Execute the command, creating missing profiles and memberships
+        and removing stale memberships, then report the rows and time of
+        each phase.
+
+        Args:
+        ----
+            *args: Additional positional arguments.
+            **kwargs: Keyword arguments, including 'batch_size' and 'dry_run'.
+
+        """
+        try:
+            user_related_models_dict = cmd.get_user_related_models()
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f"Error fetching user-related models: {e}")
+            )
+            return
+
+        relations = self._get_relations(user_related_models_dict)
+        if not relations:
+            self.stdout.write(
+                self.style.WARNING(
+                    "No valid audiences found, Please run 'generate_audiences' first. Exiting..."
+                )
+            )
+            return
+
+        dry_run = bool(kwargs.get("dry_run"))
+        batch_size = kwargs.get("batch_size") or self.DEFAULT_BATCH_SIZE
+
+        related_users = UserModel.objects.filter(
+            reduce(
+                or_, (get_user_relation_filter(rel_name) for rel_name, _ in relations)
+            )
+        )
+        phases = [
+            self._run_phase(
+                "Create profiles",
+                related_users.exclude(
+                    Exists(UserAnnouncementProfile.objects.filter(user=OuterRef("pk")))
+                ),
+                self._create_profiles,
+                dry_run,
+                batch_size,
+            )
+        ]
+        for rel_name, audience in relations:
+            phases.append(
+                self._run_phase(
+                    f"Add to '{audience.name}'",
+                    self._get_missing_members(rel_name, audience),
+                    lambda user_ids, audience=audience: self._add_members(
+                        user_ids, audience
+                    ),
+                    dry_run,
+                    batch_size,
+                )
+            )
+            phases.append(
+                self._run_phase(
+                    f"Remove from '{audience.name}'",
+                    self._get_stale_memberships(rel_name, audience),
+                    self._remove_memberships,
+                    dry_run,
+                    batch_size,
+                )
+            )
+
+        if not dry_run and any(rows for _label, rows, _seconds in phases[1:]):
+            invalidate_all_audience_ids()
+
+        self._report(phases, dry_run)
+
+    def _get_relations(
+        self, user_related_models_dict: Dict
+    ) -> List[Tuple[str, Audience]]:
+        """Pair the user-related models with their audiences.
+
+        Args:
+        ----
+            user_related_models_dict (Dict): The accessor names of the user-related models, by model.
+
+        Returns:
+        -------
+            List[Tuple[str, Audience]]: The accessor name of each relation
+            whose audience exists, with the audience.
+
+        """
+        audiences = {
+            audience.name: audience
+            for audience in Audience.objects.filter(
+                name__in=[
+                    model._meta.verbose_name.title()
+                    for model in user_related_models_dict
+                ]
+            )
+        }
+
+        return [
+            (rel_name, audiences[model._meta.verbose_name.title()])
+            for model, rel_name in user_related_models_dict.items()
+            if model._meta.verbose_name.title() in audiences
+        ]
+
+    def _get_missing_members(self, rel_name: str, audience: Audience) -> QuerySet:
+        """Select the users having rows in a relation but missing from its
+        audience."""
+        return UserModel.objects.filter(get_user_relation_filter(rel_name)).exclude(
+            Exists(
+                UserAudience.objects.filter(
+                    user_announce_profile__user=OuterRef("pk"), audience=audience
+                )
+            )
+        )
+
+    def _get_stale_memberships(self, rel_name: str, audience: Audience) -> QuerySet:
+        """Select the memberships of the audience of a relation whose users
+        have no row in it."""
+        return UserAudience.objects.filter(audience=audience).exclude(
+            get_user_relation_filter(
+                rel_name, user_path="user_announce_profile__user__"
+            )
+        )
+
+    def _run_phase(
+        self,
+        label: str,
+        rows: QuerySet,
+        apply: Callable[[List[int]], None],
+        dry_run: bool,
+        batch_size: int,
+    ) -> Tuple[str, int, float]:
+        """Apply a write to the selected rows in batches, or count them.
+
+        Args:
+        ----
+            label (str): The name of the phase in the report.
+            rows (QuerySet): The rows to write.
+            apply (Callable[[List[int]], None]): The write, given a batch of row ids.
+            dry_run (bool): Whether to only count the rows.
+            batch_size (int): The number of rows written per batch.
+
+        Returns:
+        -------
+            Tuple[str, int, float]: The label, the number of rows and the
+            seconds spent.
+
+        """
+        started = time.perf_counter()
+        if dry_run:
+            count = rows.count()
+        else:
+            count = 0
+            for ids in iter_id_batches(rows, batch_size):
+                with transaction.atomic():
+                    apply(ids)
+                count += len(ids)
+
+        return label, count, time.perf_counter() - started
+
+    def _create_profiles(self, user_ids: List[int]) -> None:
+        """Create the profiles of a batch of users."""
+        UserAnnouncementProfile.objects.bulk_create(
+            [UserAnnouncementProfile(user_id=user_id) for user_id in user_ids],
+            ignore_conflicts=True,
+        )
+
+    def _add_members(self, user_ids: List[int], audience: Audience) -> None:
+        """Add a batch of users to an audience.
+
+        `bulk_create` bypasses model signals, so the materialized feed of
+        the new members is synchronized explicitly.
+
+        """
+        profile_ids = list(
+            UserAnnouncementProfile.objects.filter(user_id__in=user_ids).values_list(
+                "pk", flat=True
+            )
+        )
+        UserAudience.objects.bulk_create(
+            [
+                UserAudience(user_announce_profile_id=profile_id, audience=audience)
+                for profile_id in profile_ids
+            ],
+            ignore_conflicts=True,
+        )
+
+        if config.materialized_feed_enabled:
+            UserAnnouncementFeed.objects.sync(profile_ids=profile_ids)
+
+    def _remove_memberships(self, membership_ids: List[int]) -> None:
+        """Delete a batch of memberships, through the ORM so the receivers
+        of the feed and audience cache see them."""
+        UserAudience.objects.filter(pk__in=membership_ids).delete()
+
+    def _report(self, phases: List[Tuple[str, int, float]], dry_run: bool) -> None:
+        """Write the rows and time of each phase.
+
+        Args:
+        ----
+            phases (List[Tuple[str, int, float]]): The label, rows and seconds of each phase.
+            dry_run (bool): Whether the rows were only counted.
+
+        """
+        for label, rows, seconds in phases:
+            self.stdout.write(f"{label}: {rows} rows in {seconds:.3f}s")
+
+        total = sum(seconds for _label, _rows, seconds in phases)
+        if dry_run:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Dry run completed in {total:.3f}s, nothing changed."
+                )
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"Audience memberships reconciled in {total:.3f}s.")
+            )
@@ -0,0 +1,59 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import DEFAULT_DB_ALIAS
+
+from django_announcement.search import get_search_backend
+
+
+class Command(BaseCommand):
+    """A Django management command to create (or rebuild) the index of the
+    configured full-text search backend.
+
+    Run it once after setting `DJANGO_ANNOUNCEMENT_API_SEARCH_BACKEND` on
+    an existing database; afterwards the index is kept up to date on write.
+
+    """
+
+    help = "Create or rebuild the full-text search index of announcements."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the database option to the command.
+
+        Args:
+            parser (CommandParser): The argument parser of the command.
+
+        """
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to create the index in.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Set up the index of the configured search backend.
+
+        Args:
+        ----
+            *args: Additional positional arguments.
+            **options: The command options.
+
+        """
+        backend = get_search_backend()
+        if backend is None:
+            self.stdout.write(
+                self.style.WARNING(
+                    "No search backend is configured. Set "
+                    "'DJANGO_ANNOUNCEMENT_API_SEARCH_BACKEND' to enable "
+                    "full-text search."
+                )
+            )
+            return
+
+        backend.setup(options["database"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Search index of {type(backend).__name__} is up to date."
+            )
+        )
@@ -0,0 +1 @@
+from .replica_routing import AnnouncementReplicaMiddleware
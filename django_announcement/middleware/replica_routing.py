@@ -0,0 +1,24 @@
+from typing import Callable
+
+from django.http import HttpRequest, HttpResponse
+
+from django_announcement.repository.router import routing_context
+
+
+class AnnouncementReplicaMiddleware:
+    """Middleware exposing the request to `AnnouncementReplicaRouter`.
+
+    The router pins the reads of a user or session to the primary database
+    after they wrote announcements: it looks up the pin of a request once,
+    and stores it once the request ends if the request wrote. Add this
+    middleware after `AuthenticationMiddleware`, so the user of the request
+    is known.
+
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with routing_context(request):
+            return self.get_response(request)
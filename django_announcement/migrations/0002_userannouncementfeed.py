@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:21
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_announcement", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserAnnouncementFeed",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        db_comment="Timestamp for when the record was created.",
+                        default=django.utils.timezone.now,
+                        help_text="The time when the record was created.",
+                        verbose_name="Created at",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        db_comment="Timestamp for when the record was last updated.",
+                        help_text="The time when the record was last updated.",
+                        verbose_name="Updated at",
+                    ),
+                ),
+                (
+                    "announcement",
+                    models.ForeignKey(
+                        db_comment="Foreign key to the Announcement table.",
+                        help_text="The announcement delivered to the user profile.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="feed_entries",
+                        to="django_announcement.announcement",
+                        verbose_name="Announcement",
+                    ),
+                ),
+                (
+                    "user_announce_profile",
+                    models.ForeignKey(
+                        db_comment="Foreign key to the UserAnnouncementProfile table.",
+                        help_text="The user profile that receives the announcement.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="feed_entries",
+                        to="django_announcement.userannouncementprofile",
+                        verbose_name="User Profile",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "User Announcement Feed",
+                "verbose_name_plural": "User Announcement Feeds",
+                "db_table": "user_announcement_feed",
+                "unique_together": {("user_announce_profile", "announcement")},
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:55
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_announcement", "0002_userannouncementfeed"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="announcement",
+            index=models.Index(
+                models.OrderBy(
+                    django.db.models.functions.comparison.Coalesce(
+                        "published_at", "created_at"
+                    ),
+                    descending=True,
+                ),
+                models.OrderBy(models.F("id"), descending=True),
+                name="announcement_cursor_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_announcement", "0003_announcement_cursor_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="announcement",
+            index=models.Index(
+                fields=["published_at", "expires_at"], name="announcement_publish_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="announcement",
+            index=models.Index(fields=["expires_at"], name="announcement_expires_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="audienceannouncement",
+            index=models.Index(
+                fields=["audience", "announcement"], name="audience_announcement_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:56
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_announcement", "0004_announcement_access_path_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnnouncementChange",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        db_comment="Timestamp of the change.",
+                        default=django.utils.timezone.now,
+                        help_text="The time of the change.",
+                        verbose_name="Created at",
+                    ),
+                ),
+                (
+                    "announcement",
+                    models.ForeignKey(
+                        db_comment="Id of the changed announcement, kept after its deletion.",
+                        db_constraint=False,
+                        db_index=False,
+                        help_text="The changed announcement.",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="django_announcement.announcement",
+                        verbose_name="Announcement",
+                    ),
+                ),
+                (
+                    "audience",
+                    models.ForeignKey(
+                        blank=True,
+                        db_comment="Id of the audience that gained or lost the announcement, if any.",
+                        db_constraint=False,
+                        db_index=False,
+                        help_text="The audience that gained or lost the announcement, if any.",
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="django_announcement.audience",
+                        verbose_name="Audience",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Announcement Change",
+                "verbose_name_plural": "Announcement Changes",
+                "db_table": "announcement_changes",
+            },
+        ),
+    ]
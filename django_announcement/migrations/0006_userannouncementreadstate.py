@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:04
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_announcement", "0005_announcementchange"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserAnnouncementReadState",
+            fields=[
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        db_comment="Timestamp for when the record was created.",
+                        default=django.utils.timezone.now,
+                        help_text="The time when the record was created.",
+                        verbose_name="Created at",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        db_comment="Timestamp for when the record was last updated.",
+                        help_text="The time when the record was last updated.",
+                        verbose_name="Updated at",
+                    ),
+                ),
+                (
+                    "user_announce_profile",
+                    models.OneToOneField(
+                        db_comment="One-to-one relationship with the UserAnnouncementProfile table.",
+                        help_text="The user profile whose read announcements are tracked.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="read_state",
+                        serialize=False,
+                        to="django_announcement.userannouncementprofile",
+                        verbose_name="User Profile",
+                    ),
+                ),
+                (
+                    "read_up_to",
+                    models.PositiveBigIntegerField(
+                        db_comment="High-water mark of the read announcement ids.",
+                        default=0,
+                        help_text="Every announcement with an id up to this one is read.",
+                        verbose_name="Read Up To",
+                    ),
+                ),
+                (
+                    "read_ids",
+                    models.JSONField(
+                        blank=True,
+                        db_comment="Sorted ids of the announcements read above the high-water mark.",
+                        default=list,
+                        help_text="The sorted ids of the announcements read above the mark.",
+                        verbose_name="Read IDs",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "User Announcement Read State",
+                "verbose_name_plural": "User Announcement Read States",
+                "db_table": "user_announcement_read_states",
+            },
+        ),
+    ]
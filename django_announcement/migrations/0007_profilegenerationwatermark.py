@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:17
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_announcement", "0006_userannouncementreadstate"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProfileGenerationWatermark",
+            fields=[
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        db_comment="Timestamp for when the record was created.",
+                        default=django.utils.timezone.now,
+                        help_text="The time when the record was created.",
+                        verbose_name="Created at",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        db_comment="Timestamp for when the record was last updated.",
+                        help_text="The time when the record was last updated.",
+                        verbose_name="Updated at",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        db_comment="Name of the users or of the user-related relation.",
+                        help_text="The users or the user-related relation the mark applies to.",
+                        max_length=255,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Name",
+                    ),
+                ),
+                (
+                    "value",
+                    models.PositiveBigIntegerField(
+                        db_comment="Highest id processed by the last run.",
+                        default=0,
+                        help_text="The highest id processed.",
+                        verbose_name="Value",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Profile Generation Watermark",
+                "verbose_name_plural": "Profile Generation Watermarks",
+                "db_table": "profile_generation_watermarks",
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_announcement", "0007_profilegenerationwatermark"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="announcementchange",
+            name="user",
+            field=models.ForeignKey(
+                blank=True,
+                db_comment="Id of the user who joined or left the audience, if any.",
+                db_constraint=False,
+                db_index=False,
+                help_text="The user who joined or left the audience, if any.",
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="User",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="announcementchange",
+            name="announcement",
+            field=models.ForeignKey(
+                blank=True,
+                db_comment="Id of the changed announcement, kept after its deletion, if any.",
+                db_constraint=False,
+                db_index=False,
+                help_text="The changed announcement, if any.",
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to="django_announcement.announcement",
+                verbose_name="Announcement",
+            ),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:13
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def position_marks(apps, schema_editor):
+    """Position the id marks of existing read states at the effective
+    publication time of the latest announcement up to them."""
+    Announcement = apps.get_model("django_announcement", "Announcement")
+    UserAnnouncementReadState = apps.get_model(
+        "django_announcement", "UserAnnouncementReadState"
+    )
+    UserAnnouncementReadState.objects.filter(read_up_to__gt=0).update(
+        read_up_to_at=Subquery(
+            Announcement.objects.filter(pk__lte=OuterRef("read_up_to"))
+            .order_by("-pk")
+            .values(position=Coalesce("published_at", "created_at"))[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_announcement", "0008_announcementchange_user"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userannouncementreadstate",
+            name="read_up_to_at",
+            field=models.DateTimeField(
+                blank=True,
+                db_comment="Effective publication time of the high-water mark of read announcements.",
+                help_text="The publication time of the mark, or empty if nothing is read.",
+                null=True,
+                verbose_name="Read Up To At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="userannouncementreadstate",
+            name="read_up_to",
+            field=models.PositiveBigIntegerField(
+                db_comment="Announcement id of the high-water mark of read announcements.",
+                default=0,
+                help_text="The announcement id of the mark, breaking publication time ties.",
+                verbose_name="Read Up To",
+            ),
+        ),
+        migrations.RunPython(position_marks, migrations.RunPython.noop),
+    ]
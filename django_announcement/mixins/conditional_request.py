@@ -0,0 +1,242 @@
+from datetime import datetime
+from hashlib import sha1
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.db.models import Count, Max, Model, QuerySet
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from django_announcement.settings.conf import config
+
+# An (ETag, Last-Modified) pair
+Validators = Tuple[str, Optional[datetime]]
+
+
+class ConditionalRequestMixin:
+    """A mixin answering conditional ``GET`` requests of the list and
+    retrieve actions with ``304 Not Modified`` before any serialization.
+
+    The validators are computed with a single aggregate query for lists and
+    from the already fetched instance for retrieves:
+
+    - The ETag hashes the maximum of the ``validator_fields`` timestamps, the
+      number of visible objects (so deletions and visibility changes are
+      detected) and the parts returned by `get_etag_context`.
+    - ``Last-Modified`` is the maximum of the ``validator_fields`` timestamps.
+      It is only used to answer ``If-Modified-Since`` on retrieves, since a
+      timestamp alone can not reveal that a list lost an element.
+
+    Attributes:
+        validator_fields (Sequence[str]): Timestamp fields (or lookups) whose
+            changes alter the representation of an object.
+
+    """
+
+    validator_fields: Sequence[str] = ("updated_at",)
+
+    def conditional_requests_enabled(self) -> bool:
+        """Return whether conditional requests are answered.
+
+        Returns:
+            bool: True when the validators should be computed.
+
+        """
+        return config.api_conditional_requests_enabled
+
+    def get_etag_context(self) -> List[str]:
+        """Return the request dependent parts of the ETag.
+
+        Representations differ per query string, media type and serializer,
+        so these are always part of the ETag. Views can extend the list with
+        anything else that alters the response, such as the audiences of the
+        requesting user.
+
+        Returns:
+            List[str]: The parts hashed into the ETag.
+
+        """
+        return [
+            self.request.get_full_path(),
+            str(self.request.accepted_media_type),
+            self.get_serializer_class().__name__,
+        ]
+
+    def make_etag(self, parts: List[Any]) -> str:
+        """Build a weak ETag from the given parts.
+
+        Args:
+            parts (List[Any]): The values identifying the representation.
+
+        Returns:
+            str: The quoted, weak ETag.
+
+        """
+        digest = sha1(
+            "|".join(map(str, [*parts, *self.get_etag_context()])).encode()
+        ).hexdigest()
+        return f"W/{quote_etag(digest)}"
+
+    def get_list_aggregates(self) -> Dict[str, Any]:
+        """Return the aggregates the validators of a list are computed from.
+
+        Returns:
+            Dict[str, Any]: The count and the maximum of each validator field.
+
+        """
+        return {
+            "validator_count": Count("pk"),
+            **{
+                f"validator_{index}": Max(field)
+                for index, field in enumerate(self.validator_fields)
+            },
+        }
+
+    def make_list_validators(self, aggregates: Dict[str, Any]) -> Validators:
+        """Build the validators of a list from its aggregates.
+
+        Args:
+            aggregates (Dict[str, Any]): The values of `get_list_aggregates`.
+
+        Returns:
+            Validators: The ETag and Last-Modified of the list.
+
+        """
+        count = aggregates.pop("validator_count")
+        last_modified = max(filter(None, aggregates.values()), default=None)
+        return self.make_etag([count, last_modified]), last_modified
+
+    def get_list_validators(self, queryset: QuerySet) -> Validators:
+        """Compute the validators of a list with one aggregate query.
+
+        Args:
+            queryset (QuerySet): The filtered queryset of the list.
+
+        Returns:
+            Validators: The ETag and Last-Modified of the list.
+
+        """
+        return self.make_list_validators(
+            queryset.order_by().aggregate(**self.get_list_aggregates())
+        )
+
+    async def aget_list_validators(self, queryset: QuerySet) -> Validators:
+        """Asynchronous version of `get_list_validators`.
+
+        Args:
+            queryset (QuerySet): The filtered queryset of the list.
+
+        Returns:
+            Validators: The ETag and Last-Modified of the list.
+
+        """
+        return self.make_list_validators(
+            await queryset.order_by().aaggregate(**self.get_list_aggregates())
+        )
+
+    def get_object_validators(self, instance: Model) -> Validators:
+        """Compute the validators of a single object from its timestamps.
+
+        Args:
+            instance (Model): The object being retrieved.
+
+        Returns:
+            Validators: The ETag and Last-Modified of the object.
+
+        """
+        timestamps = []
+        for field in self.validator_fields:
+            value: Any = instance
+            for attr in field.split("__"):
+                value = getattr(value, attr, None) if value is not None else None
+            timestamps.append(value)
+
+        last_modified = max(filter(None, timestamps), default=None)
+        return self.make_etag([instance.pk, *timestamps]), last_modified
+
+    def get_not_modified_response(
+        self,
+        etag: str,
+        last_modified: Optional[datetime],
+        use_last_modified: bool = True,
+    ) -> Optional[HttpResponse]:
+        """Evaluate the preconditions of the request.
+
+        Args:
+            etag (str): The current ETag of the representation.
+            last_modified (Optional[datetime]): The current modification time.
+            use_last_modified (bool): Whether ``If-Modified-Since`` may be honored.
+
+        Returns:
+            Optional[HttpResponse]: A ``304``/``412`` response when a precondition
+            applies, otherwise None.
+
+        """
+        headers = HttpResponse()
+        self.set_validator_headers(headers, etag, last_modified)
+
+        response = get_conditional_response(
+            self.request._request,
+            etag=etag,
+            last_modified=(
+                int(last_modified.timestamp())
+                if last_modified and use_last_modified
+                else None
+            ),
+            response=headers,
+        )
+        # The placeholder comes back untouched when no precondition applies
+        return None if response is headers else response
+
+    @staticmethod
+    def set_validator_headers(
+        response: HttpResponse, etag: str, last_modified: Optional[datetime]
+    ) -> None:
+        """Attach the validators to a response.
+
+        Args:
+            response (HttpResponse): The response to update.
+            etag (str): The ETag of the representation.
+            last_modified (Optional[datetime]): The modification time, if known.
+
+        """
+        response["ETag"] = etag
+        if last_modified:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        """List the objects, or answer ``304`` when the client's copy is
+        still current."""
+        if not self.conditional_requests_enabled():
+            return super().list(request, *args, **kwargs)
+
+        etag, last_modified = self.get_list_validators(
+            self.filter_queryset(self.get_queryset())
+        )
+        not_modified = self.get_not_modified_response(
+            etag, last_modified, use_last_modified=False
+        )
+        if not_modified is not None:
+            return not_modified
+
+        response = super().list(request, *args, **kwargs)
+        self.set_validator_headers(response, etag, last_modified)
+        return response
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        """Retrieve an object, or answer ``304`` when the client's copy is
+        still current."""
+        if not self.conditional_requests_enabled():
+            return super().retrieve(request, *args, **kwargs)
+
+        instance = self.get_object()
+        etag, last_modified = self.get_object_validators(instance)
+        not_modified = self.get_not_modified_response(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = Response(self.get_serializer(instance).data)
+        self.set_validator_headers(response, etag, last_modified)
+        return response
@@ -0,0 +1,306 @@
+import base64
+import binascii
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from django.db.models import Q
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy as _
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from django_announcement.models import (
+    Announcement,
+    AnnouncementChange,
+    AudienceAnnouncement,
+)
+from django_announcement.settings.conf import config
+
+# A position in the change log: the last change id and the sync time
+Cursor = Tuple[int, datetime]
+
+
+def encode_cursor(change_id: int, synced_at: datetime) -> str:
+    """Encode a change log position as an opaque cursor.
+
+    Args:
+        change_id (int): The id of the last change synced.
+        synced_at (datetime): The time the announcements were synced at.
+
+    Returns:
+        str: The URL safe cursor.
+
+    """
+    value = f"{change_id}:{synced_at.timestamp()!r}"
+    return base64.urlsafe_b64encode(value.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Decode a cursor built by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor sent by the client.
+
+    Returns:
+        Cursor: The id of the last change synced and the sync time.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+
+    """
+    try:
+        change_id, timestamp = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        )
+        return int(change_id), datetime.fromtimestamp(float(timestamp), tz=timezone.utc)
+    except (binascii.Error, UnicodeError, ValueError, OverflowError) as exc:
+        raise ValueError(cursor) from exc
+
+
+class DeltaSyncMixin:
+    """A mixin serving the announcements changed since a cursor, so clients
+    keeping a local copy of the feed sync only what changed.
+
+    Writes touching announcements are logged in `AnnouncementChange` (see
+    `connect_change_log_receivers`). The ``changes`` action reads the log
+    after the cursor of the client, and answers with the changed
+    announcements the user can still see, and the ids of the others as
+    tombstones: deleted announcements, announcements removed from the
+    audiences of the user, and announcements that expired. When the user
+    joined or left an audience, every announcement of that audience is
+    synced, and those the user no longer sees become tombstones.
+    Announcements whose ``published_at`` or ``expires_at`` passed since
+    the last sync are added too, since time changes their visibility
+    without a write. The cost is bounded by the number of changes, not by
+    the feed size.
+
+    Ids are taken when rows are inserted, not when their transaction
+    commits, so a change may appear after later ones were synced. Changes
+    are therefore only served once older than `changes_safety_window`,
+    which should exceed the longest transaction writing announcements.
+
+    """
+
+    # Number of change log rows read per sync
+    changes_page_size: int = 500
+
+    # Age of the changes served, leaving in-flight transactions time to commit
+    changes_safety_window: timedelta = timedelta(seconds=5)
+
+    # Query parameter carrying the cursor of the last sync
+    cursor_query_param: str = "since"
+
+    invalid_cursor_message = _("Invalid cursor.")
+
+    def change_log_enabled(self) -> bool:
+        """Return whether the delta sync is served.
+
+        Returns:
+            bool: True when the change log is enabled.
+
+        """
+        return config.change_log_enabled
+
+    def get_sync_audience_ids(self) -> Optional[List[int]]:
+        """Return the audiences whose changes concern the user, or None for
+        every audience."""
+        if self.request.user.is_staff:
+            return None
+
+        return self.audience_ids
+
+    def get_sync_user_id(self) -> Optional[int]:
+        """Return the user whose membership changes are synced, or None
+        for staff users, who see every audience."""
+        if self.request.user.is_staff:
+            return None
+
+        return self.request.user.pk
+
+    def get_changed_ids(
+        self,
+        change_id: int,
+        audience_ids: Optional[List[int]],
+        settled_at: datetime,
+        user_id: Optional[int] = None,
+    ) -> Tuple[Set[int], int, bool]:
+        """Read a page of the change log after a change.
+
+        Changes of the announcements themselves only concern users whose
+        audiences the announcements still target; removals from their
+        audiences are logged with the audience. Membership changes of the
+        user touch every announcement of the audience joined or left.
+
+        Args:
+            change_id (int): The id of the last change synced.
+            audience_ids (Optional[List[int]]): The audiences of the user,
+                or None for every audience.
+            settled_at (datetime): The page stops before the first change
+                logged after this time.
+            user_id (Optional[int]): The user whose membership changes
+                are read, if any.
+
+        Returns:
+            Tuple[Set[int], int, bool]: The ids of the touched
+            announcements, the id of the last change read and whether
+            more changes follow.
+
+        """
+        changes = list(
+            AnnouncementChange.objects.since(
+                change_id, audience_ids, user_id
+            ).values_list(
+                "pk", "announcement_id", "audience_id", "user_id", "created_at"
+            )[
+                : self.changes_page_size + 1
+            ]
+        )
+        has_more = len(changes) > self.changes_page_size
+        changes = changes[: self.changes_page_size]
+        for index, change in enumerate(changes):
+            if change[4] > settled_at:
+                # Earlier ids may still belong to uncommitted transactions
+                changes, has_more = changes[:index], False
+                break
+        if changes:
+            change_id = changes[-1][0]
+
+        touched, untargeted, memberships = set(), set(), set()
+        for _pk, announcement_id, audience_id, member_id, _created_at in changes:
+            if member_id is not None:
+                memberships.add(audience_id)
+            elif audience_id is not None or audience_ids is None:
+                touched.add(announcement_id)
+            else:
+                untargeted.add(announcement_id)
+
+        untargeted -= touched
+        if untargeted:
+            touched.update(
+                AudienceAnnouncement.objects.filter(
+                    announcement_id__in=untargeted, audience_id__in=audience_ids
+                ).values_list("announcement_id", flat=True)
+            )
+        if memberships:
+            touched.update(
+                AudienceAnnouncement.objects.filter(
+                    audience_id__in=memberships
+                ).values_list("announcement_id", flat=True)
+            )
+
+        return touched, change_id, has_more
+
+    def get_rescheduled_ids(
+        self, audience_ids: List[int], since: datetime, until: datetime
+    ) -> Set[int]:
+        """Return the announcements of the audiences published or expired
+        between two sync times.
+
+        Args:
+            audience_ids (List[int]): The audiences of the user.
+            since (datetime): The time of the last sync.
+            until (datetime): The time of this sync.
+
+        Returns:
+            Set[int]: The ids of the announcements.
+
+        """
+        return set(
+            Announcement.objects.get_by_audience(audience_ids)
+            .filter(
+                Q(published_at__gt=since, published_at__lte=until)
+                | Q(expires_at__gte=since, expires_at__lt=until)
+            )
+            .values_list("pk", flat=True)
+        )
+
+    def get_cursor(self) -> Optional[Cursor]:
+        """Parse the cursor of the request.
+
+        Returns:
+            Optional[Cursor]: The position of the last sync, or None when
+            the client syncs for the first time.
+
+        Raises:
+            ValidationError: If the cursor is malformed.
+
+        """
+        value = self.request.query_params.get(self.cursor_query_param)
+        if not value:
+            return None
+
+        try:
+            return decode_cursor(value)
+        except ValueError:
+            raise ValidationError(
+                {self.cursor_query_param: [self.invalid_cursor_message]}
+            ) from None
+
+    @action(detail=False, methods=["get"])
+    def changes(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Return the announcements changed since the cursor.
+
+        Without a cursor, only the current cursor is returned: clients
+        take it before downloading the feed, then sync from it.
+
+        """
+        cursor, synced_at = self.get_cursor(), now()
+        settled_at = synced_at - self.changes_safety_window
+        if cursor is None:
+            return Response(
+                self.make_changes_data(
+                    AnnouncementChange.objects.last_id(before=settled_at), synced_at
+                )
+            )
+
+        change_id, since = cursor
+        audience_ids = self.get_sync_audience_ids()
+        touched, change_id, has_more = self.get_changed_ids(
+            change_id, audience_ids, settled_at, self.get_sync_user_id()
+        )
+        if has_more:
+            # Time transitions are synced once the log is drained
+            synced_at = since
+        elif audience_ids is not None:
+            touched |= self.get_rescheduled_ids(audience_ids, since, synced_at)
+
+        if not touched:
+            return Response(
+                self.make_changes_data(change_id, synced_at, has_more=has_more)
+            )
+
+        visible = self.get_queryset().filter(pk__in=touched)
+        return Response(
+            self.make_changes_data(
+                change_id,
+                synced_at,
+                has_more=has_more,
+                changed=self.get_serializer(visible, many=True).data,
+                removed=sorted(touched - set(visible.values_list("pk", flat=True))),
+            )
+        )
+
+    def make_changes_data(
+        self,
+        change_id: int,
+        synced_at: datetime,
+        has_more: bool = False,
+        changed: Optional[List[Any]] = None,
+        removed: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        """Build the body of a ``changes`` response.
+
+        Returns:
+            Dict[str, Any]: The cursor to sync from next, whether more
+            changes follow, the changed announcements and the ids of the
+            removed ones.
+
+        """
+        return {
+            "cursor": encode_cursor(change_id, synced_at),
+            "has_more": has_more,
+            "changed": changed or [],
+            "removed": removed or [],
+        }
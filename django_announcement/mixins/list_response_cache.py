@@ -0,0 +1,89 @@
+from typing import Any, List
+
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from django_announcement.settings.conf import config
+from django_announcement.utils.cache import (
+    get_cached_list_response,
+    make_list_response_key,
+    set_cached_list_response,
+)
+from django_announcement.utils.cache.list_responses import MISSING
+
+
+class ListResponseCacheMixin:
+    """A mixin sharing list responses between requests that would produce
+    the same data.
+
+    Responses are cached with Django's cache framework under a hash of the
+    canonical query parameters, the request origin, the accepted media
+    type, the serializer and the parts returned by
+    `get_list_cache_context`, bound to a content version that is bumped
+    whenever announcements change. Placed after `ConditionalRequestMixin`
+    in the bases, ``304`` answers are still given before the cache is
+    consulted.
+
+    """
+
+    def list_response_cache_enabled(self) -> bool:
+        """Return whether list responses are cached.
+
+        Returns:
+            bool: True when the list response cache is enabled.
+
+        """
+        return config.list_response_cache_enabled
+
+    def get_list_cache_context(self) -> List[str]:
+        """Return the view dependent parts of the cache key, such as the
+        audiences of the requesting user.
+
+        Returns:
+            List[str]: The parts hashed into the cache key.
+
+        """
+        return []
+
+    def get_list_cache_key(self) -> str:
+        """Build the cache key of the list requested.
+
+        The query parameters are sorted, so equivalent query strings share
+        an entry. The origin is part of the key since pagination links are
+        absolute.
+
+        Returns:
+            str: The cache key.
+
+        """
+        query_params = sorted(
+            (key, value)
+            for key, values in self.request.query_params.lists()
+            for value in values
+        )
+        return make_list_response_key(
+            [
+                self.request.build_absolute_uri(self.request.path),
+                query_params,
+                self.request.accepted_media_type,
+                self.get_serializer_class().__name__,
+                *self.get_list_cache_context(),
+            ]
+        )
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        """List the objects, serving the data from the cache when another
+        request already produced it."""
+        if not self.list_response_cache_enabled():
+            return super().list(request, *args, **kwargs)
+
+        key = self.get_list_cache_key()
+        data = get_cached_list_response(key)
+        if data is not MISSING:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            set_cached_list_response(key, response.data)
+
+        return response
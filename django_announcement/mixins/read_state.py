@@ -0,0 +1,140 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.db.models.functions import Coalesce
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from django_announcement.api.serializers.read_state import MarkReadSerializer
+from django_announcement.models import UserAnnouncementReadState
+from django_announcement.settings.conf import config
+
+
+class ReadStateMixin:
+    """A mixin tracking which announcements a user has read.
+
+    The read state of a user is a single `UserAnnouncementReadState` row:
+    a high-water mark in the order of the cursor pagination, the effective
+    publication time and id of announcements, plus the sparse set of ids
+    read above it. ``mark-read`` folds the ids into the state, and
+    ``unread-count`` counts the visible announcements outside of it with a
+    single ``COUNT`` over the announcements above the mark. Scheduled
+    announcements are unread once published, whatever their id, but
+    announcements published before the mark that become visible later,
+    for instance when added to an audience of the user, count as read.
+
+    """
+
+    # Name of the annotation holding the effective publication time
+    read_position_field: str = "read_position_at"
+
+    def read_state_enabled(self) -> bool:
+        """Return whether read states are tracked.
+
+        Returns:
+            bool: True when read states are enabled.
+
+        """
+        return config.read_state_enabled
+
+    def count_unread(self, state: UserAnnouncementReadState) -> int:
+        """Count the visible announcements a read state leaves unread.
+
+        Args:
+            state (UserAnnouncementReadState): The read state of the user.
+
+        Returns:
+            int: The number of unread announcements.
+
+        """
+        return self.get_unread_queryset(state).count()
+
+    def get_positioned_queryset(self) -> QuerySet:
+        """Return the visible announcements, annotated with their effective
+        publication time.
+
+        Returns:
+            QuerySet: The annotated announcements.
+
+        """
+        return self.get_visible_queryset().annotate(
+            **{self.read_position_field: Coalesce("published_at", "created_at")}
+        )
+
+    def filter_above_mark(
+        self, queryset: QuerySet, state: UserAnnouncementReadState
+    ) -> QuerySet:
+        """Select the announcements after the mark of a read state.
+
+        Args:
+            queryset (QuerySet): The announcements from `get_positioned_queryset`.
+            state (UserAnnouncementReadState): The read state of the user.
+
+        Returns:
+            QuerySet: The announcements after the mark.
+
+        """
+        if state.mark is None:
+            return queryset
+
+        read_up_to_at, read_up_to = state.mark
+        return queryset.filter(
+            Q(**{f"{self.read_position_field}__gt": read_up_to_at})
+            | Q(**{self.read_position_field: read_up_to_at, "pk__gt": read_up_to})
+        )
+
+    def get_unread_queryset(self, state: UserAnnouncementReadState) -> QuerySet:
+        """Return the visible announcements a read state leaves unread.
+
+        Args:
+            state (UserAnnouncementReadState): The read state of the user.
+
+        Returns:
+            QuerySet: The unread announcements.
+
+        """
+        queryset = self.filter_above_mark(self.get_positioned_queryset(), state)
+        if state.read_ids:
+            queryset = queryset.exclude(pk__in=state.read_ids)
+
+        return queryset
+
+    @action(detail=False, methods=["get"], url_path="unread-count")
+    def unread_count(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Return the number of announcements the user has not read."""
+        state = UserAnnouncementReadState.objects.for_user(request.user.pk)
+        return Response({"unread_count": self.count_unread(state)})
+
+    @action(detail=False, methods=["post"], url_path="mark-read")
+    def mark_read(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Mark the given announcements, or all of them, as read and return
+        the remaining number of unread announcements."""
+        serializer = MarkReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        positions = self.get_positioned_queryset().values_list(
+            self.read_position_field, "pk"
+        )
+        with transaction.atomic():
+            state = UserAnnouncementReadState.objects.lock_for_user(request.user.pk)
+            if serializer.validated_data["all"]:
+                last = positions.order_by(f"-{self.read_position_field}", "-pk").first()
+                if last is not None:
+                    state.mark_read_up_to(last)
+            else:
+                state.mark_read(
+                    self.filter_above_mark(positions, state).filter(
+                        pk__in=serializer.validated_data["ids"]
+                    )
+                )
+                # Only the first unread announcement after the read ones matters
+                state.compact(
+                    self.filter_above_mark(positions, state).order_by(
+                        self.read_position_field, "pk"
+                    )[: len(state.read_ids) + 1]
+                )
+            state.save()
+
+        return Response({"unread_count": self.count_unread(state)})
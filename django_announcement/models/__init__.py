@@ -1,6 +1,10 @@
 from .announcement import Announcement
 from .announcement_category import AnnouncementCategory
+from .announcement_change import AnnouncementChange
 from .audience import Audience
 from .audience_announce import AudienceAnnouncement
+from .profile_generation_watermark import ProfileGenerationWatermark
 from .user_announce_profile import UserAnnouncementProfile
+from .user_announcement_feed import UserAnnouncementFeed
+from .user_announcement_read_state import UserAnnouncementReadState
 from .user_audience import UserAudience
@@ -4,12 +4,14 @@ from django.db.models import (
     CASCADE,
     CharField,
     DateTimeField,
+    F,
     FileField,
     ForeignKey,
     Index,
     ManyToManyField,
     TextField,
 )
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 from django_announcement.mixins.models.timestamped_model import TimeStampedModel
@@ -38,7 +40,9 @@ class Announcement(TimeStampedModel):
         db_table (str): The name of the database table.
         verbose_name (str): Human-readable singular name for the model.
         verbose_name_plural (str): Human-readable plural name for the model.
-        indexes (List[Index]): Indexes for optimizing queries on title, category, and audience.
+        indexes (List[Index]): Indexes for optimizing queries on title and category, the
+            publication window used by `active()`, `upcoming()` and `expired()`, and the
+            newest-first ordering used by cursor pagination.
 
     Methods:
         __str__() -> str:
@@ -104,6 +108,16 @@ class Announcement(TimeStampedModel):
         verbose_name_plural: str = _("Announcements")
         indexes: List[Index] = [
             Index(fields=["title", "category"], name="announcement_idx"),
+            Index(
+                fields=["published_at", "expires_at"],
+                name="announcement_publish_idx",
+            ),
+            Index(fields=["expires_at"], name="announcement_expires_idx"),
+            Index(
+                Coalesce("published_at", "created_at").desc(),
+                F("id").desc(),
+                name="announcement_cursor_idx",
+            ),
         ]
 
     def __str__(self) -> str:
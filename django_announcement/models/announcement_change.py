@@ -0,0 +1,76 @@
+from django.conf import settings
+from django.db.models import DO_NOTHING, DateTimeField, ForeignKey, Model
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy as _
+
+from django_announcement.repository.manager.change_log import (
+    AnnouncementChangeDataAccessLayer,
+)
+
+
+class AnnouncementChange(Model):
+    """Entry of the change log of announcements, read by the delta sync of
+    the API.
+
+    A row is written in the transaction of every write touching an
+    announcement: with an audience when the announcement gained or lost
+    that audience, and without one when the announcement itself changed.
+    Membership changes are logged too, with a user and an audience and
+    no announcement, since they change which announcements the user can
+    see. Ids grow monotonically, so clients sync from the last id they
+    saw.
+    Rows keep the ids of deleted announcements and audiences, which is
+    how deletions reach clients as tombstones. Reads are range scans of
+    the primary key, so the foreign keys are left unindexed.
+
+    """
+
+    announcement = ForeignKey(
+        to="Announcement",
+        on_delete=DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="+",
+        blank=True,
+        null=True,
+        verbose_name=_("Announcement"),
+        help_text=_("The changed announcement, if any."),
+        db_comment="Id of the changed announcement, kept after its deletion, if any.",
+    )
+    audience = ForeignKey(
+        to="Audience",
+        on_delete=DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="+",
+        blank=True,
+        null=True,
+        verbose_name=_("Audience"),
+        help_text=_("The audience that gained or lost the announcement, if any."),
+        db_comment="Id of the audience that gained or lost the announcement, if any.",
+    )
+    user = ForeignKey(
+        to=settings.AUTH_USER_MODEL,
+        on_delete=DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="+",
+        blank=True,
+        null=True,
+        verbose_name=_("User"),
+        help_text=_("The user who joined or left the audience, if any."),
+        db_comment="Id of the user who joined or left the audience, if any.",
+    )
+    created_at = DateTimeField(
+        default=now,
+        verbose_name=_("Created at"),
+        help_text=_("The time of the change."),
+        db_comment="Timestamp of the change.",
+    )
+
+    objects = AnnouncementChangeDataAccessLayer()
+
+    class Meta:
+        db_table = "announcement_changes"
+        verbose_name = _("Announcement Change")
+        verbose_name_plural = _("Announcement Changes")
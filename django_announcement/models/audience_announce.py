@@ -1,4 +1,4 @@
-from django.db.models import CASCADE, ForeignKey
+from django.db.models import CASCADE, ForeignKey, Index
 from django.utils.translation import gettext_lazy as _
 
 from django_announcement.mixins.models.timestamped_model import TimeStampedModel
@@ -30,3 +30,11 @@ class AudienceAnnouncement(TimeStampedModel):
         verbose_name = _("Audience Announcement")
         verbose_name_plural = _("Audience Announcements")
         unique_together = ("announcement", "audience")
+        indexes = [
+            # Serves audience-driven lookups; the unique constraint above
+            # already covers lookups starting from the announcement.
+            Index(
+                fields=["audience", "announcement"],
+                name="audience_announcement_idx",
+            ),
+        ]
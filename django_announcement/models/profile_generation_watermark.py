@@ -0,0 +1,42 @@
+from django.db.models import CharField, PositiveBigIntegerField
+from django.utils.translation import gettext_lazy as _
+
+from django_announcement.mixins.models.timestamped_model import TimeStampedModel
+from django_announcement.repository.manager.watermark import (
+    ProfileGenerationWatermarkDataAccessLayer,
+)
+
+
+class ProfileGenerationWatermark(TimeStampedModel):
+    """High-water mark of the rows processed by ``generate_profiles``.
+
+    Each run records the highest user id, and for each user-related
+    relation the highest id of the rows linking users to it, so that
+    ``generate_profiles --incremental`` only processes users and related
+    rows added since.
+
+    """
+
+    name = CharField(
+        max_length=255,
+        primary_key=True,
+        verbose_name=_("Name"),
+        help_text=_("The users or the user-related relation the mark applies to."),
+        db_comment="Name of the users or of the user-related relation.",
+    )
+    value = PositiveBigIntegerField(
+        default=0,
+        verbose_name=_("Value"),
+        help_text=_("The highest id processed."),
+        db_comment="Highest id processed by the last run.",
+    )
+
+    objects = ProfileGenerationWatermarkDataAccessLayer()
+
+    class Meta:
+        db_table = "profile_generation_watermarks"
+        verbose_name = _("Profile Generation Watermark")
+        verbose_name_plural = _("Profile Generation Watermarks")
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.value}"
@@ -0,0 +1,43 @@
+from django.db.models import CASCADE, ForeignKey
+from django.utils.translation import gettext_lazy as _
+
+from django_announcement.mixins.models.timestamped_model import TimeStampedModel
+from django_announcement.repository.manager.feed import (
+    UserAnnouncementFeedDataAccessLayer,
+)
+
+
+class UserAnnouncementFeed(TimeStampedModel):
+    """Materialized feed entry linking a user profile to an announcement it can
+    see through any of its audiences.
+
+    Rows are maintained on write whenever audience memberships or announcement
+    targets change, so reading a user's feed is a single indexed range scan
+    over ``(user_announce_profile, announcement)``.
+
+    """
+
+    user_announce_profile = ForeignKey(
+        to="UserAnnouncementProfile",
+        on_delete=CASCADE,
+        related_name="feed_entries",
+        verbose_name=_("User Profile"),
+        help_text=_("The user profile that receives the announcement."),
+        db_comment="Foreign key to the UserAnnouncementProfile table.",
+    )
+    announcement = ForeignKey(
+        to="Announcement",
+        on_delete=CASCADE,
+        related_name="feed_entries",
+        verbose_name=_("Announcement"),
+        help_text=_("The announcement delivered to the user profile."),
+        db_comment="Foreign key to the Announcement table.",
+    )
+
+    objects = UserAnnouncementFeedDataAccessLayer()
+
+    class Meta:
+        db_table = "user_announcement_feed"
+        verbose_name = _("User Announcement Feed")
+        verbose_name_plural = _("User Announcement Feeds")
+        unique_together = ("user_announce_profile", "announcement")
@@ -0,0 +1,163 @@
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+from django.db.models import (
+    CASCADE,
+    DateTimeField,
+    JSONField,
+    OneToOneField,
+    PositiveBigIntegerField,
+)
+from django.utils.translation import gettext_lazy as _
+
+from django_announcement.mixins.models.timestamped_model import TimeStampedModel
+from django_announcement.repository.manager.read_state import (
+    UserAnnouncementReadStateDataAccessLayer,
+)
+
+# A position in the announcement feed: (effective publication time, id)
+Position = Tuple[datetime, int]
+
+
+class UserAnnouncementReadState(TimeStampedModel):
+    """The announcements a user has read, stored as a single row per
+    profile.
+
+    Announcements are positioned by their effective publication time
+    (``published_at``, falling back to ``created_at``) and id, the order
+    of the cursor pagination. Every announcement up to the mark, the
+    position (``read_up_to_at``, ``read_up_to``), is read, as well as the
+    ids listed in ``read_ids``, which are all above it. Reading the
+    announcements in order only moves the mark, and announcements read
+    out of order are folded into it once the gaps before them are read,
+    so the row stays small however many announcements the user reads.
+    Announcements scheduled before the mark was moved are positioned at
+    their publication, so they are unread once published.
+
+    """
+
+    user_announce_profile = OneToOneField(
+        to="UserAnnouncementProfile",
+        on_delete=CASCADE,
+        primary_key=True,
+        related_name="read_state",
+        verbose_name=_("User Profile"),
+        help_text=_("The user profile whose read announcements are tracked."),
+        db_comment="One-to-one relationship with the UserAnnouncementProfile table.",
+    )
+    read_up_to_at = DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name=_("Read Up To At"),
+        help_text=_("The publication time of the mark, or empty if nothing is read."),
+        db_comment="Effective publication time of the high-water mark of read announcements.",
+    )
+    read_up_to = PositiveBigIntegerField(
+        default=0,
+        verbose_name=_("Read Up To"),
+        help_text=_("The announcement id of the mark, breaking publication time ties."),
+        db_comment="Announcement id of the high-water mark of read announcements.",
+    )
+    read_ids = JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_("Read IDs"),
+        help_text=_("The sorted ids of the announcements read above the mark."),
+        db_comment="Sorted ids of the announcements read above the high-water mark.",
+    )
+
+    objects = UserAnnouncementReadStateDataAccessLayer()
+
+    class Meta:
+        db_table = "user_announcement_read_states"
+        verbose_name = _("User Announcement Read State")
+        verbose_name_plural = _("User Announcement Read States")
+
+    def __str__(self) -> str:
+        return f"{self.user_announce_profile} read up to {self.read_up_to}"
+
+    @property
+    def mark(self) -> Optional[Position]:
+        """Return the position up to which every announcement is read, or
+        None if nothing is read yet."""
+        if self.read_up_to_at is None:
+            return None
+
+        return self.read_up_to_at, self.read_up_to
+
+    def is_above_mark(self, position: Position) -> bool:
+        """Return whether a position is after the mark.
+
+        Args:
+            position (Position): The position of an announcement.
+
+        Returns:
+            bool: True if the announcement is not read through the mark.
+
+        """
+        return self.mark is None or position > self.mark
+
+    def is_read(self, position: Position) -> bool:
+        """Return whether an announcement is read.
+
+        Args:
+            position (Position): The position of the announcement.
+
+        Returns:
+            bool: True if the announcement is read.
+
+        """
+        return not self.is_above_mark(position) or position[1] in self.read_ids
+
+    def mark_read(self, positions: Iterable[Position]) -> None:
+        """Add announcements to the read ones, without saving.
+
+        Args:
+            positions (Iterable[Position]): The positions of the announcements.
+
+        """
+        self.read_ids = sorted(
+            {
+                *self.read_ids,
+                *(pk for _at, pk in filter(self.is_above_mark, positions)),
+            }
+        )
+
+    def mark_read_up_to(self, position: Position) -> None:
+        """Mark every announcement up to a position as read, without
+        saving.
+
+        The position is the last visible announcement, so the ids read
+        above the mark are dropped.
+
+        Args:
+            position (Position): The position of the announcement.
+
+        """
+        if self.is_above_mark(position):
+            self.read_up_to_at, self.read_up_to = position
+        self.read_ids = []
+
+    def compact(self, unread_candidates: Iterable[Position]) -> None:
+        """Move the mark over the read ids that directly follow it, without
+        saving.
+
+        Args:
+            unread_candidates (Iterable[Position]): The ascending positions
+                of the announcements the user can see above the mark, at
+                least up to the first one that is not read. Ids the user
+                cannot see, such as deleted announcements, are skipped
+                over.
+
+        """
+        read_ids = set(self.read_ids)
+        for position in unread_candidates:
+            if position[1] not in read_ids:
+                break
+            self.read_up_to_at, self.read_up_to = position
+            read_ids.discard(position[1])
+        else:
+            # Every visible announcement above the mark is read
+            read_ids.clear()
+
+        self.read_ids = sorted(read_ids)
@@ -1,4 +1,6 @@
-from django.db.models import Manager, QuerySet
+from typing import Union
+
+from django.db.models import Manager, Model, QuerySet
 
 from django_announcement.constants.types import Audiences, Categories
 from django_announcement.repository.queryset.announcement import AnnouncementQuerySet
@@ -76,6 +78,18 @@ class AnnouncementDataAccessLayer(Manager):
         """
         return self.get_queryset().get_by_audience(audiences)
 
+    def get_by_user(self, user: Union[Model, int]) -> QuerySet:
+        """Retrieves announcements targeted at the audiences of a user.
+
+        Args:
+            user (Union[Model, int]): A user instance or user ID.
+
+        Returns:
+            QuerySet: A queryset of announcements for the user's audiences.
+
+        """
+        return self.get_queryset().get_by_user(user)
+
     def get_by_category(self, categories: Categories) -> QuerySet:
         """Retrieves announcements filtered by category(s).
 
@@ -88,3 +102,15 @@ class AnnouncementDataAccessLayer(Manager):
 
         """
         return self.get_queryset().get_by_category(categories)
+
+    def get_by_feed(self, user: Union[Model, int]) -> QuerySet:
+        """Retrieves announcements from the materialized feed of a user.
+
+        Args:
+            user (Union[Model, int]): A user instance or user ID.
+
+        Returns:
+            QuerySet: A queryset of announcements in the user's feed.
+
+        """
+        return self.get_queryset().get_by_feed(user)
@@ -0,0 +1,106 @@
+from datetime import datetime
+from typing import Iterable, Optional
+
+from django.db.models import Manager, Max, Q, QuerySet
+
+
+class AnnouncementChangeDataAccessLayer(Manager):
+    """Data Access Layer for the AnnouncementChange model.
+
+    Records the announcements touched by each write and the membership
+    changes of users, and reads back the changes after a cursor for the
+    delta sync of the API.
+
+    """
+
+    # Number of change rows written per bulk insert
+    batch_size: int = 1000
+
+    def record(
+        self,
+        announcement_ids: Iterable[int],
+        audience_ids: Optional[Iterable[int]] = None,
+    ) -> None:
+        """Log a change of the given announcements.
+
+        Args:
+            announcement_ids (Iterable[int]): The changed announcements.
+            audience_ids (Optional[Iterable[int]]): The audiences that
+                gained or lost the announcements, or None for a change of
+                the announcements themselves, which concerns whoever can
+                see them.
+
+        """
+        audience_ids = [None] if audience_ids is None else list(audience_ids)
+        self.bulk_create(
+            [
+                self.model(announcement_id=announcement_id, audience_id=audience_id)
+                for announcement_id in announcement_ids
+                for audience_id in audience_ids
+            ],
+            batch_size=self.batch_size,
+        )
+
+    def record_memberships(
+        self, user_ids: Iterable[int], audience_ids: Iterable[int]
+    ) -> None:
+        """Log users joining or leaving audiences.
+
+        Args:
+            user_ids (Iterable[int]): The users whose memberships changed.
+            audience_ids (Iterable[int]): The audiences they joined or left.
+
+        """
+        audience_ids = list(audience_ids)
+        self.bulk_create(
+            [
+                self.model(user_id=user_id, audience_id=audience_id)
+                for user_id in user_ids
+                for audience_id in audience_ids
+            ],
+            batch_size=self.batch_size,
+        )
+
+    def last_id(self, before: Optional[datetime] = None) -> int:
+        """Return the id of the latest change, or 0 if there is none.
+
+        Args:
+            before (Optional[datetime]): Only consider the changes logged
+                up to this time, or None for all changes.
+
+        """
+        queryset = self if before is None else self.filter(created_at__lte=before)
+        return queryset.aggregate(last_id=Max("pk"))["last_id"] or 0
+
+    def since(
+        self,
+        change_id: int,
+        audience_ids: Optional[Iterable[int]] = None,
+        user_id: Optional[int] = None,
+    ) -> QuerySet:
+        """Return the changes after a change, oldest first.
+
+        Args:
+            change_id (int): The id of the last change already synced.
+            audience_ids (Optional[Iterable[int]]): Only the changes of
+                these audiences and those of the announcements themselves,
+                or None for all changes of announcements.
+            user_id (Optional[int]): Also the membership changes of this
+                user. Membership changes of other users are never
+                returned.
+
+        Returns:
+            QuerySet: The changes, as an index range scan of the primary
+            key.
+
+        """
+        queryset = self.filter(pk__gt=change_id)
+        changes = Q(user_id__isnull=True)
+        if audience_ids is not None:
+            changes &= Q(audience_id__in=list(audience_ids)) | Q(
+                audience_id__isnull=True
+            )
+        if user_id is not None:
+            changes |= Q(user_id=user_id)
+
+        return queryset.filter(changes).order_by("pk")
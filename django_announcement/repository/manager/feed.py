@@ -0,0 +1,153 @@
+from typing import Iterable, Iterator, List, Optional
+
+from django.db.models import Exists, Manager, OuterRef, QuerySet
+
+from django_announcement.models.user_audience import UserAudience
+
+
+class UserAnnouncementFeedDataAccessLayer(Manager):
+    """Data Access Layer for the UserAnnouncementFeed model.
+
+    This class keeps the materialized feed in line with the
+    ``UserAudience`` and ``AudienceAnnouncement`` tables. A feed entry
+    exists for a (profile, announcement) pair exactly when the profile
+    belongs to at least one audience the announcement targets.
+
+    """
+
+    # Number of feed rows written per bulk insert
+    batch_size: int = 1000
+
+    # Number of ids bound per ``IN`` list, kept below SQLite's variable limit
+    id_chunk_size: int = 500
+
+    def sync(
+        self,
+        profile_ids: Optional[Iterable[int]] = None,
+        announcement_ids: Optional[Iterable[int]] = None,
+    ) -> None:
+        """Bring the feed up to date for the given profiles and/or
+        announcements, adding missing entries and removing stale ones.
+
+        Passing neither argument synchronizes the whole feed. Large id
+        lists are processed in chunks of ``id_chunk_size`` so the queries
+        stay within the database's bound-parameter limit.
+
+        Args:
+            profile_ids (Optional[Iterable[int]]): Restrict the sync to these profiles.
+            announcement_ids (Optional[Iterable[int]]): Restrict the sync to these announcements.
+
+        """
+        announcement_ids = self._as_list(announcement_ids)
+
+        for profile_chunk in self._chunks(profile_ids):
+            for announcement_chunk in self._chunks(announcement_ids):
+                self.fill(profile_chunk, announcement_chunk)
+                self.prune(profile_chunk, announcement_chunk)
+
+    def fill(
+        self,
+        profile_ids: Optional[Iterable[int]] = None,
+        announcement_ids: Optional[Iterable[int]] = None,
+    ) -> None:
+        """Insert the feed entries that are reachable through audiences but
+        missing from the feed.
+
+        Args:
+            profile_ids (Optional[Iterable[int]]): Restrict the insert to these
+                profiles. A queryset of ids is kept as a subquery.
+            announcement_ids (Optional[Iterable[int]]): Restrict the insert to these announcements.
+
+        """
+        lookups = {"audience__audience_announcements__isnull": False}
+        if isinstance(profile_ids, QuerySet):
+            lookups["user_announce_profile_id__in"] = profile_ids
+        elif profile_ids is not None:
+            lookups["user_announce_profile_id__in"] = self._as_list(profile_ids)
+        if announcement_ids is not None:
+            lookups["audience__audience_announcements__announcement_id__in"] = (
+                self._as_list(announcement_ids)
+            )
+
+        missing_pairs = (
+            UserAudience.objects.filter(**lookups)
+            .annotate(
+                feed_exists=Exists(
+                    self.filter(
+                        user_announce_profile_id=OuterRef("user_announce_profile_id"),
+                        announcement_id=OuterRef(
+                            "audience__audience_announcements__announcement_id"
+                        ),
+                    )
+                )
+            )
+            .filter(feed_exists=False)
+            .values_list(
+                "user_announce_profile_id",
+                "audience__audience_announcements__announcement_id",
+            )
+            .distinct()
+        )
+
+        batch = []
+        for profile_id, announcement_id in missing_pairs.iterator(
+            chunk_size=self.batch_size
+        ):
+            batch.append(
+                self.model(
+                    user_announce_profile_id=profile_id,
+                    announcement_id=announcement_id,
+                )
+            )
+            if len(batch) >= self.batch_size:
+                self.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+
+        if batch:
+            self.bulk_create(batch, ignore_conflicts=True)
+
+    def prune(
+        self,
+        profile_ids: Optional[Iterable[int]] = None,
+        announcement_ids: Optional[Iterable[int]] = None,
+    ) -> None:
+        """Delete feed entries that are no longer reachable through any
+        audience.
+
+        Args:
+            profile_ids (Optional[Iterable[int]]): Restrict the cleanup to these profiles.
+            announcement_ids (Optional[Iterable[int]]): Restrict the cleanup to these announcements.
+
+        """
+        entries = self.get_queryset()
+        if profile_ids is not None:
+            entries = entries.filter(user_announce_profile_id__in=profile_ids)
+        if announcement_ids is not None:
+            entries = entries.filter(announcement_id__in=announcement_ids)
+
+        entries.exclude(
+            Exists(
+                UserAudience.objects.filter(
+                    user_announce_profile_id=OuterRef("user_announce_profile_id"),
+                    audience__audience_announcements__announcement_id=OuterRef(
+                        "announcement_id"
+                    ),
+                )
+            )
+        ).delete()
+
+    def _chunks(self, ids: Optional[Iterable[int]]) -> Iterator[Optional[List[int]]]:
+        """Split an optional iterable of ids into lists of at most
+        ``id_chunk_size`` ids, yielding None once when no ids are given."""
+        if ids is None:
+            yield None
+            return
+
+        ids = sorted(set(ids))
+        for start in range(0, len(ids), self.id_chunk_size):
+            yield ids[start : start + self.id_chunk_size]
+
+    @staticmethod
+    def _as_list(ids: Optional[Iterable[int]]) -> Optional[List[int]]:
+        """Normalize an optional iterable of ids to a list."""
+        return None if ids is None else list(ids)
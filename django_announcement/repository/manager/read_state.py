@@ -0,0 +1,50 @@
+from typing import Any
+
+from django.db.models import Manager
+
+from django_announcement.models.user_announce_profile import UserAnnouncementProfile
+
+
+class UserAnnouncementReadStateDataAccessLayer(Manager):
+    """Data Access Layer for the UserAnnouncementReadState model.
+
+    Loads the read state of a user in a single query, whether or not it
+    was saved before, and locks it for updates.
+
+    """
+
+    def for_user(self, user_id: int) -> Any:
+        """Return the read state of a user.
+
+        Args:
+            user_id (int): The id of the user.
+
+        Returns:
+            UserAnnouncementReadState: The saved state, or an unsaved empty
+            one if the user never marked an announcement as read.
+
+        """
+        state = self.filter(user_announce_profile__user_id=user_id).first()
+        return self.model() if state is None else state
+
+    def lock_for_user(self, user_id: int) -> Any:
+        """Return the read state of a user, locked until the end of the
+        current transaction.
+
+        The profile of the user and the state are created on first use, so
+        users without audiences, such as staff, keep a read state too.
+
+        Args:
+            user_id (int): The id of the user.
+
+        Returns:
+            UserAnnouncementReadState: The saved state.
+
+        """
+        profile, _created = UserAnnouncementProfile.objects.get_or_create(
+            user_id=user_id
+        )
+        state, _created = self.select_for_update().get_or_create(
+            user_announce_profile=profile
+        )
+        return state
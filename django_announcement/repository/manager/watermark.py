@@ -0,0 +1,21 @@
+from typing import Dict
+
+from django.db.models import Manager
+
+
+class ProfileGenerationWatermarkDataAccessLayer(Manager):
+    """Data Access Layer for the ProfileGenerationWatermark model."""
+
+    def marks(self) -> Dict[str, int]:
+        """Return the recorded marks by name."""
+        return dict(self.values_list("name", "value"))
+
+    def store(self, marks: Dict[str, int]) -> None:
+        """Record marks, replacing the previous values.
+
+        Args:
+            marks (Dict[str, int]): The highest processed ids by name.
+
+        """
+        for name, value in marks.items():
+            self.update_or_create(name=name, defaults={"value": value})
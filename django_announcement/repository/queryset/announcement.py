@@ -1,9 +1,17 @@
-from django.db.models import Q, QuerySet
+from typing import Iterable, Optional, Tuple, Union
+
+from django.db.models import Exists, Model, OuterRef, Q, QuerySet
 from django.utils.timezone import now
 
 from django_announcement.constants.types import Audiences, Categories
 from django_announcement.models.announcement_category import AnnouncementCategory
 from django_announcement.models.audience import Audience
+from django_announcement.models.audience_announce import AudienceAnnouncement
+from django_announcement.repository.queryset.rows import (
+    AudienceRowIterable,
+    RowIterable,
+)
+from django_announcement.utils.cache import get_user_audience_ids
 
 
 class AnnouncementQuerySet(QuerySet):
@@ -20,9 +28,29 @@ class AnnouncementQuerySet(QuerySet):
         expired(): Filters announcements that have already expired.
         by_audience(audience_id: int): Filters announcements by target audience ID.
         by_category(category_id: int): Filters announcements by category ID.
+        get_by_user(user): Filters announcements by the (cached) audiences of a user.
+        get_by_feed(user): Filters announcements through the user's materialized feed.
+        with_relations(relations): Loads exactly the given relations.
+        only_fields(fields): Loads only the columns and relations of the given fields.
+        as_rows(with_audience, fields): Fetches announcements as lightweight rows.
 
     """
 
+    # Columns fetched by `as_rows`, related fields spelled as lookups
+    row_fields: Tuple[str, ...] = (
+        "id",
+        "title",
+        "content",
+        "published_at",
+        "expires_at",
+        "attachment",
+        "created_at",
+        "updated_at",
+        "category__id",
+        "category__name",
+        "category__description",
+    )
+
     @property
     def _join(self) -> QuerySet:
         """Apply select_related and prefetch_related to optimize queries.
@@ -71,6 +99,11 @@ class AnnouncementQuerySet(QuerySet):
     def get_by_audience(self, audiences: Audiences) -> QuerySet:
         """Filter announcements by the target audience(s).
 
+        The audiences are matched with a correlated ``EXISTS`` subquery on
+        the ``audience_announcement`` table, so announcements targeting
+        several of the audiences are returned once without a ``DISTINCT``
+        over every selected column.
+
         Args:
             audiences (Audiences): A single audience instance,
             audience ID, or an iterable of audience instances.
@@ -82,11 +115,38 @@ class AnnouncementQuerySet(QuerySet):
         if isinstance(audiences, (int, Audience)):
             audiences = [audiences]
 
-        return self._join.filter(audience__in=audiences).distinct()
+        return self._join.filter(
+            Exists(
+                AudienceAnnouncement.objects.filter(
+                    announcement=OuterRef("pk"), audience__in=audiences
+                )
+            )
+        )
+
+    def get_by_user(self, user: Union[Model, int]) -> QuerySet:
+        """Filter announcements by the audiences the user belongs to.
+
+        The user's audience ids are resolved through
+        `get_user_audience_ids`, which serves them from the cache when
+        the audience cache is enabled.
+
+        Args:
+            user (Union[Model, int]): A user instance or user ID.
+
+        Returns:
+            QuerySet: A queryset containing announcements for the user's audiences.
+
+        """
+        user_id = user if isinstance(user, int) else user.pk
+
+        return self.get_by_audience(get_user_audience_ids(user_id))
 
     def get_by_category(self, categories: Categories) -> QuerySet:
         """Filter announcements by target category(s).
 
+        An announcement has a single category, so the filter can not
+        produce duplicates and needs no ``DISTINCT``.
+
         Args:
             categories (Categories): A single category instance,
             category ID, or an iterable of category instances.
@@ -98,4 +158,118 @@ class AnnouncementQuerySet(QuerySet):
         if isinstance(categories, (int, AnnouncementCategory)):
             categories = [categories]
 
-        return self._join.filter(category__in=categories).distinct()
+        return self._join.filter(category__in=categories)
+
+    def get_by_feed(self, user: Union[Model, int]) -> QuerySet:
+        """Filter announcements through the materialized feed of a user.
+
+        The feed holds exactly one row per (profile, announcement) pair,
+        so no DISTINCT is needed and the lookup is an indexed range scan
+        on the user's feed entries.
+
+        Args:
+            user (Union[Model, int]): A user instance or user ID.
+
+        Returns:
+            QuerySet: A queryset containing announcements in the user's feed.
+
+        """
+        user_id = user if isinstance(user, int) else user.pk
+
+        return self._join.filter(feed_entries__user_announce_profile__user_id=user_id)
+
+    def with_relations(self, relations: Iterable[str]) -> QuerySet:
+        """Load exactly the given relations, replacing those of `_join`.
+
+        Forward foreign keys are joined with ``select_related`` and
+        many-to-many or reverse relations are fetched with
+        ``prefetch_related``, so callers only declare what they read.
+
+        Args:
+            relations (Iterable[str]): The names of the relations to load,
+                e.g. ``["category"]``; an empty iterable loads none.
+
+        Returns:
+            QuerySet: The queryset loading the given relations.
+
+        """
+        queryset = self.select_related(None).prefetch_related(None)
+        selected, prefetched = [], []
+        for name in sorted(set(relations)):
+            field = self.model._meta.get_field(name)
+            if field.many_to_many or field.one_to_many:
+                prefetched.append(name)
+            else:
+                selected.append(name)
+
+        if selected:
+            queryset = queryset.select_related(*selected)
+        if prefetched:
+            queryset = queryset.prefetch_related(*prefetched)
+
+        return queryset
+
+    def only_fields(self, fields: Iterable[str]) -> QuerySet:
+        """Load only what is needed to represent the given fields.
+
+        Plain fields are passed to ``only()``, so large columns such as
+        ``content`` are not loaded unless requested. The ``category`` join
+        and the ``audience`` prefetch of `_join` are only kept when those
+        fields are requested. The primary key is always loaded.
+
+        Args:
+            fields (Iterable[str]): The names of the requested fields.
+
+        Returns:
+            QuerySet: The narrowed queryset.
+
+        """
+        fields = {self.model._meta.get_field(name) for name in fields}
+        queryset = self.with_relations(
+            field.name for field in fields if field.is_relation
+        )
+
+        return queryset.only(
+            "id",
+            *sorted(
+                field.name
+                for field in fields
+                if not (field.many_to_many or field.one_to_many)
+            ),
+        )
+
+    def as_rows(
+        self, with_audience: bool = False, fields: Optional[Iterable[str]] = None
+    ) -> QuerySet:
+        """Fetch the announcements as lightweight ``__slots__`` rows instead
+        of model instances.
+
+        The queryset selects `row_fields` with ``values()`` and yields a
+        `Row` per announcement, with the category columns flattened into
+        ``category__id``, ``category__name`` and ``category__description``.
+        It can still be filtered, ordered, annotated and sliced like any
+        other queryset.
+
+        Args:
+            with_audience (bool): Whether to attach the audiences of each
+                announcement, loaded with one extra query, as ``audience``.
+            fields (Optional[Iterable[str]]): Restricts the columns to those
+                of the given fields (``category`` selecting every category
+                column); the primary key is always fetched.
+
+        Returns:
+            QuerySet: A queryset yielding `Row` objects.
+
+        """
+        columns = self.row_fields
+        if fields is not None:
+            fields = set(fields)
+            columns = tuple(
+                column
+                for column in columns
+                if column == "id" or column.split("__")[0] in fields
+            )
+
+        queryset = self.prefetch_related(None).values(*columns)
+        queryset._iterable_class = AudienceRowIterable if with_audience else RowIterable
+        return queryset
@@ -0,0 +1,124 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Tuple, Type
+
+from django.db.models.query import BaseIterable
+
+from django_announcement.models.audience_announce import AudienceAnnouncement
+
+
+class Row:
+    """A lightweight, read-only record holding the values of one database
+    row as attributes.
+
+    Subclasses are created by `make_row_class` with one ``__slots__`` entry
+    per selected column, so a row costs neither a model instance nor a
+    dictionary.
+
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def __init__(self, *values: Any) -> None:
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    @property
+    def pk(self) -> Any:
+        """The primary key of the row, mirroring ``Model.pk``."""
+        return getattr(self, "id")
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the values of the row keyed by column name.
+
+        Returns:
+            Dict[str, Any]: The values of the row.
+
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self.as_dict()}>"
+
+
+@lru_cache(maxsize=None)
+def make_row_class(names: Tuple[str, ...]) -> Type[Row]:
+    """Create (once per set of columns) a `Row` subclass with the given
+    slots.
+
+    Args:
+        names (Tuple[str, ...]): The column names, e.g. ``category__name``.
+
+    Returns:
+        Type[Row]: The row class.
+
+    """
+    return type("Row", (Row,), {"__slots__": names})
+
+
+class RowIterable(BaseIterable):
+    """Yield a `Row` for each row of a ``values()`` queryset.
+
+    The columns follow the order of the SQL select, which is the order
+    ``ValuesIterable`` relies on as well: extra selects, values and then
+    annotations (such as the cursor position of the cursor pagination).
+
+    """
+
+    def get_names(self) -> Tuple[str, ...]:
+        """Return the column names of the select.
+
+        Returns:
+            Tuple[str, ...]: The names of the selected columns.
+
+        """
+        query = self.queryset.query
+        return (*query.extra_select, *query.values_select, *query.annotation_select)
+
+    def __iter__(self) -> Iterator[Row]:
+        queryset = self.queryset
+        row_class = make_row_class(self.get_names())
+        compiler = queryset.query.get_compiler(queryset.db)
+        for values in compiler.results_iter(
+            chunked_fetch=self.chunked_fetch, chunk_size=self.chunk_size
+        ):
+            yield row_class(*values)
+
+
+class AudienceRowIterable(RowIterable):
+    """Yield announcement rows together with their audiences.
+
+    The audiences of all fetched announcements are loaded with one extra
+    query, like ``prefetch_related("audience")`` would, and attached to
+    each row as an ``audience`` list of rows ordered by audience id.
+
+    """
+
+    audience_fields: Tuple[str, ...] = ("id", "name", "description")
+
+    def get_names(self) -> Tuple[str, ...]:
+        return (*super().get_names(), "audience")
+
+    def __iter__(self) -> Iterator[Row]:
+        queryset = self.queryset
+        row_class = make_row_class(self.get_names())
+        compiler = queryset.query.get_compiler(queryset.db)
+        rows: List[Tuple[Any, ...]] = list(compiler.results_iter())
+        if not rows:
+            return
+
+        pk_index = self.get_names().index("id")
+        audiences: Dict[Any, List[Row]] = {row[pk_index]: [] for row in rows}
+        audience_class = make_row_class(self.audience_fields)
+        for announcement_id, *values in (
+            AudienceAnnouncement.objects.using(queryset.db)
+            .filter(announcement_id__in=list(audiences))
+            .order_by("audience_id")
+            .values_list(
+                "announcement_id",
+                *(f"audience__{name}" for name in self.audience_fields),
+            )
+        ):
+            audiences[announcement_id].append(audience_class(*values))
+
+        for values in rows:
+            yield row_class(*values, audiences[values[pk_index]])
@@ -0,0 +1,199 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, Type
+
+from django.core.cache import BaseCache, caches
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Model
+from django.http import HttpRequest
+
+from django_announcement.settings.conf import config
+
+APP_LABEL = "django_announcement"
+KEY_PREFIX = "django_announcement:primary_pin"
+
+
+class RoutingState:
+    """The routing state of the request being served.
+
+    The shared pin of the user or session is looked up at most once per
+    request, and stored at most once, when the request ends, if it wrote.
+
+    Attributes:
+        request (HttpRequest): The request being served.
+        pin_key (Optional[str]): The stickiness key whose shared pin was
+            looked up.
+        pinned (bool): Whether that key was pinned to the primary.
+        wrote (bool): Whether the request wrote to the announcement tables.
+
+    """
+
+    def __init__(self, request: HttpRequest) -> None:
+        self.request = request
+        self.pin_key: Optional[str] = None
+        self.pinned = False
+        self.wrote = False
+
+
+# The routing state of the request being served
+routing_state: ContextVar[Optional[RoutingState]] = ContextVar(
+    "announcement_routing_state", default=None
+)
+# Monotonic time until which reads of the current context use the primary
+pinned_until: ContextVar[float] = ContextVar("announcement_pinned_until", default=0.0)
+
+
+def _get_cache() -> BaseCache:
+    """Return the cache backend configured for the announcement app."""
+    return caches[config.cache_alias]
+
+
+def get_stickiness_key(request: Optional[HttpRequest]) -> Optional[str]:
+    """Identify the user, or else the session, issuing a request.
+
+    Args:
+        request (Optional[HttpRequest]): The request being served, if any.
+
+    Returns:
+        Optional[str]: The key remembering the writes of the user or
+        session, or None for anonymous requests without a session.
+
+    """
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return f"{KEY_PREFIX}:user:{user.pk}"
+
+    session = getattr(request, "session", None)
+    if session is not None and session.session_key:
+        return f"{KEY_PREFIX}:session:{session.session_key}"
+
+    return None
+
+
+@contextmanager
+def routing_context(request: HttpRequest) -> Iterator[None]:
+    """Route the announcement queries issued while serving a request.
+
+    Reads stay on the primary database while the user or session of the
+    request recently wrote to the announcement tables. If the request
+    wrote, its user or session is pinned once it ends.
+
+    Args:
+        request (HttpRequest): The request being served.
+
+    """
+    state = RoutingState(request)
+    state_token = routing_state.set(state)
+    pin_token = pinned_until.set(0.0)
+    try:
+        yield
+    finally:
+        pinned_until.reset(pin_token)
+        routing_state.reset(state_token)
+        if state.wrote:
+            # The user is only known once authenticated, e.g. by the view
+            key = get_stickiness_key(request)
+            if key is not None:
+                _get_cache().set(key, True, config.database_stickiness_timeout)
+
+
+def pin_to_primary() -> None:
+    """Keep the reads of the current context, and of later requests of the
+    same user or session, on the primary database for
+    `config.database_stickiness_timeout` seconds."""
+    pinned_until.set(time.monotonic() + config.database_stickiness_timeout)
+
+    state = routing_state.get()
+    if state is not None:
+        state.wrote = True
+
+
+def is_pinned_to_primary() -> bool:
+    """Return whether reads of the current context must use the primary.
+
+    Returns:
+        bool: True inside transactions of the primary database, and within
+        the stickiness window of a write of the current context, user or
+        session.
+
+    """
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return True
+
+    if pinned_until.get() > time.monotonic():
+        return True
+
+    state = routing_state.get()
+    if state is None:
+        return False
+
+    key = get_stickiness_key(state.request)
+    if key is None:
+        return False
+    if key != state.pin_key:
+        state.pin_key, state.pinned = key, bool(_get_cache().get(key))
+
+    return state.pinned
+
+
+class AnnouncementReplicaRouter:
+    """Database router sending the reads of the announcement app to the
+    `config.database_replicas` aliases.
+
+    Writes go to the default database, and mark the current context, user
+    and session as having written: their reads stay on the primary for
+    `config.database_stickiness_timeout` seconds, so they read their own
+    writes despite replication lag. Reads inside transactions of the
+    primary database stay on it as well. The user and session are those of
+    the request served by `AnnouncementReplicaMiddleware`, and their pins
+    cost one cache read per request, plus one write per request that
+    wrote.
+
+    The models of other apps are left to the other routers.
+
+    """
+
+    def db_for_read(self, model: Type[Model], **hints: Any) -> Optional[str]:
+        """Pick a replica for announcement reads, unless pinned to the
+        primary."""
+        if model._meta.app_label != APP_LABEL or not config.database_replicas:
+            return None
+
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+
+        if is_pinned_to_primary():
+            return DEFAULT_DB_ALIAS
+
+        return random.choice(config.database_replicas)
+
+    def db_for_write(self, model: Type[Model], **hints: Any) -> Optional[str]:
+        """Send announcement writes to the primary, pinning the following
+        reads to it."""
+        if model._meta.app_label != APP_LABEL or not config.database_replicas:
+            return None
+
+        pin_to_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> Optional[bool]:
+        """Allow relations between objects of the primary and its
+        replicas, which hold the same rows."""
+        aliases = {DEFAULT_DB_ALIAS, *config.database_replicas}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+
+        return None
+
+    def allow_migrate(
+        self, db: str, app_label: str, model_name: Optional[str] = None, **hints: Any
+    ) -> Optional[bool]:
+        """Keep the migrations of the announcement app off the replicas,
+        which receive its tables through replication."""
+        if app_label != APP_LABEL or db not in config.database_replicas:
+            return None
+
+        return False
@@ -0,0 +1,40 @@
+from functools import lru_cache
+from typing import Optional, Type
+
+from .backends import (
+    BaseSearchBackend,
+    InMemorySearchBackend,
+    PostgresSearchBackend,
+    SQLiteFTS5SearchBackend,
+)
+
+
+@lru_cache(maxsize=None)
+def get_backend_instance(backend_class: Type[BaseSearchBackend]) -> BaseSearchBackend:
+    """Return the shared instance of a search backend class.
+
+    Args:
+        backend_class (Type[BaseSearchBackend]): The backend class.
+
+    Returns:
+        BaseSearchBackend: The instance shared by the process.
+
+    """
+    return backend_class()
+
+
+def get_search_backend() -> Optional[BaseSearchBackend]:
+    """Return the configured full-text search backend.
+
+    Returns:
+        Optional[BaseSearchBackend]: The backend set by the
+        ``DJANGO_ANNOUNCEMENT_API_SEARCH_BACKEND`` setting, or None when
+        searches use the ``API_SEARCH_FIELDS`` lookups.
+
+    """
+    from django_announcement.settings.conf import config
+
+    if config.api_search_backend is None:
+        return None
+
+    return get_backend_instance(config.api_search_backend)
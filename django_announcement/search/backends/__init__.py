@@ -0,0 +1,4 @@
+from .base import BaseSearchBackend
+from .memory import InMemorySearchBackend
+from .postgres import PostgresSearchBackend
+from .sqlite import SQLiteFTS5SearchBackend
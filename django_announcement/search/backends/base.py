@@ -0,0 +1,85 @@
+import re
+from typing import Iterable, List, Optional
+
+from django.db.models import QuerySet
+
+# Words of a search query or document, across all scripts
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class BaseSearchBackend:
+    """Base class of the announcement full-text search backends.
+
+    A backend filters an announcement queryset down to the announcements
+    matching a search query and annotates each of them with a relevance
+    score under `rank_annotation` (higher is more relevant). Every word of
+    the query has to match, as a prefix, a word of the title, the content
+    or the category name of an announcement.
+
+    Backends keeping their own index either maintain it in the database
+    (e.g. with triggers), or set `maintained_by_signals` so the app
+    connects receivers calling `index` and `remove` on writes.
+
+    Attributes:
+        rank_annotation (str): The name of the relevance annotation.
+        maintained_by_signals (bool): Whether the index is maintained by
+            the model signal receivers of the app.
+
+    """
+
+    rank_annotation: str = "search_rank"
+    maintained_by_signals: bool = False
+
+    @staticmethod
+    def tokenize(text: Optional[str]) -> List[str]:
+        """Split a text into lowercase words.
+
+        Args:
+            text (Optional[str]): The text to split.
+
+        Returns:
+            List[str]: The words of the text, in order.
+
+        """
+        return TOKEN_PATTERN.findall((text or "").lower())
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        """Filter the announcements matching a search query.
+
+        Args:
+            queryset (QuerySet): The announcements to search.
+            query (str): The search query entered by a user.
+
+        Returns:
+            QuerySet: The matching announcements, annotated with their
+            relevance. The queryset is returned as is when the query has
+            no words.
+
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def setup(self, using: str = "default") -> None:
+        """Create (or rebuild) the index structures of the backend.
+
+        Args:
+            using (str): The alias of the database to set up.
+
+        """
+
+    def index(self, announcement_ids: Iterable[int]) -> None:
+        """(Re)index the given announcements.
+
+        Args:
+            announcement_ids (Iterable[int]): The ids of the announcements
+                that were created or changed.
+
+        """
+
+    def remove(self, announcement_ids: Iterable[int]) -> None:
+        """Remove the given announcements from the index.
+
+        Args:
+            announcement_ids (Iterable[int]): The ids of the deleted
+                announcements.
+
+        """
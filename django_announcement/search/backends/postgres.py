@@ -0,0 +1,112 @@
+from typing import Any, List, Tuple
+
+from django.db import connections
+from django.db.models import F, Func, Q, QuerySet, Subquery
+
+from django_announcement.search.backends.base import BaseSearchBackend
+
+
+class AnnouncementDocument(Func):
+    """The ``tsvector`` of the title and content of an announcement.
+
+    The SQL is rendered without parameters so that it is identical to the
+    expression of the ``announcement_search_idx`` GIN index, which lets
+    PostgreSQL answer the match from the index.
+
+    """
+
+    def __init__(self, search_config: str, *fields: str) -> None:
+        from django.contrib.postgres.search import SearchVectorField
+
+        super().__init__(
+            *(F(field) for field in fields), output_field=SearchVectorField()
+        )
+        self.search_config = search_config
+
+    def as_sql(self, compiler: Any, connection: Any, **extra: Any) -> Tuple[str, List]:
+        parts, params = [], []
+        for expression in self.get_source_expressions():
+            sql, expression_params = compiler.compile(expression)
+            parts.append(f"COALESCE({sql}, '')")
+            params.extend(expression_params)
+
+        document = " || ' ' || ".join(parts)
+        return f"to_tsvector('{self.search_config}'::regconfig, {document})", params
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """Full-text search with PostgreSQL ``tsvector`` matching.
+
+    `setup` creates a GIN index over the ``tsvector`` of the title and
+    content of the announcements. The index is an expression index, so the
+    database keeps it up to date on every write and no extra column or
+    trigger is needed. Announcements also match when their category name
+    matches the query; categories are few, so they are searched directly.
+
+    Results are ranked with ``ts_rank``. Requires ``psycopg`` (or
+    ``psycopg2``).
+
+    Attributes:
+        search_config (str): The text search configuration, e.g. the
+            language used for stemming.
+
+    """
+
+    search_config: str = "english"
+    index_name: str = "announcement_search_idx"
+    document_fields: Tuple[str, ...] = ("title", "content")
+
+    def get_document(self) -> AnnouncementDocument:
+        """Return the indexed document expression."""
+        return AnnouncementDocument(self.search_config, *self.document_fields)
+
+    def setup(self, using: str = "default") -> None:
+        """Create the GIN index of the announcement documents."""
+        columns = " || ' ' || ".join(
+            f"COALESCE({field}, '')" for field in self.document_fields
+        )
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.index_name} ON announcements "
+                f"USING GIN (to_tsvector('{self.search_config}'::regconfig, {columns}))"
+            )
+
+    def make_search_query(self, query: str) -> Any:
+        """Build a ``tsquery`` requiring every word of the query as a
+        prefix, or None if the query has no words."""
+        from django.contrib.postgres.search import SearchQuery
+
+        tokens = self.tokenize(query)
+        if not tokens:
+            return None
+
+        return SearchQuery(
+            " & ".join(f"{token}:*" for token in tokens),
+            config=self.search_config,
+            search_type="raw",
+        )
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        """Filter the announcements matching the query, ranked by
+        ``ts_rank``."""
+        from django.contrib.postgres.search import SearchRank, SearchVector
+
+        from django_announcement.models import AnnouncementCategory
+
+        search_query = self.make_search_query(query)
+        if search_query is None:
+            return queryset
+
+        categories = AnnouncementCategory.objects.annotate(
+            document=SearchVector("name", config=self.search_config)
+        ).filter(document=search_query)
+
+        document = self.get_document()
+        return (
+            queryset.alias(search_document=document)
+            .filter(
+                Q(search_document=search_query)
+                | Q(category__in=Subquery(categories.values("pk")))
+            )
+            .annotate(**{self.rank_annotation: SearchRank(document, search_query)})
+        )
@@ -0,0 +1,167 @@
+from typing import Any, Dict, List, Tuple
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.db.models import F, FloatField, Func, QuerySet
+from django.db.models.expressions import RawSQL
+
+from django_announcement.search.backends.base import BaseSearchBackend
+
+
+class FTS5Rank(Func):
+    """The ``bm25`` relevance of an announcement for an FTS5 match
+    expression, negated so that higher is more relevant.
+
+    The score is read from the search table row of the announcement, whose
+    rowid is the announcement id.
+
+    """
+
+    output_field = FloatField()
+
+    def __init__(self, table: str, expression: str) -> None:
+        super().__init__(F("pk"))
+        self.table = table
+        self.expression = expression
+
+    def as_sql(self, compiler: Any, connection: Any, **extra: Any) -> Tuple[str, List]:
+        pk_sql, params = compiler.compile(self.get_source_expressions()[0])
+        table = self.table
+        return (
+            f"(SELECT -bm25({table}) FROM {table} "
+            f"WHERE {table}.rowid = {pk_sql} AND {table} MATCH %s)",
+            [*params, self.expression],
+        )
+
+
+class SQLiteFTS5SearchBackend(BaseSearchBackend):
+    """Full-text search with an SQLite FTS5 virtual table.
+
+    `setup` creates the ``announcement_search`` table, whose rowid is the
+    announcement id, with the title, content and category name of every
+    announcement. Triggers on the announcement and category tables keep it
+    up to date on every write, including bulk writes bypassing signals.
+
+    Matching uses the FTS5 inverted index and results are ranked with
+    ``bm25``, so the cost of a search grows with the number of matches
+    rather than with the size of the table. The table and triggers are
+    only created by the ``setup_search_index`` command; searching a
+    database without them raises ``ImproperlyConfigured``.
+
+    """
+
+    table: str = "announcement_search"
+
+    def __init__(self) -> None:
+        # Database aliases whose search table is known to exist
+        self.ready: Dict[str, bool] = {}
+
+    def get_setup_statements(self) -> List[str]:
+        """Return the idempotent statements creating the table and its
+        triggers.
+
+        Returns:
+            List[str]: The SQL statements.
+
+        """
+        table = self.table
+        document = (
+            "new.id, new.title, new.content, "
+            "(SELECT name FROM announcement_categories WHERE id = new.category_id)"
+        )
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+            "title, content, category_name, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_insert "
+            "AFTER INSERT ON announcements BEGIN "
+            f"INSERT INTO {table}(rowid, title, content, category_name) "
+            f"VALUES ({document}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_update "
+            "AFTER UPDATE OF title, content, category_id ON announcements BEGIN "
+            f"DELETE FROM {table} WHERE rowid = old.id; "
+            f"INSERT INTO {table}(rowid, title, content, category_name) "
+            f"VALUES ({document}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_delete "
+            "AFTER DELETE ON announcements BEGIN "
+            f"DELETE FROM {table} WHERE rowid = old.id; END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_category_update "
+            "AFTER UPDATE OF name ON announcement_categories BEGIN "
+            f"UPDATE {table} SET category_name = new.name WHERE rowid IN "
+            "(SELECT id FROM announcements WHERE category_id = new.id); END",
+        ]
+
+    def setup(self, using: str = "default") -> None:
+        """Create the search table and triggers, and rebuild the table
+        from the announcements."""
+        with connections[using].cursor() as cursor:
+            for statement in self.get_setup_statements():
+                cursor.execute(statement)
+            cursor.execute(f"DELETE FROM {self.table}")
+            cursor.execute(
+                f"INSERT INTO {self.table}(rowid, title, content, category_name) "
+                "SELECT a.id, a.title, a.content, c.name FROM announcements a "
+                "JOIN announcement_categories c ON c.id = a.category_id"
+            )
+
+        self.ready[using] = True
+
+    def check_setup(self, using: str) -> None:
+        """Check that the search table of a database exists.
+
+        Args:
+            using (str): The alias of the database to search.
+
+        Raises:
+            ImproperlyConfigured: If the table was not created by the
+                ``setup_search_index`` command.
+
+        """
+        if self.ready.get(using):
+            return
+
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [self.table],
+            )
+            if cursor.fetchone() is None:
+                raise ImproperlyConfigured(
+                    f"The full-text search table '{self.table}' does not exist "
+                    f"in the '{using}' database. Run 'python manage.py "
+                    f"setup_search_index --database {using}' to create it."
+                )
+
+        self.ready[using] = True
+
+    def make_match_expression(self, query: str) -> str:
+        """Build an FTS5 query requiring every word of the query as a
+        prefix.
+
+        The words only contain word characters, so quoting them is enough
+        to keep FTS5 operators out of user input.
+
+        Args:
+            query (str): The search query.
+
+        Returns:
+            str: The FTS5 match expression, empty if the query has no words.
+
+        """
+        return " ".join(f'"{token}"*' for token in self.tokenize(query))
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        """Filter the announcements matching the query, ranked by bm25."""
+        expression = self.make_match_expression(query)
+        if not expression:
+            return queryset
+
+        self.check_setup(queryset.db)
+        table = self.table
+        # The matches come from the FTS5 index, and each score is read from
+        # the index entry of its announcement by rowid
+        return queryset.filter(
+            pk__in=RawSQL(
+                f"SELECT rowid FROM {table} WHERE {table} MATCH %s", [expression]
+            )
+        ).annotate(**{self.rank_annotation: FTS5Rank(table, expression)})
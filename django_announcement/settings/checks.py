@@ -1,13 +1,19 @@
 from typing import Any, List
 
-from django.core.checks import Error, register
+from django.core.checks import Error, Warning, register
 
+from django_announcement.constants.pagination import COUNT_MODES
 from django_announcement.settings.conf import config
+from django_announcement.streaming.brokers import LocalBroker
 from django_announcement.validators.config_validators import (
     validate_boolean_setting,
+    validate_cache_alias_setting,
+    validate_choice_setting,
+    validate_database_aliases_setting,
     validate_list_fields,
     validate_optional_path_setting,
     validate_optional_paths_setting,
+    validate_positive_integer_setting,
     validate_throttle_rate,
     validate_upload_path_setting,
 )
@@ -92,6 +98,12 @@ def check_announcement_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
             f"{config.prefix}SERIALIZER_EXCLUDE_EMPTY_FIELDS",
         )
     )
+    errors.extend(
+        validate_boolean_setting(
+            config.use_serializer_fast_path,
+            f"{config.prefix}SERIALIZER_USE_FAST_PATH",
+        )
+    )
     errors.extend(
         validate_boolean_setting(
             config.api_allow_list, f"{config.prefix}API_ALLOW_LIST"
@@ -102,6 +114,36 @@ def check_announcement_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
             config.api_allow_retrieve, f"{config.prefix}API_ALLOW_RETRIEVE"
         )
     )
+    errors.extend(
+        validate_boolean_setting(
+            config.api_conditional_requests_enabled,
+            f"{config.prefix}API_CONDITIONAL_REQUESTS_ENABLED",
+        )
+    )
+    errors.extend(
+        validate_boolean_setting(
+            config.api_async_enabled,
+            f"{config.prefix}API_ASYNC_ENABLED",
+        )
+    )
+    errors.extend(
+        validate_boolean_setting(
+            config.materialized_feed_enabled,
+            f"{config.prefix}MATERIALIZED_FEED_ENABLED",
+        )
+    )
+    errors.extend(
+        validate_boolean_setting(
+            config.audience_cache_enabled,
+            f"{config.prefix}AUDIENCE_CACHE_ENABLED",
+        )
+    )
+    errors.extend(
+        validate_boolean_setting(
+            config.list_response_cache_enabled,
+            f"{config.prefix}LIST_RESPONSE_CACHE_ENABLED",
+        )
+    )
     errors.extend(
         validate_upload_path_setting(
             config.attachment_upload_path, f"{config.prefix}ATTACHMENT_UPLOAD_PATH"
@@ -143,6 +185,12 @@ def check_announcement_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
             f"{config.prefix}AUTHENTICATED_USER_THROTTLE_RATE",
         )
     )
+    errors.extend(
+        validate_positive_integer_setting(
+            config.throttle_lease_size,
+            f"{config.prefix}THROTTLE_LEASE_SIZE",
+        )
+    )
     errors.extend(
         validate_optional_path_setting(
             config.get_setting(f"{config.prefix}API_THROTTLE_CLASS", None),
@@ -155,6 +203,19 @@ def check_announcement_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
             f"{config.prefix}API_PAGINATION_CLASS",
         )
     )
+    errors.extend(
+        validate_choice_setting(
+            config.api_pagination_count_mode,
+            COUNT_MODES,
+            f"{config.prefix}API_PAGINATION_COUNT_MODE",
+        )
+    )
+    errors.extend(
+        validate_positive_integer_setting(
+            config.api_pagination_count_cap,
+            f"{config.prefix}API_PAGINATION_COUNT_CAP",
+        )
+    )
     errors.extend(
         validate_optional_paths_setting(
             config.get_setting(f"{config.prefix}API_PARSER_CLASSES", []),
@@ -173,6 +234,12 @@ def check_announcement_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
             f"{config.prefix}API_FILTERSET_CLASS",
         )
     )
+    errors.extend(
+        validate_optional_path_setting(
+            config.get_setting(f"{config.prefix}API_SEARCH_BACKEND", None),
+            f"{config.prefix}API_SEARCH_BACKEND",
+        )
+    )
     errors.extend(
         validate_optional_path_setting(
             config.get_setting(f"{config.prefix}API_EXTRA_PERMISSION_CLASS", None),
@@ -186,4 +253,82 @@ def check_announcement_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
         )
     )
 
+    errors.extend(
+        validate_cache_alias_setting(
+            config.cache_alias,
+            f"{config.prefix}CACHE_ALIAS",
+        )
+    )
+    errors.extend(
+        validate_positive_integer_setting(
+            config.audience_cache_timeout,
+            f"{config.prefix}AUDIENCE_CACHE_TIMEOUT",
+        )
+    )
+    errors.extend(
+        validate_positive_integer_setting(
+            config.list_response_cache_timeout,
+            f"{config.prefix}LIST_RESPONSE_CACHE_TIMEOUT",
+        )
+    )
+    errors.extend(
+        validate_database_aliases_setting(
+            config.database_replicas,
+            f"{config.prefix}DATABASE_REPLICAS",
+        )
+    )
+    errors.extend(
+        validate_positive_integer_setting(
+            config.database_stickiness_timeout,
+            f"{config.prefix}DATABASE_STICKINESS_TIMEOUT",
+        )
+    )
+    errors.extend(
+        validate_boolean_setting(
+            config.stream_enabled,
+            f"{config.prefix}STREAM_ENABLED",
+        )
+    )
+    errors.extend(
+        validate_optional_path_setting(
+            config.get_setting(f"{config.prefix}STREAM_BROKER", None),
+            f"{config.prefix}STREAM_BROKER",
+        )
+    )
+    errors.extend(
+        validate_positive_integer_setting(
+            config.stream_heartbeat_interval,
+            f"{config.prefix}STREAM_HEARTBEAT_INTERVAL",
+        )
+    )
+    if config.stream_enabled is True and config.stream_broker in (None, LocalBroker):
+        errors.append(
+            Warning(
+                "Announcement streams relay events with 'LocalBroker', which only "
+                "reaches the streams of the process committing a change.",
+                hint=f"Set '{config.prefix}STREAM_BROKER' to a cross-process broker "
+                "such as 'django_announcement.streaming.brokers.RedisBroker' unless "
+                "a single ASGI process serves both the streams and every write.",
+                id=f"django_announcement.W001_{config.prefix}STREAM_BROKER",
+            )
+        )
+    errors.extend(
+        validate_boolean_setting(
+            config.change_log_enabled,
+            f"{config.prefix}CHANGE_LOG_ENABLED",
+        )
+    )
+    errors.extend(
+        validate_boolean_setting(
+            config.read_state_enabled,
+            f"{config.prefix}READ_STATE_ENABLED",
+        )
+    )
+    errors.extend(
+        validate_boolean_setting(
+            config.audience_live_sync_enabled,
+            f"{config.prefix}AUDIENCE_LIVE_SYNC_ENABLED",
+        )
+    )
+
     return errors
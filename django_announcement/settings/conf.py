@@ -7,9 +7,13 @@ from django_announcement.constants.default_settings import (
     DefaultAdminSettings,
     DefaultAPISettings,
     DefaultAttachmentSettings,
+    DefaultCacheSettings,
     DefaultCommandSettings,
+    DefaultDatabaseSettings,
+    DefaultFeedSettings,
     DefaultPaginationAndFilteringSettings,
     DefaultSerializerSettings,
+    DefaultStreamSettings,
     DefaultThrottleSettings,
 )
 from django_announcement.constants.types import DefaultPath, OptionalPaths
@@ -24,17 +28,24 @@ class AnnouncementConfig:
     Attributes:
         include_serializer_full_details (bool): Whether full details are included in the serializer.
         exclude_serializer_empty_fields (bool): Whether empty fields should be excluded in the serializer.
+        use_serializer_fast_path (bool): Whether lists are serialized from lightweight rows instead of model instances.
         api_allow_list (bool): Whether the API allows listing announcements.
         api_allow_retrieve (bool): Whether the API allows retrieving single announcements.
+        api_conditional_requests_enabled (bool): Whether the API answers conditional requests with 304 responses.
+        api_async_enabled (bool): Whether the API routes serve the asynchronous viewset.
         authenticated_user_throttle_rate (str): Throttle rate for authenticated users.
         staff_user_throttle_rate (str): Throttle rate for staff users.
         api_throttle_class (Optional[Type[Any]]): The class used for request throttling.
+        throttle_lease_size (int): The most requests a process leases at once from the shared throttle counter of a user.
         api_pagination_class (Optional[Type[Any]]): The class used for pagination.
+        api_pagination_count_mode (str): How limit/offset pagination counts results ("exact", "capped" or "none").
+        api_pagination_count_cap (int): The maximum number of rows counted in the "capped" count mode.
         api_extra_permission_class (Optional[Type[Any]]): An additional permission class for the API.
         api_parser_classes (Optional[List[Type[Any]]]): A list of parser classes used for the API.
         api_filterset_class (Optional[Type[Any]]): The class used for filtering announcements.
         api_ordering_fields (List[str]): Fields that can be used for ordering announcements in API queries.
         api_search_fields (List[str]): Fields that can be searched in API queries.
+        api_search_backend (Optional[Type[Any]]): The full-text search backend used instead of the search fields.
         admin_has_add_permission (bool): Whether the admin has permission to add announcements.
         admin_has_change_permission (bool): Whether the admin has permission to change announcements.
         admin_has_delete_permission (bool): Whether the admin has permission to delete announcements.
@@ -45,6 +56,20 @@ class AnnouncementConfig:
         admin_site_class (Optional[Type[Any]]): The class used for the admin site.
         generate_audiences_exclude_apps (List[str]): A list of apps excluded from audience generation.
         generate_audiences_exclude_models (List[str]): A list of models excluded from audience generation.
+        audience_live_sync_enabled (bool): Whether audience memberships follow writes to user-related models.
+        materialized_feed_enabled (bool): Whether the per-user materialized feed is maintained and used by the API.
+        change_log_enabled (bool): Whether announcement changes are logged and served to delta sync clients.
+        read_state_enabled (bool): Whether the announcements read by each user are tracked.
+        cache_alias (str): The alias of the Django cache used by the announcement caches.
+        audience_cache_enabled (bool): Whether the audience ids of users are cached.
+        audience_cache_timeout (int): Timeout in seconds of the cached audience ids.
+        list_response_cache_enabled (bool): Whether list responses are shared between users with the same audiences.
+        list_response_cache_timeout (int): Timeout in seconds of the cached list responses.
+        database_replicas (List[str]): The database aliases of the replicas serving announcement reads.
+        database_stickiness_timeout (int): Seconds reads stay on the primary database after a write.
+        stream_enabled (bool): Whether the Server-Sent Events stream of new announcements is served.
+        stream_broker (Optional[Type[Any]]): The broker relaying announcement events between processes.
+        stream_heartbeat_interval (int): Seconds between the keepalive comments of idle streams.
 
     """
 
@@ -59,6 +84,10 @@ class AnnouncementConfig:
     default_throttle_settings: DefaultThrottleSettings = DefaultThrottleSettings()
     default_command_settings: DefaultCommandSettings = DefaultCommandSettings()
     default_attachment_settings: DefaultAttachmentSettings = DefaultAttachmentSettings()
+    default_feed_settings: DefaultFeedSettings = DefaultFeedSettings()
+    default_cache_settings: DefaultCacheSettings = DefaultCacheSettings()
+    default_database_settings: DefaultDatabaseSettings = DefaultDatabaseSettings()
+    default_stream_settings: DefaultStreamSettings = DefaultStreamSettings()
 
     def __init__(self) -> None:
         """Initialize the AnnouncementConfig, loading values from Django
@@ -101,6 +130,10 @@ class AnnouncementConfig:
             f"{self.prefix}SERIALIZER_EXCLUDE_EMPTY_FIELDS",
             self.default_serializer_settings.exclude_serializer_empty_fields,
         )
+        self.use_serializer_fast_path: bool = self.get_setting(
+            f"{self.prefix}SERIALIZER_USE_FAST_PATH",
+            self.default_serializer_settings.use_serializer_fast_path,
+        )
 
         self.api_allow_list: bool = self.get_setting(
             f"{self.prefix}API_ALLOW_LIST", self.default_api_settings.allow_list
@@ -109,6 +142,14 @@ class AnnouncementConfig:
             f"{self.prefix}API_ALLOW_RETRIEVE",
             self.default_api_settings.allow_retrieve,
         )
+        self.api_conditional_requests_enabled: bool = self.get_setting(
+            f"{self.prefix}API_CONDITIONAL_REQUESTS_ENABLED",
+            self.default_api_settings.conditional_requests_enabled,
+        )
+        self.api_async_enabled: bool = self.get_setting(
+            f"{self.prefix}API_ASYNC_ENABLED",
+            self.default_api_settings.async_enabled,
+        )
         self.generate_audiences_exclude_apps: List[str] = self.get_setting(
             f"{self.prefix}GENERATE_AUDIENCES_EXCLUDE_APPS",
             self.default_command_settings.generate_audiences_exclude_apps,
@@ -117,6 +158,10 @@ class AnnouncementConfig:
             f"{self.prefix}GENERATE_AUDIENCES_EXCLUDE_MODELS",
             self.default_command_settings.generate_audiences_exclude_models,
         )
+        self.audience_live_sync_enabled: bool = self.get_setting(
+            f"{self.prefix}AUDIENCE_LIVE_SYNC_ENABLED",
+            self.default_command_settings.audience_live_sync_enabled,
+        )
         self.attachment_upload_path: str = self.get_setting(
             f"{self.prefix}ATTACHMENT_UPLOAD_PATH",
             self.default_attachment_settings.upload_path,
@@ -137,10 +182,22 @@ class AnnouncementConfig:
             f"{self.prefix}API_THROTTLE_CLASS",
             self.default_throttle_settings.throttle_class,
         )
+        self.throttle_lease_size: int = self.get_setting(
+            f"{self.prefix}THROTTLE_LEASE_SIZE",
+            self.default_throttle_settings.throttle_lease_size,
+        )
         self.api_pagination_class: OptionalPaths = self.get_optional_paths(
             f"{self.prefix}API_PAGINATION_CLASS",
             self.default_pagination_and_filter_settings.pagination_class,
         )
+        self.api_pagination_count_mode: str = self.get_setting(
+            f"{self.prefix}API_PAGINATION_COUNT_MODE",
+            self.default_pagination_and_filter_settings.count_mode,
+        )
+        self.api_pagination_count_cap: int = self.get_setting(
+            f"{self.prefix}API_PAGINATION_COUNT_CAP",
+            self.default_pagination_and_filter_settings.count_cap,
+        )
         self.api_extra_permission_class: OptionalPaths = self.get_optional_paths(
             f"{self.prefix}API_EXTRA_PERMISSION_CLASS",
             self.default_api_settings.extra_permission_class,
@@ -161,10 +218,66 @@ class AnnouncementConfig:
             f"{self.prefix}API_SEARCH_FIELDS",
             self.default_pagination_and_filter_settings.search_fields,
         )
+        self.api_search_backend: OptionalPaths = self.get_optional_paths(
+            f"{self.prefix}API_SEARCH_BACKEND",
+            self.default_pagination_and_filter_settings.search_backend,
+        )
         self.admin_site_class: OptionalPaths = self.get_optional_paths(
             f"{self.prefix}ADMIN_SITE_CLASS",
             self.default_admin_settings.admin_site_class,
         )
+        self.materialized_feed_enabled: bool = self.get_setting(
+            f"{self.prefix}MATERIALIZED_FEED_ENABLED",
+            self.default_feed_settings.materialized_feed_enabled,
+        )
+        self.change_log_enabled: bool = self.get_setting(
+            f"{self.prefix}CHANGE_LOG_ENABLED",
+            self.default_feed_settings.change_log_enabled,
+        )
+        self.read_state_enabled: bool = self.get_setting(
+            f"{self.prefix}READ_STATE_ENABLED",
+            self.default_feed_settings.read_state_enabled,
+        )
+        self.cache_alias: str = self.get_setting(
+            f"{self.prefix}CACHE_ALIAS",
+            self.default_cache_settings.cache_alias,
+        )
+        self.audience_cache_enabled: bool = self.get_setting(
+            f"{self.prefix}AUDIENCE_CACHE_ENABLED",
+            self.default_cache_settings.audience_cache_enabled,
+        )
+        self.audience_cache_timeout: int = self.get_setting(
+            f"{self.prefix}AUDIENCE_CACHE_TIMEOUT",
+            self.default_cache_settings.audience_cache_timeout,
+        )
+        self.list_response_cache_enabled: bool = self.get_setting(
+            f"{self.prefix}LIST_RESPONSE_CACHE_ENABLED",
+            self.default_cache_settings.list_response_cache_enabled,
+        )
+        self.list_response_cache_timeout: int = self.get_setting(
+            f"{self.prefix}LIST_RESPONSE_CACHE_TIMEOUT",
+            self.default_cache_settings.list_response_cache_timeout,
+        )
+        self.database_replicas: List[str] = self.get_setting(
+            f"{self.prefix}DATABASE_REPLICAS",
+            self.default_database_settings.replica_aliases,
+        )
+        self.database_stickiness_timeout: int = self.get_setting(
+            f"{self.prefix}DATABASE_STICKINESS_TIMEOUT",
+            self.default_database_settings.stickiness_timeout,
+        )
+        self.stream_enabled: bool = self.get_setting(
+            f"{self.prefix}STREAM_ENABLED",
+            self.default_stream_settings.enabled,
+        )
+        self.stream_broker: OptionalPaths = self.get_optional_paths(
+            f"{self.prefix}STREAM_BROKER",
+            self.default_stream_settings.broker,
+        )
+        self.stream_heartbeat_interval: int = self.get_setting(
+            f"{self.prefix}STREAM_HEARTBEAT_INTERVAL",
+            self.default_stream_settings.heartbeat_interval,
+        )
 
     def get_setting(self, setting_name: str, default_value: Any) -> Any:
         """Retrieve a setting from Django settings with a default fallback.
@@ -0,0 +1,61 @@
+from .audience_cache import (
+    connect_audience_cache_receivers,
+    disconnect_audience_cache_receivers,
+    invalidate_audience_ids_on_m2m_change,
+    invalidate_audience_ids_on_profile_delete,
+    invalidate_audience_ids_on_user_audience_change,
+    remember_profile_before_user_audience_save,
+)
+from .audience_sync import (
+    connect_audience_sync_receivers,
+    disconnect_audience_sync_receivers,
+    remember_user_before_save,
+    remember_user_on_init,
+    sync_audiences_on_related_delete,
+    sync_audiences_on_related_m2m_change,
+    sync_audiences_on_related_save,
+    sync_user_audiences,
+)
+from .change_log import (
+    connect_change_log_receivers,
+    disconnect_change_log_receivers,
+    log_announcement_change,
+    log_category_change,
+    log_membership_change,
+    log_membership_m2m_change,
+    log_target_change,
+    log_target_m2m_change,
+    remember_membership_before_change,
+    remember_target_before_change,
+)
+from .feed import (
+    connect_feed_receivers,
+    disconnect_feed_receivers,
+    remember_feed_owner_before_change,
+    sync_feed_on_audience_announcement_change,
+    sync_feed_on_audience_announcement_m2m_change,
+    sync_feed_on_user_audience_change,
+    sync_feed_on_user_audience_m2m_change,
+)
+from .list_response_cache import (
+    connect_list_response_cache_receivers,
+    disconnect_list_response_cache_receivers,
+    invalidate_list_responses_on_change,
+)
+from .search import (
+    connect_search_index_receivers,
+    disconnect_search_index_receivers,
+    index_announcement_on_save,
+    index_category_announcements_on_save,
+    remove_announcement_on_delete,
+)
+from .stream import (
+    connect_stream_receivers,
+    disconnect_stream_receivers,
+    publish_membership_on_user_audience_change,
+    publish_membership_on_user_audience_m2m_change,
+    publish_on_audience_announcement_m2m_change,
+    publish_on_audience_announcement_save,
+    publish_rescheduled_announcement,
+    remember_published_at_before_save,
+)
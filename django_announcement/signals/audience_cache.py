@@ -0,0 +1,150 @@
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple, Type
+
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import (
+    ModelSignal,
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_save,
+)
+
+from django_announcement.models import UserAnnouncementProfile, UserAudience
+from django_announcement.utils.cache import (
+    invalidate_all_audience_ids,
+    invalidate_user_audience_ids,
+)
+
+
+def _invalidate_users_on_commit(user_ids: List[int]) -> None:
+    """Drop the cached audience ids of the given users once the current
+    transaction commits, so concurrent readers can not re-cache the
+    membership that is about to be replaced.
+
+    Args:
+        user_ids (List[int]): The ids of the users whose membership changed.
+
+    """
+    transaction.on_commit(lambda: invalidate_user_audience_ids(user_ids))
+
+
+def _invalidate_profiles(profile_ids: Set[int]) -> None:
+    """Invalidate the cached audience ids of the owners of the given
+    profiles.
+
+    The owners are resolved immediately, since the profiles may be gone
+    by the time the transaction commits.
+
+    Args:
+        profile_ids (Set[int]): The ids of the profiles whose membership changed.
+
+    """
+    _invalidate_users_on_commit(
+        list(
+            UserAnnouncementProfile.objects.filter(pk__in=profile_ids).values_list(
+                "user_id", flat=True
+            )
+        )
+    )
+
+
+# Attribute carrying the previous profile of a membership across pre/post save
+_PREVIOUS_PROFILE_ATTR = "_announcement_audience_cache_previous_profile"
+
+
+def remember_profile_before_user_audience_save(
+    sender: Any,
+    instance: UserAudience,
+    raw: bool = False,
+    update_fields: Optional[Iterable[str]] = None,
+    **kwargs: Any,
+) -> None:
+    """Capture the previous profile of an updated membership row, whose
+    owner loses the membership if the row is moved to another profile."""
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None and not {
+        "user_announce_profile",
+        "user_announce_profile_id",
+    } & set(update_fields):
+        return
+
+    setattr(
+        instance,
+        _PREVIOUS_PROFILE_ATTR,
+        UserAudience.objects.filter(pk=instance.pk)
+        .values_list("user_announce_profile_id", flat=True)
+        .first(),
+    )
+
+
+def invalidate_audience_ids_on_user_audience_change(
+    sender: Any, instance: UserAudience, **kwargs: Any
+) -> None:
+    """Drop the cached audience ids of a user whose membership row was
+    written or deleted, and of its previous owner if the row was moved."""
+    _invalidate_profiles(
+        {
+            instance.user_announce_profile_id,
+            getattr(instance, _PREVIOUS_PROFILE_ATTR, None),
+        }
+        - {None}
+    )
+
+
+def invalidate_audience_ids_on_profile_delete(
+    sender: Any, instance: UserAnnouncementProfile, **kwargs: Any
+) -> None:
+    """Drop the cached audience ids of a user whose profile was deleted."""
+    _invalidate_users_on_commit([instance.user_id])
+
+
+def invalidate_audience_ids_on_m2m_change(
+    sender: Any,
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[Set[int]],
+    **kwargs: Any,
+) -> None:
+    """Drop cached audience ids after membership changes made through the
+    related managers (e.g. ``profile.audiences.add()``)."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        _invalidate_users_on_commit([instance.user_id])
+    elif action == "post_clear":
+        # The cleared members are unknown at this point
+        transaction.on_commit(invalidate_all_audience_ids)
+    else:
+        _invalidate_profiles(pk_set or set())
+
+
+# (signal, receiver, sender) triples invalidating the audience cache
+AUDIENCE_CACHE_RECEIVERS: List[Tuple[ModelSignal, Callable[..., None], Type[Model]]] = [
+    (pre_save, remember_profile_before_user_audience_save, UserAudience),
+    (post_save, invalidate_audience_ids_on_user_audience_change, UserAudience),
+    (post_delete, invalidate_audience_ids_on_user_audience_change, UserAudience),
+    (post_delete, invalidate_audience_ids_on_profile_delete, UserAnnouncementProfile),
+    (m2m_changed, invalidate_audience_ids_on_m2m_change, UserAudience),
+]
+
+
+def connect_audience_cache_receivers() -> None:
+    """Connect the receivers invalidating the audience cache.
+
+    Like the feed receivers, they are only connected when the audience
+    cache is enabled so deletions keep using Django's fast-delete path.
+
+    """
+    for signal, handler, sender in AUDIENCE_CACHE_RECEIVERS:
+        signal.connect(handler, sender=sender)
+
+
+def disconnect_audience_cache_receivers() -> None:
+    """Disconnect the receivers connected by
+    `connect_audience_cache_receivers`."""
+    for signal, handler, sender in AUDIENCE_CACHE_RECEIVERS:
+        signal.disconnect(handler, sender=sender)
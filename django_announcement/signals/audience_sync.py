@@ -0,0 +1,360 @@
+from functools import partial, reduce
+from operator import or_
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+from weakref import WeakKeyDictionary
+
+from django.db import transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Field, Model, Q
+from django.db.models.signals import (
+    ModelSignal,
+    m2m_changed,
+    post_delete,
+    post_init,
+    post_save,
+    pre_save,
+)
+
+from django_announcement.management.commands.generate_audiences import (
+    Command as GenerateAudiencesCommand,
+)
+from django_announcement.models import (
+    Audience,
+    UserAnnouncementFeed,
+    UserAnnouncementProfile,
+    UserAudience,
+)
+from django_announcement.settings.conf import config
+from django_announcement.utils.cache import invalidate_user_audience_ids
+from django_announcement.utils.user_model import (
+    UserModel,
+    get_user_relation,
+    get_user_relation_filter,
+)
+
+# Attribute carrying the user a related row was loaded or last saved with
+_INITIAL_ATTR = "_announcement_audience_sync_initial"
+
+# Audience name by accessor name of each synced relation on the user model
+_relations: Dict[str, str] = {}
+
+# Foreign key to the user, and to the related row for many-to-many
+# intermediate models, by model of the rows linking users to the relations
+_user_fks: Dict[Type[Model], Field] = {}
+_source_fks: Dict[Type[Model], Field] = {}
+
+# Accessor name of the relation by model of the rows linking users to it
+_rel_names: Dict[Type[Model], str] = {}
+
+# Users waiting for the transaction of each connection to commit, by the
+# accessor name of the relations they were written through
+_pending: "WeakKeyDictionary[BaseDatabaseWrapper, Dict[str, Set[Any]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def sync_user_audiences(
+    user_ids: Iterable[int], rel_names: Optional[Collection[str]] = None
+) -> None:
+    """Add users to the audience of each related model they have rows in,
+    creating their profile if needed, and remove them from the audiences
+    of the related models they have no rows in anymore.
+
+    Only the audiences named after a synced related model are managed.
+
+    Args:
+        user_ids (Iterable[int]): The ids of the users to synchronize.
+        rel_names (Optional[Collection[str]]): Only the audiences of these
+            relations, or None for every synced relation.
+
+    """
+    user_ids = list(user_ids)
+    synced = {
+        rel_name: name
+        for rel_name, name in _relations.items()
+        if rel_names is None or rel_name in rel_names
+    }
+    audience_ids = dict(
+        Audience.objects.filter(name__in=set(synced.values())).values_list("name", "pk")
+    )
+    relations = {
+        rel_name: audience_ids[name]
+        for rel_name, name in synced.items()
+        if name in audience_ids
+    }
+    if not user_ids or not relations:
+        return
+
+    members = {
+        rel_name: set(
+            UserModel.objects.filter(
+                get_user_relation_filter(rel_name), pk__in=user_ids
+            ).values_list("pk", flat=True)
+        )
+        for rel_name in relations
+    }
+    related_user_ids = set().union(*members.values())
+    existing_profiles = set(
+        UserAnnouncementProfile.objects.filter(
+            user_id__in=related_user_ids
+        ).values_list("user_id", flat=True)
+    )
+    UserAnnouncementProfile.objects.bulk_create(
+        [
+            UserAnnouncementProfile(user_id=user_id)
+            for user_id in related_user_ids - existing_profiles
+        ],
+        ignore_conflicts=True,
+    )
+
+    profile_ids = dict(
+        UserAnnouncementProfile.objects.filter(user_id__in=user_ids).values_list(
+            "user_id", "pk"
+        )
+    )
+    wanted = {
+        (profile_ids[user_id], relations[rel_name])
+        for rel_name, rel_user_ids in members.items()
+        for user_id in rel_user_ids
+    }
+    current = set(
+        UserAudience.objects.filter(
+            user_announce_profile_id__in=profile_ids.values(),
+            audience_id__in=relations.values(),
+        ).values_list("user_announce_profile_id", "audience_id")
+    )
+
+    added = wanted - current
+    if added:
+        UserAudience.objects.bulk_create(
+            [
+                UserAudience(user_announce_profile_id=profile_id, audience_id=audience)
+                for profile_id, audience in added
+            ],
+            ignore_conflicts=True,
+        )
+        # `bulk_create` bypasses the receivers of the feed and audience cache
+        if config.materialized_feed_enabled:
+            UserAnnouncementFeed.objects.sync(
+                profile_ids={profile_id for profile_id, _audience in added}
+            )
+        invalidate_user_audience_ids(user_ids)
+
+    removed = current - wanted
+    if removed:
+        UserAudience.objects.filter(
+            reduce(
+                or_,
+                (
+                    Q(user_announce_profile_id=profile_id, audience_id=audience)
+                    for profile_id, audience in removed
+                ),
+            )
+        ).delete()
+
+
+def _flush_pending(connection: BaseDatabaseWrapper) -> None:
+    """Synchronize the users queued by the committed transaction of a
+    connection."""
+    pending = _pending.pop(connection, None)
+    if not pending:
+        return
+
+    with transaction.atomic(using=connection.alias):
+        sync_user_audiences(set().union(*pending.values()), set(pending))
+
+
+def _schedule_sync(rows: Type[Model], values: Iterable[Any], using: str) -> None:
+    """Queue users for a sync once the current transaction commits.
+
+    The queue belongs to the connection, so it never mixes the writes of
+    other connections, threads or async tasks. Every write registers the
+    flush, so a rolled back transaction can not strand the queue: the
+    first flush after a commit synchronizes every queued user, and the
+    following ones find the queue empty.
+
+    Args:
+        rows (Type[Model]): The model of the rows linking users to a relation.
+        values (Iterable[Any]): The values of the foreign key to the user.
+        using (str): The alias of the database written to.
+
+    """
+    user_fk = _user_fks[rows]
+    target = user_fk.target_field
+    if not target.primary_key:
+        values = UserModel.objects.filter(
+            **{f"{target.attname}__in": values}
+        ).values_list("pk", flat=True)
+
+    connection = transaction.get_connection(using)
+    pending = _pending.setdefault(connection, {})
+    pending.setdefault(_rel_names[rows], set()).update(values)
+    transaction.on_commit(partial(_flush_pending, connection), using=using)
+
+
+def remember_user_on_init(sender: Any, instance: Model, **kwargs: Any) -> None:
+    """Capture the user a related row is loaded with, so saves only
+    resync when it changes."""
+    attname = _user_fks[sender].attname
+    if attname in instance.__dict__:
+        instance.__dict__[_INITIAL_ATTR] = instance.__dict__[attname]
+
+
+def remember_user_before_save(
+    sender: Any, instance: Model, raw: bool = False, **kwargs: Any
+) -> None:
+    """Capture the previous user of an updated related row loaded without
+    it, the only case needing a query."""
+    attname = _user_fks[sender].attname
+    if (
+        raw
+        or instance._state.adding
+        or _INITIAL_ATTR in instance.__dict__
+        or attname not in instance.__dict__
+    ):
+        return
+
+    instance.__dict__[_INITIAL_ATTR] = (
+        sender._default_manager.filter(pk=instance.pk)
+        .values_list(attname, flat=True)
+        .first()
+    )
+
+
+def sync_audiences_on_related_save(
+    sender: Any,
+    instance: Model,
+    created: bool = False,
+    raw: bool = False,
+    update_fields: Optional[Iterable[str]] = None,
+    using: Optional[str] = None,
+    **kwargs: Any,
+) -> None:
+    """Queue the user of a new related row, or both users of a row moved
+    to another user. Saves leaving the user alone queue nobody."""
+    user_fk = _user_fks[sender]
+    if raw or user_fk.attname not in instance.__dict__:
+        return
+    if update_fields is not None and not {user_fk.name, user_fk.attname} & set(
+        update_fields
+    ):
+        return
+
+    current = instance.__dict__[user_fk.attname]
+    previous = instance.__dict__.get(_INITIAL_ATTR)
+    instance.__dict__[_INITIAL_ATTR] = current
+    if not created and previous == current:
+        return
+
+    values = {current} if created else {current, previous}
+    if values - {None}:
+        _schedule_sync(sender, values - {None}, using)
+
+
+def sync_audiences_on_related_delete(
+    sender: Any, instance: Model, using: Optional[str] = None, **kwargs: Any
+) -> None:
+    """Queue the user of a deleted related row, who may have no row left."""
+    value = getattr(instance, _user_fks[sender].attname)
+    if value is not None:
+        _schedule_sync(sender, [value], using)
+
+
+def sync_audiences_on_related_m2m_change(
+    sender: Any,
+    instance: Model,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[Set[Any]],
+    using: Optional[str] = None,
+    **kwargs: Any,
+) -> None:
+    """Queue the users added to or removed from a many-to-many relation
+    with a user-related model."""
+    user_fk = _user_fks[sender]
+    if reverse:
+        # The instance is the user
+        if action in ("post_add", "post_remove", "post_clear"):
+            _schedule_sync(
+                sender, [getattr(instance, user_fk.target_field.attname)], using
+            )
+    elif action in ("post_add", "post_remove"):
+        _schedule_sync(sender, pk_set or set(), using)
+    elif action == "pre_clear":
+        # The cleared users are unknown once the rows are gone
+        _schedule_sync(
+            sender,
+            sender._default_manager.filter(
+                **{_source_fks[sender].attname: instance.pk}
+            ).values_list(user_fk.attname, flat=True),
+            using,
+        )
+
+
+# (signal, receiver, sender) triples syncing audience memberships, built
+# from the user-related models found when the receivers are connected
+AUDIENCE_SYNC_RECEIVERS: List[Tuple[ModelSignal, Callable[..., None], Type[Model]]] = []
+
+
+def connect_audience_sync_receivers() -> None:
+    """Connect the receivers syncing audience memberships to the
+    user-related models found by the ``generate_audiences`` command.
+
+    They are only connected when the live sync is enabled, since any
+    ``post_delete`` receiver disables Django's fast-delete path for the
+    related models. Only the foreign key to the user drives the audience
+    rules, so saves are followed through the value it was loaded with,
+    and those leaving it alone cost neither a query nor a sync.
+
+    """
+    for model, rel_name in GenerateAudiencesCommand.get_user_related_models().items():
+        rows, user_fk = get_user_relation(rel_name)
+        _relations[rel_name] = model._meta.verbose_name.title()
+        _user_fks[rows] = user_fk
+        _rel_names[rows] = rel_name
+
+        if rows is model:
+            AUDIENCE_SYNC_RECEIVERS.extend(
+                [
+                    (post_init, remember_user_on_init, rows),
+                    (pre_save, remember_user_before_save, rows),
+                    (post_save, sync_audiences_on_related_save, rows),
+                    (post_delete, sync_audiences_on_related_delete, rows),
+                ]
+            )
+        else:
+            _source_fks[rows] = next(
+                field
+                for field in rows._meta.concrete_fields
+                if field.is_relation and field is not user_fk
+            )
+            AUDIENCE_SYNC_RECEIVERS.append(
+                (m2m_changed, sync_audiences_on_related_m2m_change, rows)
+            )
+
+    for signal, handler, sender in AUDIENCE_SYNC_RECEIVERS:
+        signal.connect(handler, sender=sender)
+
+
+def disconnect_audience_sync_receivers() -> None:
+    """Disconnect the receivers connected by
+    `connect_audience_sync_receivers`."""
+    for signal, handler, sender in AUDIENCE_SYNC_RECEIVERS:
+        signal.disconnect(handler, sender=sender)
+
+    AUDIENCE_SYNC_RECEIVERS.clear()
+    _relations.clear()
+    _user_fks.clear()
+    _source_fks.clear()
+    _rel_names.clear()
@@ -0,0 +1,218 @@
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple, Type
+
+from django.db.models import Model
+from django.db.models.signals import (
+    ModelSignal,
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_save,
+)
+
+from django_announcement.models import (
+    Announcement,
+    AnnouncementCategory,
+    AnnouncementChange,
+    AudienceAnnouncement,
+    UserAnnouncementProfile,
+    UserAudience,
+)
+
+# Attribute carrying the previous target of a through row across pre/post save
+_PREVIOUS_ATTR = "_announcement_change_log_previous"
+
+
+def log_announcement_change(
+    sender: Any, instance: Announcement, raw: bool = False, **kwargs: Any
+) -> None:
+    """Log a saved or deleted announcement."""
+    if not raw:
+        AnnouncementChange.objects.record([instance.pk])
+
+
+def log_category_change(
+    sender: Any,
+    instance: AnnouncementCategory,
+    created: bool = False,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Log the announcements of a saved category, which is part of their
+    representation."""
+    if raw or created:
+        return
+
+    AnnouncementChange.objects.record(
+        instance.announcements.values_list("pk", flat=True)
+    )
+
+
+def remember_target_before_change(
+    sender: Any, instance: AudienceAnnouncement, raw: bool = False, **kwargs: Any
+) -> None:
+    """Capture the previous target of an updated through row, whose
+    audience may lose the announcement."""
+    if raw or instance.pk is None:
+        return
+
+    setattr(
+        instance,
+        _PREVIOUS_ATTR,
+        sender.objects.filter(pk=instance.pk)
+        .values_list("announcement_id", "audience_id")
+        .first(),
+    )
+
+
+def log_target_change(
+    sender: Any, instance: AudienceAnnouncement, raw: bool = False, **kwargs: Any
+) -> None:
+    """Log an audience gaining or losing an announcement through a saved
+    or deleted through row."""
+    if raw:
+        return
+
+    previous = instance.__dict__.pop(_PREVIOUS_ATTR, None)
+    if previous is not None and previous != (
+        instance.announcement_id,
+        instance.audience_id,
+    ):
+        AnnouncementChange.objects.record([previous[0]], [previous[1]])
+
+    AnnouncementChange.objects.record(
+        [instance.announcement_id], [instance.audience_id]
+    )
+
+
+def log_target_m2m_change(
+    sender: Any,
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[Set[int]],
+    **kwargs: Any,
+) -> None:
+    """Log the audiences gaining announcements through the related
+    managers (e.g. ``announcement.audience.add()``).
+
+    Removals delete the through rows with the collector, which sends
+    ``post_delete`` to `log_target_change` once this receiver is
+    connected.
+
+    """
+    if action != "post_add" or not pk_set:
+        return
+
+    if reverse:
+        AnnouncementChange.objects.record(pk_set, [instance.pk])
+    else:
+        AnnouncementChange.objects.record([instance.pk], pk_set)
+
+
+def _get_profile_users(profile_ids: Iterable[int]) -> List[int]:
+    """Return the owners of profiles."""
+    return list(
+        UserAnnouncementProfile.objects.filter(pk__in=list(profile_ids)).values_list(
+            "user_id", flat=True
+        )
+    )
+
+
+def remember_membership_before_change(
+    sender: Any, instance: UserAudience, raw: bool = False, **kwargs: Any
+) -> None:
+    """Capture the previous member and audience of an updated membership
+    row, whose user may leave the audience."""
+    if raw or instance.pk is None:
+        return
+
+    setattr(
+        instance,
+        _PREVIOUS_ATTR,
+        sender.objects.filter(pk=instance.pk)
+        .values_list("user_announce_profile__user_id", "audience_id")
+        .first(),
+    )
+
+
+def log_membership_change(
+    sender: Any, instance: UserAudience, raw: bool = False, **kwargs: Any
+) -> None:
+    """Log a user joining or leaving an audience through a saved or
+    deleted membership row."""
+    if raw:
+        return
+
+    # The profile may already be deleted
+    user_id = (
+        UserAnnouncementProfile.objects.filter(pk=instance.user_announce_profile_id)
+        .values_list("user_id", flat=True)
+        .first()
+    )
+    previous = instance.__dict__.pop(_PREVIOUS_ATTR, None)
+    if previous is not None and previous != (user_id, instance.audience_id):
+        AnnouncementChange.objects.record_memberships([previous[0]], [previous[1]])
+
+    if user_id is not None:
+        AnnouncementChange.objects.record_memberships([user_id], [instance.audience_id])
+
+
+def log_membership_m2m_change(
+    sender: Any,
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[Set[int]],
+    **kwargs: Any,
+) -> None:
+    """Log the users joining audiences through the related managers (e.g.
+    ``profile.audiences.add()``).
+
+    Removals delete the membership rows with the collector, which sends
+    ``post_delete`` to `log_membership_change`.
+
+    """
+    if action != "post_add" or not pk_set:
+        return
+
+    if reverse:
+        AnnouncementChange.objects.record_memberships(
+            _get_profile_users(pk_set), [instance.pk]
+        )
+    else:
+        AnnouncementChange.objects.record_memberships([instance.user_id], pk_set)
+
+
+# (signal, receiver, sender) triples maintaining the change log
+CHANGE_LOG_RECEIVERS: List[Tuple[ModelSignal, Callable[..., None], Type[Model]]] = [
+    (post_save, log_announcement_change, Announcement),
+    (post_delete, log_announcement_change, Announcement),
+    (post_save, log_category_change, AnnouncementCategory),
+    (pre_save, remember_target_before_change, AudienceAnnouncement),
+    (post_save, log_target_change, AudienceAnnouncement),
+    (post_delete, log_target_change, AudienceAnnouncement),
+    (m2m_changed, log_target_m2m_change, AudienceAnnouncement),
+    (pre_save, remember_membership_before_change, UserAudience),
+    (post_save, log_membership_change, UserAudience),
+    (post_delete, log_membership_change, UserAudience),
+    (m2m_changed, log_membership_m2m_change, UserAudience),
+]
+
+
+def connect_change_log_receivers() -> None:
+    """Connect the receivers maintaining the change log.
+
+    They are only connected when the change log is enabled, since any
+    ``post_delete`` receiver disables Django's fast-delete path for the
+    through models.
+
+    """
+    for signal, handler, sender in CHANGE_LOG_RECEIVERS:
+        signal.connect(handler, sender=sender)
+
+
+def disconnect_change_log_receivers() -> None:
+    """Disconnect the receivers connected by
+    `connect_change_log_receivers`."""
+    for signal, handler, sender in CHANGE_LOG_RECEIVERS:
+        signal.disconnect(handler, sender=sender)
@@ -0,0 +1,199 @@
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple, Type
+
+from django.db.models import Model
+from django.db.models.signals import (
+    ModelSignal,
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_save,
+)
+
+from django_announcement.models import (
+    AudienceAnnouncement,
+    UserAnnouncementFeed,
+    UserAudience,
+)
+from django_announcement.settings.conf import config
+
+# Attribute used to carry ids across pre/post signal pairs
+_PENDING_ATTR = "_announcement_feed_pending_ids"
+
+
+def _remember(instance: Any, ids: Iterable[int]) -> None:
+    """Store ids on the instance so the matching post signal can sync them.
+
+    Args:
+        instance (Any): The model instance the signal was sent for.
+        ids (Iterable[int]): The ids that must be synchronized afterwards.
+
+    """
+    setattr(instance, _PENDING_ATTR, set(ids))
+
+
+def _pop_remembered(instance: Any) -> Set[int]:
+    """Return and clear the ids stored by `_remember`.
+
+    Args:
+        instance (Any): The model instance the signal was sent for.
+
+    Returns:
+        Set[int]: The remembered ids, or an empty set.
+
+    """
+    return set(instance.__dict__.pop(_PENDING_ATTR, set()))
+
+
+def remember_feed_owner_before_change(
+    sender: Any, instance: Any, raw: bool = False, **kwargs: Any
+) -> None:
+    """Capture the previous owner of an updated through row so the feed
+    entries it produced can be pruned after the change."""
+    if not config.materialized_feed_enabled or raw or instance.pk is None:
+        return
+
+    owner_field = (
+        "announcement_id"
+        if sender is AudienceAnnouncement
+        else "user_announce_profile_id"
+    )
+    _remember(
+        instance,
+        sender.objects.filter(pk=instance.pk).values_list(owner_field, flat=True),
+    )
+
+
+def sync_feed_on_audience_announcement_change(
+    sender: Any, instance: AudienceAnnouncement, raw: bool = False, **kwargs: Any
+) -> None:
+    """Fan an announcement out to (or withdraw it from) the feeds of the
+    audience members when one of its targets changes."""
+    if not config.materialized_feed_enabled or raw:
+        return
+
+    announcement_ids = _pop_remembered(instance) | {instance.announcement_id}
+    UserAnnouncementFeed.objects.sync(announcement_ids=announcement_ids)
+
+
+def sync_feed_on_user_audience_change(
+    sender: Any, instance: UserAudience, raw: bool = False, **kwargs: Any
+) -> None:
+    """Rebuild the feed of a profile whose audience membership changed."""
+    if not config.materialized_feed_enabled or raw:
+        return
+
+    profile_ids = _pop_remembered(instance) | {instance.user_announce_profile_id}
+    UserAnnouncementFeed.objects.sync(profile_ids=profile_ids)
+
+
+def _sync_m2m(
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[Set[int]],
+    reverse_ids: Any,
+    sync_kwarg: str,
+) -> None:
+    """Shared handling of `m2m_changed` for the two through models.
+
+    Args:
+        instance (Any): The instance whose relation changed.
+        action (str): The m2m action name.
+        reverse (bool): Whether the change was made from the audience side.
+        pk_set (Optional[Set[int]]): The primary keys added or removed.
+        reverse_ids (Any): Callable returning the related ids of an audience before a clear.
+        sync_kwarg (str): The keyword of `UserAnnouncementFeed.objects.sync` to use.
+
+    """
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            UserAnnouncementFeed.objects.sync(**{sync_kwarg: [instance.pk]})
+        return
+
+    if action == "pre_clear":
+        _remember(instance, reverse_ids(instance))
+    elif action in ("post_add", "post_remove"):
+        UserAnnouncementFeed.objects.sync(**{sync_kwarg: pk_set or []})
+    elif action == "post_clear":
+        UserAnnouncementFeed.objects.sync(**{sync_kwarg: _pop_remembered(instance)})
+
+
+def sync_feed_on_audience_announcement_m2m_change(
+    sender: Any,
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[Set[int]],
+    **kwargs: Any,
+) -> None:
+    """Keep the feed in sync with ``Announcement.audience`` changes made
+    through the related managers (e.g. ``announcement.audience.add()``)."""
+    if not config.materialized_feed_enabled:
+        return
+
+    _sync_m2m(
+        instance,
+        action,
+        reverse,
+        pk_set,
+        lambda audience: audience.audience_announcements.values_list(
+            "announcement_id", flat=True
+        ),
+        "announcement_ids",
+    )
+
+
+def sync_feed_on_user_audience_m2m_change(
+    sender: Any,
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[Set[int]],
+    **kwargs: Any,
+) -> None:
+    """Keep the feed in sync with ``UserAnnouncementProfile.audiences``
+    changes made through the related managers."""
+    if not config.materialized_feed_enabled:
+        return
+
+    _sync_m2m(
+        instance,
+        action,
+        reverse,
+        pk_set,
+        lambda audience: audience.audience_users.values_list(
+            "user_announce_profile_id", flat=True
+        ),
+        "profile_ids",
+    )
+
+
+# (signal, receiver, sender) triples maintaining the feed
+FEED_RECEIVERS: List[Tuple[ModelSignal, Callable[..., None], Type[Model]]] = [
+    (pre_save, remember_feed_owner_before_change, AudienceAnnouncement),
+    (pre_save, remember_feed_owner_before_change, UserAudience),
+    (post_save, sync_feed_on_audience_announcement_change, AudienceAnnouncement),
+    (post_delete, sync_feed_on_audience_announcement_change, AudienceAnnouncement),
+    (post_save, sync_feed_on_user_audience_change, UserAudience),
+    (post_delete, sync_feed_on_user_audience_change, UserAudience),
+    (m2m_changed, sync_feed_on_audience_announcement_m2m_change, AudienceAnnouncement),
+    (m2m_changed, sync_feed_on_user_audience_m2m_change, UserAudience),
+]
+
+
+def connect_feed_receivers() -> None:
+    """Connect the receivers maintaining the materialized feed.
+
+    They are only connected when the feed is enabled, since any
+    ``post_delete`` receiver disables Django's fast-delete path for
+    the through models.
+
+    """
+    for signal, handler, sender in FEED_RECEIVERS:
+        signal.connect(handler, sender=sender)
+
+
+def disconnect_feed_receivers() -> None:
+    """Disconnect the receivers connected by `connect_feed_receivers`."""
+    for signal, handler, sender in FEED_RECEIVERS:
+        signal.disconnect(handler, sender=sender)
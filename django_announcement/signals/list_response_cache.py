@@ -0,0 +1,51 @@
+from typing import Any, Callable, List, Tuple, Type
+
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import ModelSignal, m2m_changed, post_delete, post_save
+
+from django_announcement.models import (
+    Announcement,
+    AnnouncementCategory,
+    AudienceAnnouncement,
+)
+from django_announcement.utils.cache import invalidate_list_responses
+
+
+def invalidate_list_responses_on_change(sender: Any, **kwargs: Any) -> None:
+    """Invalidate the cached list responses once the transaction writing
+    an announcement, its category or its audiences commits."""
+    if kwargs.get("action", "post_").startswith("post_"):
+        transaction.on_commit(invalidate_list_responses)
+
+
+# (signal, receiver, sender) triples invalidating the list response cache
+LIST_RESPONSE_CACHE_RECEIVERS: List[
+    Tuple[ModelSignal, Callable[..., None], Type[Model]]
+] = [
+    (post_save, invalidate_list_responses_on_change, Announcement),
+    (post_delete, invalidate_list_responses_on_change, Announcement),
+    (post_save, invalidate_list_responses_on_change, AnnouncementCategory),
+    (post_delete, invalidate_list_responses_on_change, AnnouncementCategory),
+    (post_save, invalidate_list_responses_on_change, AudienceAnnouncement),
+    (post_delete, invalidate_list_responses_on_change, AudienceAnnouncement),
+    (m2m_changed, invalidate_list_responses_on_change, AudienceAnnouncement),
+]
+
+
+def connect_list_response_cache_receivers() -> None:
+    """Connect the receivers invalidating the list response cache.
+
+    Like the other cache receivers, they are only connected when the
+    list response cache is enabled.
+
+    """
+    for signal, handler, sender in LIST_RESPONSE_CACHE_RECEIVERS:
+        signal.connect(handler, sender=sender)
+
+
+def disconnect_list_response_cache_receivers() -> None:
+    """Disconnect the receivers connected by
+    `connect_list_response_cache_receivers`."""
+    for signal, handler, sender in LIST_RESPONSE_CACHE_RECEIVERS:
+        signal.disconnect(handler, sender=sender)
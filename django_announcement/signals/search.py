@@ -0,0 +1,70 @@
+from typing import Any, Callable, List, Tuple, Type
+
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import ModelSignal, post_delete, post_save
+
+from django_announcement.models import Announcement, AnnouncementCategory
+from django_announcement.search import get_search_backend
+
+
+def index_announcement_on_save(
+    sender: Any, instance: Announcement, **kwargs: Any
+) -> None:
+    """Reindex a saved announcement once its transaction commits."""
+    backend = get_search_backend()
+    if backend is not None:
+        transaction.on_commit(lambda: backend.index([instance.pk]))
+
+
+def remove_announcement_on_delete(
+    sender: Any, instance: Announcement, **kwargs: Any
+) -> None:
+    """Drop a deleted announcement from the index once its transaction
+    commits."""
+    backend = get_search_backend()
+    if backend is not None:
+        announcement_id = instance.pk
+        transaction.on_commit(lambda: backend.remove([announcement_id]))
+
+
+def index_category_announcements_on_save(
+    sender: Any, instance: AnnouncementCategory, **kwargs: Any
+) -> None:
+    """Reindex the announcements of a saved category, whose name is part
+    of their documents, once its transaction commits."""
+    backend = get_search_backend()
+    if backend is not None:
+        transaction.on_commit(
+            lambda: backend.index(
+                Announcement.objects.filter(category=instance).values_list(
+                    "pk", flat=True
+                )
+            )
+        )
+
+
+# (signal, receiver, sender) triples maintaining the search index
+SEARCH_INDEX_RECEIVERS: List[Tuple[ModelSignal, Callable[..., None], Type[Model]]] = [
+    (post_save, index_announcement_on_save, Announcement),
+    (post_delete, remove_announcement_on_delete, Announcement),
+    (post_save, index_category_announcements_on_save, AnnouncementCategory),
+]
+
+
+def connect_search_index_receivers() -> None:
+    """Connect the receivers maintaining the search index.
+
+    They are only connected for search backends whose index is not
+    maintained by the database itself.
+
+    """
+    for signal, handler, sender in SEARCH_INDEX_RECEIVERS:
+        signal.connect(handler, sender=sender)
+
+
+def disconnect_search_index_receivers() -> None:
+    """Disconnect the receivers connected by
+    `connect_search_index_receivers`."""
+    for signal, handler, sender in SEARCH_INDEX_RECEIVERS:
+        signal.disconnect(handler, sender=sender)
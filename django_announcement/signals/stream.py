@@ -0,0 +1,206 @@
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple, Type
+
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import (
+    ModelSignal,
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_save,
+)
+from django.utils.timezone import now
+
+from django_announcement.models import (
+    Announcement,
+    AudienceAnnouncement,
+    UserAnnouncementProfile,
+    UserAudience,
+)
+from django_announcement.streaming import (
+    publish_announcements,
+    publish_membership_changes,
+)
+
+# Attribute carrying the previous publication time across pre/post save
+_PUBLISHED_AT_ATTR = "_announcement_stream_published_at"
+
+
+def _publish_on_commit(
+    announcement_ids: Iterable[int], audience_ids: Optional[Iterable[int]] = None
+) -> None:
+    """Announce the announcements to the streams once the transaction
+    commits."""
+    announcement_ids = list(announcement_ids)
+    audience_ids = None if audience_ids is None else list(audience_ids)
+    transaction.on_commit(lambda: publish_announcements(announcement_ids, audience_ids))
+
+
+def _publish_membership_on_commit(user_ids: Iterable[int]) -> None:
+    """Tell the streams of the users that their audiences changed once the
+    transaction commits.
+
+    The stream receivers are connected after the audience cache ones, so
+    the cached audiences of the users are invalidated first.
+
+    """
+    user_ids = list(user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: publish_membership_changes(user_ids))
+
+
+def _get_profile_users(profile_ids: Iterable[int]) -> List[int]:
+    """Resolve the owners of profiles now, since the profiles may be gone
+    by the time the transaction commits."""
+    return list(
+        UserAnnouncementProfile.objects.filter(pk__in=list(profile_ids)).values_list(
+            "user_id", flat=True
+        )
+    )
+
+
+def remember_published_at_before_save(
+    sender: Any, instance: Announcement, raw: bool = False, **kwargs: Any
+) -> None:
+    """Capture the previous publication time of an updated announcement."""
+    if raw or instance.pk is None:
+        return
+
+    setattr(
+        instance,
+        _PUBLISHED_AT_ATTR,
+        sender.objects.filter(pk=instance.pk)
+        .values_list("published_at", flat=True)
+        .first(),
+    )
+
+
+def publish_rescheduled_announcement(
+    sender: Any,
+    instance: Announcement,
+    created: bool = False,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Announce an announcement whose publication time moved from or to
+    the future, which changes when it becomes active.
+
+    New announcements have no audiences yet; they are announced when
+    their audiences are added.
+
+    """
+    if raw or created or _PUBLISHED_AT_ATTR not in instance.__dict__:
+        return
+
+    _now = now()
+    previous = instance.__dict__.pop(_PUBLISHED_AT_ATTR)
+    if previous == instance.published_at:
+        return
+
+    if any(
+        value is not None and value > _now
+        for value in (previous, instance.published_at)
+    ):
+        _publish_on_commit([instance.pk])
+
+
+def publish_on_audience_announcement_save(
+    sender: Any,
+    instance: AudienceAnnouncement,
+    created: bool = False,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Announce an announcement to an audience it now targets."""
+    if raw:
+        return
+
+    _publish_on_commit([instance.announcement_id], [instance.audience_id])
+
+
+def publish_on_audience_announcement_m2m_change(
+    sender: Any,
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[Set[int]],
+    **kwargs: Any,
+) -> None:
+    """Announce announcements to the audiences added through the related
+    managers (e.g. ``announcement.audience.add()``)."""
+    if action != "post_add" or not pk_set:
+        return
+
+    if reverse:
+        _publish_on_commit(pk_set, [instance.pk])
+    else:
+        _publish_on_commit([instance.pk], pk_set)
+
+
+def publish_membership_on_user_audience_change(
+    sender: Any, instance: UserAudience, raw: bool = False, **kwargs: Any
+) -> None:
+    """Tell the streams of a user whose membership row was written or
+    deleted to resolve their audiences again."""
+    if raw:
+        return
+
+    _publish_membership_on_commit(
+        _get_profile_users([instance.user_announce_profile_id])
+    )
+
+
+def publish_membership_on_user_audience_m2m_change(
+    sender: Any,
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[Set[int]],
+    **kwargs: Any,
+) -> None:
+    """Tell the streams of users added through the related managers (e.g.
+    ``profile.audiences.add()``) to resolve their audiences again.
+
+    Removals and clears delete the membership rows one by one, which
+    `publish_membership_on_user_audience_change` already sees.
+
+    """
+    if action != "post_add" or not pk_set:
+        return
+
+    if reverse:
+        _publish_membership_on_commit(_get_profile_users(pk_set))
+    else:
+        # The instance is the profile
+        _publish_membership_on_commit([instance.user_id])
+
+
+# (signal, receiver, sender) triples feeding the announcement streams
+STREAM_RECEIVERS: List[Tuple[ModelSignal, Callable[..., None], Type[Model]]] = [
+    (pre_save, remember_published_at_before_save, Announcement),
+    (post_save, publish_rescheduled_announcement, Announcement),
+    (post_save, publish_on_audience_announcement_save, AudienceAnnouncement),
+    (m2m_changed, publish_on_audience_announcement_m2m_change, AudienceAnnouncement),
+    (post_save, publish_membership_on_user_audience_change, UserAudience),
+    (post_delete, publish_membership_on_user_audience_change, UserAudience),
+    (m2m_changed, publish_membership_on_user_audience_m2m_change, UserAudience),
+]
+
+
+def connect_stream_receivers() -> None:
+    """Connect the receivers publishing announcement events.
+
+    They are only connected when streams are enabled, since remembering
+    the publication time costs a query per announcement update, and the
+    membership receivers disable Django's fast-delete path for
+    ``UserAudience``.
+
+    """
+    for signal, handler, sender in STREAM_RECEIVERS:
+        signal.connect(handler, sender=sender)
+
+
+def disconnect_stream_receivers() -> None:
+    """Disconnect the receivers connected by `connect_stream_receivers`."""
+    for signal, handler, sender in STREAM_RECEIVERS:
+        signal.disconnect(handler, sender=sender)
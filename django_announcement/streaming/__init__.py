@@ -0,0 +1,68 @@
+import time
+from functools import lru_cache
+from typing import Iterable, Optional, Type
+
+from .brokers import MEMBERSHIP_EVENT, BaseBroker, LocalBroker, RedisBroker
+from .hub import (
+    AnnouncementEventHub,
+    format_event_id,
+    get_announcement_events,
+    get_event_key,
+    parse_event_id,
+)
+
+
+@lru_cache(maxsize=None)
+def get_hub_instance(broker_class: Type[BaseBroker]) -> AnnouncementEventHub:
+    """Return the event hub of the process for a broker class.
+
+    Args:
+        broker_class (Type[BaseBroker]): The broker class.
+
+    Returns:
+        AnnouncementEventHub: The hub shared by the process.
+
+    """
+    return AnnouncementEventHub(broker_class())
+
+
+def get_event_hub() -> AnnouncementEventHub:
+    """Return the event hub of the process, relaying events through the
+    broker set by ``DJANGO_ANNOUNCEMENT_STREAM_BROKER``.
+
+    Returns:
+        AnnouncementEventHub: The hub shared by the process.
+
+    """
+    from django_announcement.settings.conf import config
+
+    return get_hub_instance(config.stream_broker or LocalBroker)
+
+
+def publish_announcements(
+    announcement_ids: Iterable[int], audience_ids: Optional[Iterable[int]] = None
+) -> None:
+    """Announce announcements to the streams of their audiences.
+
+    Args:
+        announcement_ids (Iterable[int]): The announcements.
+        audience_ids (Optional[Iterable[int]]): Only announce to these
+            audiences, or None for all audiences of the announcements.
+
+    """
+    hub = get_event_hub()
+    sent_at = time.time()
+    for event in get_announcement_events(announcement_ids, audience_ids):
+        hub.publish({**event, "sent_at": sent_at})
+
+
+def publish_membership_changes(user_ids: Iterable[int]) -> None:
+    """Tell the streams of users that their audiences changed.
+
+    Args:
+        user_ids (Iterable[int]): The users whose audiences changed.
+
+    """
+    user_ids = sorted(set(user_ids))
+    if user_ids:
+        get_event_hub().publish({"type": MEMBERSHIP_EVENT, "users": user_ids})
@@ -0,0 +1,3 @@
+from .base import MEMBERSHIP_EVENT, BaseBroker, Event
+from .local import LocalBroker
+from .redis import RedisBroker
@@ -0,0 +1,40 @@
+from typing import Any, Callable, Dict
+
+# An announcement event, as published by `publish_announcements`, or a
+# membership event, as published by `publish_membership_changes`
+Event = Dict[str, Any]
+
+# The type of the events telling streams that the audiences of users changed
+MEMBERSHIP_EVENT = "membership"
+
+
+class BaseBroker:
+    """Base class of the brokers relaying announcement events between
+    processes.
+
+    The process committing a change that activates announcements calls
+    `publish`. Every process serving announcement streams calls `start`
+    once, after which the broker passes the events published by any
+    process to the ``deliver`` callback, which fans them out to the
+    streams of that process. Events are JSON serializable dicts.
+
+    """
+
+    def start(self, deliver: Callable[[Event], None]) -> None:
+        """Start passing the published events to a callback.
+
+        Args:
+            deliver (Callable[[Event], None]): Called with every event,
+                possibly from another thread.
+
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def publish(self, event: Event) -> None:
+        """Send an event to the processes serving streams.
+
+        Args:
+            event (Event): The event to send.
+
+        """
+        raise NotImplementedError  # pragma: no cover
@@ -0,0 +1,27 @@
+from typing import Callable, Optional
+
+from django_announcement.streaming.brokers.base import BaseBroker, Event
+
+
+class LocalBroker(BaseBroker):
+    """Broker delivering events to the streams of the publishing process
+    only.
+
+    Suited to deployments running a single process, such as one ASGI
+    worker, and to development. Deployments running several processes
+    need a cross-process broker such as `RedisBroker`, since a change
+    committed by one process would otherwise never reach the streams held
+    open by the others.
+
+    """
+
+    def __init__(self) -> None:
+        self.deliver: Optional[Callable[[Event], None]] = None
+
+    def start(self, deliver: Callable[[Event], None]) -> None:
+        self.deliver = deliver
+
+    def publish(self, event: Event) -> None:
+        # Nothing to deliver to before the process serves a stream
+        if self.deliver is not None:
+            self.deliver(event)
@@ -0,0 +1,45 @@
+import json
+from typing import Any, Callable, Optional
+
+from django_announcement.streaming.brokers.base import BaseBroker, Event
+
+
+class RedisBroker(BaseBroker):
+    """Broker relaying events between processes through a Redis pub/sub
+    channel.
+
+    Every process serving streams subscribes to the channel from a
+    background thread, so a change committed by any process reaches the
+    streams of all of them. Requires ``redis``.
+
+    Attributes:
+        url (str): The URL of the Redis server.
+        channel (str): The pub/sub channel carrying the events.
+
+    """
+
+    url: str = "redis://localhost:6379/0"
+    channel: str = "django_announcement:events"
+
+    def __init__(self) -> None:
+        self._client: Optional[Any] = None
+        self.thread: Optional[Any] = None
+
+    @property
+    def client(self) -> Any:
+        """The Redis client, connected on first use."""
+        if self._client is None:
+            import redis
+
+            self._client = redis.Redis.from_url(self.url)
+        return self._client
+
+    def start(self, deliver: Callable[[Event], None]) -> None:
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(
+            **{self.channel: lambda message: deliver(json.loads(message["data"]))}
+        )
+        self.thread = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def publish(self, event: Event) -> None:
+        self.client.publish(self.channel, json.dumps(event))
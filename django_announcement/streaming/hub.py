@@ -0,0 +1,461 @@
+import asyncio
+import heapq
+import itertools
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from django_announcement.streaming.brokers.base import (
+    MEMBERSHIP_EVENT,
+    BaseBroker,
+    Event,
+)
+
+# The position of a delivered announcement event in the streams: the
+# millisecond it became active, then the announcement id
+EventKey = Tuple[int, int]
+
+
+def get_event_key(event: Event) -> EventKey:
+    """Return the position of a delivered announcement event.
+
+    It only depends on the event itself, so it is the same in the hubs of
+    every process, and a client reconnecting to another process resumes
+    where it left off.
+
+    Args:
+        event (Event): The delivered event.
+
+    Returns:
+        EventKey: The activation time in milliseconds and the announcement id.
+
+    """
+    return round(event["activated_at"] * 1000), event["id"]
+
+
+def format_event_id(key: EventKey) -> str:
+    """Format the position of an event as a Server-Sent Event id."""
+    return f"{key[0]}-{key[1]}"
+
+
+def parse_event_id(value: Optional[str]) -> Optional[EventKey]:
+    """Parse a ``Last-Event-ID`` sent by a reconnecting client.
+
+    Args:
+        value (Optional[str]): The header value.
+
+    Returns:
+        Optional[EventKey]: The position of the last event received, or
+        None if the value is missing or malformed.
+
+    """
+    try:
+        activated_at, announcement_id = (value or "").split("-")
+        return int(activated_at), int(announcement_id)
+    except ValueError:
+        return None
+
+
+def targets(audience_ids: Optional[FrozenSet[int]], event: Event) -> bool:
+    """Return whether an announcement event targets one of the audiences,
+    None standing for all audiences."""
+    return audience_ids is None or not audience_ids.isdisjoint(event["audiences"])
+
+
+class Subscription:
+    """The announcement events awaited by one stream served from a thread.
+
+    Attributes:
+        audience_ids (Optional[FrozenSet[int]]): The audiences of the
+            subscriber, or None to receive the events of all audiences.
+        user_id (Optional[int]): The user whose membership changes are
+            delivered to the stream, if any.
+
+    """
+
+    def __init__(
+        self, audience_ids: Optional[Iterable[int]], user_id: Optional[int] = None
+    ) -> None:
+        self.audience_ids = None if audience_ids is None else frozenset(audience_ids)
+        self.user_id = user_id
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    def matches(self, event: Event) -> bool:
+        """Return whether an announcement event targets the subscriber."""
+        return targets(self.audience_ids, event)
+
+    def deliver(self, event: Event) -> None:
+        """Hand an event to the stream; called from any thread."""
+        self.queue.put(event)
+
+    def get(self, timeout: float) -> Optional[Event]:
+        """Wait for the next event.
+
+        Args:
+            timeout (float): Seconds to wait.
+
+        Returns:
+            Optional[Event]: The event, or None if none came in time.
+
+        """
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class AsyncSubscription(Subscription):
+    """The announcement events awaited by one stream served from an event
+    loop. It must be created in that loop."""
+
+    def __init__(
+        self, audience_ids: Optional[Iterable[int]], user_id: Optional[int] = None
+    ) -> None:
+        super().__init__(audience_ids, user_id)
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    def deliver(self, event: Event) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
+        except RuntimeError:
+            # The loop of a finished stream is closed
+            pass
+
+    async def get(self, timeout: float) -> Optional[Event]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class AnnouncementEventHub:
+    """In-process pub/sub fanning announcement events out to the streams
+    served by the process.
+
+    Events are published through the broker, which relays them to the hub
+    of every process serving streams. Each event is delivered to the
+    subscriptions of the audiences it targets, and to the subscriptions
+    of all audiences, once the announcement becomes active: events of
+    announcements published in the future are held by a scheduler thread
+    until their ``published_at``. The announcements already scheduled when
+    the hub starts are loaded from the database.
+
+    The last `replay_size` delivered events are kept, so that a client
+    reconnecting with the id of the last event it received is sent the
+    events it missed. Membership events are delivered to the streams of
+    the users they name, which then resolve their audiences again.
+
+    Attributes:
+        replay_size (int): The number of delivered events kept for replay.
+
+    """
+
+    replay_size: int = 1000
+
+    def __init__(self, broker: BaseBroker) -> None:
+        self.broker = broker
+        self.lock = threading.Lock()
+        self.wakeup = threading.Condition(self.lock)
+        self.subscriptions: Dict[int, Set[Subscription]] = defaultdict(set)
+        self.global_subscriptions: Set[Subscription] = set()
+        self.user_subscriptions: Dict[int, Set[Subscription]] = defaultdict(set)
+        # The latest delivered events with their delivery sequence number
+        self.recent: Deque[Tuple[int, EventKey, Event]] = deque(maxlen=self.replay_size)
+        self.deliveries = itertools.count(1)
+        # Heap of (published_at, sequence, event) of the scheduled events
+        self.scheduled: List[Tuple[float, int, Event]] = []
+        # The latest scheduled published_at of each announcement
+        self.activations: Dict[int, float] = {}
+        self.sequence = itertools.count()
+        self.started = False
+
+    def start(self) -> None:
+        """Load the scheduled announcements and start receiving events.
+
+        Idempotent. Called from the view opening a stream, before any
+        subscription, since it reads from the database.
+
+        """
+        with self.lock:
+            if self.started:
+                return
+            self.started = True
+
+        for event in get_announcement_events(upcoming=True):
+            self.schedule(event, replace=False)
+
+        threading.Thread(
+            target=self.run_scheduler, name="announcement-events", daemon=True
+        ).start()
+        self.broker.start(self.dispatch)
+
+    def subscribe(
+        self,
+        audience_ids: Optional[Iterable[int]],
+        asynchronous: bool = False,
+        user_id: Optional[int] = None,
+        last_event_key: Optional[EventKey] = None,
+    ) -> Subscription:
+        """Register a stream.
+
+        Args:
+            audience_ids (Optional[Iterable[int]]): The audiences of the
+                subscriber, or None to receive the events of all audiences.
+            asynchronous (bool): Whether the stream is served from the
+                running event loop.
+            user_id (Optional[int]): The user whose membership changes are
+                delivered to the stream, if any.
+            last_event_key (Optional[EventKey]): The position of the last
+                event received before reconnecting. The kept events after
+                it are delivered first.
+
+        Returns:
+            Subscription: The subscription to read the events from.
+
+        """
+        subscription = (
+            AsyncSubscription(audience_ids, user_id)
+            if asynchronous
+            else Subscription(audience_ids, user_id)
+        )
+        with self.lock:
+            if subscription.audience_ids is None:
+                self.global_subscriptions.add(subscription)
+            for audience_id in subscription.audience_ids or ():
+                self.subscriptions[audience_id].add(subscription)
+            if user_id is not None:
+                self.user_subscriptions[user_id].add(subscription)
+
+            # Under the lock, so each event is either replayed or delivered
+            if last_event_key is not None:
+                for _delivery, key, event in self.recent:
+                    if key > last_event_key and subscription.matches(event):
+                        subscription.deliver(event)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Unregister a finished stream."""
+        with self.lock:
+            self.global_subscriptions.discard(subscription)
+            self._discard(subscription, self.subscriptions, subscription.audience_ids)
+            self._discard(
+                subscription,
+                self.user_subscriptions,
+                () if subscription.user_id is None else [subscription.user_id],
+            )
+
+    def update_audiences(
+        self, subscription: Subscription, audience_ids: Iterable[int], since: int = 0
+    ) -> None:
+        """Move a stream to the new audiences of its user.
+
+        The kept events of the audiences the user joined, delivered after
+        the membership event, missed the stream; they are delivered now.
+
+        Args:
+            subscription (Subscription): The subscription of the stream.
+            audience_ids (Iterable[int]): The audiences of the user.
+            since (int): The ``delivery`` number of the membership event.
+
+        """
+        with self.lock:
+            previous = subscription.audience_ids
+            self._discard(subscription, self.subscriptions, subscription.audience_ids)
+            subscription.audience_ids = frozenset(audience_ids)
+            for audience_id in subscription.audience_ids:
+                self.subscriptions[audience_id].add(subscription)
+
+            for delivery, _key, event in self.recent:
+                if (
+                    delivery > since
+                    and subscription.matches(event)
+                    and not targets(previous, event)
+                ):
+                    subscription.deliver(event)
+
+    @staticmethod
+    def _discard(
+        subscription: Subscription,
+        index: Dict[int, Set[Subscription]],
+        keys: Optional[Iterable[int]],
+    ) -> None:
+        """Remove a subscription from an index, dropping emptied entries.
+        Called with the lock held."""
+        for key in keys or ():
+            subscriptions = index.get(key)
+            if subscriptions is None:
+                continue
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del index[key]
+
+    def publish(self, event: Event) -> None:
+        """Publish an event to the hubs of every process."""
+        self.broker.publish(event)
+
+    def dispatch(self, event: Event) -> None:
+        """Deliver an event relayed by the broker, now or once the
+        announcement becomes active."""
+        if event.get("type") == MEMBERSHIP_EVENT:
+            self.deliver_membership(event)
+        elif not self.schedule(event):
+            self.deliver(event)
+
+    def deliver_membership(self, event: Event) -> None:
+        """Hand a membership event to the streams of the users it names."""
+        with self.lock:
+            # The events delivered from now on are replayed to the streams
+            # joining audiences (see `update_audiences`)
+            event = {**event, "delivery": self.last_delivery()}
+            subscriptions = set().union(
+                *(
+                    self.user_subscriptions.get(user_id, ())
+                    for user_id in event["users"]
+                )
+            )
+
+        for subscription in subscriptions:
+            subscription.deliver(event)
+
+    def schedule(self, event: Event, replace: bool = True) -> bool:
+        """Hold the event of an announcement published in the future.
+
+        Args:
+            event (Event): The event.
+            replace (bool): Whether the event supersedes a scheduled event
+                of the same announcement.
+
+        Returns:
+            bool: Whether the event was scheduled rather than due.
+
+        """
+        published_at = event["published_at"]
+        with self.lock:
+            if not replace and event["id"] in self.activations:
+                return True
+
+            if published_at is None or published_at <= time.time():
+                self.activations.pop(event["id"], None)
+                return False
+
+            self.activations[event["id"]] = published_at
+            heapq.heappush(self.scheduled, (published_at, next(self.sequence), event))
+            self.wakeup.notify()
+            return True
+
+    def deliver(self, event: Event) -> None:
+        """Hand an active announcement's event to the matching streams, and
+        keep it for replay.
+
+        The event is stamped with the time the announcement became active:
+        its publication time, or else the time the event was sent.
+
+        """
+        expires_at = event["expires_at"]
+        if expires_at is not None and expires_at <= time.time():
+            return
+
+        event = {
+            **event,
+            "activated_at": max(
+                event["published_at"] or 0.0, event.get("sent_at") or 0.0
+            ),
+        }
+        with self.lock:
+            self.recent.append((next(self.deliveries), get_event_key(event), event))
+            subscriptions = set(self.global_subscriptions)
+            for audience_id in event["audiences"]:
+                subscriptions.update(self.subscriptions.get(audience_id, ()))
+
+        for subscription in subscriptions:
+            subscription.deliver(event)
+
+    def last_delivery(self) -> int:
+        """Return the number of the latest kept event, 0 if none. Called
+        with the lock held."""
+        return self.recent[-1][0] if self.recent else 0
+
+    def pop_due(self) -> Optional[Event]:
+        """Wait for the next scheduled event to become due.
+
+        Returns:
+            Optional[Event]: The due event, or None if it was superseded.
+
+        """
+        with self.lock:
+            while not self.scheduled or self.scheduled[0][0] > time.time():
+                timeout = self.scheduled[0][0] - time.time() if self.scheduled else None
+                self.wakeup.wait(timeout)
+
+            published_at, _, event = heapq.heappop(self.scheduled)
+            if self.activations.get(event["id"]) != published_at:
+                return None
+
+            del self.activations[event["id"]]
+            return event
+
+    def run_scheduler(self) -> None:  # pragma: no cover
+        """Deliver the scheduled events as they become due, forever."""
+        while True:
+            event = self.pop_due()
+            if event is not None:
+                self.deliver(event)
+
+
+def get_announcement_events(
+    announcement_ids: Optional[Iterable[int]] = None,
+    audience_ids: Optional[Iterable[int]] = None,
+    upcoming: bool = False,
+) -> List[Event]:
+    """Build the events announcing announcements to their audiences.
+
+    Args:
+        announcement_ids (Optional[Iterable[int]]): The announcements, or
+            None for all of them.
+        audience_ids (Optional[Iterable[int]]): Only announce to these
+            audiences, e.g. those just added, or None for all audiences.
+        upcoming (bool): Only announce announcements published in the
+            future.
+
+    Returns:
+        List[Event]: One event per announcement targeting an audience,
+        skipping expired announcements.
+
+    """
+    from django.db.models import Q
+    from django.utils.timezone import now
+
+    from django_announcement.models import AudienceAnnouncement
+
+    _now = now()
+    links = AudienceAnnouncement.objects.filter(
+        Q(announcement__expires_at__isnull=True) | Q(announcement__expires_at__gt=_now)
+    )
+    if announcement_ids is not None:
+        links = links.filter(announcement_id__in=list(announcement_ids))
+    if audience_ids is not None:
+        links = links.filter(audience_id__in=list(audience_ids))
+    if upcoming:
+        links = links.filter(announcement__published_at__gt=_now)
+
+    events: Dict[int, Event] = {}
+    for announcement_id, audience_id, published_at, expires_at in links.values_list(
+        "announcement_id",
+        "audience_id",
+        "announcement__published_at",
+        "announcement__expires_at",
+    ).order_by("announcement_id", "audience_id"):
+        event = events.get(announcement_id)
+        if event is None:
+            event = events[announcement_id] = {
+                "id": announcement_id,
+                "audiences": [],
+                "published_at": published_at.timestamp() if published_at else None,
+                "expires_at": expires_at.timestamp() if expires_at else None,
+            }
+        event["audiences"].append(audience_id)
+
+    return list(events.values())
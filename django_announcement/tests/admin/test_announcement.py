@@ -273,3 +273,45 @@ class TestAnnouncementAdmin:
 
         # Assert that the method returns the expected formfield result
         assert result == "formfield_response"
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAnnouncementAdminSearch:
+    """Tests for searching the AnnouncementAdmin change list with a search backend."""
+
+    def get_titles(self, client: Client, **params: str) -> list:
+        client.login(username="admin", password="password")
+        url = reverse("admin:django_announcement_announcement_changelist")
+        response = client.get(url, params)
+        assert response.status_code == 200, "Expected the status code to be 200 OK."
+        return [
+            announcement.title for announcement in response.context["cl"].result_list
+        ]
+
+    def test_search_ranked_by_relevance(
+        self,
+        admin_user: UserModel,
+        client: Client,
+        search_backend,
+        search_announcements: list,
+    ) -> None:
+        """
+        Test that admin searches use the search backend and order by relevance,
+        unless a column is sorted.
+
+        Args:
+        ----
+            admin_user (User Model): The admin user for authentication.
+            client (Client): The Django test client used to simulate requests.
+            search_backend: The configured search backend.
+            search_announcements (list): The announcements to search.
+        """
+        assert self.get_titles(client, q="serv") == [
+            "Server maintenance tonight",
+            "Holiday party",
+        ]
+        assert self.get_titles(client, q="serv", o="1") == [
+            "Holiday party",
+            "Server maintenance tonight",
+        ]
+        assert len(self.get_titles(client)) == 3
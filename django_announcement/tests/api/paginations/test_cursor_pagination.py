@@ -0,0 +1,209 @@
+import sys
+from datetime import timedelta
+from typing import List
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from django_announcement.api.paginations import DefaultCursorPagination
+from django_announcement.models import Announcement, AnnouncementCategory
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_paginations,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.fixture
+def announcements(db) -> List[Announcement]:
+    """
+    Fixture to create announcements with distinct, tied and missing publication times.
+
+    Returns:
+        List[Announcement]: The announcements in the expected (newest first) order.
+    """
+    category = AnnouncementCategory.objects.create(name="Cursor")
+    base = now() - timedelta(days=30)
+    published_times = [base + timedelta(hours=i) for i in range(8)]
+    published_times += [base + timedelta(hours=3)] * 3  # ties
+    created = [
+        Announcement.objects.create(
+            title=f"Announcement {i}",
+            content="content",
+            category=category,
+            published_at=published_at,
+        )
+        for i, published_at in enumerate(published_times)
+    ]
+    # Published on creation, ordered by created_at
+    created.append(
+        Announcement.objects.create(
+            title="Immediate", content="content", category=category
+        )
+    )
+    return sorted(
+        created,
+        key=lambda item: (item.published_at or item.created_at, item.pk),
+        reverse=True,
+    )
+
+
+@pytest.mark.django_db
+class TestDefaultCursorPagination:
+    """
+    Test suite for the DefaultCursorPagination class.
+    """
+
+    def setup_method(self) -> None:
+        """
+        Initialize APIRequestFactory for each test and reset the throttle cache.
+        """
+        self.factory = APIRequestFactory()
+        cache.clear()
+
+    def teardown_method(self) -> None:
+        """
+        Reset the throttle cache after each test.
+        """
+        cache.clear()
+
+    def paginate(self, url: str):
+        """
+        Paginate all announcements for the given URL and return the paginator and page.
+
+        The URL is requested as is, so the limit and cursor carried by
+        next/previous links are preserved.
+        """
+        request = Request(self.factory.get(url))
+        paginator = DefaultCursorPagination()
+        page = paginator.paginate_queryset(Announcement.objects.all(), request)
+        return paginator, page
+
+    def test_walk_forward_and_backward(self, announcements: List[Announcement]) -> None:
+        """
+        Test that following next/previous links visits every announcement exactly once in order.
+
+        Asserts:
+        -------
+            - Forward pages concatenate to the full, stable ordering.
+            - Previous links return the same pages in reverse.
+        """
+        pages = []
+        url = "/announcements/?limit=4"
+        while url:
+            paginator, page = self.paginate(url)
+            pages.append(([item.pk for item in page], url))
+            url = paginator.get_next_link()
+
+        assert [pk for ids, _ in pages for pk in ids] == [a.pk for a in announcements]
+        assert paginator.get_previous_link() is not None
+
+        # Walk back from the last page
+        url = paginator.get_previous_link()
+        for ids, _ in reversed(pages[:-1]):
+            paginator, page = self.paginate(url)
+            assert [item.pk for item in page] == ids
+            url = paginator.get_previous_link()
+
+        assert url is None
+
+    def test_never_counts(self, announcements: List[Announcement]) -> None:
+        """
+        Test that paginating never issues COUNT or OFFSET queries.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            paginator, page = self.paginate("/announcements/?limit=3")
+            paginator, page = self.paginate(paginator.get_next_link())
+
+        assert len(page) == 3
+        for query in queries:
+            assert "COUNT" not in query["sql"].upper()
+            assert "OFFSET" not in query["sql"].upper()
+
+    @pytest.mark.parametrize(
+        "limit, expected", [(None, 10), (0, 10), (5, 5), (500, 100), ("abc", 10)]
+    )
+    def test_page_size_bounds(self, limit, expected: int) -> None:
+        """
+        Test that the page size respects the default, minimum and maximum limits.
+        """
+        params = {"limit": limit} if limit is not None else {}
+        request = Request(self.factory.get("/announcements/", params))
+        assert DefaultCursorPagination().get_page_size(request) == expected
+
+    @pytest.mark.parametrize(
+        "cursor", ["not-base64!", "bm90LWpzb24=", "eyJwIjogIngiLCAiaSI6IDF9", "W10="]
+    )
+    def test_invalid_cursor(self, cursor: str) -> None:
+        """
+        Test that undecodable cursors are rejected with NotFound.
+        """
+        request = Request(self.factory.get("/announcements/", {"cursor": cursor}))
+        with pytest.raises(NotFound):
+            DefaultCursorPagination().paginate_queryset(
+                Announcement.objects.all(), request
+            )
+
+    def test_empty_page_links_back_to_start(
+        self, announcements: List[Announcement]
+    ) -> None:
+        """
+        Test that a cursor past the end yields an empty page linking to the first page.
+        """
+        paginator, page = self.paginate("/announcements/?limit=100")
+        last_url = paginator.encode_cursor(page[-1], reverse=False)
+
+        paginator, page = self.paginate(last_url)
+        assert page == []
+        assert paginator.get_next_link() is None
+        assert "cursor" not in paginator.get_previous_link()
+
+    def test_ordering_is_rejected(self) -> None:
+        """
+        Test that combining the fixed cursor ordering with ?ordering= is rejected.
+        """
+        request = Request(self.factory.get("/announcements/", {"ordering": "title"}))
+        with pytest.raises(ValidationError):
+            DefaultCursorPagination().paginate_queryset(
+                Announcement.objects.all(), request
+            )
+
+    def test_api_uses_cursor_pagination(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        announcements: List[Announcement],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that the viewset paginates with cursors when configured.
+        """
+        monkeypatch.setattr(config, "api_pagination_class", DefaultCursorPagination)
+        monkeypatch.setattr(config, "api_allow_list", True)
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.get(reverse("announcement-list"), {"limit": 5})
+
+        assert response.status_code == 200
+        assert "count" not in response.data
+        assert [item["id"] for item in response.data["results"]] == [
+            a.pk for a in announcements[:5]
+        ]
+        assert "cursor=" in response.data["next"]
+        assert response.data["previous"] is None
+
+        response = api_client.get(response.data["next"])
+        assert [item["id"] for item in response.data["results"]] == [
+            a.pk for a in announcements[5:10]
+        ]
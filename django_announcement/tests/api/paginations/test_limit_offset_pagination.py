@@ -1,12 +1,17 @@
 import sys
+from typing import Any, Dict, List
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 
 from django_announcement.api.paginations.limit_offset_pagination import (
     DefaultLimitOffSetPagination,
 )
+from django_announcement.models import Announcement, AnnouncementCategory
+from django_announcement.settings.conf import config
 from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
@@ -107,3 +112,118 @@ class TestDefaultLimitOffsetPagination:
         assert (
             limit == paginator.default_limit
         ), "The default limit was not correctly enforced for a limit below the minimum allowed value."
+
+
+@pytest.fixture
+def announcements(db) -> List[Announcement]:
+    """
+    Fixture to create seven announcements in a single category.
+    """
+    category = AnnouncementCategory.objects.create(name="Paginated")
+    return [
+        Announcement.objects.create(
+            title=f"Announcement {i}", content="content", category=category
+        )
+        for i in range(7)
+    ]
+
+
+@pytest.mark.django_db
+class TestLimitOffsetCountModes:
+    """
+    Test suite for the capped and count-free modes of DefaultLimitOffSetPagination.
+    """
+
+    def setup_method(self) -> None:
+        """
+        Initialize APIRequestFactory for each test.
+        """
+        self.factory = APIRequestFactory()
+
+    def paginate(self, params: Dict[str, Any]):
+        """
+        Paginate all announcements ordered by id and return the paginator and response data.
+        """
+        request = Request(self.factory.get("/announcements/", params))
+        paginator = DefaultLimitOffSetPagination()
+        page = paginator.paginate_queryset(Announcement.objects.order_by("id"), request)
+        return paginator, paginator.get_paginated_response([a.pk for a in page]).data
+
+    def test_exact_mode_is_default(self, announcements: List[Announcement]) -> None:
+        """
+        Test that the exact DRF count is kept by default.
+        """
+        _, data = self.paginate({"limit": 3})
+        assert data["count"] == 7
+        assert "has_next" not in data
+
+    def test_none_mode_never_counts(
+        self,
+        announcements: List[Announcement],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that the count-free mode detects further pages from an extra row, without COUNT queries.
+        """
+        monkeypatch.setattr(config, "api_pagination_count_mode", "none")
+
+        with CaptureQueriesContext(connection) as queries:
+            _, data = self.paginate({"limit": 3, "offset": 3})
+
+        assert all("COUNT" not in query["sql"].upper() for query in queries)
+        assert "count" not in data
+        assert data["has_next"] is True
+        assert data["results"] == [a.pk for a in announcements[3:6]]
+        assert "offset=6" in data["next"]
+        assert data["previous"] is not None
+
+        _, data = self.paginate({"limit": 3, "offset": 6})
+        assert data["has_next"] is False
+        assert data["next"] is None
+
+    @pytest.mark.parametrize("cap, count, approximate", [(5, 5, True), (7, 7, False)])
+    def test_capped_mode(
+        self,
+        announcements: List[Announcement],
+        monkeypatch: pytest.MonkeyPatch,
+        cap: int,
+        count: int,
+        approximate: bool,
+    ) -> None:
+        """
+        Test that the capped mode never counts beyond the cap and flags approximate counts.
+        """
+        monkeypatch.setattr(config, "api_pagination_count_cap", cap)
+
+        _, data = self.paginate({"limit": 5, "count": "capped"})
+
+        assert data["count"] == count
+        assert data["count_is_approximate"] is approximate
+        assert data["next"] is not None
+
+    def test_per_request_mode_overrides_setting(
+        self,
+        announcements: List[Announcement],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that a supported ?count= overrides the setting and an unsupported one is ignored.
+        """
+        monkeypatch.setattr(config, "api_pagination_count_mode", "none")
+
+        _, data = self.paginate({"count": "exact"})
+        assert data["count"] == 7
+
+        paginator, data = self.paginate({"count": "bogus"})
+        assert paginator.count_mode == "none"
+        assert "count" not in data
+
+    def test_paginated_response_schema(self) -> None:
+        """
+        Test that the response schema documents the fields of every count mode.
+        """
+        schema = DefaultLimitOffSetPagination().get_paginated_response_schema({})
+        assert schema["required"] == ["results"]
+        assert {"count", "count_is_approximate", "has_next"} <= set(
+            schema["properties"]
+        )
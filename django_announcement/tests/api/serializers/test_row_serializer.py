@@ -0,0 +1,210 @@
+import sys
+from datetime import timedelta
+from typing import Any, Dict, List
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from django_announcement.api.paginations import (
+    DefaultCursorPagination,
+    DefaultLimitOffSetPagination,
+)
+from django_announcement.api.serializers.announcement import (
+    AnnouncementSerializer,
+    SimpleAnnouncementSerializer,
+)
+from django_announcement.api.serializers.row import RowSerializer
+from django_announcement.models import Announcement, AnnouncementCategory, Audience
+from django_announcement.repository.queryset.rows import Row
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_serializers,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.fixture
+def announcements(audience: Audience) -> List[Announcement]:
+    """
+    Fixture to create announcements covering empty, nested and file fields.
+
+    Returns:
+        List[Announcement]: The created announcements.
+    """
+    described = AnnouncementCategory.objects.create(name="News", description="All")
+    bare = AnnouncementCategory.objects.create(name="Bare")
+    other = Audience.objects.create(name="Other")
+
+    with_everything = Announcement.objects.create(
+        title="Everything",
+        content="content",
+        category=described,
+        published_at=now() - timedelta(days=1),
+        expires_at=now() + timedelta(days=1),
+        attachment="announcement_attachments/flyer.pdf",
+    )
+    with_everything.audience.add(other, audience)
+    with_nothing = Announcement.objects.create(
+        title="Nothing", content="", category=bare
+    )
+    return [with_everything, with_nothing]
+
+
+def drf_data(serializer_class, queryset, context) -> List[Dict[str, Any]]:
+    """Serialize with DRF, ordering nested audiences by id like the rows."""
+    data = serializer_class(queryset, many=True, context=context).data
+    for item in data:
+        if "audience" in item:
+            item["audience"] = sorted(item["audience"], key=lambda a: a["id"])
+    return [dict(item) for item in data]
+
+
+@pytest.mark.django_db
+class TestRows:
+    """
+    Test suite for the rows yielded by AnnouncementQuerySet.as_rows.
+    """
+
+    def test_rows_are_slotted(self, announcements: List[Announcement]) -> None:
+        """
+        Test that rows hold flattened columns in slots and expose pk.
+        """
+        row = Announcement.objects.all().as_rows().get(pk=announcements[0].pk)
+
+        assert isinstance(row, Row)
+        assert not hasattr(row, "__dict__")
+        assert row.pk == announcements[0].pk
+        assert row.category__name == "News"
+        assert row.as_dict()["attachment"] == "announcement_attachments/flyer.pdf"
+        assert "category__description" in repr(row)
+
+    def test_rows_with_audience(
+        self, announcements: List[Announcement], django_assert_num_queries
+    ) -> None:
+        """
+        Test that audiences are attached with one extra query.
+        """
+        with django_assert_num_queries(2):
+            rows = list(
+                Announcement.objects.all().as_rows(with_audience=True).order_by("id")
+            )
+
+        assert [a.name for a in rows[0].audience] == ["VIP", "Other"]
+        assert rows[1].audience == []
+        assert list(Announcement.objects.none().as_rows(with_audience=True)) == []
+
+
+@pytest.mark.django_db
+class TestRowSerializer:
+    """
+    Test suite for the RowSerializer fast path.
+    """
+
+    @pytest.mark.parametrize(
+        "serializer_class", [SimpleAnnouncementSerializer, AnnouncementSerializer]
+    )
+    @pytest.mark.parametrize("exclude_empty", [False, True])
+    @pytest.mark.parametrize("with_request", [False, True])
+    def test_matches_model_serializer(
+        self,
+        announcements: List[Announcement],
+        monkeypatch: pytest.MonkeyPatch,
+        serializer_class,
+        exclude_empty: bool,
+        with_request: bool,
+    ) -> None:
+        """
+        Test that rows serialize to exactly the JSON of the model serializers.
+        """
+        monkeypatch.setattr(config, "exclude_serializer_empty_fields", exclude_empty)
+        context = (
+            {"request": Request(APIRequestFactory().get("/"))} if with_request else {}
+        )
+        queryset = Announcement.objects.all().order_by("id")
+        rows = queryset.as_rows(
+            with_audience=RowSerializer.requires_audience(serializer_class)
+        )
+
+        assert RowSerializer(
+            rows, serializer_class=serializer_class, context=context
+        ).data == drf_data(serializer_class, queryset, context)
+
+    def test_file_name_without_url(
+        self, announcements: List[Announcement], settings
+    ) -> None:
+        """
+        Test that the file name is returned when file URLs are disabled.
+        """
+        from django_announcement.api.serializers import row
+
+        settings.REST_FRAMEWORK = {"UPLOADED_FILES_USE_URL": False}
+        row.compile_serializer.cache_clear()
+        try:
+            data = RowSerializer(
+                Announcement.objects.all().as_rows().order_by("id"),
+                serializer_class=SimpleAnnouncementSerializer,
+            ).data
+        finally:
+            settings.REST_FRAMEWORK = {}
+            row.compile_serializer.cache_clear()
+
+        assert data[0]["attachment"] == "announcement_attachments/flyer.pdf"
+
+
+@pytest.mark.django_db
+class TestFastPathView:
+    """
+    Test suite for the fast path of the AnnouncementViewSet.
+    """
+
+    @pytest.fixture(autouse=True)
+    def enable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Allow listing, with a clean throttle cache.
+        """
+        monkeypatch.setattr(config, "api_allow_list", True)
+        cache.clear()
+        yield
+        cache.clear()
+
+    @pytest.mark.parametrize("is_staff", [False, True])
+    @pytest.mark.parametrize(
+        "pagination_class",
+        [DefaultLimitOffSetPagination, DefaultCursorPagination, None],
+    )
+    def test_same_response(
+        self,
+        api_client: APIClient,
+        user: User,
+        admin_user: User,
+        announcements: List[Announcement],
+        monkeypatch: pytest.MonkeyPatch,
+        is_staff: bool,
+        pagination_class,
+    ) -> None:
+        """
+        Test that the fast path answers with the same JSON for every pagination.
+        """
+        monkeypatch.setattr(config, "api_pagination_class", pagination_class)
+        api_client.force_authenticate(user=admin_user if is_staff else user)
+        url = reverse("announcement-list")
+
+        def get() -> Any:
+            response = api_client.get(url)
+            assert response.status_code == 200
+            results = response.json()
+            for item in results if pagination_class is None else results["results"]:
+                item.get("audience", []).sort(key=lambda a: a["id"])
+            return results
+
+        expected = get()
+        monkeypatch.setattr(config, "use_serializer_fast_path", True)
+        assert get() == expected
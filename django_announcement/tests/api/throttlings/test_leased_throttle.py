@@ -0,0 +1,186 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from django_announcement.api.throttlings import LeasedUserRateThrottle
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_throttlings,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+class Clock:
+    """
+    A settable clock standing in for the throttle timer.
+    """
+
+    def __init__(self, now: float = 6000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """
+    Fixture to drive the throttle timer, with empty local and shared state.
+    """
+    clock = Clock()
+    monkeypatch.setattr(LeasedUserRateThrottle, "timer", clock)
+    monkeypatch.setattr(LeasedUserRateThrottle, "leases", {})
+    cache.clear()
+    yield clock
+    cache.clear()
+
+
+class MockView(APIView):
+    """
+    A mock API view applying the LeasedUserRateThrottle.
+    """
+
+    throttle_classes = [LeasedUserRateThrottle]
+
+    def get(self, request: Request) -> Response:
+        return Response({"message": "Request allowed"})
+
+
+def request_as(user: User) -> Response:
+    """
+    Issue a GET request to the mock view as a user.
+    """
+    request = APIRequestFactory().get("/mock-view/")
+    force_authenticate(request, user=user)
+    return MockView.as_view()(request)
+
+
+@pytest.mark.django_db
+class TestLeasedUserRateThrottle:
+    """
+    Test suite for the throttle spending budgets leased from the shared counter.
+    """
+
+    def test_batches_spare_round_trips(
+        self, clock: Clock, user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that a batch of requests is decided locally after each lease.
+        """
+        monkeypatch.setattr(config, "authenticated_user_throttle_rate", "100/min")
+        monkeypatch.setattr(config, "throttle_lease_size", 5)
+
+        with patch.object(cache, "incr", wraps=cache.incr) as incr:
+            for _ in range(10):
+                assert request_as(user).status_code == 200
+
+        # Two leases of 5, the first creating the counter after a missed incr
+        assert incr.call_count == 2
+        assert cache.get(f"throttle_user_{user.pk}:100") == 10
+
+    def test_rate_holds_across_processes(
+        self,
+        clock: Clock,
+        user: User,
+        admin_user: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that processes sharing the counter never exceed the role rates together.
+        """
+        monkeypatch.setattr(config, "authenticated_user_throttle_rate", "25/min")
+        monkeypatch.setattr(config, "staff_user_throttle_rate", "5/min")
+        statuses = []
+        for _ in range(15):
+            # Every request lands on another process, without local budget
+            monkeypatch.setattr(LeasedUserRateThrottle, "leases", {})
+            statuses.append(request_as(user).status_code)
+
+        # Each process leases 2 requests; the 13th only gets the last one
+        assert statuses == [200] * 13 + [429] * 2
+        assert [request_as(admin_user).status_code for _ in range(6)] == [200] * 5 + [
+            429
+        ]
+
+    def test_spent_window(
+        self, clock: Clock, user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that spent windows reject locally until the next window.
+        """
+        monkeypatch.setattr(config, "authenticated_user_throttle_rate", "3/min")
+        assert [request_as(user).status_code for _ in range(3)] == [200] * 3
+
+        clock.now += 20
+        with patch.object(cache, "incr", wraps=cache.incr) as incr:
+            response = request_as(user)
+            assert request_as(user).status_code == 429
+        assert incr.call_count == 1
+        assert response.status_code == 429
+        assert response["Retry-After"] == "40"
+
+        clock.now += 40
+        assert request_as(user).status_code == 200
+
+    def test_lease_outside_lock(
+        self, clock: Clock, user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that the cache is leased without the lock, merging leases taken meanwhile.
+        """
+        monkeypatch.setattr(config, "authenticated_user_throttle_rate", "100/min")
+        monkeypatch.setattr(config, "throttle_lease_size", 5)
+        key = f"throttle_user_{user.pk}"
+        lease = LeasedUserRateThrottle.lease
+
+        def concurrent_lease(throttle, window_key):
+            assert not LeasedUserRateThrottle.lock.locked()
+            # Another request of the user leased during the round trip
+            LeasedUserRateThrottle.leases[key] = (100, 3)
+            return lease(throttle, window_key)
+
+        monkeypatch.setattr(LeasedUserRateThrottle, "lease", concurrent_lease)
+
+        assert request_as(user).status_code == 200
+        assert LeasedUserRateThrottle.leases[key] == (100, 7)
+
+    def test_stale_leases_are_dropped(
+        self, clock: Clock, user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that the budgets of past windows are dropped once there are too many.
+        """
+        monkeypatch.setattr(LeasedUserRateThrottle, "max_leases", 1)
+        monkeypatch.setattr(
+            LeasedUserRateThrottle, "leases", {"throttle_user_0": (99, 3)}
+        )
+
+        request_as(user)
+
+        assert list(LeasedUserRateThrottle.leases) == [f"throttle_user_{user.pk}"]
+
+    def test_unlimited(self, user: User, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that requests are allowed without a rate or cache key.
+        """
+        throttle = LeasedUserRateThrottle()
+        request = Request(APIRequestFactory().get("/mock-view/"))
+        request.user = user
+
+        throttle.rate = None
+        monkeypatch.setattr(throttle, "apply_user_rate", lambda user: None)
+        assert throttle.allow_request(request, None)
+
+        throttle.rate = "1/min"
+        monkeypatch.setattr(throttle, "get_cache_key", lambda request, view: None)
+        assert throttle.allow_request(request, None)
@@ -0,0 +1,148 @@
+import sys
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from django_announcement.api.throttlings import SlidingWindowUserRateThrottle
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_throttlings,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+class Clock:
+    """
+    A settable clock standing in for the throttle timer.
+    """
+
+    def __init__(self, now: float = 6000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """
+    Fixture to drive the throttle timer, with a clean cache.
+    """
+    clock = Clock()
+    monkeypatch.setattr(SlidingWindowUserRateThrottle, "timer", clock)
+    cache.clear()
+    yield clock
+    cache.clear()
+
+
+class MockView(APIView):
+    """
+    A mock API view applying the SlidingWindowUserRateThrottle.
+    """
+
+    throttle_classes = [SlidingWindowUserRateThrottle]
+
+    def get(self, request: Request) -> Response:
+        return Response({"message": "Request allowed"})
+
+
+def request_as(user: User) -> Response:
+    """
+    Issue a GET request to the mock view as a user.
+    """
+    request = APIRequestFactory().get("/mock-view/")
+    force_authenticate(request, user=user)
+    return MockView.as_view()(request)
+
+
+@pytest.mark.django_db
+class TestSlidingWindowUserRateThrottle:
+    """
+    Test suite for the sliding-window counter throttle.
+    """
+
+    def test_role_rates(
+        self,
+        clock: Clock,
+        user: User,
+        admin_user: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that regular and staff users are limited to their configured rates.
+        """
+        monkeypatch.setattr(config, "authenticated_user_throttle_rate", "3/min")
+        monkeypatch.setattr(config, "staff_user_throttle_rate", "5/min")
+
+        assert [request_as(user).status_code for _ in range(4)] == [200] * 3 + [429]
+        assert [request_as(admin_user).status_code for _ in range(6)] == [200] * 5 + [
+            429
+        ]
+
+    def test_sliding_window(
+        self, clock: Clock, user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that the previous window weighs in proportionally to its overlap with the sliding window.
+        """
+        monkeypatch.setattr(config, "authenticated_user_throttle_rate", "4/min")
+        for _ in range(4):
+            assert request_as(user).status_code == 200
+
+        # A quarter into the next window, 3 of the 4 previous requests remain
+        clock.now += 75
+        assert request_as(user).status_code == 200
+        response = request_as(user)
+        assert response.status_code == 429
+        # Rejected requests are not counted; the next one fits once half slid out
+        assert response["Retry-After"] == "15"
+
+        clock.now += 15
+        assert request_as(user).status_code == 200
+
+    def test_counters_are_constant_size(
+        self, clock: Clock, user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that a user costs an integer per window, whatever the rate.
+        """
+        monkeypatch.setattr(config, "authenticated_user_throttle_rate", "1000/min")
+        for _ in range(50):
+            request_as(user)
+
+        assert cache.get(f"throttle_user_{user.pk}:100") == 50
+        assert cache.get(f"throttle_user_{user.pk}") is None
+
+    def test_wait_until_next_window(self, clock: Clock) -> None:
+        """
+        Test that the wait covers the rest of the window when it alone is over the rate.
+        """
+        throttle = SlidingWindowUserRateThrottle()
+        throttle.num_requests, throttle.duration = 2, 60
+        throttle.current, throttle.previous, throttle.elapsed = 2, 0, 20
+
+        assert throttle.wait() == 40
+
+    def test_unlimited(self, user: User, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that requests are allowed without a rate or cache key.
+        """
+        throttle = SlidingWindowUserRateThrottle()
+        request = Request(APIRequestFactory().get("/mock-view/"))
+        request.user = user
+
+        throttle.rate = None
+        monkeypatch.setattr(throttle, "apply_user_rate", lambda user: None)
+        assert throttle.allow_request(request, None)
+
+        throttle.rate = "1/min"
+        monkeypatch.setattr(throttle, "get_cache_key", lambda request, view: None)
+        assert throttle.allow_request(request, None)
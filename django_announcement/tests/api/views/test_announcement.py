@@ -8,7 +8,7 @@ from django.urls import reverse
 from rest_framework.permissions import AllowAny
 from rest_framework.test import APIClient
 
-from django_announcement.models import Announcement
+from django_announcement.models import Announcement, UserAnnouncementFeed
 from django_announcement.settings.conf import config
 from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
@@ -85,6 +85,36 @@ class TestAnnouncementViewSet:
                 response.data["id"] == announcement.id
             ), f"Expected announcement ID {announcement.id}, got {response.data['id']}."
 
+    def test_list_announcements_from_feed(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        monkeypatch: Mock,
+    ):
+        """
+        Test that non-staff users are served from the materialized feed when enabled.
+        """
+        monkeypatch.setattr(config, "materialized_feed_enabled", True)
+        monkeypatch.setattr(config, "api_allow_list", True)
+        UserAnnouncementFeed.objects.sync()
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(reverse("announcement-list"))
+
+        assert (
+            response.status_code == 200
+        ), f"Expected 200 OK, got {response.status_code}."
+        assert [item["id"] for item in response.data["results"]] == [
+            announcement.id
+        ], "Expected the feed entry of the user's audience."
+
+        UserAnnouncementFeed.objects.all().delete()
+        response = api_client.get(reverse("announcement-list"))
+        assert (
+            response.data["results"] == []
+        ), "Expected the list to be read from the (now empty) feed."
+
     @pytest.mark.parametrize("is_staff", [True, False])
     def test_list_announcements_disabled(
         self, api_client: APIClient, admin_user: User, user: User, is_staff: bool
@@ -161,3 +191,41 @@ class TestAnnouncementViewSet:
                 assert (
                     "audience" not in response.data
                 ), "Expected 'audience' not to be present in the simple serializer."
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize(
+        "is_staff, full_details, expected_queries",
+        [
+            # Audience ids, count and page: no audience prefetch
+            (False, False, 3),
+            # The detailed serializer renders audiences
+            (False, True, 4),
+            # Count, page and audience prefetch
+            (True, False, 3),
+        ],
+    )
+    def test_list_loads_serializer_relations(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        user: User,
+        announcement: Announcement,
+        monkeypatch: Mock,
+        django_assert_num_queries,
+        is_staff: bool,
+        full_details: bool,
+        expected_queries: int,
+    ):
+        """
+        Test that lists only load the relations rendered by the chosen serializer.
+        """
+        monkeypatch.setattr(config, "api_allow_list", True)
+        monkeypatch.setattr(config, "include_serializer_full_details", full_details)
+        api_client.force_authenticate(user=admin_user if is_staff else user)
+
+        with django_assert_num_queries(expected_queries):
+            response = api_client.get(reverse("announcement-list"))
+
+        assert response.status_code == 200
+        assert response.data["results"][0]["category"]["name"] == "General"
+        assert ("audience" in response.data["results"][0]) is (is_staff or full_details)
@@ -0,0 +1,265 @@
+import asyncio
+import json
+import sys
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from django_announcement.api.renderers import EventStreamRenderer
+from django_announcement.models import Announcement, AnnouncementCategory, Audience
+from django_announcement.settings.conf import config
+from django_announcement.streaming import AnnouncementEventHub, publish_announcements
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_views,
+    pytest.mark.streaming,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+def frame_fields(frame: bytes) -> dict:
+    """
+    Return the fields of a Server-Sent Event.
+    """
+    return dict(line.split(": ", 1) for line in frame.decode().strip().split("\n"))
+
+
+def announcement_id(frame: bytes) -> int:
+    """
+    Return the id of the announcement pushed by an ``announcement`` event.
+    """
+    fields = frame_fields(frame)
+    assert fields["event"] == "announcement"
+    return json.loads(fields["data"])["id"]
+
+
+async def next_frame(content) -> bytes:
+    """
+    Wait for the next frame of a stream.
+    """
+    return await asyncio.wait_for(content.__anext__(), 5)
+
+
+@pytest.fixture
+def other_announcement(announcement_category: AnnouncementCategory) -> Announcement:
+    """
+    Fixture to create an announcement targeting an audience `user` is not part of.
+    """
+    announcement = Announcement.objects.create(
+        title="Other", content="Not for testuser.", category=announcement_category
+    )
+    announcement.audience.add(Audience.objects.create(name="Other"))
+    return announcement
+
+
+@pytest.mark.django_db
+class TestAnnouncementStreamView:
+    """
+    Test suite for the Server-Sent Events stream of new announcements.
+    """
+
+    @pytest.fixture(autouse=True)
+    def clean_cache(self) -> None:
+        """
+        Start from a clean throttle cache.
+        """
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_stream_pushes_audience_announcements(
+        self,
+        event_hub: AnnouncementEventHub,
+        user: User,
+        announcement: Announcement,
+        other_announcement: Announcement,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that a user is pushed the announcements of their audiences only, with keepalives.
+        """
+        monkeypatch.setattr(config, "stream_heartbeat_interval", 0.01)
+        client = AsyncClient()
+        client.force_login(user)
+
+        async def receive() -> list:
+            response = await client.get(
+                reverse("announcement-stream"), HTTP_ACCEPT="text/event-stream"
+            )
+            assert response.status_code == 200
+            assert response["Content-Type"] == "text/event-stream"
+            assert response["Cache-Control"] == "no-cache"
+
+            content = response.streaming_content.__aiter__()
+            frames = [await next_frame(content), await next_frame(content)]
+            await sync_to_async(publish_announcements)(
+                [other_announcement.pk, announcement.pk]
+            )
+            frames.append(await next_frame(content))
+            frames.append(await next_frame(content))
+            await content.aclose()
+            return frames
+
+        connected, keepalive, pushed, idle = async_to_sync(receive)()
+
+        assert connected == b": connected\n\n"
+        assert keepalive == idle == b": keepalive\n\n"
+        assert announcement_id(pushed) == announcement.pk
+        assert not event_hub.subscriptions and not event_hub.user_subscriptions
+
+    def test_staff_receive_every_audience(
+        self,
+        event_hub: AnnouncementEventHub,
+        admin_user: User,
+        other_announcement: Announcement,
+    ) -> None:
+        """
+        Test that staff streams receive the announcements of all audiences.
+        """
+        client = AsyncClient()
+        client.force_login(admin_user)
+
+        async def receive() -> bytes:
+            response = await client.get(reverse("announcement-stream"))
+            content = response.streaming_content.__aiter__()
+            await next_frame(content)
+            await sync_to_async(publish_announcements)([other_announcement.pk])
+            frame = await next_frame(content)
+            await content.aclose()
+            return frame
+
+        assert announcement_id(async_to_sync(receive)()) == other_announcement.pk
+        assert not event_hub.global_subscriptions
+
+    def test_membership_changes_move_stream(
+        self,
+        event_hub: AnnouncementEventHub,
+        user: User,
+        other_announcement: Announcement,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        """
+        Test that a stream follows its user into a new audience, including the
+        events delivered before it resolved the audiences again.
+        """
+        other_audience = other_announcement.audience.get()
+        client = AsyncClient()
+        client.force_login(user)
+
+        def join() -> None:
+            with django_capture_on_commit_callbacks(execute=True):
+                user.announcement_profile.audiences.add(other_audience)
+            publish_announcements([other_announcement.pk])
+
+        async def receive() -> bytes:
+            response = await client.get(reverse("announcement-stream"))
+            content = response.streaming_content.__aiter__()
+            await next_frame(content)
+            await sync_to_async(join)()
+            frame = await next_frame(content)
+            await content.aclose()
+            return frame
+
+        assert announcement_id(async_to_sync(receive)()) == other_announcement.pk
+        assert [event["users"] for event in event_hub.broker.published[:1]] == [
+            [user.pk]
+        ]
+
+    def test_last_event_id_replay(
+        self,
+        event_hub: AnnouncementEventHub,
+        user: User,
+        announcement: Announcement,
+        other_announcement: Announcement,
+        audience: Audience,
+    ) -> None:
+        """
+        Test that a reconnecting client is sent the events it missed, and only those.
+        """
+        missed = Announcement.objects.create(
+            title="Missed", content="-", category=announcement.category
+        )
+        missed.audience.add(audience)
+        client = AsyncClient()
+        client.force_login(user)
+
+        async def receive() -> tuple:
+            response = await client.get(reverse("announcement-stream"))
+            content = response.streaming_content.__aiter__()
+            await next_frame(content)
+            await sync_to_async(publish_announcements)([announcement.pk])
+            first = await next_frame(content)
+            await content.aclose()
+
+            await sync_to_async(publish_announcements)(
+                [other_announcement.pk, missed.pk]
+            )
+            response = await client.get(
+                reverse("announcement-stream"),
+                headers={"Last-Event-ID": frame_fields(first)["id"]},
+            )
+            content = response.streaming_content.__aiter__()
+            frames = [await next_frame(content), await next_frame(content)]
+            await content.aclose()
+            return first, frames
+
+        first, (connected, replayed) = async_to_sync(receive)()
+
+        assert announcement_id(first) == announcement.pk
+        assert connected == b": connected\n\n"
+        assert announcement_id(replayed) == missed.pk
+
+    def test_wsgi_refused(
+        self, event_hub: AnnouncementEventHub, api_client: APIClient, user: User
+    ) -> None:
+        """
+        Test that WSGI requests are refused instead of holding a worker thread.
+        """
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(
+            reverse("announcement-stream"), HTTP_ACCEPT="text/event-stream"
+        )
+
+        assert response.status_code == 501
+        assert response.content.startswith(b"event: error\ndata: ")
+        assert not event_hub.started
+
+    def test_disabled(
+        self, api_client: APIClient, user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that the stream answers 405 unless streams are enabled.
+        """
+        monkeypatch.setattr(config, "stream_enabled", False)
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(reverse("announcement-stream"))
+
+        assert response.status_code == 405
+
+    def test_unauthenticated(
+        self, event_hub: AnnouncementEventHub, api_client: APIClient
+    ) -> None:
+        """
+        Test that anonymous event stream requests are rejected with an error event.
+        """
+        response = api_client.get(
+            reverse("announcement-stream"), HTTP_ACCEPT="text/event-stream"
+        )
+
+        assert response.status_code in (401, 403)
+        assert response.content.startswith(b"event: error\ndata: ")
+
+    def test_renderer_without_data(self) -> None:
+        """
+        Test that empty responses render to an empty body.
+        """
+        assert EventStreamRenderer().render(None) == b""
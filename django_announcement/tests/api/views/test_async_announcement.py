@@ -0,0 +1,401 @@
+import sys
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import NotSupportedError
+from django.db.models import QuerySet
+from django.test import AsyncClient
+from django.urls import resolve, reverse
+from rest_framework.pagination import CursorPagination
+
+from django_announcement.api.views.async_announcement import AsyncAnnouncementViewSet
+from django_announcement.models import Announcement
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_views,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.fixture
+def async_client() -> AsyncClient:
+    """
+    Fixture to provide an instance of Django's AsyncClient.
+    """
+    return AsyncClient()
+
+
+@pytest.fixture
+def many_announcements(announcement: Announcement) -> list:
+    """
+    Fixture to create eleven announcements visible to the `user` fixture.
+    """
+    announcements = [announcement]
+    for index in range(10):
+        extra = Announcement.objects.create(
+            title=f"Announcement {index}",
+            content="More content.",
+            category=announcement.category,
+        )
+        extra.audience.add(*announcement.audience.all())
+        announcements.append(extra)
+    return announcements
+
+
+def get(client: AsyncClient, url: str, **extra) -> object:
+    """
+    Issue a GET request with the async client from synchronous tests.
+    """
+    return async_to_sync(client.get)(url, **extra)
+
+
+@pytest.mark.django_db
+class TestAsyncAnnouncementViewSet:
+    """
+    Test suite for the AsyncAnnouncementViewSet class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def enable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Enable both API actions, with a clean cache.
+        """
+        monkeypatch.setattr(config, "api_allow_list", True)
+        monkeypatch.setattr(config, "api_allow_retrieve", True)
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_view_is_coroutine(self) -> None:
+        """
+        Test that the routed views run in the event loop under ASGI.
+        """
+        match = resolve(reverse("async-announcement-list"))
+        assert iscoroutinefunction(match.func)
+        assert match.func.cls is AsyncAnnouncementViewSet
+
+    @pytest.mark.parametrize("is_staff", [True, False])
+    def test_list_matches_sync_view(
+        self,
+        async_client: AsyncClient,
+        admin_user: User,
+        user: User,
+        many_announcements: list,
+        is_staff: bool,
+    ) -> None:
+        """
+        Test that the async list returns the same page as the synchronous viewset.
+        """
+        async_client.force_login(admin_user if is_staff else user)
+        query = "?limit=5&offset=2"
+
+        sync = get(async_client, reverse("announcement-list") + query)
+        response = get(async_client, reverse("async-announcement-list") + query)
+
+        assert response.status_code == 200
+        assert response.json()["results"] == sync.json()["results"]
+        assert response.json()["count"] == 11
+        assert len(response.json()["results"]) == 5
+
+    @pytest.mark.parametrize(
+        "count_mode, keys",
+        [
+            ("exact", {"count", "next", "previous", "results"}),
+            (
+                "capped",
+                {"count", "count_is_approximate", "next", "previous", "results"},
+            ),
+            ("none", {"has_next", "next", "previous", "results"}),
+        ],
+    )
+    def test_list_count_modes(
+        self,
+        async_client: AsyncClient,
+        user: User,
+        many_announcements: list,
+        monkeypatch: pytest.MonkeyPatch,
+        count_mode: str,
+        keys: set,
+    ) -> None:
+        """
+        Test that every count mode of the pagination is served asynchronously.
+        """
+        monkeypatch.setattr(config, "api_pagination_count_cap", 5)
+        async_client.force_login(user)
+
+        response = get(
+            async_client,
+            reverse("async-announcement-list") + f"?count={count_mode}&limit=10",
+        )
+
+        data = response.json()
+        assert response.status_code == 200
+        assert set(data) == keys
+        assert len(data["results"]) == 10
+        assert data["next"] is not None
+        if count_mode == "capped":
+            assert data["count"] == 5 and data["count_is_approximate"]
+        if count_mode == "none":
+            assert data["has_next"]
+
+    def test_list_empty_page(
+        self, async_client: AsyncClient, user: User, announcement: Announcement
+    ) -> None:
+        """
+        Test that an offset past the end yields an empty exact page.
+        """
+        async_client.force_login(user)
+
+        response = get(async_client, reverse("async-announcement-list") + "?offset=5")
+
+        assert response.json()["count"] == 1
+        assert response.json()["results"] == []
+
+    def test_list_fast_path(
+        self,
+        async_client: AsyncClient,
+        user: User,
+        announcement: Announcement,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that the serializer fast path is used by the async list.
+        """
+        monkeypatch.setattr(config, "use_serializer_fast_path", True)
+        async_client.force_login(user)
+
+        response = get(async_client, reverse("async-announcement-list"))
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["results"]] == [announcement.pk]
+
+    @pytest.mark.parametrize("fast_path", [True, False])
+    def test_list_without_pagination(
+        self,
+        async_client: AsyncClient,
+        user: User,
+        many_announcements: list,
+        monkeypatch: pytest.MonkeyPatch,
+        fast_path: bool,
+    ) -> None:
+        """
+        Test that an unpaginated list streams every row in chunks.
+        """
+        monkeypatch.setattr(config, "use_serializer_fast_path", fast_path)
+        monkeypatch.setattr(config, "api_pagination_class", None)
+        monkeypatch.setattr(AsyncAnnouncementViewSet, "pagination_class", None)
+        monkeypatch.setattr(AsyncAnnouncementViewSet, "chunk_size", 3)
+        async_client.force_login(user)
+
+        response = get(async_client, reverse("async-announcement-list"))
+
+        assert response.status_code == 200
+        assert len(response.json()) == 11
+
+    def test_list_without_pagination_prefetch_fallback(
+        self,
+        async_client: AsyncClient,
+        admin_user: User,
+        many_announcements: list,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that unpaginated lists with prefetched audiences are loaded at once
+        where async iteration does not support prefetching.
+        """
+
+        def aiterator(queryset, chunk_size=2000):
+            raise NotSupportedError(
+                "Using QuerySet.aiterator() after prefetch_related() is not supported."
+            )
+
+        monkeypatch.setattr(config, "use_serializer_fast_path", False)
+        monkeypatch.setattr(config, "api_pagination_class", None)
+        monkeypatch.setattr(AsyncAnnouncementViewSet, "pagination_class", None)
+        monkeypatch.setattr(QuerySet, "aiterator", aiterator)
+        async_client.force_login(admin_user)
+
+        response = get(async_client, reverse("async-announcement-list"))
+
+        assert response.status_code == 200
+        assert len(response.json()) == 11
+        assert all("audience" in item for item in response.json())
+
+    def test_list_with_sync_paginator(
+        self,
+        async_client: AsyncClient,
+        user: User,
+        many_announcements: list,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that paginators without `apaginate_queryset` run in a thread.
+        """
+        paginator = type(
+            "Pagination", (CursorPagination,), {"page_size": 4, "ordering": "-id"}
+        )
+        monkeypatch.setattr(config, "api_pagination_class", paginator)
+        async_client.force_login(user)
+
+        response = get(async_client, reverse("async-announcement-list"))
+
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == 4
+        assert response.json()["next"] is not None
+
+    def test_retrieve(
+        self,
+        async_client: AsyncClient,
+        admin_user: User,
+        user: User,
+        announcement: Announcement,
+    ) -> None:
+        """
+        Test that staff and non-staff users retrieve a visible announcement.
+        """
+        url = reverse("async-announcement-detail", kwargs={"pk": announcement.pk})
+        for _user in [admin_user, user]:
+            async_client.force_login(_user)
+
+            response = get(async_client, url)
+
+            assert response.status_code == 200
+            assert response.json()["id"] == announcement.pk
+
+    @pytest.mark.parametrize("pk", ["999999", "not-a-number"])
+    def test_retrieve_not_found(
+        self, async_client: AsyncClient, user: User, announcement: Announcement, pk
+    ) -> None:
+        """
+        Test that unknown or malformed ids answer 404.
+        """
+        async_client.force_login(user)
+
+        response = get(async_client, f"/async-announcement/announcements/{pk}/")
+
+        assert response.status_code == 404
+
+    def test_unauthenticated(self, async_client: AsyncClient, db) -> None:
+        """
+        Test that the synchronous permission checks still reject anonymous users.
+        """
+        response = get(async_client, reverse("async-announcement-list"))
+
+        assert response.status_code in (401, 403)
+
+    def test_list_disabled(
+        self, async_client: AsyncClient, user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that a disabled list action answers 405 like the synchronous view.
+        """
+        monkeypatch.setattr(config, "api_allow_list", False)
+        async_client.force_login(user)
+
+        response = get(async_client, reverse("async-announcement-list"))
+
+        assert response.status_code == 405
+
+    def test_conditional_requests(
+        self,
+        async_client: AsyncClient,
+        user: User,
+        announcement: Announcement,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that lists and retrieves answer 304 when the client copy is current.
+        """
+        monkeypatch.setattr(config, "api_conditional_requests_enabled", True)
+        async_client.force_login(user)
+
+        for url in [
+            reverse("async-announcement-list"),
+            reverse("async-announcement-detail", kwargs={"pk": announcement.pk}),
+        ]:
+            response = get(async_client, url)
+            assert response.status_code == 200
+            etag = response["ETag"]
+
+            response = get(async_client, url, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+
+    def test_list_response_cache(
+        self,
+        async_client: AsyncClient,
+        user: User,
+        announcement: Announcement,
+        monkeypatch: pytest.MonkeyPatch,
+        django_assert_max_num_queries,
+    ) -> None:
+        """
+        Test that cached list responses are served without reading announcements.
+        """
+        monkeypatch.setattr(config, "list_response_cache_enabled", True)
+        async_client.force_login(user)
+        url = reverse("async-announcement-list")
+
+        first = get(async_client, url)
+        Announcement.objects.filter(pk=announcement.pk).update(title="Changed")
+
+        # The session, user and audience lookups; the announcements are not queried
+        with django_assert_max_num_queries(3):
+            second = get(async_client, url)
+
+        assert second.status_code == 200
+        assert second.json() == first.json()
+
+    def test_router_selects_async_viewset(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that the API router serves the async viewset when enabled.
+        """
+        import importlib
+
+        from django_announcement.api.routers import announcement as routers
+
+        monkeypatch.setattr(config, "api_async_enabled", True)
+        try:
+            importlib.reload(routers)
+            viewsets = {url.callback.cls for url in routers.urlpatterns}
+            assert AsyncAnnouncementViewSet in viewsets
+        finally:
+            monkeypatch.setattr(config, "api_async_enabled", False)
+            importlib.reload(routers)
+
+    def test_unsupported_method(
+        self, async_client: AsyncClient, user: User, announcement: Announcement
+    ) -> None:
+        """
+        Test that methods outside `http_method_names` answer 405.
+        """
+        async_client.force_login(user)
+
+        async def brew():
+            return await async_client.generic(
+                "BREW", reverse("async-announcement-list")
+            )
+
+        response = async_to_sync(brew)()
+
+        assert response.status_code == 405
+
+    @pytest.mark.usefixtures("change_log")
+    def test_synchronous_action(
+        self, async_client: AsyncClient, user: User, announcement: Announcement
+    ) -> None:
+        """
+        Test that synchronous actions, such as the delta sync, run in a thread.
+        """
+        async_client.force_login(user)
+
+        response = get(async_client, reverse("async-announcement-changes"))
+
+        assert response.status_code == 200
+        assert response.json()["changed"] == []
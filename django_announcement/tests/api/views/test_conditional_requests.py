@@ -0,0 +1,164 @@
+import sys
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from django_announcement.models import Announcement, Audience
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_views,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestConditionalRequests:
+    """
+    Test suite for the conditional GET support of the AnnouncementViewSet.
+    """
+
+    @pytest.fixture(autouse=True)
+    def enable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Enable conditional requests and both API actions, with a clean throttle cache.
+        """
+        monkeypatch.setattr(config, "api_conditional_requests_enabled", True)
+        monkeypatch.setattr(config, "api_allow_list", True)
+        monkeypatch.setattr(config, "api_allow_retrieve", True)
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_list_not_modified(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        django_assert_max_num_queries,
+    ) -> None:
+        """
+        Test that a list whose ETag still matches is answered with 304 before serialization.
+        """
+        api_client.force_authenticate(user=user)
+        url = reverse("announcement-list")
+
+        response = api_client.get(url)
+        assert response.status_code == 200
+        etag = response["ETag"]
+        assert etag.startswith('W/"')
+        assert response["Last-Modified"]
+
+        # One aggregate query for the validators; the page is never fetched
+        with django_assert_max_num_queries(2):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert not response.content
+
+    def test_list_etag_follows_visible_set(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        audience: Audience,
+    ) -> None:
+        """
+        Test that the list ETag changes with edits, visibility, query params and audiences.
+        """
+        api_client.force_authenticate(user=user)
+        url = reverse("announcement-list")
+        etags = {api_client.get(url)["ETag"]}
+
+        announcement.title = "Edited"
+        announcement.save()
+        etags.add(api_client.get(url)["ETag"])
+
+        announcement.expires_at = announcement.created_at - timedelta(days=1)
+        announcement.save(update_fields=["expires_at"])
+        Announcement.objects.filter(pk=announcement.pk).update(
+            updated_at=announcement.updated_at
+        )
+        etags.add(api_client.get(url)["ETag"])
+
+        etags.add(api_client.get(url, {"limit": 5})["ETag"])
+
+        user.announcement_profile.audiences.add(Audience.objects.create(name="New"))
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=",".join(etags))
+        assert response.status_code == 200
+        etags.add(response["ETag"])
+
+        assert len(etags) == 5
+
+    def test_list_ignores_if_modified_since(
+        self, api_client: APIClient, user: User, announcement: Announcement
+    ) -> None:
+        """
+        Test that If-Modified-Since alone never yields a 304 for lists.
+        """
+        api_client.force_authenticate(user=user)
+        response = api_client.get(
+            reverse("announcement-list"),
+            HTTP_IF_MODIFIED_SINCE=http_date(
+                (announcement.updated_at + timedelta(days=1)).timestamp()
+            ),
+        )
+        assert response.status_code == 200
+
+    def test_retrieve_not_modified(
+        self, api_client: APIClient, admin_user: User, announcement: Announcement
+    ) -> None:
+        """
+        Test that retrieve honors both If-None-Match and If-Modified-Since.
+        """
+        api_client.force_authenticate(user=admin_user)
+        url = reverse("announcement-detail", kwargs={"pk": announcement.pk})
+
+        response = api_client.get(url)
+        assert response.status_code == 200
+        assert response.data["id"] == announcement.pk
+
+        assert (
+            api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+        )
+        assert (
+            api_client.get(
+                url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+            ).status_code
+            == 304
+        )
+
+        announcement.category.name = "Renamed"
+        announcement.category.save()
+        assert (
+            api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 200
+        )
+
+    def test_disabled_by_default(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that no validators are emitted when conditional requests are disabled.
+        """
+        monkeypatch.setattr(config, "api_conditional_requests_enabled", False)
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(reverse("announcement-list"))
+        assert "ETag" not in response
+
+        response = api_client.get(
+            reverse("announcement-detail", kwargs={"pk": announcement.pk})
+        )
+        assert response.status_code == 200
+        assert "ETag" not in response
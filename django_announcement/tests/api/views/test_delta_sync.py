@@ -0,0 +1,290 @@
+import sys
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework.test import APIClient
+
+from django_announcement.api.views.announcement import AnnouncementViewSet
+from django_announcement.mixins.delta_sync import decode_cursor, encode_cursor
+from django_announcement.models import (
+    Announcement,
+    AnnouncementCategory,
+    AnnouncementChange,
+    Audience,
+    UserAnnouncementProfile,
+)
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_views,
+    pytest.mark.delta_sync,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+def sync(api_client: APIClient, cursor: str = None, **extra) -> dict:
+    """
+    Request the changes since a cursor and return the response data.
+    """
+    params = {} if cursor is None else {"since": cursor}
+    response = api_client.get(reverse("announcement-changes"), params, **extra)
+    assert response.status_code == 200, response.data
+    return response.data
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("change_log")
+class TestDeltaSync:
+    """
+    Test suite for the delta sync of announcements since a cursor.
+    """
+
+    @pytest.fixture(autouse=True)
+    def clean_cache(self) -> None:
+        """
+        Start from a clean throttle cache.
+        """
+        cache.clear()
+        yield
+        cache.clear()
+
+    @pytest.fixture(autouse=True)
+    def settled_changes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Serve changes as soon as they are logged, unless a test restores the window.
+        """
+        monkeypatch.setattr(AnnouncementViewSet, "changes_safety_window", timedelta(0))
+
+    def test_first_sync_returns_cursor(
+        self, api_client: APIClient, user: User, announcement: Announcement
+    ) -> None:
+        """
+        Test that a sync without cursor only returns the current position of the log.
+        """
+        api_client.force_authenticate(user=user)
+
+        data = sync(api_client)
+
+        assert data["changed"] == [] and data["removed"] == []
+        assert decode_cursor(data["cursor"])[0] == AnnouncementChange.objects.last_id()
+        assert sync(api_client, data["cursor"])["changed"] == []
+
+    def test_changes_and_tombstones(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        audience: Audience,
+        announcement_category: AnnouncementCategory,
+    ) -> None:
+        """
+        Test that edits are returned, and removals from the audience and deletions are tombstones.
+        """
+        api_client.force_authenticate(user=user)
+        cursor = sync(api_client)["cursor"]
+        removed = Announcement.objects.create(
+            title="Removed", content="-", category=announcement_category
+        )
+        removed.audience.add(audience)
+        deleted = Announcement.objects.create(
+            title="Deleted", content="-", category=announcement_category
+        )
+        deleted.audience.add(audience)
+        cursor = sync(api_client, cursor)["cursor"]
+
+        announcement.title = "Edited"
+        announcement.save()
+        removed.audience.remove(audience)
+        deleted_id = deleted.pk
+        deleted.delete()
+        # Changes of announcements for other audiences are not reported
+        other = Announcement.objects.create(
+            title="Other", content="-", category=announcement_category
+        )
+        other.audience.add(Audience.objects.create(name="Other"))
+
+        data = sync(api_client, cursor)
+
+        assert [item["id"] for item in data["changed"]] == [announcement.pk]
+        assert data["changed"][0]["title"] == "Edited"
+        assert data["removed"] == sorted([removed.pk, deleted_id])
+        assert data["has_more"] is False
+        assert sync(api_client, data["cursor"])["removed"] == []
+
+    def test_time_transitions(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        audience: Audience,
+        announcement_category: AnnouncementCategory,
+    ) -> None:
+        """
+        Test that announcements published or expired since the last sync are returned.
+        """
+        api_client.force_authenticate(user=user)
+        published = Announcement.objects.create(
+            title="Published", content="-", category=announcement_category
+        )
+        published.audience.add(audience)
+        # Updates bypass the change log, like time passing
+        Announcement.objects.filter(pk=announcement.pk).update(
+            expires_at=now() - timedelta(minutes=30)
+        )
+        Announcement.objects.filter(pk=published.pk).update(
+            published_at=now() - timedelta(minutes=30)
+        )
+        cursor = encode_cursor(
+            AnnouncementChange.objects.last_id(), now() - timedelta(hours=1)
+        )
+
+        data = sync(api_client, cursor)
+
+        assert [item["id"] for item in data["changed"]] == [published.pk]
+        assert data["removed"] == [announcement.pk]
+
+    def test_membership_changes(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        audience: Audience,
+        announcement_category: AnnouncementCategory,
+    ) -> None:
+        """
+        Test that leaving an audience tombstones its announcements and joining one syncs them.
+        """
+        other = Audience.objects.create(name="Other")
+        joined = Announcement.objects.create(
+            title="Joined", content="-", category=announcement_category
+        )
+        joined.audience.add(other)
+        other_profile = UserAnnouncementProfile.objects.create(
+            user=User.objects.create(username="other")
+        )
+        api_client.force_authenticate(user=user)
+        cursor = sync(api_client)["cursor"]
+
+        profile = user.announcement_profile
+        profile.audiences.remove(audience)
+        profile.audiences.add(other)
+        # Memberships of other users are not reported
+        other_profile.audiences.add(audience)
+
+        data = sync(api_client, cursor)
+
+        assert [item["id"] for item in data["changed"]] == [joined.pk]
+        assert data["removed"] == [announcement.pk]
+        assert sync(api_client, data["cursor"])["changed"] == []
+
+    def test_safety_window(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that changes younger than the safety window are held back with the cursor.
+        """
+        monkeypatch.setattr(
+            AnnouncementViewSet, "changes_safety_window", timedelta(minutes=1)
+        )
+        api_client.force_authenticate(user=user)
+        settled = AnnouncementChange.objects.last_id()
+        AnnouncementChange.objects.filter(pk__lte=settled).update(
+            created_at=now() - timedelta(minutes=2)
+        )
+        announcement.title = "Edited"
+        announcement.save()
+
+        first = sync(api_client)
+        data = sync(api_client, encode_cursor(0, now()))
+
+        assert decode_cursor(first["cursor"])[0] == settled
+        assert decode_cursor(data["cursor"])[0] == settled
+        assert data["has_more"] is False
+
+        AnnouncementChange.objects.filter(pk__gt=settled).update(
+            created_at=now() - timedelta(minutes=2)
+        )
+        data = sync(api_client, data["cursor"])
+
+        assert [item["title"] for item in data["changed"]] == ["Edited"]
+
+    def test_paging(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that long logs are synced over several requests, keeping the sync time until drained.
+        """
+        monkeypatch.setattr(AnnouncementViewSet, "changes_page_size", 1)
+        api_client.force_authenticate(user=user)
+        since = now() - timedelta(hours=1)
+
+        first = sync(api_client, encode_cursor(0, since))
+        pages = [first]
+        while pages[-1]["has_more"]:
+            pages.append(sync(api_client, pages[-1]["cursor"]))
+
+        assert first["has_more"] is True
+        assert decode_cursor(first["cursor"]) == (1, since)
+        assert [item["id"] for item in first["changed"]] == [announcement.pk]
+        assert all(decode_cursor(page["cursor"])[1] == since for page in pages[:-1])
+        assert decode_cursor(pages[-1]["cursor"])[1] > since
+
+    def test_staff_sync_every_audience(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        announcement_category: AnnouncementCategory,
+    ) -> None:
+        """
+        Test that staff users sync the announcements of all audiences.
+        """
+        api_client.force_authenticate(user=admin_user)
+        cursor = sync(api_client)["cursor"]
+        announcement = Announcement.objects.create(
+            title="Untargeted", content="-", category=announcement_category
+        )
+
+        data = sync(api_client, cursor)
+
+        assert [item["id"] for item in data["changed"]] == [announcement.pk]
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "MQ==", "MTp0b21vcnJvdw=="])
+    def test_invalid_cursor(
+        self, api_client: APIClient, user: User, cursor: str
+    ) -> None:
+        """
+        Test that malformed cursors are rejected.
+        """
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(reverse("announcement-changes"), {"since": cursor})
+
+        assert response.status_code == 400
+        assert "since" in response.data
+
+    def test_disabled(
+        self, api_client: APIClient, user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that the delta sync answers 405 unless the change log is enabled.
+        """
+        monkeypatch.setattr(config, "change_log_enabled", False)
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(reverse("announcement-changes"))
+
+        assert response.status_code == 405
@@ -0,0 +1,199 @@
+import sys
+from datetime import timedelta
+
+import pytest
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from django_announcement.models import (
+    Announcement,
+    AnnouncementCategory,
+    Audience,
+    AudienceAnnouncement,
+    UserAnnouncementProfile,
+)
+from django_announcement.settings.conf import config
+from django_announcement.signals import (
+    connect_list_response_cache_receivers,
+    disconnect_list_response_cache_receivers,
+    invalidate_list_responses_on_change,
+)
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_views,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.fixture
+def same_audience_user(audience: Audience) -> User:
+    """
+    Fixture to create a second user belonging to the same audiences as `user`.
+    """
+    other = User.objects.create_user(username="sameaudience", password="12345")
+    UserAnnouncementProfile.objects.create(user=other).audiences.add(audience)
+    return other
+
+
+@pytest.mark.django_db
+class TestListResponseCache:
+    """
+    Test suite for the shared list response cache of the AnnouncementViewSet.
+    """
+
+    @pytest.fixture(autouse=True)
+    def enable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Enable the list response cache and its receivers, with a clean cache.
+        """
+        monkeypatch.setattr(config, "list_response_cache_enabled", True)
+        monkeypatch.setattr(config, "api_allow_list", True)
+        connect_list_response_cache_receivers()
+        cache.clear()
+        yield
+        cache.clear()
+        disconnect_list_response_cache_receivers()
+
+    def test_shared_between_same_audiences(
+        self,
+        api_client: APIClient,
+        user: User,
+        same_audience_user: User,
+        announcement: Announcement,
+        django_assert_max_num_queries,
+    ) -> None:
+        """
+        Test that users with the same audiences share a response without listing queries.
+        """
+        url = reverse("announcement-list")
+        api_client.force_authenticate(user=user)
+        expected = api_client.get(url).json()
+
+        api_client.force_authenticate(user=same_audience_user)
+        # Only the audience ids of the user are loaded
+        with django_assert_max_num_queries(1):
+            response = api_client.get(url)
+
+        assert response.json() == expected
+        assert expected["count"] == 1
+
+    def test_keyed_by_audiences_and_query(
+        self,
+        api_client: APIClient,
+        user: User,
+        admin_user: User,
+        announcement: Announcement,
+    ) -> None:
+        """
+        Test that audiences, staff and query params select different entries,
+        while reordered query params share one.
+        """
+        url = reverse("announcement-list")
+        api_client.force_authenticate(user=user)
+        assert api_client.get(url, {"limit": 5, "offset": 0}).json()["count"] == 1
+
+        hidden = Announcement.objects.create(
+            title="Hidden", content="content", category=announcement.category
+        )
+        hidden.audience.add(Audience.objects.create(name="Hidden"))
+
+        # Cached, although the content version was not bumped without receivers
+        assert api_client.get(f"{url}?offset=0&limit=5").json()["count"] == 1
+        api_client.force_authenticate(user=admin_user)
+        assert api_client.get(url).json()["count"] == 2
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda announcement: Announcement.objects.get(pk=announcement.pk).save(),
+            lambda announcement: announcement.category.save(),
+            lambda announcement: announcement.audience.add(
+                Audience.objects.create(name="New")
+            ),
+            lambda announcement: AudienceAnnouncement.objects.filter(
+                announcement=announcement
+            ).delete(),
+            lambda announcement: Announcement.objects.create(
+                title="New",
+                content="content",
+                category=AnnouncementCategory.objects.create(name="New"),
+            ),
+        ],
+        ids=["announcement", "category", "audience-add", "audience-delete", "create"],
+    )
+    def test_invalidated_on_commit(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        change,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        """
+        Test that writes to announcements, categories and audiences invalidate cached lists.
+        """
+        url = reverse("announcement-list")
+        api_client.force_authenticate(user=user)
+        api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            change(announcement)
+        assert callbacks
+
+        with CaptureQueriesContext(connection) as queries:
+            api_client.get(url)
+        assert any("announcements" in query["sql"] for query in queries)
+
+    def test_pre_m2m_actions_are_ignored(
+        self, django_capture_on_commit_callbacks
+    ) -> None:
+        """
+        Test that only completed relation changes schedule an invalidation.
+        """
+        with django_capture_on_commit_callbacks() as callbacks:
+            invalidate_list_responses_on_change(AudienceAnnouncement, action="pre_add")
+        assert not callbacks
+
+    def test_disabled_by_default(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that nothing is cached when the list response cache is disabled.
+        """
+        monkeypatch.setattr(config, "list_response_cache_enabled", False)
+        url = reverse("announcement-list")
+        api_client.force_authenticate(user=user)
+        assert api_client.get(url).json()["count"] == 1
+
+        Announcement.objects.filter(pk=announcement.pk).update(
+            expires_at=announcement.created_at - timedelta(days=1)
+        )
+        assert api_client.get(url).json()["count"] == 0
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+def test_receivers_connected_only_when_enabled(
+    enabled: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that the app only connects the list response cache receivers when the cache is enabled.
+    """
+    monkeypatch.setattr(config, "list_response_cache_enabled", enabled)
+    disconnect_list_response_cache_receivers()
+
+    apps.get_app_config("django_announcement").ready()
+
+    assert post_save.has_listeners(AnnouncementCategory) is enabled
+    disconnect_list_response_cache_receivers()
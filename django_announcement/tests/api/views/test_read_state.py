@@ -0,0 +1,184 @@
+import sys
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework.test import APIClient
+
+from django_announcement.models import (
+    Announcement,
+    AnnouncementCategory,
+    Audience,
+    UserAnnouncementReadState,
+)
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_views,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.fixture
+def announcements(
+    announcement: Announcement,
+    announcement_category: AnnouncementCategory,
+    audience: Audience,
+) -> list:
+    """
+    Fixture to create five announcements visible to the `user` fixture.
+    """
+    announcements = [announcement]
+    for index in range(4):
+        extra = Announcement.objects.create(
+            title=f"Announcement {index}",
+            content="More content.",
+            category=announcement_category,
+        )
+        extra.audience.add(audience)
+        announcements.append(extra)
+    return announcements
+
+
+def unread_count(api_client: APIClient) -> int:
+    """
+    Return the unread count of the authenticated user.
+    """
+    response = api_client.get(reverse("announcement-unread-count"))
+    assert response.status_code == 200
+    return response.data["unread_count"]
+
+
+def mark_read(api_client: APIClient, **data) -> object:
+    """
+    Mark announcements as read for the authenticated user.
+    """
+    return api_client.post(reverse("announcement-mark-read"), data, format="json")
+
+
+@pytest.mark.django_db
+class TestReadState:
+    """
+    Test suite for the read state endpoints.
+    """
+
+    @pytest.fixture(autouse=True)
+    def enable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Enable read states, with a clean throttle cache.
+        """
+        monkeypatch.setattr(config, "read_state_enabled", True)
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_mark_read(
+        self, api_client: APIClient, user: User, announcements: list
+    ) -> None:
+        """
+        Test that marked announcements stop counting as unread, and the state stays compact.
+        """
+        api_client.force_authenticate(user=user)
+        first, second, third, fourth, fifth = (item.pk for item in announcements)
+        assert unread_count(api_client) == 5
+
+        response = mark_read(api_client, ids=[second, fourth, 999])
+        assert response.status_code == 200
+        assert response.data == {"unread_count": 3}
+
+        assert mark_read(api_client, ids=[first, third]).data["unread_count"] == 1
+        state = UserAnnouncementReadState.objects.for_user(user.pk)
+        assert (state.read_up_to, state.read_ids) == (fourth, [])
+
+        assert mark_read(api_client, all=True).data["unread_count"] == 0
+        assert UserAnnouncementReadState.objects.for_user(user.pk).read_up_to == fifth
+
+    def test_scheduled_announcement_unread_once_published(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcements: list,
+        announcement_category: AnnouncementCategory,
+        audience: Audience,
+    ) -> None:
+        """
+        Test that an announcement published after the mark is unread, even with an id below it.
+        """
+        scheduled = Announcement.objects.create(
+            title="Scheduled",
+            content="Later.",
+            category=announcement_category,
+            published_at=now() + timedelta(days=1),
+        )
+        scheduled.audience.add(audience)
+        latest = Announcement.objects.create(
+            title="Latest", content="Now.", category=announcement_category
+        )
+        latest.audience.add(audience)
+        api_client.force_authenticate(user=user)
+        assert mark_read(api_client, all=True).data["unread_count"] == 0
+
+        # Time passing, without a write
+        Announcement.objects.filter(pk=scheduled.pk).update(published_at=now())
+
+        assert scheduled.pk < latest.pk
+        assert unread_count(api_client) == 1
+        assert mark_read(api_client, ids=[scheduled.pk]).data["unread_count"] == 0
+        state = UserAnnouncementReadState.objects.for_user(user.pk)
+        assert (state.read_up_to, state.read_ids) == (scheduled.pk, [])
+
+    def test_unread_count_queries(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcements: list,
+        django_assert_num_queries,
+    ) -> None:
+        """
+        Test that the unread count costs a fixed number of queries.
+        """
+        api_client.force_authenticate(user=user)
+        mark_read(api_client, ids=[announcements[2].pk])
+
+        # Audience ids, read state and the count
+        with django_assert_num_queries(3):
+            assert unread_count(api_client) == 4
+
+    def test_staff(
+        self, api_client: APIClient, admin_user: User, announcements: list
+    ) -> None:
+        """
+        Test that staff users, who have no profile, count every announcement.
+        """
+        api_client.force_authenticate(user=admin_user)
+
+        assert unread_count(api_client) == 5
+        assert mark_read(api_client, all=True).data["unread_count"] == 0
+
+    @pytest.mark.parametrize(
+        "data", [{}, {"ids": [1], "all": True}, {"ids": ["one"]}, {"ids": [0]}]
+    )
+    def test_invalid_payload(self, api_client: APIClient, user: User, data) -> None:
+        """
+        Test that payloads without exactly one of `ids` and `all` are rejected.
+        """
+        api_client.force_authenticate(user=user)
+
+        assert mark_read(api_client, **data).status_code == 400
+
+    def test_disabled(
+        self, api_client: APIClient, user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that the read state endpoints answer 405 unless enabled.
+        """
+        monkeypatch.setattr(config, "read_state_enabled", False)
+        api_client.force_authenticate(user=user)
+
+        assert api_client.get(reverse("announcement-unread-count")).status_code == 405
+        assert mark_read(api_client, all=True).status_code == 405
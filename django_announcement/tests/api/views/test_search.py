@@ -0,0 +1,117 @@
+import sys
+from typing import List
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from django_announcement.search import (
+    BaseSearchBackend,
+    InMemorySearchBackend,
+    SQLiteFTS5SearchBackend,
+)
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_views,
+    pytest.mark.search,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAnnouncementSearch:
+    """
+    Test suite for `?search=` on the AnnouncementViewSet.
+    """
+
+    @pytest.fixture(autouse=True)
+    def enable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Allow listing with a clean throttle cache.
+        """
+        monkeypatch.setattr(config, "api_allow_list", True)
+        cache.clear()
+        yield
+        cache.clear()
+
+    def get_titles(self, api_client: APIClient, user: User, **params: str) -> List:
+        api_client.force_authenticate(user=user)
+        response = api_client.get(reverse("announcement-list"), params)
+        assert response.status_code == 200, "Expected the status code to be 200 OK."
+        return [item["title"] for item in response.data["results"]]
+
+    @pytest.mark.parametrize("fast_path", [False, True])
+    @pytest.mark.parametrize(
+        "search_backend",
+        [SQLiteFTS5SearchBackend, InMemorySearchBackend],
+        indirect=True,
+    )
+    def test_ranked_by_relevance(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        search_backend: BaseSearchBackend,
+        search_announcements: List,
+        monkeypatch: pytest.MonkeyPatch,
+        fast_path: bool,
+    ) -> None:
+        """
+        Test that searches use the backend and order matches by relevance.
+        """
+        monkeypatch.setattr(config, "use_serializer_fast_path", fast_path)
+
+        assert self.get_titles(api_client, admin_user, search="serv") == [
+            "Server maintenance tonight",
+            "Holiday party",
+        ]
+        assert self.get_titles(api_client, admin_user, search="social") == [
+            "Holiday party"
+        ]
+        assert self.get_titles(api_client, admin_user, search="nothing") == []
+
+    def test_explicit_ordering(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        search_backend: BaseSearchBackend,
+        search_announcements: List,
+    ) -> None:
+        """
+        Test that `?ordering=` takes precedence over the relevance.
+        """
+        assert self.get_titles(
+            api_client, admin_user, search="serv", ordering="-id"
+        ) == ["Holiday party", "Server maintenance tonight"]
+
+    def test_query_without_words(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        search_backend: BaseSearchBackend,
+        search_announcements: List,
+    ) -> None:
+        """
+        Test that a search without words does not filter the announcements.
+        """
+        assert len(self.get_titles(api_client, admin_user, search="?")) == 3
+
+    def test_without_backend(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        search_announcements: List,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that the search fields are used when no backend is configured.
+        """
+        monkeypatch.setattr(config, "api_search_backend", None)
+
+        assert self.get_titles(api_client, admin_user, search="erver room") == [
+            "Holiday party"
+        ]
@@ -0,0 +1,154 @@
+import sys
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from django_announcement.models import Announcement
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_views,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    """
+    Test suite for the `?fields=` parameter of the AnnouncementViewSet.
+    """
+
+    @pytest.fixture(autouse=True)
+    def enable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Allow both API actions and keep empty fields, with a clean throttle cache.
+        """
+        monkeypatch.setattr(config, "exclude_serializer_empty_fields", False)
+        monkeypatch.setattr(config, "api_allow_list", True)
+        monkeypatch.setattr(config, "api_allow_retrieve", True)
+        cache.clear()
+        yield
+        cache.clear()
+
+    @pytest.mark.parametrize("fast_path", [False, True])
+    def test_headline_fields(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        monkeypatch: pytest.MonkeyPatch,
+        fast_path: bool,
+    ) -> None:
+        """
+        Test that only the requested fields are represented and loaded.
+        """
+        monkeypatch.setattr(config, "use_serializer_fast_path", fast_path)
+        api_client.force_authenticate(user=user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(
+                reverse("announcement-list"), {"fields": "id, title,published_at"}
+            )
+
+        assert response.status_code == 200
+        assert response.json()["results"] == [
+            {"id": announcement.pk, "title": announcement.title, "published_at": None}
+        ]
+        page_query = queries[-1]["sql"]
+        assert '"content"' not in page_query
+        assert "announcement_categories" not in page_query
+
+    def test_relations_only_when_requested(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        announcement: Announcement,
+        django_assert_num_queries,
+    ) -> None:
+        """
+        Test that the category join and the audience prefetch follow the requested fields.
+        """
+        api_client.force_authenticate(user=admin_user)
+        url = reverse("announcement-list")
+
+        # Count and page, without the audience prefetch
+        with django_assert_num_queries(2):
+            response = api_client.get(url, {"fields": "id,category"})
+        assert response.json()["results"][0]["category"]["name"] == "General"
+
+        with django_assert_num_queries(3):
+            response = api_client.get(url, {"fields": "audience"})
+        assert response.json()["results"][0] == {
+            "audience": [
+                {
+                    "id": announcement.audience.get().pk,
+                    "name": "VIP",
+                    "description": announcement.audience.get().description,
+                }
+            ]
+        }
+
+    def test_unknown_fields_are_rejected(
+        self, api_client: APIClient, user: User, announcement: Announcement
+    ) -> None:
+        """
+        Test that fields not exposed to the user are rejected with a 400 response.
+        """
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(
+            reverse("announcement-list"), {"fields": "title,audience"}
+        )
+
+        assert response.status_code == 400
+        assert "audience" in str(response.data["fields"][0])
+
+    def test_retrieve_with_conditional_requests(
+        self,
+        api_client: APIClient,
+        user: User,
+        announcement: Announcement,
+        monkeypatch: pytest.MonkeyPatch,
+        django_assert_max_num_queries,
+    ) -> None:
+        """
+        Test that retrieves load the validator fields without extra queries.
+        """
+        monkeypatch.setattr(config, "api_conditional_requests_enabled", True)
+        api_client.force_authenticate(user=user)
+        url = reverse("announcement-detail", kwargs={"pk": announcement.pk})
+
+        # Audience ids and the announcement with its category
+        with django_assert_max_num_queries(2):
+            response = api_client.get(url, {"fields": "title"})
+
+        assert response.json() == {"title": announcement.title}
+        assert (
+            api_client.get(
+                url, {"fields": "title"}, HTTP_IF_NONE_MATCH=response["ETag"]
+            ).status_code
+            == 304
+        )
+
+
+@pytest.mark.django_db
+def test_only_fields(announcement: Announcement) -> None:
+    """
+    Test that only_fields defers unrequested columns and drops unrequested relations.
+    """
+    queryset = Announcement.objects.all().only_fields(["title"])
+
+    assert not queryset.query.select_related
+    assert not queryset._prefetch_related_lookups
+    instance = queryset.get()
+    assert instance.get_deferred_fields() >= {"content", "attachment", "category_id"}
+
+    rows = list(Announcement.objects.all().as_rows(fields=["title"]))
+    assert rows[0].as_dict() == {"id": announcement.pk, "title": announcement.title}
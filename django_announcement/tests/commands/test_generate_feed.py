@@ -0,0 +1,49 @@
+import sys
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from django_announcement.models import (
+    Announcement,
+    UserAnnouncementFeed,
+    UserAnnouncementProfile,
+)
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.commands_generate_feed,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestGenerateFeedCommand:
+    """
+    Test suite for the `generate_feed` management command.
+    """
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_feed_generated_from_memberships(
+        self,
+        user_announcement_profile: UserAnnouncementProfile,
+        announcement: Announcement,
+        monkeypatch: pytest.MonkeyPatch,
+        enabled: bool,
+    ) -> None:
+        """
+        Test that the command materializes the existing memberships and warns when disabled.
+        """
+        monkeypatch.setattr(config, "materialized_feed_enabled", enabled)
+        UserAnnouncementFeed.objects.all().delete()
+
+        out = StringIO()
+        call_command("generate_feed", stdout=out)
+
+        assert UserAnnouncementFeed.objects.filter(
+            user_announce_profile=user_announcement_profile, announcement=announcement
+        ).exists()
+        assert "Announcement feed is up to date (1 entries)." in out.getvalue()
+        assert ("The materialized feed is disabled." in out.getvalue()) is not enabled
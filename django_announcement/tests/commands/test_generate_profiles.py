@@ -1,14 +1,33 @@
+import os
+import subprocess
 import sys
 from io import StringIO
 from unittest.mock import MagicMock, patch
 
+import django
 import pytest
+from django.contrib.admin.models import LogEntry
 from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.db.models import F
+from django.db.models.functions import Now
 
 from django_announcement.management.commands.generate_audiences import (
     Command as GenerateAudiencesCommand,
 )
-from django_announcement.models import Audience, UserAnnouncementProfile, UserAudience
+from django_announcement.management.commands.generate_profiles import (
+    Command as GenerateProfilesCommand,
+)
+from django_announcement.models import (
+    Announcement,
+    AnnouncementCategory,
+    Audience,
+    ProfileGenerationWatermark,
+    UserAnnouncementFeed,
+    UserAnnouncementProfile,
+    UserAudience,
+)
+from django_announcement.settings.conf import config
 from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 from django_announcement.utils.user_model import UserModel
 
@@ -166,3 +185,366 @@ class TestGenerateProfilesCommand:
 
         #  Assert that audience successfully assigned to the target user
         assert UserAudience.objects.filter(user_announce_profile=user_announce_profile)
+
+    @patch("builtins.input", side_effect=["yes"])
+    @patch.object(GenerateAudiencesCommand, "get_user_related_models")
+    def test_feed_synced_for_assigned_profiles(
+        self,
+        mock_get_related_models: MagicMock,
+        mock_input: MagicMock,
+        user: UserModel,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """
+        Test that bulk-assigned memberships are fanned out to the materialized feed.
+        """
+        monkeypatch.setattr(config, "materialized_feed_enabled", True)
+        mock_get_related_models.return_value = {
+            UserAnnouncementProfile: "announcement_profile"
+        }
+        audience = Audience.objects.create(name="User Announcement Profile")
+        announcement = Announcement.objects.create(
+            title="Feed",
+            content="Feed",
+            category=AnnouncementCategory.objects.create(name="Feed"),
+        )
+        announcement.audience.add(audience)
+
+        call_command("generate_profiles", stdout=StringIO())
+
+        assert UserAnnouncementFeed.objects.filter(
+            user_announce_profile__user=user, announcement=announcement
+        ).exists()
+
+    @patch("builtins.input", side_effect=["yes"])
+    @patch.object(GenerateAudiencesCommand, "get_user_related_models")
+    @patch(
+        "django_announcement.management.commands.generate_profiles.invalidate_all_audience_ids"
+    )
+    def test_audience_cache_invalidated_on_commit(
+        self,
+        mock_invalidate: MagicMock,
+        mock_get_related_models: MagicMock,
+        mock_input: MagicMock,
+        user: UserModel,
+        django_capture_on_commit_callbacks,
+    ):
+        """
+        Test that the cached audience ids are only invalidated once the assignments are committed.
+        """
+        mock_get_related_models.return_value = {
+            UserAnnouncementProfile: "announcement_profile"
+        }
+        Audience.objects.create(name="User Announcement Profile")
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            call_command("generate_profiles", stdout=StringIO())
+
+        mock_invalidate.assert_not_called()
+        for callback in callbacks:
+            callback()
+        mock_invalidate.assert_called_once_with()
+
+    @patch("builtins.input", side_effect=["yes"])
+    @patch.object(GenerateAudiencesCommand, "get_user_related_models")
+    def test_users_processed_in_batches(
+        self,
+        mock_get_related_models: MagicMock,
+        mock_input: MagicMock,
+    ):
+        """
+        Test that every related user is assigned when users span several batches.
+        """
+        mock_get_related_models.return_value = {
+            UserAnnouncementProfile: "announcement_profile"
+        }
+        audience = Audience.objects.create(name="User Announcement Profile")
+        users = [UserModel.objects.create(username=f"batch{i}") for i in range(5)]
+        for user in users:
+            UserAnnouncementProfile.objects.create(user=user)
+        UserAudience.objects.create(
+            user_announce_profile=users[2].announcement_profile, audience=audience
+        )
+
+        call_command("generate_profiles", "--batch-size", "2", stdout=StringIO())
+
+        assert set(
+            UserAudience.objects.filter(audience=audience).values_list(
+                "user_announce_profile__user_id", flat=True
+            )
+        ) == {user.pk for user in users}
+
+    @patch("builtins.input", side_effect=["yes", "yes"])
+    @patch.object(GenerateAudiencesCommand, "get_user_related_models")
+    def test_incremental_run_processes_new_rows_only(
+        self,
+        mock_get_related_models: MagicMock,
+        mock_input: MagicMock,
+        user: UserModel,
+    ):
+        """
+        Test that an incremental run only assigns users linked to related rows added since the last run.
+        """
+        mock_get_related_models.return_value = {
+            UserAnnouncementProfile: "announcement_profile"
+        }
+        audience = Audience.objects.create(name="User Announcement Profile")
+        call_command("generate_profiles", stdout=StringIO())
+        assert ProfileGenerationWatermark.objects.marks() == {
+            "users": user.pk,
+            "relation:announcement_profile": user.announcement_profile.pk,
+        }
+
+        # Dropped from the audience after the run, so a full run would restore it
+        UserAudience.objects.filter(audience=audience).delete()
+        new_user = UserModel.objects.create(username="new")
+        UserAnnouncementProfile.objects.create(user=new_user)
+
+        call_command("generate_profiles", "--incremental", stdout=StringIO())
+
+        assert list(
+            UserAudience.objects.filter(audience=audience).values_list(
+                "user_announce_profile__user", flat=True
+            )
+        ) == [new_user.pk]
+        assert ProfileGenerationWatermark.objects.marks()["users"] == new_user.pk
+
+    @patch("builtins.input", side_effect=["yes"])
+    @patch.object(GenerateAudiencesCommand, "get_user_related_models")
+    def test_incremental_run_processes_unmarked_relations(
+        self,
+        mock_get_related_models: MagicMock,
+        mock_input: MagicMock,
+        user: UserModel,
+    ):
+        """
+        Test that relations without a mark, such as those with a new audience, are processed in full.
+        """
+        mock_get_related_models.return_value = {
+            UserAnnouncementProfile: "announcement_profile"
+        }
+        Audience.objects.create(name="User Announcement Profile")
+        ProfileGenerationWatermark.objects.store({"users": user.pk})
+
+        call_command("generate_profiles", "--incremental", stdout=StringIO())
+
+        assert UserAudience.objects.filter(user_announce_profile__user=user).exists()
+
+
+class InlineExecutor:
+    """
+    A process pool stand-in running the tasks in the current process.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+
+    def __enter__(self) -> "InlineExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def map(self, fn, iterable):
+        return map(fn, iterable)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestGenerateProfilesWorkers:
+    """
+    Test suite for the parallel execution of the `generate_profiles` command.
+    """
+
+    @patch(
+        "django_announcement.management.commands.generate_profiles.ProcessPoolExecutor",
+        InlineExecutor,
+    )
+    @patch.object(GenerateAudiencesCommand, "get_user_related_models")
+    def test_user_id_ranges_split_among_workers(
+        self, mock_get_related_models: MagicMock
+    ):
+        """
+        Test that the user id ranges handed to the workers cover every related user once.
+        """
+        mock_get_related_models.return_value = {
+            UserAnnouncementProfile: "announcement_profile"
+        }
+        audience = Audience.objects.create(name="User Announcement Profile")
+        users = [UserModel.objects.create(username=f"worker{i}") for i in range(11)]
+        for user in users:
+            UserAnnouncementProfile.objects.create(user=user)
+
+        command = GenerateProfilesCommand()
+        ranges = command._get_user_id_ranges(UserModel.objects.all(), 4)
+        assert ranges[0][0] == users[0].pk - 1 and ranges[-1][1] == users[-1].pk
+        assert all(low < high for low, high in ranges)
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+
+        call_command(
+            "generate_profiles",
+            "--skip-confirmation",
+            "--workers",
+            "2",
+            "--batch-size",
+            "2",
+            stdout=StringIO(),
+        )
+
+        assert UserAudience.objects.filter(audience=audience).count() == len(users)
+
+    @pytest.mark.skipif(
+        django.VERSION < (5, 1), reason="SQLite transaction modes need Django 5.1"
+    )
+    def test_process_pool(self, tmp_path) -> None:
+        """
+        Test that a real pool of two worker processes assigns every user of a file database.
+
+        The test database lives in memory, where the writes of child processes are lost,
+        so the command runs in a fresh interpreter on a database file.
+        """
+        script = """
+from io import StringIO
+from unittest.mock import patch
+
+from django_announcement.tests.setup import configure_django_settings
+
+configure_django_settings()
+
+from django.core.management import call_command
+
+from django_announcement.management.commands.generate_audiences import Command
+from django_announcement.models import Audience, UserAnnouncementProfile, UserAudience
+from django_announcement.utils.user_model import UserModel
+
+call_command("migrate", verbosity=0)
+audience = Audience.objects.create(name="User Announcement Profile")
+for index in range(6):
+    UserAnnouncementProfile.objects.create(
+        user=UserModel.objects.create(username=f"worker{index}")
+    )
+with patch.object(
+    Command,
+    "get_user_related_models",
+    return_value={UserAnnouncementProfile: "announcement_profile"},
+):
+    call_command(
+        "generate_profiles",
+        "--skip-confirmation",
+        "--workers",
+        "2",
+        "--batch-size",
+        "2",
+        stdout=StringIO(),
+    )
+assert UserAudience.objects.filter(audience=audience).count() == 6
+"""
+        env = {
+            **os.environ,
+            "DJANGO_ANNOUNCEMENT_TEST_DATABASE": str(tmp_path / "db.sqlite3"),
+        }
+
+        subprocess.run([sys.executable, "-c", script], env=env, check=True)
+
+
+@pytest.mark.django_db
+class TestGenerateProfilesSetBased:
+    """
+    Test suite for the set-based mode of the `generate_profiles` command.
+    """
+
+    @patch.object(GenerateAudiencesCommand, "get_user_related_models")
+    def test_profiles_and_assignments_inserted_in_database(
+        self,
+        mock_get_related_models: MagicMock,
+        user: UserModel,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """
+        Test that the missing profiles and assignments of related users are created, and the feed of the new assignments filled.
+        """
+        monkeypatch.setattr(config, "materialized_feed_enabled", True)
+        mock_get_related_models.return_value = {LogEntry: "logentry_set"}
+        audience = Audience.objects.create(name="Log Entry")
+        announcement = Announcement.objects.create(
+            title="Feed",
+            content="Feed",
+            category=AnnouncementCategory.objects.create(name="Feed"),
+        )
+        announcement.audience.add(audience)
+        users = [UserModel.objects.create(username=f"set{i}") for i in range(3)]
+        for related_user in [user, *users[:2], users[0]]:
+            LogEntry.objects.create(user=related_user, action_flag=1)
+        UserAudience.objects.create(
+            user_announce_profile=user.announcement_profile, audience=audience
+        )
+
+        call_command(
+            "generate_profiles", "--skip-confirmation", "--set-based", stdout=StringIO()
+        )
+
+        expected = {user.pk, users[0].pk, users[1].pk}
+        assert not UserAnnouncementProfile.objects.filter(user=users[2]).exists()
+        assert (
+            set(
+                UserAudience.objects.filter(audience=audience).values_list(
+                    "user_announce_profile__user", flat=True
+                )
+            )
+            == expected
+        )
+        assert set(
+            UserAnnouncementFeed.objects.filter(announcement=announcement).values_list(
+                "user_announce_profile__user", flat=True
+            )
+        ) == expected - {user.pk}
+
+    def test_one_statement_per_relation(self, django_assert_num_queries):
+        """
+        Test that profiles and the assignments of a relation take one statement each, whatever the user count.
+        """
+        audience = Audience.objects.create(name="Log Entry")
+        for i in range(5):
+            LogEntry.objects.create(
+                user=UserModel.objects.create(username=f"stmt{i}"), action_flag=1
+            )
+
+        # Two inserts, each within its own savepoint inside the atomic block
+        with django_assert_num_queries(8):
+            assert GenerateProfilesCommand()._assign_users_in_database(
+                [LogEntry], ["logentry_set"], {"Log Entry": audience}, None
+            )
+
+        assert UserAudience.objects.filter(audience=audience).count() == 5
+
+    def test_conflicting_insert_runs_again(self):
+        """
+        Test that an insert failing on a row committed concurrently runs once more, then gives up.
+        """
+        command = GenerateProfilesCommand()
+        for i in range(2):
+            UserModel.objects.create(username=f"race{i}")
+        values = {"user": F("pk"), "created_at": Now(), "updated_at": Now()}
+        failures = []
+
+        def fail_inserts(count):
+            def execute_wrapper(execute, sql, params, many, context):
+                if sql.startswith("INSERT") and len(failures) < count:
+                    failures.append(sql)
+                    raise IntegrityError("Inserted concurrently")
+                return execute(sql, params, many, context)
+
+            return connection.execute_wrapper(execute_wrapper)
+
+        with fail_inserts(2), pytest.raises(IntegrityError):
+            command._insert_from_select(
+                UserAnnouncementProfile, UserModel.objects.all(), values
+            )
+        assert len(failures) == 2
+
+        failures.clear()
+        with fail_inserts(1):
+            inserted = command._insert_from_select(
+                UserAnnouncementProfile, UserModel.objects.all(), values
+            )
+        assert len(failures) == 1
+        assert inserted == UserAnnouncementProfile.objects.count() == 2
@@ -0,0 +1,142 @@
+import sys
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.contrib.admin.models import LogEntry
+from django.core.management import call_command
+
+from django_announcement.management.commands.generate_audiences import (
+    Command as GenerateAudiencesCommand,
+)
+from django_announcement.models import (
+    Audience,
+    UserAnnouncementProfile,
+    UserAudience,
+)
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from django_announcement.utils.user_model import UserModel
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.commands_reconcile_audiences,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+def members(audience: Audience) -> set:
+    """
+    Return the ids of the users in an audience.
+    """
+    return set(
+        UserAudience.objects.filter(audience=audience).values_list(
+            "user_announce_profile__user_id", flat=True
+        )
+    )
+
+
+@pytest.mark.django_db
+@patch.object(
+    GenerateAudiencesCommand,
+    "get_user_related_models",
+    return_value={LogEntry: "logentry_set"},
+)
+class TestReconcileAudiencesCommand:
+    """
+    Test suite for the `reconcile_audiences` management command.
+    """
+
+    @pytest.fixture
+    def drifted(self, user: UserModel, audience: Audience) -> dict:
+        """
+        Memberships of the log entry audience drifted from the log entries:
+        a stale member, a member to keep and two missing users, one without profile.
+        """
+        log_audience = Audience.objects.create(name="Log Entry")
+        kept, missing = (
+            UserModel.objects.create(username=name) for name in ("kept", "missing")
+        )
+        new = UserModel.objects.create(username="new")
+        for related_user in (kept, missing):
+            UserAnnouncementProfile.objects.create(user=related_user)
+        for related_user in (kept, missing, new, new):
+            LogEntry.objects.create(user=related_user, action_flag=1)
+        for related_user in (user, kept):
+            UserAudience.objects.create(
+                user_announce_profile=related_user.announcement_profile,
+                audience=log_audience,
+            )
+
+        return {
+            "audience": log_audience,
+            "stale": user,
+            "expected": {kept.pk, missing.pk, new.pk},
+        }
+
+    def test_dry_run_counts_without_changes(
+        self, mock_get_related_models: MagicMock, drifted: dict
+    ) -> None:
+        """
+        Test that a dry run reports the rows of each phase and writes nothing.
+        """
+        before = members(drifted["audience"])
+        out = StringIO()
+        call_command("reconcile_audiences", "--dry-run", stdout=out)
+
+        output = out.getvalue()
+        assert "Create profiles: 1 rows" in output
+        assert "Add to 'Log Entry': 2 rows" in output
+        assert "Remove from 'Log Entry': 1 rows" in output
+        assert "Dry run completed" in output
+        assert members(drifted["audience"]) == before
+        assert UserAnnouncementProfile.objects.count() == 3
+
+    @patch(
+        "django_announcement.management.commands.reconcile_audiences.invalidate_all_audience_ids"
+    )
+    def test_reconcile_in_batches(
+        self,
+        mock_invalidate: MagicMock,
+        mock_get_related_models: MagicMock,
+        drifted: dict,
+        audience: Audience,
+    ) -> None:
+        """
+        Test that missing members are added and stale ones removed, leaving other audiences alone.
+        """
+        out = StringIO()
+        call_command("reconcile_audiences", "--batch-size", "1", stdout=out)
+
+        assert members(drifted["audience"]) == drifted["expected"]
+        assert drifted["stale"].pk in members(audience)
+        assert "Audience memberships reconciled" in out.getvalue()
+        mock_invalidate.assert_called_once_with()
+
+        # Nothing is left to reconcile
+        out = StringIO()
+        call_command("reconcile_audiences", "--dry-run", stdout=out)
+        assert "Add to 'Log Entry': 0 rows" in out.getvalue()
+        assert "Remove from 'Log Entry': 0 rows" in out.getvalue()
+
+    def test_no_audiences(self, mock_get_related_models: MagicMock) -> None:
+        """
+        Test that the command exits when no related model has its audience.
+        """
+        out = StringIO()
+        call_command("reconcile_audiences", stdout=out)
+
+        assert "No valid audiences found" in out.getvalue()
+
+    def test_get_user_related_models_exception(
+        self, mock_get_related_models: MagicMock
+    ) -> None:
+        """
+        Test that the command exits if fetching the user-related models fails.
+        """
+        mock_get_related_models.side_effect = Exception("Simulated exception")
+        out = StringIO()
+        call_command("reconcile_audiences", stdout=out)
+
+        assert (
+            "Error fetching user-related models: Simulated exception" in out.getvalue()
+        )
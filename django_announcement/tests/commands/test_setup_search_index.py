@@ -0,0 +1,49 @@
+import sys
+from io import StringIO
+from typing import List
+
+import pytest
+from django.core.management import call_command
+
+from django_announcement.models import Announcement
+from django_announcement.search import BaseSearchBackend, InMemorySearchBackend
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.commands_setup_search_index,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestSetupSearchIndexCommand:
+    """
+    Test suite for the `setup_search_index` management command.
+    """
+
+    @pytest.mark.parametrize("search_backend", [InMemorySearchBackend], indirect=True)
+    def test_index_built(
+        self, search_backend: BaseSearchBackend, search_announcements: List
+    ) -> None:
+        """
+        Test that the command builds the index of the configured backend.
+        """
+        out = StringIO()
+        call_command("setup_search_index", stdout=out)
+
+        assert "InMemorySearchBackend" in out.getvalue()
+        assert set(search_backend.documents) == set(
+            Announcement.objects.values_list("pk", flat=True)
+        )
+
+    def test_without_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that the command warns when no search backend is configured.
+        """
+        monkeypatch.setattr(config, "api_search_backend", None)
+        out = StringIO()
+        call_command("setup_search_index", stdout=out)
+
+        assert "No search backend is configured" in out.getvalue()
@@ -7,7 +7,11 @@ from django_announcement.tests.fixtures import (
     announcement_category,
     api_client,
     audience,
+    change_log,
+    event_hub,
     mock_request,
+    search_announcements,
+    search_backend,
     setup_data,
     user,
     user_announcement_profile,
@@ -1,5 +1,6 @@
 from .admin import announce_profile_admin, announcement_admin, mock_request
 from .api import api_client
+from .change_log import change_log
 from .models import (
     announcement,
     announcement_category,
@@ -7,4 +8,6 @@ from .models import (
     user_announcement_profile,
 )
 from .queryset import setup_data
+from .search import search_announcements, search_backend
+from .streaming import event_hub
 from .user import admin_user, user
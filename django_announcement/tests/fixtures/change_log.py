@@ -0,0 +1,18 @@
+import pytest
+
+from django_announcement.settings.conf import config
+from django_announcement.signals import (
+    connect_change_log_receivers,
+    disconnect_change_log_receivers,
+)
+
+
+@pytest.fixture
+def change_log(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Fixture to enable the change log and connect its receivers for the duration of a test.
+    """
+    monkeypatch.setattr(config, "change_log_enabled", True)
+    connect_change_log_receivers()
+    yield
+    disconnect_change_log_receivers()
@@ -0,0 +1,63 @@
+from typing import List
+
+import pytest
+
+from django_announcement.models import Announcement, AnnouncementCategory
+from django_announcement.search import (
+    BaseSearchBackend,
+    SQLiteFTS5SearchBackend,
+    get_backend_instance,
+    get_search_backend,
+)
+from django_announcement.settings.conf import config
+from django_announcement.signals import (
+    connect_search_index_receivers,
+    disconnect_search_index_receivers,
+)
+
+
+@pytest.fixture
+def search_backend(request, monkeypatch: pytest.MonkeyPatch) -> BaseSearchBackend:
+    """
+    Fixture to configure a fresh search backend, `SQLiteFTS5SearchBackend` unless
+    another class is given with indirect parametrization.
+    """
+    backend_class = getattr(request, "param", SQLiteFTS5SearchBackend)
+    monkeypatch.setattr(config, "api_search_backend", backend_class)
+    get_backend_instance.cache_clear()
+    if backend_class.maintained_by_signals:
+        connect_search_index_receivers()
+    backend = get_search_backend()
+    backend.setup()
+
+    yield backend
+
+    if backend_class.maintained_by_signals:
+        disconnect_search_index_receivers()
+    get_backend_instance.cache_clear()
+
+
+@pytest.fixture
+def search_announcements(
+    announcement_category: AnnouncementCategory,
+) -> List[Announcement]:
+    """
+    Fixture to create announcements with distinct texts to search.
+    """
+    return [
+        Announcement.objects.create(
+            title="Server maintenance tonight",
+            content="The servers restart at midnight. Servers return by 2am.",
+            category=announcement_category,
+        ),
+        Announcement.objects.create(
+            title="Holiday party",
+            content="Join the party in the server room.",
+            category=AnnouncementCategory.objects.create(name="Social"),
+        ),
+        Announcement.objects.create(
+            title="Café opening",
+            content="The new café opens on Monday.",
+            category=announcement_category,
+        ),
+    ]
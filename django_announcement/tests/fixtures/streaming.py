@@ -0,0 +1,47 @@
+from typing import List
+
+import pytest
+
+from django_announcement.settings.conf import config
+from django_announcement.signals import (
+    connect_stream_receivers,
+    disconnect_stream_receivers,
+)
+from django_announcement.streaming import (
+    AnnouncementEventHub,
+    LocalBroker,
+    get_event_hub,
+    get_hub_instance,
+)
+from django_announcement.streaming.brokers import Event
+
+
+class RecordingBroker(LocalBroker):
+    """
+    Local broker remembering the events published through it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.published: List[Event] = []
+
+    def publish(self, event: Event) -> None:
+        self.published.append(event)
+        super().publish(event)
+
+
+@pytest.fixture
+def event_hub(monkeypatch: pytest.MonkeyPatch) -> AnnouncementEventHub:
+    """
+    Fixture to enable streams with a fresh event hub relaying through a
+    `RecordingBroker`, and to connect the stream receivers.
+    """
+    monkeypatch.setattr(config, "stream_enabled", True)
+    monkeypatch.setattr(config, "stream_broker", RecordingBroker)
+    get_hub_instance.cache_clear()
+    connect_stream_receivers()
+
+    yield get_event_hub()
+
+    disconnect_stream_receivers()
+    get_hub_instance.cache_clear()
@@ -0,0 +1,244 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+from django.contrib.admin.models import LogEntry
+from django.contrib.auth.models import Group, User
+from django.db import transaction
+
+from django_announcement.management.commands.generate_audiences import (
+    Command as GenerateAudiencesCommand,
+)
+from django_announcement.models import Audience, UserAnnouncementProfile, UserAudience
+from django_announcement.settings.conf import config
+from django_announcement.signals import (
+    audience_sync,
+    connect_audience_sync_receivers,
+    disconnect_audience_sync_receivers,
+    sync_audiences_on_related_m2m_change,
+)
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.models,
+    pytest.mark.models_audience_sync,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+def members(audience: Audience) -> set:
+    """
+    Return the ids of the users in an audience.
+    """
+    return set(
+        UserAudience.objects.filter(audience=audience).values_list(
+            "user_announce_profile__user_id", flat=True
+        )
+    )
+
+
+def log(user: User) -> LogEntry:
+    """
+    Create a log entry, the user-related row of these tests.
+    """
+    return LogEntry.objects.create(user=user, action_flag=1)
+
+
+@pytest.mark.django_db
+class TestAudienceSync:
+    """
+    Test suite for the receivers keeping audience memberships in line with user-related models.
+    """
+
+    @pytest.fixture(autouse=True)
+    def audience_sync(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Enable the live sync with log entries as the only user-related model.
+        """
+        monkeypatch.setattr(config, "audience_live_sync_enabled", True)
+        with patch.object(
+            GenerateAudiencesCommand,
+            "get_user_related_models",
+            return_value={LogEntry: "logentry_set"},
+        ):
+            connect_audience_sync_receivers()
+        yield
+        disconnect_audience_sync_receivers()
+
+    @pytest.fixture
+    def log_audience(self) -> Audience:
+        """
+        The audience generated for log entries.
+        """
+        return Audience.objects.create(name="Log Entry")
+
+    def test_new_row_joins_audience_on_commit(
+        self, log_audience: Audience, django_capture_on_commit_callbacks
+    ) -> None:
+        """
+        Test that the user of a new related row gets a profile and joins the audience once committed.
+        """
+        new_user = User.objects.create(username="new")
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            log(new_user)
+            assert not members(log_audience)
+
+        for callback in callbacks:
+            callback()
+        assert members(log_audience) == {new_user.pk}
+        assert UserAnnouncementProfile.objects.filter(user=new_user).exists()
+
+    def test_writes_coalesce_per_transaction(
+        self,
+        user: User,
+        admin_user: User,
+        log_audience: Audience,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        """
+        Test that the users written in a transaction are synced together, once.
+        """
+        with patch.object(
+            audience_sync,
+            "sync_user_audiences",
+            wraps=audience_sync.sync_user_audiences,
+        ) as sync:
+            with django_capture_on_commit_callbacks(execute=True):
+                for related_user in (user, admin_user, user):
+                    log(related_user)
+
+        sync.assert_called_once_with({user.pk, admin_user.pk}, {"logentry_set"})
+        assert members(log_audience) == {user.pk, admin_user.pk}
+
+    def test_saves_keeping_user_queue_nothing(
+        self,
+        user: User,
+        log_audience: Audience,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        """
+        Test that saves leaving the user of a related row alone cost neither a query nor a sync.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            entry = log(user)
+
+        loaded = LogEntry.objects.get(pk=entry.pk)
+        with django_capture_on_commit_callbacks() as callbacks:
+            with django_assert_num_queries(2):
+                entry.change_message = "edited"
+                entry.save()
+                loaded.save(update_fields=["change_message"])
+
+        assert not callbacks
+        assert not audience_sync._pending
+
+    def test_deferred_user_is_looked_up(
+        self,
+        user: User,
+        admin_user: User,
+        log_audience: Audience,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        """
+        Test that a row loaded without its user and then moved still resyncs both users.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            entry = log(user)
+
+        deferred = LogEntry.objects.only("pk").get(pk=entry.pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            deferred.user = admin_user
+            deferred.save()
+
+        assert members(log_audience) == {admin_user.pk}
+
+    def test_pending_users_belong_to_connection(
+        self, user: User, log_audience: Audience, django_capture_on_commit_callbacks
+    ) -> None:
+        """
+        Test that queued users are kept on the connection written to and flushed with its commit.
+        """
+        connection = transaction.get_connection()
+        with django_capture_on_commit_callbacks() as callbacks:
+            log(user)
+            assert audience_sync._pending[connection] == {"logentry_set": {user.pk}}
+
+        for callback in callbacks:
+            callback()
+        assert connection not in audience_sync._pending
+        assert members(log_audience) == {user.pk}
+
+    def test_removal_and_reassignment_leave_audience(
+        self,
+        user: User,
+        admin_user: User,
+        audience: Audience,
+        log_audience: Audience,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        """
+        Test that users without related rows left leave the audience, keeping unrelated memberships.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            first, second = log(user), log(user)
+        assert members(log_audience) == {user.pk}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            first.delete()
+        assert members(log_audience) == {user.pk}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            second.user = admin_user
+            second.save()
+        assert members(log_audience) == {admin_user.pk}
+        assert user.pk in members(audience)
+
+    def test_without_audience(
+        self, user: User, django_capture_on_commit_callbacks
+    ) -> None:
+        """
+        Test that nothing is written until the audience of the related model exists.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            log(User.objects.create(username="early"))
+
+        assert not UserAnnouncementProfile.objects.filter(
+            user__username="early"
+        ).exists()
+
+    def test_m2m_changes_queue_users(
+        self, user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that users added, removed or cleared through a many-to-many relation are queued.
+        """
+        # Stand in for a model declaring a many-to-many field to the user
+        through = User.groups.through
+        monkeypatch.setitem(
+            audience_sync._user_fks, through, through._meta.get_field("user")
+        )
+        monkeypatch.setitem(
+            audience_sync._source_fks, through, through._meta.get_field("group")
+        )
+        queued = []
+        monkeypatch.setattr(
+            audience_sync,
+            "_schedule_sync",
+            lambda rows, values, using: queued.append(set(values)),
+        )
+        group = Group.objects.create(name="members")
+        group.user_set.add(user)
+
+        for action, reverse, instance, pk_set in [
+            ("post_add", False, group, {user.pk}),
+            ("pre_clear", False, group, None),
+            ("post_remove", True, user, {group.pk}),
+            ("pre_add", False, group, {user.pk}),
+        ]:
+            sync_audiences_on_related_m2m_change(
+                through, instance, action, reverse, pk_set, using="default"
+            )
+
+        assert queued == [{user.pk}, {user.pk}, {user.pk}]
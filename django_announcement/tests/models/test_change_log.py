@@ -0,0 +1,207 @@
+import sys
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+
+from django_announcement.models import (
+    Announcement,
+    AnnouncementCategory,
+    AnnouncementChange,
+    Audience,
+    AudienceAnnouncement,
+    UserAnnouncementProfile,
+    UserAudience,
+)
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.models,
+    pytest.mark.models_change_log,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+def memberships(after: int = 0) -> list:
+    """
+    Return the (user id, audience id) pairs of the membership changes logged after a change id.
+    """
+    return list(
+        AnnouncementChange.objects.filter(pk__gt=after, user__isnull=False)
+        .order_by("pk")
+        .values_list("user_id", "audience_id")
+    )
+
+
+def logged(after: int = 0) -> list:
+    """
+    Return the (announcement id, audience id) pairs logged after a change id.
+    """
+    return list(
+        AnnouncementChange.objects.since(after).values_list(
+            "announcement_id", "audience_id"
+        )
+    )
+
+
+@pytest.mark.django_db
+class TestAnnouncementChangeManager:
+    """
+    Test suite for recording and reading the change log.
+    """
+
+    def test_record_and_since(self) -> None:
+        """
+        Test that changes are logged per audience and read back in order after a cursor.
+        """
+        assert AnnouncementChange.objects.last_id() == 0
+
+        AnnouncementChange.objects.record([1, 2])
+        first = AnnouncementChange.objects.last_id()
+        AnnouncementChange.objects.record([3], [10, 20])
+
+        assert logged() == [(1, None), (2, None), (3, 10), (3, 20)]
+        assert logged(first) == [(3, 10), (3, 20)]
+        assert list(
+            AnnouncementChange.objects.since(0, [20]).values_list(
+                "announcement_id", "audience_id"
+            )
+        ) == [(1, None), (2, None), (3, 20)]
+
+    def test_memberships_only_reach_their_user(self) -> None:
+        """
+        Test that membership changes are only read back for their user.
+        """
+        AnnouncementChange.objects.record([1], [10])
+        AnnouncementChange.objects.record_memberships([5, 6], [10])
+
+        assert list(
+            AnnouncementChange.objects.since(0, [10], user_id=5).values_list(
+                "announcement_id", "audience_id", "user_id"
+            )
+        ) == [(1, 10, None), (None, 10, 5)]
+        assert logged() == [(1, 10)]
+
+    def test_last_id_before(self) -> None:
+        """
+        Test that the latest change can be bounded by time.
+        """
+        AnnouncementChange.objects.record([1, 2])
+        first = AnnouncementChange.objects.order_by("pk").first()
+        AnnouncementChange.objects.exclude(pk=first.pk).update(
+            created_at=first.created_at + timedelta(minutes=1)
+        )
+
+        assert AnnouncementChange.objects.last_id(before=first.created_at) == first.pk
+        assert AnnouncementChange.objects.last_id() == first.pk + 1
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("change_log")
+class TestChangeLogReceivers:
+    """
+    Test suite for the receivers logging the writes touching announcements.
+    """
+
+    def test_announcement_writes(
+        self, announcement: Announcement, audience: Audience
+    ) -> None:
+        """
+        Test that saving, targeting and deleting an announcement are logged.
+        """
+        assert logged() == [(announcement.pk, None), (announcement.pk, audience.pk)]
+        cursor = AnnouncementChange.objects.last_id()
+
+        announcement.title = "Edited"
+        announcement.save()
+        announcement_id = announcement.pk
+        announcement.delete()
+
+        # The deletion cascades to the through row, a tombstone for the audience
+        assert sorted(logged(cursor), key=str) == sorted(
+            [
+                (announcement_id, None),
+                (announcement_id, audience.pk),
+                (announcement_id, None),
+            ],
+            key=str,
+        )
+
+    def test_category_save(
+        self, announcement: Announcement, announcement_category: AnnouncementCategory
+    ) -> None:
+        """
+        Test that renaming a category logs its announcements, which embed it.
+        """
+        cursor = AnnouncementChange.objects.last_id()
+
+        announcement_category.name = "Renamed"
+        announcement_category.save()
+
+        assert logged(cursor) == [(announcement.pk, None)]
+
+    def test_m2m_changes(self, announcement: Announcement, audience: Audience) -> None:
+        """
+        Test that removals and clears from both sides log the audiences losing announcements.
+        """
+        other = Audience.objects.create(name="Other")
+        cursor = AnnouncementChange.objects.last_id()
+
+        other.all_announcements.add(announcement)
+        announcement.audience.remove(audience)
+        other.all_announcements.clear()
+        announcement.audience.clear()
+
+        assert logged(cursor) == [
+            (announcement.pk, other.pk),
+            (announcement.pk, audience.pk),
+            (announcement.pk, other.pk),
+        ]
+
+    def test_through_row_retargeted(
+        self, announcement: Announcement, audience: Audience
+    ) -> None:
+        """
+        Test that moving a through row logs both the previous and the new audience.
+        """
+        other = Audience.objects.create(name="Other")
+        row = AudienceAnnouncement.objects.get(announcement=announcement)
+        cursor = AnnouncementChange.objects.last_id()
+
+        row.audience = other
+        row.save()
+        row.save()
+
+        assert logged(cursor) == [
+            (announcement.pk, audience.pk),
+            (announcement.pk, other.pk),
+            (announcement.pk, other.pk),
+        ]
+
+    def test_membership_changes(self, user: User, audience: Audience) -> None:
+        """
+        Test that users joining and leaving audiences, from either side or through rows, are logged.
+        """
+        other = Audience.objects.create(name="Other")
+        profile = user.announcement_profile
+        other_user = User.objects.create(username="other")
+        other_profile = UserAnnouncementProfile.objects.create(user=other_user)
+        cursor = AnnouncementChange.objects.last_id()
+
+        profile.audiences.add(other)
+        other.users.add(other_profile)
+        profile.audiences.remove(audience)
+        row = UserAudience.objects.get(user_announce_profile=other_profile)
+        row.user_announce_profile = profile
+        row.audience = audience
+        row.save()
+        other.users.clear()
+
+        assert memberships(cursor) == [
+            (user.pk, other.pk),
+            (other_user.pk, other.pk),
+            (user.pk, audience.pk),
+            (other_user.pk, other.pk),
+            (user.pk, audience.pk),
+            (user.pk, other.pk),
+        ]
@@ -0,0 +1,240 @@
+import sys
+from typing import Dict
+
+import pytest
+from django.apps import apps
+from django.db.models.signals import pre_save
+
+from django_announcement.models import (
+    Announcement,
+    Audience,
+    AudienceAnnouncement,
+    UserAnnouncementFeed,
+    UserAnnouncementProfile,
+    UserAudience,
+)
+from django_announcement.settings.conf import config
+from django_announcement.signals import (
+    connect_feed_receivers,
+    disconnect_feed_receivers,
+)
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from django_announcement.utils.user_model import UserModel
+
+pytestmark = [
+    pytest.mark.models,
+    pytest.mark.models_feed,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.fixture
+def feed_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Fixture to enable the materialized feed and connect its receivers for the duration of a test.
+    """
+    monkeypatch.setattr(config, "materialized_feed_enabled", True)
+    connect_feed_receivers()
+    yield
+    disconnect_feed_receivers()
+
+
+@pytest.fixture
+def profile(db) -> UserAnnouncementProfile:
+    """
+    Fixture to create a UserAnnouncementProfile without any audience.
+    """
+    feed_user = UserModel.objects.create_user(username="feeduser", password="pw")
+    return UserAnnouncementProfile.objects.create(user=feed_user)
+
+
+def feed_pairs() -> set:
+    """
+    Return the (profile id, announcement id) pairs currently in the feed.
+    """
+    return set(
+        UserAnnouncementFeed.objects.values_list(
+            "user_announce_profile_id", "announcement_id"
+        )
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("feed_enabled")
+class TestUserAnnouncementFeed:
+    """
+    Test suite for the UserAnnouncementFeed model and its write-time maintenance.
+    """
+
+    def test_feed_filled_when_profile_joins_audience(
+        self, profile: UserAnnouncementProfile, setup_data: Dict[str, Announcement]
+    ) -> None:
+        """
+        Test that joining an audience fans its announcements out to the profile.
+        """
+        audience1 = setup_data["audiences"][0]
+        profile.audiences.add(audience1)
+
+        assert feed_pairs() == {
+            (profile.pk, setup_data["active"].pk),
+            (profile.pk, setup_data["expired"].pk),
+        }
+
+    def test_feed_filled_when_announcement_targets_audience(
+        self, profile: UserAnnouncementProfile, setup_data: Dict[str, Announcement]
+    ) -> None:
+        """
+        Test that targeting an audience fans the announcement out to its members.
+        """
+        audience2 = setup_data["audiences"][1]
+        UserAudience.objects.create(user_announce_profile=profile, audience=audience2)
+        setup_data["active"].audience.add(audience2)
+
+        assert (profile.pk, setup_data["active"].pk) in feed_pairs()
+        assert (profile.pk, setup_data["upcoming"].pk) in feed_pairs()
+
+    def test_feed_pruned_only_when_no_path_is_left(
+        self, profile: UserAnnouncementProfile, setup_data: Dict[str, Announcement]
+    ) -> None:
+        """
+        Test that an entry survives while another audience still links the pair.
+        """
+        audience1, audience2 = setup_data["audiences"]
+        active = setup_data["active"]
+        active.audience.add(audience2)
+        profile.audiences.add(audience1, audience2)
+
+        profile.audiences.remove(audience1)
+        assert (profile.pk, active.pk) in feed_pairs()
+        assert (profile.pk, setup_data["expired"].pk) not in feed_pairs()
+
+        AudienceAnnouncement.objects.get(
+            announcement=active, audience=audience2
+        ).delete()
+        assert (profile.pk, active.pk) not in feed_pairs()
+
+    def test_feed_follows_reverse_side_and_clear(
+        self, profile: UserAnnouncementProfile, setup_data: Dict[str, Announcement]
+    ) -> None:
+        """
+        Test that changes made from the audience side are reflected as well.
+        """
+        audience1: Audience = setup_data["audiences"][0]
+        audience1.users.add(profile)
+        assert (profile.pk, setup_data["active"].pk) in feed_pairs()
+
+        audience1.all_announcements.clear()
+        assert not feed_pairs()
+
+        audience1.all_announcements.add(setup_data["active"])
+        assert feed_pairs() == {(profile.pk, setup_data["active"].pk)}
+
+        audience1.users.clear()
+        assert not feed_pairs()
+
+    def test_feed_follows_updated_membership(
+        self, profile: UserAnnouncementProfile, setup_data: Dict[str, Announcement]
+    ) -> None:
+        """
+        Test that moving a membership row to another audience re-targets the feed.
+        """
+        audience1, audience2 = setup_data["audiences"]
+        membership = UserAudience.objects.create(
+            user_announce_profile=profile, audience=audience1
+        )
+
+        membership.audience = audience2
+        membership.save()
+
+        assert feed_pairs() == {(profile.pk, setup_data["upcoming"].pk)}
+
+    def test_get_by_feed(
+        self, profile: UserAnnouncementProfile, setup_data: Dict[str, Announcement]
+    ) -> None:
+        """
+        Test that get_by_feed() returns the announcements materialized for a user.
+        """
+        profile.audiences.add(*setup_data["audiences"])
+
+        feed = Announcement.objects.get_by_feed(profile.user)
+        assert set(feed) == {
+            setup_data["active"],
+            setup_data["upcoming"],
+            setup_data["expired"],
+        }
+        assert list(Announcement.objects.active().get_by_feed(profile.user_id)) == [
+            setup_data["active"]
+        ]
+        assert "DISTINCT" not in str(feed.query)
+
+    def test_sync_in_batches(
+        self,
+        profile: UserAnnouncementProfile,
+        setup_data: Dict[str, Announcement],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that a full sync writes all entries when they span several batches.
+        """
+        monkeypatch.setattr(config, "materialized_feed_enabled", False)
+        profile.audiences.add(*setup_data["audiences"])
+        monkeypatch.setattr(UserAnnouncementFeed.objects, "batch_size", 1)
+
+        UserAnnouncementFeed.objects.sync()
+
+        assert len(feed_pairs()) == 3
+
+    def test_feed_not_maintained_when_disabled(
+        self,
+        profile: UserAnnouncementProfile,
+        setup_data: Dict[str, Announcement],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that no feed rows are written while the feature is disabled.
+        """
+        monkeypatch.setattr(config, "materialized_feed_enabled", False)
+        profile.audiences.add(setup_data["audiences"][0])
+        setup_data["active"].audience.add(setup_data["audiences"][1])
+
+        assert not feed_pairs()
+
+        UserAnnouncementFeed.objects.sync()
+        assert len(feed_pairs()) == 2
+
+    def test_sync_in_id_chunks(
+        self,
+        profile: UserAnnouncementProfile,
+        setup_data: Dict[str, Announcement],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that long id lists are synchronized in several bounded chunks.
+        """
+        monkeypatch.setattr(config, "materialized_feed_enabled", False)
+        profile.audiences.add(*setup_data["audiences"])
+        monkeypatch.setattr(UserAnnouncementFeed.objects, "id_chunk_size", 1)
+        announcement_ids = [a.pk for a in Announcement.objects.all()]
+
+        UserAnnouncementFeed.objects.sync(
+            profile_ids=[profile.pk, profile.pk + 1000],
+            announcement_ids=announcement_ids,
+        )
+
+        assert len(feed_pairs()) == 3
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_receivers_connected_only_when_enabled(
+    enabled: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that the app only connects the feed receivers when the feed is enabled.
+    """
+    monkeypatch.setattr(config, "materialized_feed_enabled", enabled)
+    disconnect_feed_receivers()
+
+    apps.get_app_config("django_announcement").ready()
+
+    assert pre_save.has_listeners(AudienceAnnouncement) is enabled
+    disconnect_feed_receivers()
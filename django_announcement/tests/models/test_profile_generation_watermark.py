@@ -0,0 +1,32 @@
+import sys
+
+import pytest
+
+from django_announcement.models import ProfileGenerationWatermark
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.models,
+    pytest.mark.models_profile_generation_watermark,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestProfileGenerationWatermark:
+    """
+    Test suite for the watermarks recorded by the `generate_profiles` command.
+    """
+
+    def test_store_replaces_marks(self) -> None:
+        """
+        Test that storing marks replaces the previous values and keeps the others.
+        """
+        ProfileGenerationWatermark.objects.store({"users": 3, "relation:a": 5})
+        ProfileGenerationWatermark.objects.store({"users": 7})
+
+        assert ProfileGenerationWatermark.objects.marks() == {
+            "users": 7,
+            "relation:a": 5,
+        }
+        assert str(ProfileGenerationWatermark.objects.get(name="users")) == "users: 7"
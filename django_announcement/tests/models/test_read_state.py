@@ -0,0 +1,101 @@
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from django.contrib.auth.models import User
+
+from django_announcement.models import (
+    UserAnnouncementProfile,
+    UserAnnouncementReadState,
+)
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.models,
+    pytest.mark.models_read_state,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+def position(announcement_id: int) -> tuple:
+    """
+    Return a feed position, published in the order of the ids.
+    """
+    return (
+        datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=announcement_id),
+        announcement_id,
+    )
+
+
+class TestUserAnnouncementReadState:
+    """
+    Test suite for the high-water mark and sparse set of read announcements.
+    """
+
+    def test_mark_read_and_compact(self) -> None:
+        """
+        Test that ids read out of order are folded into the mark once the gaps are read.
+        """
+        state = UserAnnouncementReadState()
+        state.mark_read_up_to(position(2))
+        candidates = [position(pk) for pk in (3, 4, 5, 6)]
+
+        state.mark_read(position(pk) for pk in (1, 5, 4))
+        state.compact(candidates)
+        assert (state.mark, state.read_ids) == (position(2), [4, 5])
+        assert state.is_read(position(2)) and state.is_read(position(5))
+        assert not state.is_read(position(3)) and not state.is_read(position(6))
+
+        state.mark_read([position(3)])
+        state.compact(candidates)
+        assert (state.mark, state.read_ids) == (position(5), [])
+
+    def test_positions_follow_publication(self) -> None:
+        """
+        Test that a low id published after the mark is unread, ties broken by id.
+        """
+        state = UserAnnouncementReadState()
+        assert state.mark is None and not state.is_read(position(1))
+
+        state.mark_read_up_to(position(5))
+
+        assert not state.is_read((position(6)[0], 1))
+        assert state.is_read((position(5)[0], 4))
+        assert not state.is_read((position(5)[0], 6))
+
+    def test_compact_skips_invisible_ids(self) -> None:
+        """
+        Test that the mark moves past the read ids the user can see, dropping the invisible ones.
+        """
+        state = UserAnnouncementReadState(read_ids=[2, 7, 9])
+
+        state.compact([position(2), position(7)])
+
+        assert (state.mark, state.read_ids) == (position(7), [])
+
+    def test_mark_read_up_to(self) -> None:
+        """
+        Test that marking up to a position drops the read ids and never moves the mark back.
+        """
+        state = UserAnnouncementReadState(read_ids=[5, 9])
+
+        state.mark_read_up_to(position(6))
+        state.mark_read_up_to(position(1))
+
+        assert (state.mark, state.read_ids) == (position(6), [])
+
+    @pytest.mark.django_db
+    def test_manager(self, user: User) -> None:
+        """
+        Test that states are read without being created, and created on lock.
+        """
+        staff = User.objects.create_user(username="staff", is_staff=True)
+
+        assert UserAnnouncementReadState.objects.for_user(user.pk).pk is None
+        state = UserAnnouncementReadState.objects.lock_for_user(staff.pk)
+
+        assert state.user_announce_profile == UserAnnouncementProfile.objects.get(
+            user=staff
+        )
+        assert str(state) == "staff read up to 0"
+        assert UserAnnouncementReadState.objects.for_user(staff.pk) == state
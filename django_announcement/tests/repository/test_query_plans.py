@@ -0,0 +1,113 @@
+import sys
+from typing import Callable
+
+import pytest
+from django.db import connection
+from django.db.models import QuerySet
+from django.db.models.functions import Coalesce
+
+from django_announcement.models import (
+    Announcement,
+    AudienceAnnouncement,
+    UserAudience,
+)
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.queryset,
+    pytest.mark.query_plans,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+    pytest.mark.skipif(
+        connection.vendor != "sqlite", reason="Plans are asserted for SQLite only."
+    ),
+]
+
+
+def announcements() -> QuerySet:
+    """
+    Return a plain AnnouncementQuerySet.
+    """
+    return Announcement.objects.get_queryset()
+
+
+@pytest.mark.django_db
+class TestAccessPathQueryPlans:
+    """
+    Regression tests pinning the index used by every repository access path.
+
+    Each case captures the ``EXPLAIN QUERY PLAN`` output of a repository method
+    and asserts the fragment showing that its supporting index is used, so a
+    dropped index or a rewritten query that stops using it fails CI.
+    """
+
+    @pytest.mark.parametrize(
+        "build, expected",
+        [
+            pytest.param(
+                lambda: Announcement.objects.active(),
+                "SEARCH announcements USING INDEX announcement_publish_idx",
+                id="active",
+            ),
+            pytest.param(
+                lambda: Announcement.objects.upcoming(),
+                "SEARCH announcements USING INDEX announcement_publish_idx (published_at>?)",
+                id="upcoming",
+            ),
+            pytest.param(
+                lambda: Announcement.objects.expired(),
+                "SEARCH announcements USING INDEX announcement_expires_idx (expires_at<?)",
+                id="expired",
+            ),
+            pytest.param(
+                lambda: announcements().get_by_audience([1, 2]),
+                "SEARCH U0 USING COVERING INDEX audience_announcement_announcement_id_audience_id",
+                id="get_by_audience",
+            ),
+            pytest.param(
+                lambda: announcements().get_by_category([1]),
+                "SEARCH announcements USING INDEX announcements_category_id",
+                id="get_by_category",
+            ),
+            pytest.param(
+                lambda: announcements().get_by_feed(1),
+                "SEARCH user_announcement_feed USING COVERING INDEX",
+                id="get_by_feed",
+            ),
+            pytest.param(
+                lambda: UserAudience.objects.filter(
+                    user_announce_profile__user_id=1
+                ).values_list("audience_id", flat=True),
+                "SEARCH user_audience USING COVERING INDEX",
+                id="user_audience_ids",
+            ),
+            pytest.param(
+                lambda: AudienceAnnouncement.objects.filter(
+                    audience_id__in=[1, 2]
+                ).values_list("announcement_id", flat=True),
+                "USING COVERING INDEX audience_announcement_idx",
+                id="audience_announcements",
+            ),
+            pytest.param(
+                lambda: announcements()
+                .annotate(cursor=Coalesce("published_at", "created_at"))
+                .order_by("-cursor", "-id"),
+                "SCAN announcements USING INDEX announcement_cursor_idx",
+                id="cursor_ordering",
+            ),
+            pytest.param(
+                lambda: announcements().order_by("-published_at"),
+                "SCAN announcements USING INDEX announcement_publish_idx",
+                id="published_at_ordering",
+            ),
+        ],
+    )
+    def test_access_path_uses_index(
+        self, build: Callable[[], QuerySet], expected: str
+    ) -> None:
+        """
+        Test that the query plan of the access path uses its supporting index.
+        """
+        plan = build().explain()
+
+        assert expected in plan, plan
+        assert "TEMP B-TREE" not in plan, plan
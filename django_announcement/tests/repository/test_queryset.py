@@ -109,3 +109,46 @@ class TestAnnouncementQuerySet:
         assert setup_data["upcoming"] in category2_announcements
         assert setup_data["active"] not in category2_announcements
         assert setup_data["expired"] not in category2_announcements
+
+    def test_audience_and_category_filters_avoid_distinct(
+        self, setup_data: Dict[str, Announcement]
+    ) -> None:
+        """
+        Test that audience and category filters need no DISTINCT and return each announcement once.
+
+        Args:
+        ----
+            setup_data (Dict[str, Announcement]): The fixture data for announcements.
+        """
+        setup_data["active"].audience.add(setup_data["audiences"][1])
+
+        by_audience = Announcement.objects.get_by_audience(setup_data["audiences"])
+        by_category = Announcement.objects.get_by_category(setup_data["categories"])
+
+        for queryset in (by_audience, by_category):
+            sql = str(queryset.query).upper()
+            assert "DISTINCT" not in sql
+            assert len(queryset) == len(set(queryset)) == 3
+
+        assert "EXISTS" in str(by_audience.query).upper()
+        plan = by_audience.explain().upper()
+        assert "TEMP B-TREE FOR DISTINCT" not in plan
+
+
+@pytest.mark.django_db
+def test_with_relations(announcement: Announcement, django_assert_num_queries) -> None:
+    """
+    Test that with_relations joins foreign keys and prefetches many-to-many relations only when declared.
+    """
+    with django_assert_num_queries(1):
+        instance = Announcement.objects.all().with_relations(["category"]).get()
+        assert instance.category.name == announcement.category.name
+
+    audience = announcement.audience.get()
+    with django_assert_num_queries(2):
+        instance = Announcement.objects.all().with_relations(["audience"]).get()
+        assert list(instance.audience.all()) == [audience]
+
+    queryset = Announcement.objects.active().with_relations([])
+    assert not queryset.query.select_related
+    assert not queryset._prefetch_related_lookups
@@ -0,0 +1,287 @@
+import sys
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from django_announcement.middleware import AnnouncementReplicaMiddleware
+from django_announcement.models import Announcement, AnnouncementCategory
+from django_announcement.repository import router as replica_router
+from django_announcement.repository.router import (
+    AnnouncementReplicaRouter,
+    get_stickiness_key,
+    is_pinned_to_primary,
+    pinned_until,
+    routing_context,
+)
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.queryset,
+    pytest.mark.router,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+class Clock:
+    """A monotonic clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """
+    Fixture to control the clock of the router.
+    """
+    clock = Clock()
+    monkeypatch.setattr(replica_router.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def replica_routing(settings, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """
+    Enable the replica router with the `replica` alias and a clean pin state.
+    """
+    settings.DATABASE_ROUTERS = [
+        "django_announcement.repository.router.AnnouncementReplicaRouter"
+    ]
+    monkeypatch.setattr(config, "database_replicas", ["replica"])
+    monkeypatch.setattr(config, "database_stickiness_timeout", 5)
+    monkeypatch.setattr(config, "api_allow_list", True)
+    cache.clear()
+    token = pinned_until.set(0.0)
+    yield
+    pinned_until.reset(token)
+    cache.clear()
+
+
+@pytest.fixture
+def primary_announcement(replica_routing: None) -> Announcement:
+    """
+    Fixture to create an announcement on the primary only, without pinning reads.
+    """
+    announcement = Announcement.objects.create(
+        title="Primary only",
+        content="Not replicated yet.",
+        category=AnnouncementCategory.objects.create(name="General"),
+    )
+    pinned_until.set(0.0)
+    return announcement
+
+
+def make_request(user=None, session_key=None):
+    """Build a request of a user, or of an anonymous session."""
+    request = RequestFactory().get("/")
+    request.user = user or AnonymousUser()
+    if session_key is not None:
+        request.session = type("Session", (), {"session_key": session_key})()
+    return request
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+class TestAnnouncementReplicaRouter:
+    """
+    Tests for routing announcement reads between the primary and a replica.
+    """
+
+    def test_reads_use_replica(self, primary_announcement: Announcement) -> None:
+        """
+        Test that reads go to the replica, which has not received the row.
+        """
+        assert Announcement.objects.db == "replica"
+        assert not Announcement.objects.filter(pk=primary_announcement.pk).exists()
+        assert Announcement.objects.using("default").count() == 1
+
+    def test_write_pins_reads_of_context(
+        self, primary_announcement: Announcement, clock: Clock
+    ) -> None:
+        """
+        Test that reads following a write stay on the primary during the window.
+        """
+        Announcement.objects.filter(pk=primary_announcement.pk).update(title="Edited")
+
+        assert Announcement.objects.get(pk=primary_announcement.pk).title == "Edited"
+
+        clock.now += 6
+        assert not Announcement.objects.exists()
+
+    def test_atomic_block_reads_primary(
+        self, primary_announcement: Announcement
+    ) -> None:
+        """
+        Test that reads inside a transaction of the primary stay on it.
+        """
+        with transaction.atomic():
+            assert Announcement.objects.filter(pk=primary_announcement.pk).exists()
+
+    def test_instance_database_is_kept(
+        self, primary_announcement: Announcement
+    ) -> None:
+        """
+        Test that related reads of an instance use the database it came from.
+        """
+        announcement = Announcement.objects.using("default").get()
+        AnnouncementCategory.objects.using("default").filter(
+            pk=announcement.category_id
+        ).update(name="Renamed")
+        announcement = Announcement.objects.using("default").get()
+
+        assert announcement.category.name == "Renamed"
+
+    def test_user_stickiness_across_requests(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        primary_announcement: Announcement,
+        clock: Clock,
+    ) -> None:
+        """
+        Test that the requests of a user who wrote read from the primary until
+        the window ends, while other users keep reading from the replica.
+        """
+        url = reverse("announcement-list")
+        api_client.force_authenticate(user=admin_user)
+        assert api_client.get(url).data["results"] == []
+
+        with routing_context(make_request(admin_user)):
+            Announcement.objects.filter(pk=primary_announcement.pk).update(
+                title="Edited"
+            )
+        assert pinned_until.get() == 0.0
+
+        response = api_client.get(url)
+        assert [item["title"] for item in response.data["results"]] == ["Edited"]
+
+        other = User.objects.create_superuser("other", "other@example.com", "password")
+        api_client.force_authenticate(user=other)
+        assert api_client.get(url).data["results"] == []
+
+        clock.now += 6
+        cache.clear()
+        api_client.force_authenticate(user=admin_user)
+        assert api_client.get(url).data["results"] == []
+
+    def test_session_stickiness(self, primary_announcement: Announcement) -> None:
+        """
+        Test that anonymous sessions are pinned by their session key.
+        """
+        with routing_context(make_request(session_key="abc")):
+            Announcement.objects.filter(pk=primary_announcement.pk).delete()
+
+        with routing_context(make_request(session_key="abc")):
+            assert is_pinned_to_primary()
+        with routing_context(make_request(session_key="xyz")):
+            assert not is_pinned_to_primary()
+        with routing_context(make_request()):
+            assert not is_pinned_to_primary()
+
+
+class TestRouterDecisions:
+    """
+    Tests for the routing decisions that do not hit the database.
+    """
+
+    def test_other_apps_and_no_replicas(
+        self, replica_routing: None, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that other apps are left to other routers, as is everything
+        without replicas.
+        """
+        router = AnnouncementReplicaRouter()
+
+        assert router.db_for_read(User) is None
+        assert router.db_for_write(User) is None
+        assert pinned_until.get() == 0.0
+
+        monkeypatch.setattr(config, "database_replicas", [])
+        assert router.db_for_read(Announcement) is None
+        assert router.db_for_write(Announcement) is None
+
+    def test_allow_relation(self, replica_routing: None) -> None:
+        """
+        Test that relations are allowed between the primary and its replicas.
+        """
+        router = AnnouncementReplicaRouter()
+        primary, replica, other = Announcement(), Announcement(), Announcement()
+        primary._state.db, replica._state.db, other._state.db = (
+            "default",
+            "replica",
+            "other",
+        )
+
+        assert router.allow_relation(primary, replica) is True
+        assert router.allow_relation(primary, other) is None
+
+    def test_stickiness_key(self) -> None:
+        """
+        Test that users take precedence over sessions.
+        """
+        user = User(pk=7)
+
+        assert get_stickiness_key(make_request(user, "abc")).endswith(":user:7")
+        assert get_stickiness_key(make_request(None, "abc")).endswith(":session:abc")
+        assert get_stickiness_key(make_request()) is None
+        assert get_stickiness_key(None) is None
+
+    def test_middleware_scopes_pins_to_request(self, replica_routing: None) -> None:
+        """
+        Test that the middleware exposes the request and drops its pin afterwards.
+        """
+        request = make_request()
+
+        def get_response(request):
+            assert replica_router.routing_state.get().request is request
+            replica_router.pin_to_primary()
+            return HttpResponse()
+
+        AnnouncementReplicaMiddleware(get_response)(request)
+
+        assert pinned_until.get() == 0.0
+        assert replica_router.routing_state.get() is None
+
+    def test_one_cache_round_trip_per_request(self, replica_routing: None) -> None:
+        """
+        Test that the shared pin is read once per request, and written once when the request wrote.
+        """
+        user = User(pk=7)
+        with patch.object(cache, "get", wraps=cache.get) as get, patch.object(
+            cache, "set", wraps=cache.set
+        ) as set_:
+            with routing_context(make_request(user)):
+                for _ in range(3):
+                    assert not is_pinned_to_primary()
+                for _ in range(3):
+                    replica_router.pin_to_primary()
+            assert get.call_count == 1
+            assert set_.call_count == 1
+
+            with routing_context(make_request(user)):
+                assert is_pinned_to_primary()
+                assert is_pinned_to_primary()
+            assert get.call_count == 2
+            assert set_.call_count == 1
+
+    def test_allow_migrate(self, replica_routing: None) -> None:
+        """
+        Test that the announcement app is not migrated on replicas.
+        """
+        router = AnnouncementReplicaRouter()
+
+        assert router.allow_migrate("replica", "django_announcement") is False
+        assert router.allow_migrate("default", "django_announcement") is None
+        assert router.allow_migrate("replica", "auth") is None
@@ -0,0 +1,217 @@
+import sys
+from typing import List
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+
+from django_announcement.models import Announcement
+from django_announcement.search import (
+    BaseSearchBackend,
+    InMemorySearchBackend,
+    PostgresSearchBackend,
+    SQLiteFTS5SearchBackend,
+)
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.search,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+BACKENDS = [SQLiteFTS5SearchBackend, InMemorySearchBackend]
+
+
+def search(backend: BaseSearchBackend, query: str) -> List[str]:
+    """Return the titles of the announcements matching a query, most
+    relevant first."""
+    return list(
+        backend.search(Announcement.objects.all(), query)
+        .order_by(f"-{backend.rank_annotation}", "-pk")
+        .values_list("title", flat=True)
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("search_backend", BACKENDS, indirect=True)
+class TestSearchBackends:
+    """
+    Behaviour shared by the search backends usable on SQLite.
+    """
+
+    def test_prefix_matching_and_ranking(
+        self, search_backend: BaseSearchBackend, search_announcements: List
+    ) -> None:
+        """
+        Test that words match as prefixes and denser matches rank first.
+        """
+        assert search(search_backend, "serv") == [
+            "Server maintenance tonight",
+            "Holiday party",
+        ]
+
+    def test_every_word_must_match(
+        self, search_backend: BaseSearchBackend, search_announcements: List
+    ) -> None:
+        """
+        Test that a match requires every word of the query, in any field.
+        """
+        assert search(search_backend, "PARTY serv") == ["Holiday party"]
+        assert search(search_backend, "social room") == ["Holiday party"]
+        assert search(search_backend, "party midnight") == []
+
+    def test_operators_are_not_interpreted(
+        self, search_backend: BaseSearchBackend, search_announcements: List
+    ) -> None:
+        """
+        Test that quotes and operators in the query are treated as text.
+        """
+        assert search(search_backend, 'café" *(') == ["Café opening"]
+        assert search(search_backend, "café OR party") == []
+
+    def test_query_without_words(
+        self, search_backend: BaseSearchBackend, search_announcements: List
+    ) -> None:
+        """
+        Test that a query without words leaves the queryset as is.
+        """
+        queryset = Announcement.objects.all()
+        assert search_backend.search(queryset, " !? ") is queryset
+
+    def test_index_follows_writes(
+        self, search_backend: BaseSearchBackend, search_announcements: List
+    ) -> None:
+        """
+        Test that created, updated and deleted announcements and renamed
+        categories are reflected in the results.
+        """
+        assert search(search_backend, "tonight") == ["Server maintenance tonight"]
+
+        server, party, _cafe = search_announcements
+        server.title = "Server maintenance postponed"
+        server.save()
+        party.delete()
+        Announcement.objects.create(
+            title="Network upgrade",
+            content="Routers are replaced tonight.",
+            category=server.category,
+        )
+        category = server.category
+        category.name = "Operations"
+        category.save()
+
+        assert search(search_backend, "tonight") == ["Network upgrade"]
+        assert search(search_backend, "holiday") == []
+        assert sorted(search(search_backend, "operations")) == [
+            "Café opening",
+            "Network upgrade",
+            "Server maintenance postponed",
+        ]
+
+    def test_setup_rebuilds_index(
+        self, search_backend: BaseSearchBackend, search_announcements: List
+    ) -> None:
+        """
+        Test that setup indexes the existing announcements and is idempotent.
+        """
+        search_backend.setup()
+        search_backend.setup()
+
+        assert search(search_backend, "monday") == ["Café opening"]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestSQLiteFTS5SearchBackend:
+    """
+    Tests specific to the SQLite FTS5 backend.
+    """
+
+    def test_existing_table_is_reused(self, search_announcements: List) -> None:
+        """
+        Test that a new backend instance uses the table created by another one.
+        """
+        SQLiteFTS5SearchBackend().setup()
+        backend = SQLiteFTS5SearchBackend()
+
+        assert search(backend, "monday") == ["Café opening"]
+        assert backend.ready == {"default": True}
+
+    def test_missing_table(self, search_announcements: List) -> None:
+        """
+        Test that searching without the table raises a configuration error instead of creating it.
+        """
+        backend = SQLiteFTS5SearchBackend()
+        backend.table = "announcement_search_missing"
+
+        with pytest.raises(ImproperlyConfigured, match="setup_search_index"):
+            search(backend, "monday")
+        assert backend.ready == {}
+
+    def test_match_expression(self) -> None:
+        """
+        Test that user input is quoted into prefix terms.
+        """
+        backend = SQLiteFTS5SearchBackend()
+
+        assert backend.make_match_expression('Hello "world" NEAR(') == (
+            '"hello"* "world"* "near"*'
+        )
+        assert backend.make_match_expression("--") == ""
+
+
+@pytest.mark.django_db
+class TestInMemorySearchBackend:
+    """
+    Tests specific to the pure-Python inverted index.
+    """
+
+    def test_index_and_remove(self, search_announcements: List) -> None:
+        """
+        Test that index is a no-op until built and remove drops the postings.
+        """
+        server, party, cafe = search_announcements
+        backend = InMemorySearchBackend()
+        backend.index([server.pk])
+        assert not backend.documents
+
+        backend.setup()
+        backend.remove([party.pk, cafe.pk])
+        Announcement.objects.filter(pk=server.pk).update(title="Moved")
+        backend.index([server.pk])
+
+        assert backend.expand("holi") == []
+        assert backend.expand("mo") == ["moved"]
+        assert set(backend.documents) == {server.pk}
+
+    def test_no_match(self, search_announcements: List) -> None:
+        """
+        Test that an unknown word matches nothing.
+        """
+        backend = InMemorySearchBackend()
+
+        assert search(backend, "party unknown") == []
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Requires a PostgreSQL database."
+)
+class TestPostgresSearchBackend:
+    """
+    Tests for the PostgreSQL backend, run against PostgreSQL databases only.
+    """
+
+    def test_search(self, search_announcements: List) -> None:
+        """
+        Test prefix matching, category matching and ranking with the GIN index.
+        """
+        backend = PostgresSearchBackend()
+        backend.setup()
+
+        assert search(backend, "maint") == ["Server maintenance tonight"]
+        assert search(backend, "social") == ["Holiday party"]
+        assert search(backend, "!!") == [
+            "Café opening",
+            "Holiday party",
+            "Server maintenance tonight",
+        ]
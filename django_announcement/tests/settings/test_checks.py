@@ -2,8 +2,10 @@ import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django.core.checks import Warning
 
 from django_announcement.settings.checks import check_announcement_settings
+from django_announcement.streaming.brokers import LocalBroker
 from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
@@ -47,6 +49,25 @@ class TestCheckNotificationSettings:
         mock_config.authenticated_user_throttle_rate = "5/minute"
         mock_config.generate_audiences_exclude_apps = []
         mock_config.generate_audiences_exclude_models = []
+        mock_config.materialized_feed_enabled = False
+        mock_config.audience_cache_enabled = False
+        mock_config.cache_alias = "default"
+        mock_config.audience_cache_timeout = 300
+        mock_config.api_pagination_count_mode = "exact"
+        mock_config.api_pagination_count_cap = 1000
+        mock_config.api_conditional_requests_enabled = False
+        mock_config.use_serializer_fast_path = False
+        mock_config.list_response_cache_enabled = False
+        mock_config.list_response_cache_timeout = 60
+        mock_config.database_replicas = []
+        mock_config.database_stickiness_timeout = 5
+        mock_config.api_async_enabled = False
+        mock_config.stream_enabled = False
+        mock_config.stream_heartbeat_interval = 15
+        mock_config.change_log_enabled = False
+        mock_config.read_state_enabled = False
+        mock_config.throttle_lease_size = 10
+        mock_config.audience_live_sync_enabled = False
         mock_config.get_setting.side_effect = lambda name, default: None
 
         errors = check_announcement_settings(None)
@@ -87,12 +108,31 @@ class TestCheckNotificationSettings:
         mock_config.attachment_validators = []
         mock_config.generate_audiences_exclude_apps = []
         mock_config.generate_audiences_exclude_models = []
+        mock_config.materialized_feed_enabled = "not_boolean"
+        mock_config.audience_cache_enabled = "not_boolean"
+        mock_config.cache_alias = "default"
+        mock_config.audience_cache_timeout = 300
+        mock_config.api_pagination_count_mode = "exact"
+        mock_config.api_pagination_count_cap = 1000
+        mock_config.api_conditional_requests_enabled = "not_boolean"
+        mock_config.use_serializer_fast_path = "not_boolean"
+        mock_config.list_response_cache_enabled = "not_boolean"
+        mock_config.list_response_cache_timeout = 60
+        mock_config.database_replicas = []
+        mock_config.database_stickiness_timeout = 5
+        mock_config.api_async_enabled = "not_boolean"
+        mock_config.stream_enabled = "not_boolean"
+        mock_config.stream_heartbeat_interval = 15
+        mock_config.change_log_enabled = "not_boolean"
+        mock_config.read_state_enabled = "not_boolean"
+        mock_config.throttle_lease_size = 10
+        mock_config.audience_live_sync_enabled = "not_boolean"
         mock_config.get_setting.side_effect = lambda name, default: None
 
         errors = check_announcement_settings(None)
 
-        # Expect 11 errors for invalid boolean values
-        assert len(errors) == 11
+        # Expect 16 errors for invalid boolean values
+        assert len(errors) == 21
         assert (
             errors[0].id
             == f"django_announcement.E001_{mock_config.prefix}ADMIN_HAS_ADD_PERMISSION"
@@ -131,12 +171,52 @@ class TestCheckNotificationSettings:
         )
         assert (
             errors[9].id
-            == f"django_announcement.E001_{mock_config.prefix}API_ALLOW_LIST"
+            == f"django_announcement.E001_{mock_config.prefix}SERIALIZER_USE_FAST_PATH"
         )
         assert (
             errors[10].id
+            == f"django_announcement.E001_{mock_config.prefix}API_ALLOW_LIST"
+        )
+        assert (
+            errors[11].id
             == f"django_announcement.E001_{mock_config.prefix}API_ALLOW_RETRIEVE"
         )
+        assert (
+            errors[12].id
+            == f"django_announcement.E001_{mock_config.prefix}API_CONDITIONAL_REQUESTS_ENABLED"
+        )
+        assert (
+            errors[13].id
+            == f"django_announcement.E001_{mock_config.prefix}API_ASYNC_ENABLED"
+        )
+        assert (
+            errors[14].id
+            == f"django_announcement.E001_{mock_config.prefix}MATERIALIZED_FEED_ENABLED"
+        )
+        assert (
+            errors[15].id
+            == f"django_announcement.E001_{mock_config.prefix}AUDIENCE_CACHE_ENABLED"
+        )
+        assert (
+            errors[16].id
+            == f"django_announcement.E001_{mock_config.prefix}LIST_RESPONSE_CACHE_ENABLED"
+        )
+        assert (
+            errors[17].id
+            == f"django_announcement.E001_{mock_config.prefix}STREAM_ENABLED"
+        )
+        assert (
+            errors[18].id
+            == f"django_announcement.E001_{mock_config.prefix}CHANGE_LOG_ENABLED"
+        )
+        assert (
+            errors[19].id
+            == f"django_announcement.E001_{mock_config.prefix}READ_STATE_ENABLED"
+        )
+        assert (
+            errors[20].id
+            == f"django_announcement.E001_{mock_config.prefix}AUDIENCE_LIVE_SYNC_ENABLED"
+        )
 
     @patch("django_announcement.settings.checks.config")
     def test_invalid_list_settings(self, mock_config: MagicMock) -> None:
@@ -170,6 +250,25 @@ class TestCheckNotificationSettings:
         mock_config.authenticated_user_throttle_rate = "5/minute"
         mock_config.generate_audiences_exclude_apps = None
         mock_config.generate_audiences_exclude_models = None
+        mock_config.materialized_feed_enabled = False
+        mock_config.audience_cache_enabled = False
+        mock_config.cache_alias = "default"
+        mock_config.audience_cache_timeout = 300
+        mock_config.api_pagination_count_mode = "exact"
+        mock_config.api_pagination_count_cap = 1000
+        mock_config.api_conditional_requests_enabled = False
+        mock_config.use_serializer_fast_path = False
+        mock_config.list_response_cache_enabled = False
+        mock_config.list_response_cache_timeout = 60
+        mock_config.database_replicas = []
+        mock_config.database_stickiness_timeout = 5
+        mock_config.api_async_enabled = False
+        mock_config.stream_enabled = False
+        mock_config.stream_heartbeat_interval = 15
+        mock_config.change_log_enabled = False
+        mock_config.read_state_enabled = False
+        mock_config.throttle_lease_size = 10
+        mock_config.audience_live_sync_enabled = False
         mock_config.get_setting.side_effect = lambda name, default: None
         mock_config.api_search_fields = [123]  # Invalid list element
 
@@ -227,14 +326,37 @@ class TestCheckNotificationSettings:
         mock_config.authenticated_user_throttle_rate = "abc/hour"
         mock_config.generate_audiences_exclude_apps = []
         mock_config.generate_audiences_exclude_models = []
+        mock_config.materialized_feed_enabled = False
+        mock_config.audience_cache_enabled = False
+        mock_config.cache_alias = "default"
+        mock_config.audience_cache_timeout = 300
+        mock_config.api_pagination_count_mode = "exact"
+        mock_config.api_pagination_count_cap = 1000
+        mock_config.api_conditional_requests_enabled = False
+        mock_config.use_serializer_fast_path = False
+        mock_config.list_response_cache_enabled = False
+        mock_config.list_response_cache_timeout = 60
+        mock_config.database_replicas = []
+        mock_config.database_stickiness_timeout = 5
+        mock_config.api_async_enabled = False
+        mock_config.stream_enabled = False
+        mock_config.stream_heartbeat_interval = 15
+        mock_config.change_log_enabled = False
+        mock_config.read_state_enabled = False
+        mock_config.throttle_lease_size = 0
+        mock_config.audience_live_sync_enabled = False
         mock_config.get_setting.side_effect = lambda name, default: None
 
         errors = check_announcement_settings(None)
 
-        # Expect 2 errors for invalid throttle rates
-        assert len(errors) == 2
+        # Expect 2 errors for invalid throttle rates and 1 for the lease size
+        assert len(errors) == 3
         assert errors[0].id == "django_announcement.E005"
         assert errors[1].id == "django_announcement.E007"
+        assert (
+            errors[2].id
+            == f"django_announcement.E015_{mock_config.prefix}THROTTLE_LEASE_SIZE"
+        )
 
     @patch("django_announcement.settings.checks.config")
     def test_invalid_path_import(self, mock_config: MagicMock) -> None:
@@ -268,18 +390,37 @@ class TestCheckNotificationSettings:
         mock_config.generate_audiences_exclude_apps = []
         mock_config.generate_audiences_exclude_models = []
         mock_config.attachment_upload_path = []  # invalid,should be str
+        mock_config.materialized_feed_enabled = False
+        mock_config.audience_cache_enabled = False
+        mock_config.cache_alias = "default"
+        mock_config.audience_cache_timeout = 300
+        mock_config.api_pagination_count_mode = "exact"
+        mock_config.api_pagination_count_cap = 1000
+        mock_config.api_conditional_requests_enabled = False
+        mock_config.use_serializer_fast_path = False
+        mock_config.list_response_cache_enabled = False
+        mock_config.list_response_cache_timeout = 60
+        mock_config.database_replicas = []
+        mock_config.database_stickiness_timeout = 5
+        mock_config.api_async_enabled = False
+        mock_config.stream_enabled = False
+        mock_config.stream_heartbeat_interval = 15
+        mock_config.change_log_enabled = False
+        mock_config.read_state_enabled = False
+        mock_config.throttle_lease_size = 10
+        mock_config.audience_live_sync_enabled = False
         mock_config.get_setting.side_effect = (
             lambda name, default: "invalid.path.ClassName"
         )
 
         errors = check_announcement_settings(None)
 
-        # Expect 8 errors for invalid path imports
-        assert len(errors) == 8
+        # Expect 10 errors for invalid path imports
+        assert len(errors) == 10
 
         assert (
-                errors[0].id
-                == f"django_announcement.E014_{mock_config.prefix}ATTACHMENT_UPLOAD_PATH"
+            errors[0].id
+            == f"django_announcement.E014_{mock_config.prefix}ATTACHMENT_UPLOAD_PATH"
         )
         assert (
             errors[1].id
@@ -294,8 +435,8 @@ class TestCheckNotificationSettings:
             == f"django_announcement.E011_{mock_config.prefix}API_PARSER_CLASSES"
         )
         assert (
-                errors[4].id
-                == f"django_announcement.E011_{mock_config.prefix}ATTACHMENT_VALIDATORS"
+            errors[4].id
+            == f"django_announcement.E011_{mock_config.prefix}ATTACHMENT_VALIDATORS"
         )
         assert (
             errors[5].id
@@ -303,9 +444,277 @@ class TestCheckNotificationSettings:
         )
         assert (
             errors[6].id
-            == f"django_announcement.E010_{mock_config.prefix}API_EXTRA_PERMISSION_CLASS"
+            == f"django_announcement.E010_{mock_config.prefix}API_SEARCH_BACKEND"
         )
         assert (
             errors[7].id
+            == f"django_announcement.E010_{mock_config.prefix}API_EXTRA_PERMISSION_CLASS"
+        )
+        assert (
+            errors[8].id
             == f"django_announcement.E010_{mock_config.prefix}ADMIN_SITE_CLASS"
         )
+        assert (
+            errors[9].id
+            == f"django_announcement.E010_{mock_config.prefix}STREAM_BROKER"
+        )
+
+    @patch("django_announcement.settings.checks.config")
+    def test_invalid_pagination_count_settings(self, mock_config: MagicMock) -> None:
+        """
+        Test that an unsupported count mode and a non-positive count cap produce errors.
+
+        Args:
+        ----
+            mock_config (MagicMock): Mocked configuration object with invalid count settings.
+
+        Asserts:
+        -------
+            One error is returned for each invalid count setting.
+        """
+        mock_config.admin_has_add_permission = True
+        mock_config.admin_has_change_permission = True
+        mock_config.admin_has_delete_permission = True
+        mock_config.admin_has_module_permission = True
+        mock_config.admin_inline_has_add_permission = True
+        mock_config.admin_inline_has_change_permission = False
+        mock_config.admin_inline_has_delete_permission = True
+        mock_config.include_serializer_full_details = True
+        mock_config.exclude_serializer_empty_fields = True
+        mock_config.api_allow_list = True
+        mock_config.api_allow_retrieve = False
+        mock_config.attachment_upload_path = "test_path/"
+        mock_config.attachment_validators = []
+        mock_config.api_ordering_fields = ["created_at"]
+        mock_config.api_search_fields = ["id"]
+        mock_config.staff_user_throttle_rate = "10/minute"
+        mock_config.authenticated_user_throttle_rate = "5/minute"
+        mock_config.generate_audiences_exclude_apps = []
+        mock_config.generate_audiences_exclude_models = []
+        mock_config.materialized_feed_enabled = False
+        mock_config.audience_cache_enabled = False
+        mock_config.cache_alias = "default"
+        mock_config.audience_cache_timeout = 300
+        mock_config.api_pagination_count_mode = "approximate"
+        mock_config.api_pagination_count_cap = 0
+        mock_config.api_conditional_requests_enabled = False
+        mock_config.use_serializer_fast_path = False
+        mock_config.list_response_cache_enabled = False
+        mock_config.list_response_cache_timeout = 60
+        mock_config.database_replicas = []
+        mock_config.database_stickiness_timeout = 5
+        mock_config.api_async_enabled = False
+        mock_config.stream_enabled = False
+        mock_config.stream_heartbeat_interval = 15
+        mock_config.change_log_enabled = False
+        mock_config.read_state_enabled = False
+        mock_config.throttle_lease_size = 10
+        mock_config.audience_live_sync_enabled = False
+        mock_config.get_setting.side_effect = lambda name, default: None
+
+        errors = check_announcement_settings(None)
+
+        assert len(errors) == 2
+        assert (
+            errors[0].id
+            == f"django_announcement.E017_{mock_config.prefix}API_PAGINATION_COUNT_MODE"
+        )
+        assert (
+            errors[1].id
+            == f"django_announcement.E015_{mock_config.prefix}API_PAGINATION_COUNT_CAP"
+        )
+
+    @patch("django_announcement.settings.checks.config")
+    def test_invalid_database_settings(self, mock_config: MagicMock) -> None:
+        """
+        Test that unknown replica aliases and a non-positive stickiness timeout produce errors.
+
+        Args:
+        ----
+            mock_config (MagicMock): Mocked configuration object with invalid database settings.
+
+        Asserts:
+        -------
+            One error is returned for each invalid database setting.
+        """
+        mock_config.admin_has_add_permission = True
+        mock_config.admin_has_change_permission = True
+        mock_config.admin_has_delete_permission = True
+        mock_config.admin_has_module_permission = True
+        mock_config.admin_inline_has_add_permission = True
+        mock_config.admin_inline_has_change_permission = False
+        mock_config.admin_inline_has_delete_permission = True
+        mock_config.include_serializer_full_details = True
+        mock_config.exclude_serializer_empty_fields = True
+        mock_config.api_allow_list = True
+        mock_config.api_allow_retrieve = False
+        mock_config.attachment_upload_path = "test_path/"
+        mock_config.attachment_validators = []
+        mock_config.api_ordering_fields = ["created_at"]
+        mock_config.api_search_fields = ["id"]
+        mock_config.staff_user_throttle_rate = "10/minute"
+        mock_config.authenticated_user_throttle_rate = "5/minute"
+        mock_config.generate_audiences_exclude_apps = []
+        mock_config.generate_audiences_exclude_models = []
+        mock_config.materialized_feed_enabled = False
+        mock_config.audience_cache_enabled = False
+        mock_config.cache_alias = "default"
+        mock_config.audience_cache_timeout = 300
+        mock_config.api_pagination_count_mode = "exact"
+        mock_config.api_pagination_count_cap = 1000
+        mock_config.api_conditional_requests_enabled = False
+        mock_config.use_serializer_fast_path = False
+        mock_config.list_response_cache_enabled = False
+        mock_config.list_response_cache_timeout = 60
+        mock_config.database_replicas = ["default", "missing"]
+        mock_config.database_stickiness_timeout = 0
+        mock_config.api_async_enabled = False
+        mock_config.stream_enabled = False
+        mock_config.stream_heartbeat_interval = 15
+        mock_config.change_log_enabled = False
+        mock_config.read_state_enabled = False
+        mock_config.throttle_lease_size = 10
+        mock_config.audience_live_sync_enabled = False
+        mock_config.get_setting.side_effect = lambda name, default: None
+
+        errors = check_announcement_settings(None)
+
+        assert len(errors) == 2
+        assert (
+            errors[0].id
+            == f"django_announcement.E018_{mock_config.prefix}DATABASE_REPLICAS"
+        )
+        assert (
+            errors[1].id
+            == f"django_announcement.E015_{mock_config.prefix}DATABASE_STICKINESS_TIMEOUT"
+        )
+
+    @patch("django_announcement.settings.checks.config")
+    def test_invalid_stream_settings(self, mock_config: MagicMock) -> None:
+        """
+        Test that an unimportable broker and a non-positive heartbeat interval produce errors.
+
+        Args:
+        ----
+            mock_config (MagicMock): Mocked configuration object with invalid stream settings.
+
+        Asserts:
+        -------
+            One error is returned for each invalid stream setting.
+        """
+        mock_config.admin_has_add_permission = True
+        mock_config.admin_has_change_permission = True
+        mock_config.admin_has_delete_permission = True
+        mock_config.admin_has_module_permission = True
+        mock_config.admin_inline_has_add_permission = True
+        mock_config.admin_inline_has_change_permission = False
+        mock_config.admin_inline_has_delete_permission = True
+        mock_config.include_serializer_full_details = True
+        mock_config.exclude_serializer_empty_fields = True
+        mock_config.api_allow_list = True
+        mock_config.api_allow_retrieve = False
+        mock_config.attachment_upload_path = "test_path/"
+        mock_config.attachment_validators = []
+        mock_config.api_ordering_fields = ["created_at"]
+        mock_config.api_search_fields = ["id"]
+        mock_config.staff_user_throttle_rate = "10/minute"
+        mock_config.authenticated_user_throttle_rate = "5/minute"
+        mock_config.generate_audiences_exclude_apps = []
+        mock_config.generate_audiences_exclude_models = []
+        mock_config.materialized_feed_enabled = False
+        mock_config.audience_cache_enabled = False
+        mock_config.cache_alias = "default"
+        mock_config.audience_cache_timeout = 300
+        mock_config.api_pagination_count_mode = "exact"
+        mock_config.api_pagination_count_cap = 1000
+        mock_config.api_conditional_requests_enabled = False
+        mock_config.use_serializer_fast_path = False
+        mock_config.list_response_cache_enabled = False
+        mock_config.list_response_cache_timeout = 60
+        mock_config.database_replicas = []
+        mock_config.database_stickiness_timeout = 5
+        mock_config.api_async_enabled = False
+        mock_config.stream_enabled = False
+        mock_config.stream_heartbeat_interval = 0
+        mock_config.change_log_enabled = False
+        mock_config.read_state_enabled = False
+        mock_config.throttle_lease_size = 10
+        mock_config.audience_live_sync_enabled = False
+        mock_config.get_setting.side_effect = lambda name, default: (
+            "invalid.path.Broker" if name.endswith("STREAM_BROKER") else None
+        )
+
+        errors = check_announcement_settings(None)
+
+        assert len(errors) == 2
+        assert (
+            errors[0].id
+            == f"django_announcement.E010_{mock_config.prefix}STREAM_BROKER"
+        )
+        assert (
+            errors[1].id
+            == f"django_announcement.E015_{mock_config.prefix}STREAM_HEARTBEAT_INTERVAL"
+        )
+
+    @patch("django_announcement.settings.checks.config")
+    def test_local_stream_broker_warning(self, mock_config: MagicMock) -> None:
+        """
+        Test that enabled streams relayed by the in-process broker produce a warning.
+
+        Args:
+        ----
+            mock_config (MagicMock): Mocked configuration object with streams on the local broker.
+
+        Asserts:
+        -------
+            One warning is returned for the stream broker.
+        """
+        mock_config.admin_has_add_permission = True
+        mock_config.admin_has_change_permission = True
+        mock_config.admin_has_delete_permission = True
+        mock_config.admin_has_module_permission = True
+        mock_config.admin_inline_has_add_permission = True
+        mock_config.admin_inline_has_change_permission = False
+        mock_config.admin_inline_has_delete_permission = True
+        mock_config.include_serializer_full_details = True
+        mock_config.exclude_serializer_empty_fields = True
+        mock_config.api_allow_list = True
+        mock_config.api_allow_retrieve = False
+        mock_config.attachment_upload_path = "test_path/"
+        mock_config.attachment_validators = []
+        mock_config.api_ordering_fields = ["created_at"]
+        mock_config.api_search_fields = ["id"]
+        mock_config.staff_user_throttle_rate = "10/minute"
+        mock_config.authenticated_user_throttle_rate = "5/minute"
+        mock_config.generate_audiences_exclude_apps = []
+        mock_config.generate_audiences_exclude_models = []
+        mock_config.materialized_feed_enabled = False
+        mock_config.audience_cache_enabled = False
+        mock_config.cache_alias = "default"
+        mock_config.audience_cache_timeout = 300
+        mock_config.api_pagination_count_mode = "exact"
+        mock_config.api_pagination_count_cap = 1000
+        mock_config.api_conditional_requests_enabled = False
+        mock_config.use_serializer_fast_path = False
+        mock_config.list_response_cache_enabled = False
+        mock_config.list_response_cache_timeout = 60
+        mock_config.database_replicas = []
+        mock_config.database_stickiness_timeout = 5
+        mock_config.api_async_enabled = False
+        mock_config.stream_enabled = True
+        mock_config.stream_heartbeat_interval = 15
+        mock_config.change_log_enabled = False
+        mock_config.read_state_enabled = False
+        mock_config.throttle_lease_size = 10
+        mock_config.audience_live_sync_enabled = False
+        mock_config.stream_broker = LocalBroker
+        mock_config.get_setting.side_effect = lambda name, default: None
+
+        errors = check_announcement_settings(None)
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], Warning)
+        assert (
+            errors[0].id
+            == f"django_announcement.W001_{mock_config.prefix}STREAM_BROKER"
+        )
@@ -1,3 +1,4 @@
+import subprocess
 import sys
 from unittest.mock import patch
 
@@ -59,3 +60,24 @@ class TestNotificationConfig:
 
         result = config.get_optional_paths("INVALID_SETTING", ["INVALID_PATH"])
         assert not result
+
+    def test_default_classes_resolve_on_first_import(self) -> None:
+        """
+        Test that the default API classes resolve when the settings are imported first.
+
+        The classes are imported while `config` is being built, so a module
+        importing `config` itself would resolve to None.
+
+        Asserts:
+        -------
+            A fresh interpreter resolves the throttle and pagination classes.
+        """
+        code = (
+            "from django_announcement.tests.setup import configure_django_settings\n"
+            "configure_django_settings()\n"
+            "from django_announcement.settings.conf import config\n"
+            "assert config.api_throttle_class is not None\n"
+            "assert config.api_pagination_class is not None\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,3 +1,4 @@
+import os
 import random
 import string
 
@@ -28,7 +29,9 @@ def configure_django_settings() -> None:
 
     - DEBUG: Enables Django's debug mode.
     - SECRET_KEY: Provides a generated secret key for Django settings.
-    - DATABASES: Configures an in-memory SQLite database for testing.
+    - DATABASES: Configures in-memory SQLite databases for testing, the second one acting
+      as a read replica. The ``DJANGO_ANNOUNCEMENT_TEST_DATABASE`` environment variable
+      names a file for the default one instead, shared with child processes.
     - INSTALLED_APPS: Includes essential Django and third-party apps needed for the test environment.
     - MIDDLEWARE: Configures the middleware stack used by Django.
     - ROOT_URLCONF: Specifies the root URL configuration module.
@@ -49,15 +52,25 @@ def configure_django_settings() -> None:
     This function is intended for use in testing environments or standalone scripts where
     a minimal Django setup is required. It does not configure production settings.
     """
+    test_database = os.environ.get("DJANGO_ANNOUNCEMENT_TEST_DATABASE")
+    # Writers of a shared file take the lock upfront instead of deadlocking
+    test_database_options = (
+        {"timeout": 20, "transaction_mode": "IMMEDIATE"} if test_database else {}
+    )
     if not settings.configured:
         settings.configure(
             DEBUG=True,
             SECRET_KEY=generate_secret_key(),  # Add a secret key for testing
             DATABASES={
                 "default": {
+                    "ENGINE": "django.db.backends.sqlite3",
+                    "NAME": test_database or ":memory:",
+                    "OPTIONS": test_database_options,
+                },
+                "replica": {
                     "ENGINE": "django.db.backends.sqlite3",
                     "NAME": ":memory:",
-                }
+                },
             },
             INSTALLED_APPS=[
                 "django.contrib.admin",
@@ -77,6 +90,7 @@ def configure_django_settings() -> None:
                 "django.middleware.common.CommonMiddleware",
                 "django.middleware.csrf.CsrfViewMiddleware",
                 "django.contrib.auth.middleware.AuthenticationMiddleware",
+                "django_announcement.middleware.AnnouncementReplicaMiddleware",
                 "django.contrib.messages.middleware.MessageMiddleware",
                 "django.middleware.clickjacking.XFrameOptionsMiddleware",
             ],
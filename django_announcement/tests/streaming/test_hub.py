@@ -0,0 +1,437 @@
+import json
+import sys
+import time
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.utils.timezone import now
+
+from django_announcement.models import (
+    Announcement,
+    AnnouncementCategory,
+    Audience,
+    AudienceAnnouncement,
+    UserAudience,
+)
+from django_announcement.streaming import (
+    MEMBERSHIP_EVENT,
+    AnnouncementEventHub,
+    LocalBroker,
+    RedisBroker,
+    format_event_id,
+    get_announcement_events,
+    get_event_key,
+    parse_event_id,
+    publish_announcements,
+)
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.streaming,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+def make_event(announcement_id: int = 1, audiences=(1,), **times) -> dict:
+    """
+    Build an announcement event, active and never expiring unless told otherwise.
+    """
+    return {
+        "id": announcement_id,
+        "audiences": list(audiences),
+        "published_at": times.get("published_at"),
+        "expires_at": times.get("expires_at"),
+        "sent_at": times.get("sent_at", time.time()),
+    }
+
+
+@pytest.fixture
+def hub() -> AnnouncementEventHub:
+    """
+    Fixture to provide an event hub relaying through a started `LocalBroker`.
+    """
+    hub = AnnouncementEventHub(LocalBroker())
+    hub.broker.start(hub.dispatch)
+    return hub
+
+
+class TestAnnouncementEventHub:
+    """
+    Test suite for the in-process fan-out of announcement events.
+    """
+
+    def test_fan_out_by_audience(self, hub: AnnouncementEventHub) -> None:
+        """
+        Test that events reach the subscriptions of their audiences and the global ones only.
+        """
+        first, second, everything = (
+            hub.subscribe([1]),
+            hub.subscribe([2, 3]),
+            hub.subscribe(None),
+        )
+
+        hub.publish(make_event(audiences=[1]))
+
+        assert first.get(0)["id"] == 1
+        assert second.get(0) is None
+        assert everything.get(0)["id"] == 1
+
+    def test_unsubscribe(self, hub: AnnouncementEventHub) -> None:
+        """
+        Test that finished streams stop receiving events and leave no empty audience sets.
+        """
+        subscription = hub.subscribe([1])
+        everything = hub.subscribe(None)
+        hub.unsubscribe(subscription)
+        hub.unsubscribe(everything)
+
+        hub.publish(make_event(audiences=[1]))
+
+        assert subscription.get(0) is None
+        assert everything.get(0) is None
+        assert not hub.subscriptions and not hub.global_subscriptions
+
+    def test_expired_events_are_dropped(self, hub: AnnouncementEventHub) -> None:
+        """
+        Test that announcements expired by delivery time are not pushed.
+        """
+        subscription = hub.subscribe([1])
+
+        hub.publish(make_event(expires_at=time.time() - 1))
+
+        assert subscription.get(0) is None
+
+    def test_future_events_wait_for_publication(
+        self, hub: AnnouncementEventHub
+    ) -> None:
+        """
+        Test that events of announcements published in the future are held until due.
+        """
+        subscription = hub.subscribe([1])
+
+        hub.publish(make_event(published_at=time.time() + 0.05))
+        assert subscription.get(0) is None
+        assert 1 in hub.activations
+
+        event = hub.pop_due()
+        assert event["id"] == 1 and not hub.activations
+        hub.deliver(event)
+        assert subscription.get(0)["id"] == 1
+
+    def test_rescheduled_events_supersede(self, hub: AnnouncementEventHub) -> None:
+        """
+        Test that only the latest publication time of an announcement is honoured.
+        """
+        subscription = hub.subscribe([1])
+        latest = time.time() + 0.04
+        hub.publish(make_event(published_at=time.time() + 0.02))
+        hub.publish(make_event(published_at=latest))
+
+        assert hub.pop_due() is None
+        assert hub.pop_due()["published_at"] == latest
+
+        # Moved back to the past: delivered at once, the scheduled entry is void
+        hub.publish(make_event(published_at=time.time() + 60))
+        hub.publish(make_event())
+        assert subscription.get(0)["id"] == 1
+        assert not hub.activations
+
+    def test_async_subscription(self, hub: AnnouncementEventHub) -> None:
+        """
+        Test that streams served from an event loop receive events from any thread.
+        """
+
+        async def receive() -> tuple:
+            subscription = hub.subscribe([1], asynchronous=True)
+            hub.publish(make_event())
+            return subscription, await subscription.get(1), await subscription.get(0)
+
+        subscription, event, nothing = async_to_sync(receive)()
+
+        assert event["id"] == 1
+        assert nothing is None
+        # The loop of the finished stream is closed; delivering is a no-op
+        subscription.deliver(make_event())
+
+    def test_replay_after_last_event(self, hub: AnnouncementEventHub) -> None:
+        """
+        Test that a reconnecting stream is first sent the kept events after its last one.
+        """
+        for announcement_id, audience_id in [(1, 1), (2, 2), (3, 1), (4, 1)]:
+            hub.publish(make_event(announcement_id, [audience_id], sent_at=100.0))
+        last_key = get_event_key(hub.recent[0][2])
+
+        subscription = hub.subscribe([1], last_event_key=last_key)
+        hub.publish(make_event(5, sent_at=200.0))
+
+        assert [subscription.get(0)["id"] for _ in range(3)] == [3, 4, 5]
+        assert subscription.get(0) is None
+
+    def test_event_ids(self) -> None:
+        """
+        Test that event ids round-trip and malformed ones are ignored.
+        """
+        key = get_event_key({"id": 7, "activated_at": 1700000000.1234})
+
+        assert parse_event_id(format_event_id(key)) == key == (1700000000123, 7)
+        for value in (None, "", "12", "a-b", "1-2-3"):
+            assert parse_event_id(value) is None
+
+    def test_membership_events_move_streams(self, hub: AnnouncementEventHub) -> None:
+        """
+        Test that membership events reach the streams of their users, which
+        receive the events of joined audiences delivered in between.
+        """
+        stream = hub.subscribe([1], user_id=10)
+        other = hub.subscribe([1], user_id=11)
+        hub.publish(make_event(1, [2]))
+
+        hub.publish({"type": MEMBERSHIP_EVENT, "users": [10]})
+        membership = stream.get(0)
+        assert membership["type"] == MEMBERSHIP_EVENT
+        assert other.get(0) is None
+
+        hub.publish(make_event(2, [2]))
+        hub.publish(make_event(3, [1]))
+        assert stream.get(0)["id"] == 3
+
+        hub.update_audiences(stream, [2], since=membership["delivery"])
+        hub.publish(make_event(4, [2]))
+
+        assert [stream.get(0)["id"] for _ in range(2)] == [2, 4]
+        assert stream.get(0) is None
+        assert set(hub.subscriptions) == {1, 2}
+
+        hub.unsubscribe(stream)
+        hub.unsubscribe(other)
+        assert not hub.subscriptions and not hub.user_subscriptions
+
+    @pytest.mark.django_db
+    def test_start_loads_upcoming_announcements(
+        self, announcement: Announcement
+    ) -> None:
+        """
+        Test that starting the hub schedules the announcements published in the future.
+        """
+        announcement.published_at = now() + timedelta(days=1)
+        announcement.save()
+        hub = AnnouncementEventHub(LocalBroker())
+
+        hub.start()
+        hub.start()
+
+        assert list(hub.activations) == [announcement.pk]
+        assert hub.broker.deliver == hub.dispatch
+
+
+@pytest.mark.django_db
+class TestAnnouncementEvents:
+    """
+    Test suite for building and publishing announcement events.
+    """
+
+    def test_events(self, announcement: Announcement, audience: Audience) -> None:
+        """
+        Test that events carry the audiences and timestamps of the announcements.
+        """
+        other = Audience.objects.create(name="Other")
+        announcement.audience.add(other)
+        announcement.published_at = now() - timedelta(hours=1)
+        announcement.save()
+
+        assert get_announcement_events([announcement.pk]) == [
+            {
+                "id": announcement.pk,
+                "audiences": [audience.pk, other.pk],
+                "published_at": announcement.published_at.timestamp(),
+                "expires_at": None,
+            }
+        ]
+        assert get_announcement_events([announcement.pk], [other.pk])[0][
+            "audiences"
+        ] == [other.pk]
+        assert get_announcement_events(upcoming=True) == []
+
+    def test_expired_and_untargeted_are_skipped(
+        self, announcement: Announcement, announcement_category: AnnouncementCategory
+    ) -> None:
+        """
+        Test that expired announcements and announcements without audiences yield no event.
+        """
+        Announcement.objects.filter(pk=announcement.pk).update(
+            expires_at=now() - timedelta(minutes=1)
+        )
+        untargeted = Announcement.objects.create(
+            title="Nobody", content="-", category=announcement_category
+        )
+
+        assert get_announcement_events([announcement.pk, untargeted.pk]) == []
+
+    def test_publish_announcements(self, event_hub, announcement: Announcement) -> None:
+        """
+        Test that announcements are published through the configured broker.
+        """
+        publish_announcements([announcement.pk])
+
+        assert [event["id"] for event in event_hub.broker.published] == [
+            announcement.pk
+        ]
+
+
+@pytest.mark.django_db
+class TestStreamReceivers:
+    """
+    Test suite for the receivers publishing announcement events on commit.
+    """
+
+    def test_audiences_added(
+        self,
+        event_hub,
+        announcement_category: AnnouncementCategory,
+        audience: Audience,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        """
+        Test that new announcements are published to their audiences on commit.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            announcement = Announcement.objects.create(
+                title="New", content="-", category=announcement_category
+            )
+            announcement.audience.add(audience)
+            assert event_hub.broker.published == []
+
+        [event] = event_hub.broker.published
+        assert event.pop("sent_at") <= time.time()
+        assert event == {
+            "id": announcement.pk,
+            "audiences": [audience.pk],
+            "published_at": None,
+            "expires_at": None,
+        }
+
+    def test_reverse_and_through_additions(
+        self,
+        event_hub,
+        announcement: Announcement,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        """
+        Test that additions from the audience side and through rows only publish the new audience.
+        """
+        first, second = Audience.objects.create(name="A"), Audience.objects.create(
+            name="B"
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            first.all_announcements.add(announcement)
+            AudienceAnnouncement.objects.create(
+                announcement=announcement, audience=second
+            )
+
+        assert [event["audiences"] for event in event_hub.broker.published] == [
+            [first.pk],
+            [second.pk],
+        ]
+
+    def test_rescheduled(
+        self,
+        event_hub,
+        announcement: Announcement,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        """
+        Test that only publication times moving from or to the future are published.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            announcement.published_at = now() - timedelta(hours=2)
+            announcement.save()
+            announcement.published_at = now() - timedelta(hours=1)
+            announcement.save()
+            announcement.title = "Edited"
+            announcement.save()
+        assert event_hub.broker.published == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            announcement.published_at = now() + timedelta(hours=1)
+            announcement.save()
+            announcement.published_at = None
+            announcement.save()
+
+        assert [event["published_at"] for event in event_hub.broker.published] == [
+            None,
+            None,
+        ]
+
+    def test_membership_changes(
+        self,
+        event_hub,
+        user,
+        admin_user,
+        audience: Audience,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        """
+        Test that membership writes, from either side and through rows, publish their users on commit.
+        """
+        other = Audience.objects.create(name="Other")
+        profile = user.announcement_profile
+        admin_profile = admin_user.announcement_profile = (
+            profile.__class__.objects.create(user=admin_user)
+        )
+
+        def published_users(write) -> list:
+            event_hub.broker.published.clear()
+            with django_capture_on_commit_callbacks(execute=True):
+                write()
+                assert event_hub.broker.published == []
+            return [
+                event["users"]
+                for event in event_hub.broker.published
+                if event.get("type") == MEMBERSHIP_EVENT
+            ]
+
+        assert published_users(lambda: profile.audiences.add(other)) == [[user.pk]]
+        assert published_users(lambda: other.users.add(admin_profile)) == [
+            [admin_user.pk]
+        ]
+        assert sorted(published_users(lambda: other.users.clear())) == [
+            [user.pk],
+            [admin_user.pk],
+        ]
+        assert published_users(
+            lambda: UserAudience.objects.filter(audience=audience).delete()
+        ) == [[user.pk]]
+        assert published_users(lambda: profile.audiences.remove(audience)) == []
+        assert published_users(lambda: other.users.add(admin_profile)) == [
+            [admin_user.pk]
+        ]
+        assert published_users(lambda: admin_profile.audiences.remove(other)) == [
+            [admin_user.pk]
+        ]
+
+
+class TestRedisBroker:
+    """
+    Test suite for the Redis relay of announcement events, with a mocked client.
+    """
+
+    def test_publish_and_relay(self) -> None:
+        """
+        Test that events are published as JSON and relayed from the subscription thread.
+        """
+        broker = RedisBroker()
+        broker._client = Mock()
+        deliver = Mock()
+        event = make_event()
+
+        broker.publish(event)
+        broker.start(deliver)
+
+        broker.client.publish.assert_called_once_with(broker.channel, json.dumps(event))
+        pubsub = broker.client.pubsub.return_value
+        handler = pubsub.subscribe.call_args.kwargs[broker.channel]
+        handler({"data": json.dumps(event).encode()})
+        deliver.assert_called_once_with(event)
+        assert broker.thread is pubsub.run_in_thread.return_value
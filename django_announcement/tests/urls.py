@@ -1,7 +1,16 @@
 from django.contrib import admin
 from django.urls import include, path
+from rest_framework.routers import SimpleRouter
+
+from django_announcement.api.views.async_announcement import AsyncAnnouncementViewSet
+
+async_router = SimpleRouter()
+async_router.register(
+    r"announcements", AsyncAnnouncementViewSet, basename="async-announcement"
+)
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("announcement/", include("django_announcement.api.routers")),
+    path("async-announcement/", include(async_router.urls)),
 ]
@@ -0,0 +1,240 @@
+import sys
+from typing import Dict
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_delete
+
+from django_announcement.models import (
+    Announcement,
+    Audience,
+    UserAnnouncementProfile,
+    UserAudience,
+)
+from django_announcement.settings.conf import config
+from django_announcement.signals import (
+    connect_audience_cache_receivers,
+    disconnect_audience_cache_receivers,
+)
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from django_announcement.utils.cache import (
+    aget_user_audience_ids,
+    get_user_audience_ids,
+    invalidate_all_audience_ids,
+    invalidate_user_audience_ids,
+)
+from django_announcement.utils.cache.audience_ids import (
+    GENERATION_KEY,
+    _get_versions,
+    _make_key,
+    _make_version_key,
+)
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.utils_cache,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestUserAudienceIdsCache:
+    """
+    Test suite for the cached user -> audience ids resolution.
+    """
+
+    @pytest.fixture(autouse=True)
+    def audience_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Enable the audience cache, connect its receivers and start every test from an empty cache.
+        """
+        monkeypatch.setattr(config, "audience_cache_enabled", True)
+        connect_audience_cache_receivers()
+        cache.clear()
+        yield
+        cache.clear()
+        disconnect_audience_cache_receivers()
+
+    def test_steady_state_needs_no_queries(
+        self, user: User, audience: Audience, django_assert_num_queries
+    ) -> None:
+        """
+        Test that a cached audience-id set is served without touching the database.
+        """
+        with django_assert_num_queries(1):
+            assert get_user_audience_ids(user.pk) == [audience.pk]
+
+        with django_assert_num_queries(0):
+            assert get_user_audience_ids(user.pk) == [audience.pk]
+
+    def test_async_resolution_shares_the_cache(
+        self, user: User, audience: Audience, django_assert_num_queries
+    ) -> None:
+        """
+        Test that the async resolution reads and fills the same cache entries.
+        """
+        with django_assert_num_queries(1):
+            assert async_to_sync(aget_user_audience_ids)(user.pk) == [audience.pk]
+
+        with django_assert_num_queries(0):
+            assert get_user_audience_ids(user.pk) == [audience.pk]
+            assert async_to_sync(aget_user_audience_ids)(user.pk) == [audience.pk]
+
+        invalidate_all_audience_ids()
+        with django_assert_num_queries(1):
+            assert async_to_sync(aget_user_audience_ids)(user.pk) == [audience.pk]
+
+    def test_invalidated_on_membership_changes(
+        self, user: User, audience: Audience, django_capture_on_commit_callbacks
+    ) -> None:
+        """
+        Test that writes through the model and the related managers invalidate the cache on commit.
+        """
+        profile = user.announcement_profile
+        other = Audience.objects.create(name="Other")
+        assert get_user_audience_ids(user.pk) == [audience.pk]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            profile.audiences.add(other)
+            # Not invalidated before the transaction commits
+            assert get_user_audience_ids(user.pk) == [audience.pk]
+        assert get_user_audience_ids(user.pk) == [audience.pk, other.pk]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            UserAudience.objects.get(
+                user_announce_profile=profile, audience=other
+            ).delete()
+        assert get_user_audience_ids(user.pk) == [audience.pk]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            other.users.add(profile)
+        assert get_user_audience_ids(user.pk) == [audience.pk, other.pk]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            other.users.clear()
+        assert get_user_audience_ids(user.pk) == [audience.pk]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            profile.delete()
+        assert get_user_audience_ids(user.pk) == []
+
+    def test_late_reader_can_not_restore_stale_membership(
+        self, user: User, audience: Audience, django_capture_on_commit_callbacks
+    ) -> None:
+        """
+        Test that a reader storing the membership it loaded before a commit does not outlive the invalidation.
+        """
+        profile = user.announcement_profile
+        other = Audience.objects.create(name="Other")
+        # A reader resolves its key and loads the old membership
+        stale_key = _make_key(user.pk, *_get_versions(cache, user.pk))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            profile.audiences.add(other)
+        # ...and only stores it after the writer's invalidation
+        cache.set(stale_key, [audience.pk])
+
+        assert get_user_audience_ids(user.pk) == [audience.pk, other.pk]
+
+    def test_moved_membership_invalidates_both_owners(
+        self,
+        user: User,
+        admin_user: User,
+        audience: Audience,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        """
+        Test that moving a membership row to another profile invalidates its previous and new owner.
+        """
+        other_profile = UserAnnouncementProfile.objects.create(user=admin_user)
+        assert get_user_audience_ids(user.pk) == [audience.pk]
+        assert get_user_audience_ids(admin_user.pk) == []
+
+        membership = UserAudience.objects.get(user_announce_profile__user=user)
+        with django_capture_on_commit_callbacks(execute=True):
+            membership.user_announce_profile = other_profile
+            membership.save()
+
+        assert get_user_audience_ids(user.pk) == []
+        assert get_user_audience_ids(admin_user.pk) == [audience.pk]
+
+        # Saves not touching the profile skip the lookup of the previous one
+        with django_capture_on_commit_callbacks(execute=True):
+            membership.save(update_fields=["audience"])
+        assert get_user_audience_ids(admin_user.pk) == [audience.pk]
+
+    def test_explicit_invalidation(self, user: User, audience: Audience) -> None:
+        """
+        Test the explicit per-user and global invalidation helpers, including a lost generation key.
+        """
+        assert get_user_audience_ids(user.pk) == [audience.pk]
+        # Simulate a write that bypasses signals
+        UserAudience.objects.filter(audience=audience).update(
+            audience=Audience.objects.create(name="Bulk")
+        )
+        assert get_user_audience_ids(user.pk) == [audience.pk]
+
+        invalidate_user_audience_ids([user.pk])
+        new_ids = get_user_audience_ids(user.pk)
+        assert new_ids != [audience.pk]
+
+        UserAudience.objects.all().update(audience=audience)
+        invalidate_all_audience_ids()
+        assert get_user_audience_ids(user.pk) == [audience.pk]
+
+        cache.delete(GENERATION_KEY)
+        invalidate_all_audience_ids()
+        assert cache.get(GENERATION_KEY) is not None
+
+        cache.delete(_make_version_key(user.pk))
+        invalidate_user_audience_ids([user.pk])
+        assert cache.get(_make_version_key(user.pk)) is not None
+
+    def test_disabled_cache_hits_database(
+        self,
+        user: User,
+        audience: Audience,
+        monkeypatch: pytest.MonkeyPatch,
+        django_assert_num_queries,
+    ) -> None:
+        """
+        Test that the helpers fall back to plain queries when the cache is disabled.
+        """
+        monkeypatch.setattr(config, "audience_cache_enabled", False)
+        invalidate_user_audience_ids([user.pk])
+        invalidate_all_audience_ids()
+
+        for _ in range(2):
+            with django_assert_num_queries(1):
+                assert get_user_audience_ids(user.pk) == [audience.pk]
+
+    def test_get_by_user(self, user: User, setup_data: Dict[str, Announcement]) -> None:
+        """
+        Test that get_by_user() filters announcements by the user's audiences.
+        """
+        user.announcement_profile.audiences.set([setup_data["audiences"][0]])
+
+        announcements = Announcement.objects.get_by_user(user)
+        assert set(announcements) == {setup_data["active"], setup_data["expired"]}
+        assert list(Announcement.objects.active().get_by_user(user.pk)) == [
+            setup_data["active"]
+        ]
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_receivers_connected_only_when_enabled(
+    enabled: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that the app only connects the audience cache receivers when the cache is enabled.
+    """
+    monkeypatch.setattr(config, "audience_cache_enabled", enabled)
+    disconnect_audience_cache_receivers()
+
+    apps.get_app_config("django_announcement").ready()
+
+    assert post_delete.has_listeners(UserAnnouncementProfile) is enabled
+    disconnect_audience_cache_receivers()
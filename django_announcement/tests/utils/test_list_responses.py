@@ -0,0 +1,107 @@
+import sys
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+from django.utils.timezone import now
+
+from django_announcement.models import Announcement, AnnouncementCategory
+from django_announcement.settings.conf import config
+from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from django_announcement.utils.cache import (
+    invalidate_list_responses,
+    make_list_response_key,
+    set_cached_list_response,
+)
+from django_announcement.utils.cache.list_responses import (
+    VERSION_KEY,
+    get_next_visibility_change,
+)
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.utils_cache,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestListResponses:
+    """
+    Test suite for the list response cache helpers.
+    """
+
+    @pytest.fixture(autouse=True)
+    def enable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Enable the list response cache with a clean cache.
+        """
+        monkeypatch.setattr(config, "list_response_cache_enabled", True)
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_timeout_ends_at_next_visibility_change(self) -> None:
+        """
+        Test that cached lists expire when the next announcement gets published or expires.
+        """
+        category = AnnouncementCategory.objects.create(name="Scheduled")
+        moment = now()
+        Announcement.objects.create(
+            title="Soon",
+            content="c",
+            category=category,
+            expires_at=moment + timedelta(seconds=30),
+        )
+        Announcement.objects.create(
+            title="Later",
+            content="c",
+            category=category,
+            published_at=moment + timedelta(hours=1),
+        )
+        assert get_next_visibility_change(moment) == moment + timedelta(seconds=30)
+
+        backend = MagicMock()
+        with patch(
+            "django_announcement.utils.cache.list_responses._get_cache",
+            return_value=backend,
+        ):
+            set_cached_list_response("key", {"results": []})
+
+        timeout = backend.set.call_args.args[2]
+        assert 0 < timeout <= 31
+
+    def test_timeout_without_scheduled_announcements(self, db) -> None:
+        """
+        Test that the configured timeout applies when nothing is scheduled.
+        """
+        assert get_next_visibility_change() is None
+
+        backend = MagicMock()
+        with patch(
+            "django_announcement.utils.cache.list_responses._get_cache",
+            return_value=backend,
+        ):
+            set_cached_list_response("key", [])
+
+        assert backend.set.call_args.args[2] == config.list_response_cache_timeout
+
+    def test_invalidation_moves_to_new_version(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that invalidating changes every key, even after the version was evicted.
+        """
+        key = make_list_response_key(["parts"])
+        invalidate_list_responses()
+        assert make_list_response_key(["parts"]) != key
+
+        cache.delete(VERSION_KEY)
+        invalidate_list_responses()
+        assert cache.get(VERSION_KEY) is not None
+
+        monkeypatch.setattr(config, "list_response_cache_enabled", False)
+        key = make_list_response_key(["parts"])
+        invalidate_list_responses()
+        assert make_list_response_key(["parts"]) == key
@@ -6,9 +6,13 @@ import pytest
 from django_announcement.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 from django_announcement.validators.config_validators import (
     validate_boolean_setting,
+    validate_cache_alias_setting,
+    validate_choice_setting,
+    validate_database_aliases_setting,
     validate_list_fields,
     validate_optional_path_setting,
     validate_optional_paths_setting,
+    validate_positive_integer_setting,
     validate_throttle_rate,
 )
 
@@ -289,3 +293,88 @@ class TestValidateOptionalClassSetting:
             errors = validate_optional_paths_setting(["INVALID_PATH"], "SOME_CLASS_SETTING")
             assert len(errors) == 1
             assert errors[0].id == "django_announcement.E013_SOME_CLASS_SETTING"
+
+
+class TestValidatePositiveIntegerSetting:
+    @pytest.mark.parametrize("value", [0, -5, "10", True, None])
+    def test_invalid_positive_integer(self, value) -> None:
+        """
+        Test that non-integer or non-positive values return an error.
+
+        Asserts:
+        -------
+            The result should contain one error with the expected error ID.
+        """
+        errors = validate_positive_integer_setting(value, "SOME_INT_SETTING")
+        assert len(errors) == 1
+        assert errors[0].id == "django_announcement.E015_SOME_INT_SETTING"
+
+    def test_valid_positive_integer(self) -> None:
+        """
+        Test that a positive integer returns no errors.
+        """
+        assert not validate_positive_integer_setting(300, "SOME_INT_SETTING")
+
+
+class TestValidateCacheAliasSetting:
+    def test_valid_cache_alias(self) -> None:
+        """
+        Test that a configured cache alias returns no errors.
+        """
+        assert not validate_cache_alias_setting("default", "SOME_CACHE_SETTING")
+
+    @pytest.mark.parametrize("alias", ["missing", None])
+    def test_invalid_cache_alias(self, alias) -> None:
+        """
+        Test that an unknown cache alias returns an error.
+
+        Asserts:
+        -------
+            The result should contain one error with the expected error ID.
+        """
+        errors = validate_cache_alias_setting(alias, "SOME_CACHE_SETTING")
+        assert len(errors) == 1
+        assert errors[0].id == "django_announcement.E016_SOME_CACHE_SETTING"
+
+
+class TestValidateChoiceSetting:
+    def test_valid_choice(self) -> None:
+        """
+        Test that a supported value returns no errors.
+        """
+        assert not validate_choice_setting("none", ("exact", "none"), "SOME_SETTING")
+
+    @pytest.mark.parametrize("value", ["approximate", None, 1])
+    def test_invalid_choice(self, value) -> None:
+        """
+        Test that an unsupported value returns an error.
+
+        Asserts:
+        -------
+            The result should contain one error with the expected error ID.
+        """
+        errors = validate_choice_setting(value, ("exact", "none"), "SOME_SETTING")
+        assert len(errors) == 1
+        assert errors[0].id == "django_announcement.E017_SOME_SETTING"
+
+
+class TestValidateDatabaseAliasesSetting:
+    def test_valid_database_aliases(self) -> None:
+        """
+        Test that configured database aliases other than the default return no errors.
+        """
+        assert not validate_database_aliases_setting([], "SOME_DB_SETTING")
+        assert not validate_database_aliases_setting(["replica"], "SOME_DB_SETTING")
+
+    @pytest.mark.parametrize("aliases", [["default"], ["missing"], [None], "replica"])
+    def test_invalid_database_aliases(self, aliases) -> None:
+        """
+        Test that unknown aliases, the default alias and non-lists return an error.
+
+        Asserts:
+        -------
+            The result should contain one error with the expected error ID.
+        """
+        errors = validate_database_aliases_setting(aliases, "SOME_DB_SETTING")
+        assert len(errors) == 1
+        assert errors[0].id == "django_announcement.E018_SOME_DB_SETTING"
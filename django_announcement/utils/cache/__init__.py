@@ -0,0 +1,12 @@
+from .audience_ids import (
+    aget_user_audience_ids,
+    get_user_audience_ids,
+    invalidate_all_audience_ids,
+    invalidate_user_audience_ids,
+)
+from .list_responses import (
+    get_cached_list_response,
+    invalidate_list_responses,
+    make_list_response_key,
+    set_cached_list_response,
+)
@@ -0,0 +1,192 @@
+import time
+from typing import Iterable, List, Tuple
+
+from django.core.cache import BaseCache, caches
+
+from django_announcement.models.user_audience import UserAudience
+from django_announcement.settings.conf import config
+
+KEY_PREFIX = "django_announcement:audience_ids"
+GENERATION_KEY = f"{KEY_PREFIX}:generation"
+
+
+def _get_cache() -> BaseCache:
+    """Return the cache backend configured for the announcement app."""
+    return caches[config.cache_alias]
+
+
+def _new_generation() -> int:
+    """Return a generation number that can not collide with an earlier one,
+    even if the generation key itself was evicted from the cache."""
+    return time.time_ns()
+
+
+def _make_version_key(user_id: int) -> str:
+    """Build the cache key holding the membership version of a user."""
+    return f"{KEY_PREFIX}:version:{user_id}"
+
+
+def _make_key(user_id: int, generation: int, version: int) -> str:
+    """Build the cache key holding the audience ids of a user at a given
+    generation and membership version."""
+    return f"{KEY_PREFIX}:{generation}:{user_id}:{version}"
+
+
+def _get_versions(cache: BaseCache, user_id: int) -> Tuple[int, int]:
+    """Return the current cache generation and membership version of a
+    user, creating them on first use.
+
+    Both are read in a single round trip in the steady state.
+
+    """
+    version_key = _make_version_key(user_id)
+    values = cache.get_many([GENERATION_KEY, version_key])
+
+    generation = values.get(GENERATION_KEY)
+    if generation is None:
+        generation = cache.get_or_set(GENERATION_KEY, _new_generation, timeout=None)
+    version = values.get(version_key)
+    if version is None:
+        version = cache.get_or_set(
+            version_key, _new_generation, timeout=config.audience_cache_timeout
+        )
+
+    return generation, version
+
+
+async def _aget_versions(cache: BaseCache, user_id: int) -> Tuple[int, int]:
+    """Asynchronous version of `_get_versions`."""
+    version_key = _make_version_key(user_id)
+    values = await cache.aget_many([GENERATION_KEY, version_key])
+
+    generation = values.get(GENERATION_KEY)
+    if generation is None:
+        generation = await cache.aget_or_set(
+            GENERATION_KEY, _new_generation, timeout=None
+        )
+    version = values.get(version_key)
+    if version is None:
+        version = await cache.aget_or_set(
+            version_key, _new_generation, timeout=config.audience_cache_timeout
+        )
+
+    return generation, version
+
+
+def _query_user_audience_ids(user_id: int) -> List[int]:
+    """Load the sorted audience ids of a user from the database."""
+    return sorted(
+        UserAudience.objects.filter(user_announce_profile__user_id=user_id).values_list(
+            "audience_id", flat=True
+        )
+    )
+
+
+def get_user_audience_ids(user_id: int) -> List[int]:
+    """Return the sorted ids of the audiences a user belongs to.
+
+    When `DJANGO_ANNOUNCEMENT_AUDIENCE_CACHE_ENABLED` is set, the ids are
+    served from the configured cache and only loaded from the database
+    after an invalidation or once the entry times out.
+
+    The cache key embeds the membership version of the user, read before
+    the database. A reader that loaded a membership about to be replaced
+    can only store it under the version it read, which the invalidation
+    moves past, so the stale value is never served.
+
+    Args:
+        user_id (int): The id of the user.
+
+    Returns:
+        List[int]: The sorted audience ids, empty if the user has no profile.
+
+    """
+    if not config.audience_cache_enabled:
+        return _query_user_audience_ids(user_id)
+
+    cache = _get_cache()
+    key = _make_key(user_id, *_get_versions(cache, user_id))
+
+    audience_ids = cache.get(key)
+    if audience_ids is None:
+        audience_ids = _query_user_audience_ids(user_id)
+        cache.set(key, audience_ids, config.audience_cache_timeout)
+
+    return audience_ids
+
+
+async def aget_user_audience_ids(user_id: int) -> List[int]:
+    """Asynchronous version of `get_user_audience_ids`, built on the async
+    cache and ORM interfaces.
+
+    Args:
+        user_id (int): The id of the user.
+
+    Returns:
+        List[int]: The sorted audience ids, empty if the user has no profile.
+
+    """
+
+    async def query() -> List[int]:
+        return sorted(
+            [
+                audience_id
+                async for audience_id in UserAudience.objects.filter(
+                    user_announce_profile__user_id=user_id
+                ).values_list("audience_id", flat=True)
+            ]
+        )
+
+    if not config.audience_cache_enabled:
+        return await query()
+
+    cache = _get_cache()
+    key = _make_key(user_id, *await _aget_versions(cache, user_id))
+
+    audience_ids = await cache.aget(key)
+    if audience_ids is None:
+        audience_ids = await query()
+        await cache.aset(key, audience_ids, config.audience_cache_timeout)
+
+    return audience_ids
+
+
+def invalidate_user_audience_ids(user_ids: Iterable[int]) -> None:
+    """Invalidate the cached audience ids of the given users by moving
+    each of them to a new membership version.
+
+    Args:
+        user_ids (Iterable[int]): The ids of the users whose membership changed.
+
+    """
+    if not config.audience_cache_enabled:
+        return
+
+    cache = _get_cache()
+    for user_id in set(user_ids):
+        version_key = _make_version_key(user_id)
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            # The version was evicted or never read; start from one that can
+            # not collide with the lost one
+            cache.set(
+                version_key, _new_generation(), timeout=config.audience_cache_timeout
+            )
+
+
+def invalidate_all_audience_ids() -> None:
+    """Invalidate every cached audience-id set at once by moving to a new
+    cache generation.
+
+    Used after bulk writes (e.g. `bulk_create`) that bypass model signals.
+
+    """
+    if not config.audience_cache_enabled:
+        return
+
+    cache = _get_cache()
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, _new_generation(), timeout=None)
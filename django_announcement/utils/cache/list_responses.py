@@ -0,0 +1,126 @@
+import time
+from datetime import datetime
+from hashlib import sha1
+from typing import Any, Iterable, Optional
+
+from django.core.cache import BaseCache, caches
+from django.db.models import Min, Q
+from django.utils.timezone import now
+
+from django_announcement.settings.conf import config
+
+KEY_PREFIX = "django_announcement:list_responses"
+VERSION_KEY = f"{KEY_PREFIX}:version"
+
+# Marks a cache miss, since a cached page is never None
+MISSING = object()
+
+
+def _get_cache() -> BaseCache:
+    """Return the cache backend configured for the announcement app."""
+    return caches[config.cache_alias]
+
+
+def _new_version() -> int:
+    """Return a content version that can not collide with an earlier one,
+    even if the version key itself was evicted from the cache."""
+    return time.time_ns()
+
+
+def get_list_content_version() -> int:
+    """Return the current content version of the announcement lists,
+    creating it on first use.
+
+    Returns:
+        int: The version, bumped by `invalidate_list_responses`.
+
+    """
+    return _get_cache().get_or_set(VERSION_KEY, _new_version, timeout=None)
+
+
+def make_list_response_key(parts: Iterable[Any]) -> str:
+    """Build the cache key of a list response from its identifying parts.
+
+    The parts are hashed, so large audience sets and query strings still
+    produce short keys that are valid for every cache backend.
+
+    Args:
+        parts (Iterable[Any]): The canonical parts identifying the response.
+
+    Returns:
+        str: The cache key, bound to the current content version.
+
+    """
+    digest = sha1("|".join(map(str, parts)).encode()).hexdigest()
+    return f"{KEY_PREFIX}:{get_list_content_version()}:{digest}"
+
+
+def get_cached_list_response(key: str) -> Any:
+    """Return the cached list response data stored under the key.
+
+    Args:
+        key (str): The key built by `make_list_response_key`.
+
+    Returns:
+        Any: The cached data, or `MISSING` if there is none.
+
+    """
+    return _get_cache().get(key, MISSING)
+
+
+def get_next_visibility_change(moment: Optional[datetime] = None) -> Optional[datetime]:
+    """Return the next time an announcement gets published or expires.
+
+    Lists only contain active announcements, so they change at these
+    moments without any write; cached lists must not outlive them. Both
+    lookups are served by the publication window indexes.
+
+    Args:
+        moment (Optional[datetime]): The reference time, defaults to now.
+
+    Returns:
+        Optional[datetime]: The next publication or expiry, if any.
+
+    """
+    # The Announcement queryset imports this package, so import it lazily
+    from django_announcement.models.announcement import Announcement
+
+    moment = moment or now()
+    boundaries = Announcement.objects.filter(
+        Q(published_at__gt=moment) | Q(expires_at__gt=moment)
+    ).aggregate(
+        next_publication=Min("published_at", filter=Q(published_at__gt=moment)),
+        next_expiry=Min("expires_at", filter=Q(expires_at__gt=moment)),
+    )
+    return min(filter(None, boundaries.values()), default=None)
+
+
+def set_cached_list_response(key: str, data: Any) -> None:
+    """Cache list response data until the configured timeout, or until the
+    next announcement publication or expiry if that comes sooner.
+
+    Args:
+        key (str): The key built by `make_list_response_key`.
+        data (Any): The response data to cache.
+
+    """
+    timeout = config.list_response_cache_timeout
+    moment = now()
+    next_change = get_next_visibility_change(moment)
+    if next_change is not None:
+        timeout = min(timeout, int((next_change - moment).total_seconds()) + 1)
+
+    _get_cache().set(key, data, timeout)
+
+
+def invalidate_list_responses() -> None:
+    """Invalidate every cached list response at once by moving to a new
+    content version."""
+    if not config.list_response_cache_enabled:
+        return
+
+    cache = _get_cache()
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, _new_version(), timeout=None)
@@ -1,4 +1,7 @@
+from typing import Optional, Tuple, Type
+
 from django.contrib.auth import get_user_model
+from django.db.models import Exists, Field, Model, OuterRef
 
 # Cache the user model and username field
 UserModel = get_user_model()
@@ -17,3 +20,52 @@ def get_username(user: UserModel) -> str:
 
     """
     return getattr(user, USERNAME_FIELD, "Unknown")
+
+
+def get_user_relation(rel_name: str) -> Tuple[Type[Model], Field]:
+    """Return the model of the rows linking users to a user-related model,
+    and their foreign key to the user.
+
+    Args:
+        rel_name (str): The accessor name of the relation on the user model.
+
+    Returns:
+        Tuple[Type[Model], Field]: The related model, or the intermediate
+        model of a many-to-many relation, with its foreign key to the user.
+
+    """
+    rel = next(
+        rel
+        for rel in UserModel._meta.related_objects
+        if rel.get_accessor_name() == rel_name
+    )
+    if not rel.many_to_many:
+        return rel.related_model, rel.field
+
+    return rel.through, rel.through._meta.get_field(rel.field.m2m_reverse_field_name())
+
+
+def get_user_relation_filter(
+    rel_name: str, mark: Optional[int] = None, user_path: str = ""
+) -> Exists:
+    """Build a filter of the users having rows in a relation.
+
+    Unlike joining the relation, it never yields a user more than once.
+
+    Args:
+        rel_name (str): The accessor name of the relation on the user model.
+        mark (Optional[int]): Only consider the rows with a greater id.
+        user_path (str): The path to the user from the filtered model.
+
+    Returns:
+        Exists: The filter of the users having rows in the relation.
+
+    """
+    model, user_fk = get_user_relation(rel_name)
+    rows = model._default_manager.filter(
+        **{user_fk.name: OuterRef(f"{user_path}{user_fk.target_field.attname}")}
+    )
+    if mark is not None:
+        rows = rows.filter(pk__gt=mark)
+
+    return Exists(rows)
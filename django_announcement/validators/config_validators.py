@@ -1,7 +1,9 @@
 from re import match
-from typing import List
+from typing import List, Sequence
 
+from django.conf import settings
 from django.core.checks import Error
+from django.db import DEFAULT_DB_ALIAS
 from django.utils.module_loading import import_string
 
 VALID_TIME_UNITS = ["second", "minute", "hour", "day"]
@@ -236,3 +238,118 @@ def validate_upload_path_setting(path: str, setting_name: str) -> List[Error]:
         )
 
     return errors
+
+
+def validate_positive_integer_setting(value: int, setting_name: str) -> List[Error]:
+    """Validate that the setting is a positive integer.
+
+    Args:
+        value (int): The value of the setting to validate.
+        setting_name (str): The name of the setting being validated.
+
+    Returns:
+        List[Error]: A list of validation errors if invalid, or an empty list if valid.
+
+    """
+    errors = []
+
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        errors.append(
+            Error(
+                f"{setting_name} must be a positive integer.",
+                hint=f"Ensure {setting_name} is an integer greater than zero.",
+                id=f"django_announcement.E015_{setting_name}",
+            )
+        )
+
+    return errors
+
+
+def validate_cache_alias_setting(alias: str, setting_name: str) -> List[Error]:
+    """Validate that the setting names a cache defined in the `CACHES`
+    setting.
+
+    Args:
+        alias (str): The cache alias to validate.
+        setting_name (str): The name of the setting being validated.
+
+    Returns:
+        List[Error]: A list of validation errors if invalid, or an empty list if valid.
+
+    """
+    errors = []
+
+    if not isinstance(alias, str) or alias not in settings.CACHES:
+        errors.append(
+            Error(
+                f"{setting_name} must be the alias of a configured cache.",
+                hint=f"Ensure '{alias}' is a key of the CACHES setting.",
+                id=f"django_announcement.E016_{setting_name}",
+            )
+        )
+
+    return errors
+
+
+def validate_choice_setting(
+    value: str, choices: Sequence[str], setting_name: str
+) -> List[Error]:
+    """Validate that the setting is one of the supported choices.
+
+    Args:
+        value (str): The value of the setting to validate.
+        choices (Sequence[str]): The supported values.
+        setting_name (str): The name of the setting being validated.
+
+    Returns:
+        List[Error]: A list of validation errors if invalid, or an empty list if valid.
+
+    """
+    errors = []
+
+    if not isinstance(value, str) or value not in choices:
+        errors.append(
+            Error(
+                f"{setting_name} must be one of: {', '.join(choices)}.",
+                hint=f"Ensure {setting_name} is set to one of the supported values.",
+                id=f"django_announcement.E017_{setting_name}",
+            )
+        )
+
+    return errors
+
+
+def validate_database_aliases_setting(
+    aliases: List[str], setting_name: str
+) -> List[Error]:
+    """Validate that the setting lists databases defined in the `DATABASES`
+    setting, other than the default database.
+
+    Args:
+        aliases (List[str]): The database aliases to validate.
+        setting_name (str): The name of the setting being validated.
+
+    Returns:
+        List[Error]: A list of validation errors if invalid, or an empty list if valid.
+
+    """
+    errors = []
+
+    if not isinstance(aliases, list) or any(
+        not isinstance(alias, str)
+        or alias not in settings.DATABASES
+        or alias == DEFAULT_DB_ALIAS
+        for alias in aliases
+    ):
+        errors.append(
+            Error(
+                f"{setting_name} must be a list of database aliases.",
+                hint=(
+                    f"Ensure every alias of '{aliases}' is a key of the DATABASES "
+                    f"setting, other than '{DEFAULT_DB_ALIAS}'."
+                ),
+                id=f"django_announcement.E018_{setting_name}",
+            )
+        )
+
+    return errors